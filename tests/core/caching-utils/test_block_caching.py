@@ -0,0 +1,285 @@
+import itertools
+import pytest
+
+from web3 import (
+    AsyncWeb3,
+    Web3,
+)
+from web3._utils.block_caching import (
+    BLOCK_HASH,
+    BLOCK_IN_RESULT,
+    BLOCK_NUMBER,
+    CHAIN_HEAD,
+    BlockCacheTracker,
+    get_request_block_dependency,
+)
+from web3.providers import (
+    AsyncBaseProvider,
+    BaseProvider,
+)
+
+BLOCK_HASH_A = "0x" + "aa" * 32
+BLOCK_HASH_B = "0x" + "bb" * 32
+ADDRESS = "0xd3CdA913deB6f67967B99D67aCDFa1712C293601"
+
+
+def _block(number, block_hash, parent_hash=BLOCK_HASH_A):
+    return {"number": hex(number), "hash": block_hash, "parentHash": parent_hash}
+
+
+class ChainMock:
+    """
+    Answers head requests with ``self.head``, requests for the blocks in
+    ``self.blocks`` by number, and counts the other requests made.
+    """
+
+    def __init__(self, head):
+        self.head = head
+        self.blocks = {}
+        self.counter = itertools.count()
+
+    def get_block(self, _method, params):
+        if params[0] == "latest":
+            return self.head
+        elif params[0] in self.blocks:
+            return self.blocks[params[0]]
+        return self.request(_method, params)
+
+    def request(self, _method, _params):
+        return next(self.counter)
+
+    @property
+    def mock_results(self):
+        return {
+            "eth_chainId": 1,
+            "eth_getBlockByNumber": self.get_block,
+            "eth_getBalance": self.request,
+            "eth_call": self.request,
+            "eth_getTransactionCount": self.request,
+        }
+
+
+@pytest.fixture
+def w3():
+    _w3 = Web3(BaseProvider())
+    _w3.provider.cache_allowed_requests = True
+    return _w3
+
+
+@pytest.mark.parametrize(
+    "method,params,expected",
+    (
+        ("eth_getBlockByNumber", ["0x10", False], (BLOCK_NUMBER, 16)),
+        ("eth_getBlockByNumber", ["earliest", False], (BLOCK_NUMBER, 0)),
+        ("eth_getBlockByNumber", ["latest", False], (CHAIN_HEAD, None)),
+        ("eth_getBlockByNumber", ["finalized", False], (CHAIN_HEAD, None)),
+        ("eth_getBalance", [ADDRESS, 16], (BLOCK_NUMBER, 16)),
+        ("eth_getBalance", [ADDRESS, BLOCK_HASH_A], (BLOCK_HASH, None)),
+        ("eth_getTransactionCount", [ADDRESS, "pending"], None),
+        ("eth_call", [{"to": ADDRESS}], (CHAIN_HEAD, None)),
+        (
+            "eth_call",
+            [{"to": ADDRESS}, {"blockHash": BLOCK_HASH_A}],
+            (BLOCK_HASH, None),
+        ),
+        ("eth_call", [{"to": ADDRESS}, {"blockNumber": "0x2"}], (BLOCK_NUMBER, 2)),
+        ("eth_getStorageAt", [ADDRESS, "0x0", "0x3"], (BLOCK_NUMBER, 3)),
+        ("eth_getLogs", [{"fromBlock": "0x1", "toBlock": "0x5"}], (BLOCK_NUMBER, 5)),
+        ("eth_getLogs", [{"fromBlock": "0x1"}], (CHAIN_HEAD, None)),
+        ("eth_getLogs", [{"blockHash": BLOCK_HASH_A}], (BLOCK_HASH, None)),
+        ("eth_getLogs", [{"fromBlock": "pending"}], None),
+        ("eth_getTransactionReceipt", [BLOCK_HASH_A], (BLOCK_IN_RESULT, None)),
+        ("eth_sendRawTransaction", ["0x00"], None),
+    ),
+)
+def test_get_request_block_dependency(method, params, expected):
+    assert get_request_block_dependency(method, params) == expected
+
+
+def test_block_cache_tracker_evicts_from_block():
+    tracker = BlockCacheTracker()
+    tracker.track_unfinalized("a", 10)
+    tracker.track_unfinalized("b", 11)
+    tracker.track_unfinalized("c", 12)
+
+    assert tracker.evict_from_block(11) == ["b", "c"]
+    assert tracker.evict_from_block(11) == []
+    assert tracker.evict_from_block(0) == ["a"]
+
+
+def test_finalized_block_number_responses_are_cached(w3, request_mocker):
+    chain = ChainMock(_block(100, BLOCK_HASH_A))
+
+    with request_mocker(w3, mock_results=chain.mock_results):
+        first = w3.manager.request_blocking("eth_getBalance", [ADDRESS, "0x1"])
+        assert w3.manager.request_blocking("eth_getBalance", [ADDRESS, "0x1"]) == first
+
+        # a new head doesn't evict responses that are final
+        w3.provider.request_cache_head_ttl = 0
+        chain.head = _block(101, BLOCK_HASH_B, parent_hash=BLOCK_HASH_B)
+        assert w3.manager.request_blocking("eth_getBalance", [ADDRESS, "0x1"]) == first
+
+    assert w3.provider._request_cache_block_tracker.head_number == 101
+
+
+def test_unfinalized_responses_are_evicted_on_reorg(w3, request_mocker):
+    w3.provider.request_cache_head_ttl = 0
+    chain = ChainMock(_block(100, BLOCK_HASH_A))
+
+    with request_mocker(w3, mock_results=chain.mock_results):
+        params = [ADDRESS, hex(99)]
+        first = w3.manager.request_blocking("eth_getBalance", params)
+
+        # new head builds on the previous head, no reorg
+        chain.head = _block(101, BLOCK_HASH_B, parent_hash=BLOCK_HASH_A)
+        assert w3.manager.request_blocking("eth_getBalance", params) == first
+
+        # the head is replaced
+        chain.head = _block(101, "0x" + "cc" * 32, parent_hash=BLOCK_HASH_A)
+        assert w3.manager.request_blocking("eth_getBalance", params) != first
+
+
+def test_unfinalized_responses_are_evicted_when_head_jumps_to_another_fork(
+    w3, request_mocker
+):
+    w3.provider.request_cache_head_ttl = 0
+    chain = ChainMock(_block(100, BLOCK_HASH_A))
+
+    with request_mocker(w3, mock_results=chain.mock_results):
+        params = [ADDRESS, hex(100)]
+        first = w3.manager.request_blocking("eth_getBalance", params)
+
+        # the head is two blocks ahead, on a chain where block 100 is the head seen
+        chain.head = _block(102, BLOCK_HASH_B, parent_hash="0x" + "cc" * 32)
+        chain.blocks[hex(100)] = _block(100, BLOCK_HASH_A)
+        assert w3.manager.request_blocking("eth_getBalance", params) == first
+
+        # the head is two blocks ahead, on a chain where block 102 was replaced
+        chain.head = _block(104, "0x" + "dd" * 32, parent_hash="0x" + "ee" * 32)
+        chain.blocks[hex(102)] = _block(102, "0x" + "ff" * 32)
+        second = w3.manager.request_blocking("eth_getBalance", params)
+        assert second != first
+        assert w3.manager.request_blocking("eth_getBalance", params) == second
+
+
+def test_block_cache_tracker_verifies_ancestor_when_head_jumps():
+    tracker = BlockCacheTracker()
+    tracker.update_head(_block(100, BLOCK_HASH_A), 0, finality_depth=10)
+    tracker.track_unfinalized("a", 95)
+    tracker.track_unfinalized("b", 100)
+    new_head = _block(102, BLOCK_HASH_B, parent_hash="0x" + "cc" * 32)
+
+    assert tracker.ancestor_to_verify(_block(101, BLOCK_HASH_B)) is None
+    assert tracker.ancestor_to_verify(new_head) == 100
+    # without the block at the number of the old head, it is taken as replaced
+    assert tracker.update_head(new_head, 1, finality_depth=10) == ["a", "b"]
+
+
+def test_head_dependent_responses_expire_with_new_head(w3, request_mocker):
+    w3.provider.request_cache_latest_ttl = 1
+    chain = ChainMock(_block(100, BLOCK_HASH_A))
+
+    with request_mocker(w3, mock_results=chain.mock_results):
+        # the head is observed when finality of a block number request is checked
+        w3.manager.request_blocking("eth_getBalance", [ADDRESS, "0x1"])
+
+        call = [{"to": ADDRESS}, "latest"]
+        first = w3.manager.request_blocking("eth_call", call)
+        assert w3.manager.request_blocking("eth_call", call) == first
+
+        w3.provider.request_cache_head_ttl = 0
+        chain.head = _block(101, BLOCK_HASH_B, parent_hash=BLOCK_HASH_A)
+        w3.manager.request_blocking("eth_getBalance", [ADDRESS, "0x1"])
+
+        second = w3.manager.request_blocking("eth_call", call)
+        assert second != first
+        assert w3.manager.request_blocking("eth_call", call) == second
+
+
+def test_head_dependent_responses_are_not_cached_by_default(w3, request_mocker):
+    chain = ChainMock(_block(100, BLOCK_HASH_A))
+
+    with request_mocker(w3, mock_results=chain.mock_results):
+        # the head is observed when finality of a block number request is checked
+        w3.manager.request_blocking("eth_getBalance", [ADDRESS, "0x1"])
+
+        balance = [ADDRESS, "latest"]
+        first = w3.manager.request_blocking("eth_getBalance", balance)
+        chain.head = _block(101, BLOCK_HASH_B, parent_hash=BLOCK_HASH_A)
+        assert w3.manager.request_blocking("eth_getBalance", balance) != first
+
+
+def test_pending_responses_are_not_cached(w3, request_mocker):
+    chain = ChainMock(_block(100, BLOCK_HASH_A))
+
+    with request_mocker(w3, mock_results=chain.mock_results):
+        params = [ADDRESS, "pending"]
+        first = w3.manager.request_blocking("eth_getTransactionCount", params)
+        assert w3.manager.request_blocking("eth_getTransactionCount", params) != first
+
+
+def test_receipts_are_cached_by_the_block_in_the_result(w3, request_mocker):
+    chain = ChainMock(_block(100, BLOCK_HASH_A))
+    receipts = iter(
+        (
+            None,
+            {"blockNumber": None},
+            {"blockNumber": "0x1", "status": "0x1"},
+            {"blockNumber": "0x1", "status": "0x0"},
+        )
+    )
+
+    with request_mocker(
+        w3,
+        mock_results={
+            **chain.mock_results,
+            "eth_getTransactionReceipt": lambda *_: next(receipts),
+        },
+    ):
+        tx_hash = [BLOCK_HASH_B]
+        assert w3.manager.request_blocking("eth_getTransactionReceipt", tx_hash) is None
+        assert w3.manager.request_blocking("eth_getTransactionReceipt", tx_hash) == {
+            "blockNumber": None
+        }
+        mined = w3.manager.request_blocking("eth_getTransactionReceipt", tx_hash)
+        assert mined["status"] == "0x1"
+        assert (
+            w3.manager.request_blocking("eth_getTransactionReceipt", tx_hash) == mined
+        )
+
+
+def test_block_caching_is_disabled_with_request_caching(request_mocker):
+    w3 = Web3(BaseProvider())
+    chain = ChainMock(_block(100, BLOCK_HASH_A))
+
+    with request_mocker(w3, mock_results=chain.mock_results):
+        params = [ADDRESS, "0x1"]
+        first = w3.manager.request_blocking("eth_getBalance", params)
+        assert w3.manager.request_blocking("eth_getBalance", params) != first
+
+    assert len(w3.provider._request_cache) == 0
+
+
+# -- async -- #
+
+
+@pytest.mark.asyncio
+async def test_async_unfinalized_responses_are_evicted_on_reorg(request_mocker):
+    async_w3 = AsyncWeb3(AsyncBaseProvider())
+    async_w3.provider.cache_allowed_requests = True
+    async_w3.provider.request_cache_head_ttl = 0
+    chain = ChainMock(_block(100, BLOCK_HASH_A))
+
+    async with request_mocker(async_w3, mock_results=chain.mock_results):
+        final = [ADDRESS, "0x1"]
+        unfinalized = [ADDRESS, hex(99)]
+        first_final = await async_w3.manager.coro_request("eth_getBalance", final)
+        first = await async_w3.manager.coro_request("eth_getBalance", unfinalized)
+
+        chain.head = _block(99, BLOCK_HASH_B)
+        assert await async_w3.manager.coro_request("eth_getBalance", unfinalized) != (
+            first
+        )
+        assert (
+            await async_w3.manager.coro_request("eth_getBalance", final) == first_final
+        )
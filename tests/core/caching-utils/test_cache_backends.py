@@ -0,0 +1,329 @@
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import pytest
+
+from web3 import (
+    Web3,
+)
+from web3.exceptions import (
+    Web3ValueError,
+)
+from web3.providers import (
+    BaseProvider,
+    HTTPProvider,
+)
+from web3.utils import (
+    CacheStats,
+    SimpleCache,
+    SQLiteCache,
+)
+
+BLOCK_HASH = "0x" + "aa" * 32
+ADDRESS = "0xd3CdA913deB6f67967B99D67aCDFa1712C293601"
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "request_cache.sqlite"
+
+
+@pytest.fixture
+def sqlite_cache(cache_path):
+    cache = SQLiteCache(cache_path, size=3)
+    # track every access so eviction order is deterministic
+    cache.ACCESS_RESOLUTION = 0
+    yield cache
+    cache.close()
+
+
+def test_sqlite_cache_operations(sqlite_cache):
+    key = ("eth_chainId", ())
+    assert key not in sqlite_cache
+    assert sqlite_cache.get_cache_entry(key) is None
+
+    value = {"jsonrpc": "2.0", "id": 0, "result": "0x1"}
+    assert sqlite_cache.cache(key, value) == (value, None)
+    assert key in sqlite_cache
+    assert len(sqlite_cache) == 1
+    assert sqlite_cache.get_cache_entry(key) == value
+    assert [cached for _, cached in sqlite_cache.items()] == [value]
+
+    assert sqlite_cache.pop(key) == value
+    assert sqlite_cache.pop(key) is None
+    assert len(sqlite_cache) == 0
+
+    sqlite_cache.cache("a", 1)
+    sqlite_cache.clear()
+    assert len(sqlite_cache) == 0
+
+
+def test_sqlite_cache_evicts_least_recently_used(sqlite_cache):
+    for key in ("a", "b", "c"):
+        sqlite_cache.cache(key, key)
+
+    # "a" is used, so "b" is the least recently used entry
+    assert sqlite_cache.get_cache_entry("a") == "a"
+    sqlite_cache.cache("d", "d")
+
+    assert len(sqlite_cache) == 3
+    assert "b" not in sqlite_cache
+    assert all(key in sqlite_cache for key in ("a", "c", "d"))
+
+
+def test_sqlite_cache_is_shared_and_survives_restarts(cache_path):
+    first = SQLiteCache(cache_path)
+    second = SQLiteCache(cache_path)
+
+    first.cache(("eth_getBlockByHash", (BLOCK_HASH, False)), {"result": "block"})
+    assert second.get_cache_entry(("eth_getBlockByHash", (BLOCK_HASH, False))) == {
+        "result": "block"
+    }
+    first.close()
+    second.close()
+
+    restarted = SQLiteCache(cache_path)
+    assert len(restarted) == 1
+    restarted.close()
+
+
+def test_request_cache_setter_resets_block_tracking():
+    provider = BaseProvider()
+    provider._request_cache_block_tracker.track_unfinalized("key", 1)
+    tracker = provider._request_cache_block_tracker
+
+    cache = SimpleCache(10)
+    provider.request_cache = cache
+    assert provider._request_cache is cache
+    assert provider._request_cache_block_tracker is not tracker
+
+
+def test_persistent_request_cache_only_caches_final_responses(
+    request_mocker, sqlite_cache
+):
+    w3 = Web3(BaseProvider())
+    w3.provider.cache_allowed_requests = True
+    w3.provider.request_cache = sqlite_cache
+    head = {"number": hex(100), "hash": BLOCK_HASH, "parentHash": BLOCK_HASH}
+
+    with request_mocker(
+        w3,
+        mock_results={
+            "eth_getBlockByNumber": lambda _m, params: (
+                head if params[0] == "latest" else {"number": params[0]}
+            ),
+            "eth_getBalance": "0x1",
+        },
+    ):
+        w3.manager.request_blocking("eth_getBalance", [ADDRESS, "0x1"])
+        w3.manager.request_blocking("eth_getBalance", [ADDRESS, hex(99)])
+        w3.manager.request_blocking("eth_getBalance", [ADDRESS, "latest"])
+
+    # keys are not scoped to the thread, so they can be shared with other processes
+    assert ("BaseProvider", "eth_getBalance", (ADDRESS, "0x1")) in sqlite_cache
+    assert len(sqlite_cache) == 1
+
+
+def test_persistent_request_cache_is_scoped_to_the_endpoint(request_mocker, cache_path):
+    mainnet = Web3(HTTPProvider("http://mainnet:8545"))
+    polygon = Web3(HTTPProvider("http://polygon:8545"))
+    for w3 in (mainnet, polygon):
+        w3.provider.cache_allowed_requests = True
+        w3.provider.request_cache = SQLiteCache(cache_path)
+
+    with request_mocker(
+        mainnet, mock_results={"eth_getBlockByHash": {"number": "0x1"}}
+    ):
+        assert mainnet.eth.get_block(BLOCK_HASH)["number"] == 1
+    with request_mocker(
+        polygon, mock_results={"eth_getBlockByHash": {"number": "0x2"}}
+    ):
+        assert polygon.eth.get_block(BLOCK_HASH)["number"] == 2
+
+    # a new provider for the same endpoint shares the cached response
+    restarted = Web3(HTTPProvider("http://mainnet:8545"))
+    restarted.provider.cache_allowed_requests = True
+    restarted.provider.request_cache = SQLiteCache(cache_path)
+    with request_mocker(restarted, mock_errors={"eth_getBlockByHash": {}}):
+        assert restarted.eth.get_block(BLOCK_HASH)["number"] == 1
+
+    for w3 in (mainnet, polygon, restarted):
+        w3.provider.request_cache.close()
+
+
+def test_persistent_request_cache_does_not_persist_endpoint_state(
+    request_mocker, sqlite_cache
+):
+    w3 = Web3(BaseProvider())
+    w3.provider.cache_allowed_requests = True
+    w3.provider.request_cache = sqlite_cache
+
+    with request_mocker(
+        w3,
+        mock_results={
+            "eth_chainId": "0x1",
+            "net_version": "1",
+            "web3_clientVersion": "Geth/v1.14.0",
+        },
+    ):
+        w3.eth.chain_id
+        w3.net.version
+        w3.client_version
+
+    assert len(sqlite_cache) == 0
+
+
+def test_simple_cache_evicts_least_recently_used():
+    cache = SimpleCache(3)
+    for key in ("a", "b", "c"):
+        cache.cache(key, key)
+
+    # looking "a" up promotes it, so "b" is evicted
+    assert cache.get_cache_entry("a") == "a"
+    _, evicted_items = cache.cache("d", "d")
+    assert evicted_items == {"b": "b"}
+    assert list(cache._data) == ["c", "a", "d"]
+
+
+def test_simple_cache_evicts_least_frequently_used():
+    cache = SimpleCache(3, eviction_policy="lfu")
+    for key in ("a", "b", "c"):
+        cache.cache(key, key)
+    for _ in range(3):
+        cache.get_cache_entry("a")
+    cache.get_cache_entry("b")
+    cache.get_cache_entry("c")
+
+    # "b" and "c" are used equally, "b" less recently
+    _, evicted_items = cache.cache("d", "d")
+    assert evicted_items == {"b": "b"}
+
+    # new entries are evicted first unless used
+    _, evicted_items = cache.cache("e", "e")
+    assert evicted_items == {"d": "d"}
+
+    # popping the least frequently used entries does not break eviction
+    cache.pop("e")
+    cache.pop("c")
+    cache.cache("f", "f")
+    cache.cache("g", "g")
+    _, evicted_items = cache.cache("h", "h")
+    assert evicted_items == {"f": "f"}
+    assert set(cache._data) == {"a", "g", "h"}
+
+
+def test_simple_cache_invalid_eviction_policy():
+    with pytest.raises(Web3ValueError, match="Unknown eviction policy"):
+        SimpleCache(3, eviction_policy="fifo")
+
+
+def test_simple_cache_ttl(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr("web3.utils.caching.time.monotonic", lambda: now)
+
+    cache = SimpleCache(2, ttl=10)
+    cache.cache("default", 1)
+    cache.cache("short", 2, ttl=1)
+    cache.cache("short", 2, ttl=1)
+
+    now = 101.0
+    assert cache.get_cache_entry("short") is None
+    assert "short" not in cache
+    assert cache.get_cache_entry("default") == 1
+
+    # expired entries are evicted before live ones to make room
+    cache.cache("other", 3)
+    now = 112.0
+    _, evicted_items = cache.cache("new", 4)
+    assert evicted_items == {"default": 1}
+    assert cache.stats.expirations == 1
+
+
+def test_simple_cache_expiry_order(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr("web3.utils.caching.time.monotonic", lambda: now)
+
+    cache = SimpleCache(3)
+    cache.cache("a", 1, ttl=5)
+    cache.cache("b", 2, ttl=1)
+    # re-caching "b" leaves its first expiry time behind, which is skipped
+    cache.cache("b", 2, ttl=20)
+    cache.cache("c", 3, ttl=10)
+
+    now = 106.0
+    assert "a" not in cache
+    assert "b" in cache
+    _, evicted_items = cache.cache("d", 4)
+    assert evicted_items == {"a": 1}
+
+    now = 111.0
+    _, evicted_items = cache.cache("e", 5)
+    assert evicted_items == {"c": 3}
+    assert set(key for key, _ in cache.items()) == {"b", "d", "e"}
+
+
+def test_simple_cache_stats():
+    cache = SimpleCache(1)
+    cache.cache("a", 1)
+    cache.get_cache_entry("a")
+    cache.get_cache_entry("a")
+    cache.get_cache_entry("b")
+    cache.cache("b", 2)
+
+    assert cache.stats == CacheStats(hits=2, misses=1, evictions=1, expirations=0)
+    assert cache.stats.hit_rate == 2 / 3
+
+    cache.reset_stats()
+    assert cache.stats == CacheStats(0, 0, 0, 0)
+    assert cache.stats.hit_rate == 0.0
+
+
+@pytest.mark.parametrize("eviction_policy", ("lru", "lfu"))
+def test_simple_cache_is_thread_safe(eviction_policy):
+    cache = SimpleCache(50, eviction_policy=eviction_policy)
+
+    def use_cache(thread_index):
+        for i in range(2000):
+            key = (thread_index * 7 + i) % 80
+            if cache.get_cache_entry(key) is None:
+                cache.cache(key, i)
+            if i % 10 == 0:
+                cache.pop(key)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(use_cache, range(8)))
+
+    assert len(cache) <= 50
+    if eviction_policy == "lfu":
+        assert set(cache._frequencies) == set(cache._data)
+    stats = cache.stats
+    assert stats.hits + stats.misses == 8 * 2000
+
+
+def test_persistent_request_cache_only_caches_final_transactions(
+    request_mocker, sqlite_cache
+):
+    w3 = Web3(BaseProvider())
+    w3.provider.cache_allowed_requests = True
+    w3.provider.request_cache = sqlite_cache
+    head = {"number": hex(100), "hash": BLOCK_HASH, "parentHash": BLOCK_HASH}
+    pending, recent, final = ("0x" + digit * 64 for digit in "123")
+    block_numbers = {pending: None, recent: hex(99), final: "0x1"}
+
+    with request_mocker(
+        w3,
+        mock_results={
+            "eth_getBlockByNumber": head,
+            "eth_getTransactionByHash": lambda _m, params: {
+                "hash": params[0],
+                "blockNumber": block_numbers[params[0]],
+            },
+            "eth_getRawTransactionByHash": "0x02",
+        },
+    ):
+        for transaction_hash in (pending, recent, final):
+            w3.manager.request_blocking("eth_getTransactionByHash", [transaction_hash])
+        w3.manager.request_blocking("eth_getRawTransactionByHash", [final])
+
+    assert ("BaseProvider", "eth_getTransactionByHash", (final,)) in sqlite_cache
+    assert len(sqlite_cache) == 1
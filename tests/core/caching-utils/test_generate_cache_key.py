@@ -1,3 +1,4 @@
+import pytest
 import random
 
 from eth_utils import (
@@ -10,6 +11,10 @@ from hypothesis import (
 
 from web3._utils.caching import (
     generate_cache_key,
+    generate_structural_cache_key,
+)
+from web3.exceptions import (
+    Web3TypeError,
 )
 
 
@@ -42,10 +47,53 @@ def recursive_shuffle_dict(v):
         return v
 
 
+@pytest.mark.parametrize(
+    "cache_key_fn", (generate_cache_key, generate_structural_cache_key)
+)
 @given(value=all_st)
-def test_key_generation_is_deterministic(value):
+def test_key_generation_is_deterministic(cache_key_fn, value):
     left = recursive_shuffle_dict(value)
     right = recursive_shuffle_dict(value)
-    left_key = generate_cache_key(left)
-    right_key = generate_cache_key(right)
+    left_key = cache_key_fn(left)
+    right_key = cache_key_fn(right)
     assert left_key == right_key
+
+
+@pytest.mark.parametrize("value", ("0x1", b"\x01", None))
+def test_structural_key_uses_ids_directly(value):
+    assert generate_structural_cache_key(value) == value
+
+
+@pytest.mark.parametrize(
+    "cache_key_fn", (generate_cache_key, generate_structural_cache_key)
+)
+@pytest.mark.parametrize("request_id", (0, 1, 12345))
+def test_key_of_request_id_matches_its_text(cache_key_fn, request_id):
+    # nodes may echo numeric request ids as strings
+    assert cache_key_fn(request_id) == cache_key_fn(str(request_id))
+
+
+@pytest.mark.parametrize(
+    "left,right",
+    (
+        ([True], [1]),
+        ([1.0], [1]),
+        ([0], [False]),
+        ({"a": 1}, [("a", 1)]),
+        (("eth_getBlockByNumber", ["0x1", True]), ("eth_getBlockByNumber", ["0x1"])),
+        (("eth_getBalance", ["0x1", "latest"]), ("eth_getBalance", ["0x1", "0x1"])),
+    ),
+)
+def test_structural_key_distinguishes_requests(left, right):
+    assert generate_structural_cache_key(left) != generate_structural_cache_key(right)
+
+
+def test_structural_key_treats_lists_and_tuples_alike():
+    assert generate_structural_cache_key(
+        ("eth_chainId", [])
+    ) == generate_structural_cache_key(["eth_chainId", ()])
+
+
+def test_structural_key_raises_for_unsupported_types():
+    with pytest.raises(Web3TypeError):
+        generate_structural_cache_key(object())
@@ -11,6 +11,7 @@ from web3 import (
 )
 from web3._utils.caching import (
     generate_cache_key,
+    generate_structural_cache_key,
 )
 from web3.exceptions import (
     Web3RPCError,
@@ -30,7 +31,7 @@ from web3.utils import (
 def simple_cache_return_value_a():
     _cache = SimpleCache()
     _cache.cache(
-        generate_cache_key(f"{threading.get_ident()}:{('fake_endpoint', [1])}"),
+        generate_structural_cache_key((threading.get_ident(), "fake_endpoint", [1])),
         {"jsonrpc": "2.0", "id": 0, "result": "value-a"},
     )
     return _cache
@@ -107,6 +108,16 @@ def test_request_caching_does_not_cache_endpoints_not_in_allowlist(w3):
     assert result_a != result_b
 
 
+def test_request_caching_uses_provider_cache_key_fn(w3):
+    w3.provider.cache_key_fn = generate_cache_key
+
+    result = w3.manager.request_blocking("fake_endpoint", [1])
+    assert w3.manager.request_blocking("fake_endpoint", [1]) == result
+    assert w3.provider._request_cache.items()[0][0] == generate_cache_key(
+        (threading.get_ident(), "fake_endpoint", [1])
+    )
+
+
 def test_caching_requests_does_not_share_state_between_providers(request_mocker):
     w3_a, w3_b, w3_c = (
         Web3(provider=BaseProvider()),
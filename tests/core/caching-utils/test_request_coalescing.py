@@ -0,0 +1,185 @@
+import asyncio
+import pytest
+import threading
+
+from web3 import (
+    AsyncWeb3,
+)
+from web3._utils.caching import (
+    async_handle_request_caching,
+)
+from web3._utils.coalescing import (
+    CoalescingStats,
+)
+from web3.providers.async_base import (
+    AsyncBaseProvider,
+)
+
+
+class SlowAsyncProvider(AsyncBaseProvider):
+    def __init__(self) -> None:
+        super().__init__()
+        self.coalesce_requests = True
+        self.requests_sent = []
+        self.release = asyncio.Event()
+
+    @async_handle_request_caching
+    async def make_request(self, method, params):
+        self.requests_sent.append((method, params))
+        await self.release.wait()
+        if method == "eth_getBalance" and params[0] == "0xbad":
+            raise ValueError("bad request")
+        result = "0x1" if method == "eth_chainId" else f"{method}{params}"
+        return {"jsonrpc": "2.0", "id": 0, "result": result}
+
+
+async def _gather_when_sent(provider, *requests):
+    tasks = [
+        asyncio.ensure_future(provider.make_request(method, params))
+        for method, params in requests
+    ]
+    # let every request reach the provider or an in-flight request
+    await asyncio.sleep(0)
+    provider.release.set()
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_identical_in_flight_requests_are_coalesced():
+    provider = SlowAsyncProvider()
+
+    responses = await _gather_when_sent(
+        provider,
+        *[("eth_chainId", [])] * 5,
+        *[("eth_getBlockByNumber", ["latest", False])] * 3,
+        ("eth_getBlockByNumber", ["0x1", False]),
+    )
+
+    assert provider.requests_sent == [
+        ("eth_chainId", []),
+        ("eth_getBlockByNumber", ["latest", False]),
+        ("eth_getBlockByNumber", ["0x1", False]),
+    ]
+    assert [response["result"] for response in responses] == [
+        *["0x1"] * 5,
+        *["eth_getBlockByNumber['latest', False]"] * 3,
+        "eth_getBlockByNumber['0x1', False]",
+    ]
+    assert provider.request_coalescing_stats == CoalescingStats(requests=3, coalesced=6)
+
+    # requests made once the first has completed are sent again
+    await provider.make_request("eth_chainId", [])
+    assert len(provider.requests_sent) == 4
+    assert provider._request_coalescer._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_requests_are_not_coalesced_unless_enabled_and_read_only():
+    provider = SlowAsyncProvider()
+    await _gather_when_sent(provider, *[("eth_sendRawTransaction", ["0x01"])] * 2)
+    assert len(provider.requests_sent) == 2
+
+    provider = SlowAsyncProvider()
+    provider.coalesce_requests = False
+    await _gather_when_sent(provider, *[("eth_chainId", [])] * 2)
+    assert len(provider.requests_sent) == 2
+    assert provider.request_coalescing_stats == CoalescingStats(0, 0)
+
+
+@pytest.mark.asyncio
+async def test_errors_are_raised_to_every_coalesced_request():
+    provider = SlowAsyncProvider()
+
+    responses = await _gather_when_sent(
+        provider, *[("eth_getBalance", ["0xbad", "latest"])] * 3
+    )
+
+    assert len(provider.requests_sent) == 1
+    assert all(isinstance(response, ValueError) for response in responses)
+    assert provider._request_coalescer._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_coalesced_requests_are_sent_if_the_shared_request_is_cancelled():
+    provider = SlowAsyncProvider()
+
+    first = asyncio.ensure_future(provider.make_request("eth_chainId", []))
+    second = asyncio.ensure_future(provider.make_request("eth_chainId", []))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    provider.release.set()
+
+    assert (await second)["result"] == "0x1"
+    assert first.cancelled()
+    assert len(provider.requests_sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelling_a_coalesced_request_does_not_cancel_the_shared_request():
+    provider = SlowAsyncProvider()
+
+    first = asyncio.ensure_future(provider.make_request("eth_chainId", []))
+    second = asyncio.ensure_future(provider.make_request("eth_chainId", []))
+    await asyncio.sleep(0)
+    second.cancel()
+    await asyncio.sleep(0)
+    provider.release.set()
+
+    assert (await first)["result"] == "0x1"
+    assert second.cancelled()
+    assert len(provider.requests_sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_w3_coalesces_concurrent_calls():
+    async_w3 = AsyncWeb3(SlowAsyncProvider())
+
+    calls = [asyncio.ensure_future(async_w3.eth.chain_id) for _ in range(10)]
+    await asyncio.sleep(0.01)
+    async_w3.provider.release.set()
+    await asyncio.gather(*calls)
+
+    assert async_w3.provider.requests_sent == [("eth_chainId", ())]
+    assert async_w3.provider.request_coalescing_stats.coalesced == 9
+
+
+class SleepingAsyncProvider(AsyncBaseProvider):
+    def __init__(self) -> None:
+        super().__init__()
+        self.coalesce_requests = True
+        self.requests_sent = []
+
+    @async_handle_request_caching
+    async def make_request(self, method, params):
+        self.requests_sent.append((method, params))
+        await asyncio.sleep(0.05)
+        return {"jsonrpc": "2.0", "id": 0, "result": "0x1"}
+
+
+def test_requests_are_only_coalesced_within_their_event_loop():
+    provider = SleepingAsyncProvider()
+    barrier = threading.Barrier(2)
+    results = []
+
+    async def _make_requests():
+        barrier.wait(timeout=5)
+        responses = await asyncio.gather(
+            provider.make_request("eth_chainId", []),
+            provider.make_request("eth_chainId", []),
+        )
+        results.extend(response["result"] for response in responses)
+
+    threads = [
+        threading.Thread(target=asyncio.run, args=(_make_requests(),)) for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == ["0x1"] * 4
+    # one request sent from each event loop
+    assert len(provider.requests_sent) == 2
+    assert provider.request_coalescing_stats == CoalescingStats(requests=2, coalesced=2)
+    assert provider._request_coalescer._in_flight == {}
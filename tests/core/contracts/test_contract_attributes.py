@@ -1,3 +1,4 @@
+import json
 import pytest
 
 from web3.exceptions import (
@@ -41,3 +42,59 @@ def test_hasattr(w3, abi, attribute):
 
     assert hasattr(contract_attribute, "Increased") is True
     assert hasattr(contract_attribute, "Decreased") is False
+
+
+@pytest.mark.parametrize("attribute", ("functions", "events", "caller"))
+def test_attributes_are_built_on_first_access(w3, abi, attribute):
+    contract = w3.eth.contract(address=w3.eth.accounts[0], abi=abi)
+    contract_attribute = getattr(contract, attribute)
+    assert "Increased" not in vars(contract_attribute)
+
+    increased = contract_attribute.Increased
+
+    assert vars(contract_attribute)["Increased"] is increased
+    assert contract_attribute.Increased is increased
+
+
+@pytest.mark.parametrize("attribute", ("functions", "events", "caller"))
+def test_dir_lists_attributes_before_first_access(w3, abi, attribute):
+    contract = w3.eth.contract(address=w3.eth.accounts[0], abi=abi)
+    contract_attribute = getattr(contract, attribute)
+
+    assert "Increased" in dir(contract_attribute)
+    assert "Decreased" not in dir(contract_attribute)
+    assert "Increased" not in vars(contract_attribute)
+
+
+def test_contract_functions_are_shared_by_contract_class(w3, abi):
+    contract_factory = w3.eth.contract(abi=abi)
+    first, second = (contract_factory(account) for account in w3.eth.accounts[:2])
+
+    assert type(first.functions.Increased) is type(second.functions.Increased)
+    assert first.functions.Increased.address == w3.eth.accounts[0]
+    assert second.functions.Increased.address == w3.eth.accounts[1]
+    assert first.caller.Increased.args[0].address == w3.eth.accounts[0]
+    assert contract_factory.functions.Increased.address is None
+    assert first.events.Increased.address == w3.eth.accounts[0]
+    assert second.events.Increased.address == w3.eth.accounts[1]
+
+
+def test_contract_functions_are_shared_by_contracts_of_the_same_abi(w3, abi):
+    contract_abi = json.loads(abi)
+    first, second = (
+        w3.eth.contract(address=account, abi=contract_abi)
+        for account in w3.eth.accounts[:2]
+    )
+    decoding_tuples = w3.eth.contract(
+        address=w3.eth.accounts[0], abi=contract_abi, decode_tuples=True
+    )
+    other_abi = w3.eth.contract(address=w3.eth.accounts[0], abi=json.loads(abi))
+
+    assert type(first.functions.Increased) is type(second.functions.Increased)
+    assert first.functions.Increased.address == w3.eth.accounts[0]
+    assert second.functions.Increased.address == w3.eth.accounts[1]
+    assert type(first.functions.Increased) is not type(
+        decoding_tuples.functions.Increased
+    )
+    assert decoding_tuples.functions.Increased.decode_tuples is True
+    assert type(first.functions.Increased) is not type(other_abi.functions.Increased)
@@ -1,10 +1,32 @@
 import json
 import pytest
 
+from eth_utils import (
+    encode_hex,
+    function_abi_to_4byte_selector,
+)
+from hexbytes import (
+    HexBytes,
+)
+
 from web3 import (
     constants,
 )
+from web3._utils.abi import (
+    get_abi_input_types,
+    map_abi_data,
+)
+from web3._utils.contracts import (
+    get_function_encoder,
+)
+from web3._utils.normalizers import (
+    abi_address_to_hex,
+    abi_bytes_to_bytes,
+    abi_ens_resolver,
+    abi_string_to_text,
+)
 from web3.exceptions import (
+    Web3TypeError,
     Web3ValidationError,
 )
 
@@ -197,3 +219,78 @@ def test_contract_abi_encoding_strict(w3, abi, arguments, data, expected):
     contract = w3.eth.contract(abi=abi)
     actual = contract.encode_abi("a", arguments, data=data)
     assert actual == expected
+
+
+ABI_E = [
+    {
+        "type": "function",
+        "name": "e",
+        "inputs": [
+            {"name": "to", "type": "address"},
+            {"name": "data", "type": "bytes"},
+            {"name": "key", "type": "bytes32"},
+            {"name": "note", "type": "string"},
+            {"name": "recipients", "type": "address[]"},
+            {
+                "name": "order",
+                "type": "tuple",
+                "components": [
+                    {"name": "maker", "type": "address"},
+                    {"name": "salt", "type": "bytes4"},
+                    {"name": "amounts", "type": "uint256[]"},
+                ],
+            },
+        ],
+        "outputs": [],
+    }
+]
+
+
+def _generic_encode_abi(w3, abi, arguments):
+    # the normalization and encoding of arguments without a compiled encoder
+    argument_types = get_abi_input_types(abi)
+    normalizers = [
+        abi_address_to_hex,
+        abi_bytes_to_bytes,
+        abi_string_to_text,
+        abi_ens_resolver(w3),
+    ]
+    return encode_hex(
+        function_abi_to_4byte_selector(abi)
+        + w3.codec.encode(
+            argument_types, map_abi_data(normalizers, argument_types, arguments)
+        )
+    )
+
+
+def test_contract_abi_encoding_matches_generic_encoding(w3):
+    address = w3.to_checksum_address("0x" + "ab" * 20)
+    arguments = [
+        address,
+        "0x1234",
+        f"0x{'cd' * 32}",
+        "café",
+        [address, w3.to_checksum_address("0x" + "12" * 20)],
+        (HexBytes(address), "0x01020304", [1, 2]),
+    ]
+    contract = w3.eth.contract(abi=ABI_E)
+
+    assert contract.encode_abi("e", arguments) == _generic_encode_abi(
+        w3, ABI_E[0], arguments
+    )
+    assert contract.encode_abi("e", arguments, data="0x1234")[:6] == "0x1234"
+
+
+def test_function_encoder_is_compiled_once_per_abi_and_codec(w3):
+    encoder = get_function_encoder(w3.codec, ABI_B[0])
+
+    assert get_function_encoder(w3.codec, ABI_B[0]) is encoder
+    assert encoder.selector == bytes.fromhex("f0fdf834")
+    assert encoder.encode_call(w3, [1]) == f"0xf0fdf834{'00' * 31}01"
+    assert not encoder.can_encode(["not a number"])
+    with pytest.raises(Web3TypeError, match="Expected types are: uint256"):
+        encoder.encode_arguments(w3, ["not a number"])
+
+    # toggling strict bytes checking swaps the codec, encoded by its own registry
+    w3.strict_bytes_type_checking = False
+    assert get_function_encoder(w3.codec, ABI_B[0]) is not encoder
@@ -202,3 +202,61 @@ def test_strict_finds_function_with_matching_args(w3, arguments, expected_types)
     assert abi["name"] == "a"
     assert len(abi["inputs"]) == len(expected_types)
     assert get_abi_input_types(abi) == expected_types
+
+
+@pytest.mark.parametrize(
+    "arguments,expected_types",
+    (
+        ([], []),
+        ([1234567890], ["uint256"]),
+        ([-1], ["int8"]),
+        ([[(-1, True), (2, False)]], ["(int256,bool)[]"]),
+    ),
+)
+def test_function_abi_resolver_matches_find_matching_fn_abi(
+    w3, arguments, expected_types
+):
+    Contract = w3.eth.contract(abi=MULTIPLE_FUNCTIONS)
+    resolver = Contract._get_function_abi_resolver()
+
+    fn_abi, checked = resolver.resolve(w3.codec, "a", arguments)
+
+    assert fn_abi == Contract._find_matching_fn_abi("a", arguments)
+    assert get_abi_input_types(fn_abi) == expected_types
+    # only overloads are checked against the arguments
+    assert checked is (len(arguments) == 1)
+
+
+def test_function_abi_resolver_raises_resolution_errors(w3):
+    Contract = w3.eth.contract(abi=MULTIPLE_FUNCTIONS)
+    resolver = Contract._get_function_abi_resolver()
+
+    with pytest.raises(Web3ValidationError, match="Ambiguous argument encoding"):
+        resolver.resolve(w3.codec, "a", [100])
+    with pytest.raises(Web3ValidationError, match="improper number of arguments"):
+        resolver.resolve(w3.codec, "a", [1, 2])
+
+
+def test_function_abi_resolver_is_shared_by_the_contract_class(w3):
+    Contract = w3.eth.contract(abi=MULTIPLE_FUNCTIONS)
+    address = "0x" + "00" * 19 + "01"
+    contract, other_contract = Contract(address), Contract(address)
+    resolver = Contract._get_function_abi_resolver()
+
+    contract.functions.a(1234567890)
+    other_contract.caller.a
+    assert contract.functions.a._function_abi_resolver is resolver
+    assert other_contract.functions.a._function_abi_resolver is resolver
+    assert other_contract.caller._function_abi_resolver is resolver
+    assert resolver.candidates("a", 1) is resolver.candidates("a", 1)
+
+
+def test_unchecked_arguments_raise_resolution_errors_when_encoded(w3):
+    Contract = w3.eth.contract(abi=SINGLE_FN_ONE_ARG)
+    address = "0x" + "00" * 19 + "01"
+
+    function = Contract(address).functions.a("not a number")
+    with pytest.raises(Web3ValidationError, match="no matching argument types"):
+        function.build_transaction({"gas": 21000, "gasPrice": 1, "nonce": 0})
+    with pytest.raises(Web3ValidationError, match="no matching argument types"):
+        Contract.encode_abi("a", args=["not a number"])
@@ -0,0 +1,202 @@
+import pytest
+
+from hexbytes import (
+    HexBytes,
+)
+import pytest_asyncio
+
+from tests.core.contracts.utils import (
+    async_deploy,
+    deploy,
+)
+from web3._utils.contract_sources.contract_data.multicall3 import (
+    MULTICALL3_DATA,
+)
+from web3.contract import (
+    AsyncMulticall,
+    Multicall,
+)
+from web3.exceptions import (
+    BadFunctionCallOutput,
+    ContractCustomError,
+    ContractLogicError,
+    Web3RPCError,
+    Web3ValueError,
+)
+from web3.middleware import (
+    Web3Middleware,
+)
+
+
+@pytest.fixture
+def multicall3(w3):
+    return deploy(w3, w3.eth.contract(**MULTICALL3_DATA))
+
+
+@pytest_asyncio.fixture
+async def async_multicall3(async_w3):
+    return await async_deploy(async_w3, async_w3.eth.contract(**MULTICALL3_DATA))
+
+
+def _count_eth_calls(w3):
+    eth_calls = []
+
+    class EthCallCounter(Web3Middleware):
+        def request_processor(self, method, params):
+            if method == "eth_call":
+                eth_calls.append(params)
+            return method, params
+
+    w3.middleware_onion.add(EthCallCounter)
+    return eth_calls
+
+
+def test_multicall_returns_the_values_of_the_calls(
+    w3, multicall3, math_contract, string_contract, tuple_contract
+):
+    tuple_input = {"a": 1, "b": [2, 3], "c": [{"x": 4, "y": [True, False], "z": []}]}
+    functions = [
+        math_contract.functions.multiply7(3),
+        math_contract.functions.add(2, 5),
+        string_contract.functions.getValue(),
+        tuple_contract.functions.method(tuple_input),
+        math_contract.functions.counter(),
+    ]
+    expected = [function.call() for function in functions]
+    eth_calls = _count_eth_calls(w3)
+
+    results = Multicall(w3, multicall3.address).call(functions)
+
+    assert [result.value for result in results] == expected
+    assert all(result.success and result.error is None for result in results)
+    assert len(eth_calls) == 1
+
+
+def test_multicall_reports_failed_calls(w3, multicall3, math_contract, revert_contract):
+    empty_contract = math_contract.factory(w3)(address=w3.eth.accounts[1])
+    eth_calls = _count_eth_calls(w3)
+
+    results = Multicall(w3, multicall3.address).call(
+        [
+            revert_contract.functions.revertWithMessage(),
+            math_contract.functions.multiply7(3),
+            revert_contract.functions.customErrorWithoutMessage(),
+            revert_contract.functions.revertWithoutMessage(),
+            empty_contract.functions.multiply7(3),
+            revert_contract.functions.normalFunction(),
+        ]
+    )
+
+    assert [result.success for result in results] == [
+        False,
+        True,
+        False,
+        False,
+        False,
+        True,
+    ]
+    assert results[1].value == 21
+    assert results[5].value is True
+    assert isinstance(results[0].error, ContractLogicError)
+    assert results[0].error.message == "execution reverted: Function has been reverted."
+    assert isinstance(results[2].error, ContractCustomError)
+    assert isinstance(results[3].error, ContractLogicError)
+    assert isinstance(results[4].error, BadFunctionCallOutput)
+    # calls failing on their own are not retried
+    assert len(eth_calls) == 1
+
+
+def test_multicall_retries_calls_failing_without_revert_data_given_gas(
+    w3, multicall3, math_contract, revert_contract
+):
+    eth_calls = _count_eth_calls(w3)
+
+    results = Multicall(w3, multicall3.address, gas=10_000_000).call(
+        [
+            math_contract.functions.multiply7(3),
+            revert_contract.functions.revertWithoutMessage(),
+        ]
+    )
+
+    assert [result.success for result in results] == [True, False]
+    # the call failing without revert data may have run out of gas, so it is retried
+    assert len(eth_calls) == 2
+
+
+def test_multicall_splits_calls_by_calldata_size(w3, multicall3, math_contract):
+    functions = [math_contract.functions.multiply7(i) for i in range(10)]
+    eth_calls = _count_eth_calls(w3)
+
+    # 36 bytes of calldata and 192 bytes of encoding for each call
+    results = Multicall(w3, multicall3.address, max_calldata_size=3 * 228).call(
+        functions
+    )
+
+    assert [result.value for result in results] == [7 * i for i in range(10)]
+    assert len(eth_calls) == 4
+
+
+def test_multicall_calls_all_batches_at_the_same_block(w3, multicall3, math_contract):
+    functions = [math_contract.functions.multiply7(i) for i in range(10)]
+    eth_calls = _count_eth_calls(w3)
+
+    Multicall(w3, multicall3.address, max_calldata_size=3 * 228).call(functions)
+
+    assert len(eth_calls) == 4
+    assert {params[1] for params in eth_calls} == {hex(w3.eth.block_number)}
+
+
+def test_multicall_retries_failed_batches_in_smaller_batches(
+    w3, multicall3, math_contract
+):
+    functions = [math_contract.functions.multiply7(i) for i in range(8)]
+    calls_per_batch = []
+
+    class GasCap(Web3Middleware):
+        # fails ``eth_call`` requests making more than 3 calls, as a node would fail
+        # those exceeding its gas cap
+        def request_processor(self, method, params):
+            if method == "eth_call":
+                calldata = HexBytes(params[0]["data"])
+                num_calls = int.from_bytes(calldata[36:68], "big")
+                calls_per_batch.append(num_calls)
+                if num_calls > 3:
+                    raise Web3RPCError("out of gas")
+            return method, params
+
+    w3.middleware_onion.add(GasCap)
+
+    results = Multicall(w3, multicall3.address).call(functions)
+
+    assert [result.value for result in results] == [7 * i for i in range(8)]
+    assert calls_per_batch == [8, 4, 2, 2, 4, 2, 2]
+
+
+def test_multicall_requires_bound_functions(w3, multicall3, math_contract):
+    multicall = Multicall(w3, multicall3.address)
+
+    with pytest.raises(Web3ValueError, match="arguments"):
+        multicall.call([math_contract.functions.multiply7])
+    with pytest.raises(Web3ValueError, match="address"):
+        multicall.call([math_contract.factory(w3).functions.multiply7(3)])
+    with pytest.raises(Web3ValueError):
+        Multicall(w3, multicall3.address, max_calldata_size=0)
+
+
+@pytest.mark.asyncio
+async def test_async_multicall_returns_the_values_of_the_calls(
+    async_w3, async_multicall3, async_math_contract, async_revert_contract
+):
+    results = await AsyncMulticall(
+        async_w3, async_multicall3.address, max_calldata_size=300
+    ).call(
+        [
+            async_math_contract.functions.multiply7(3),
+            async_revert_contract.functions.revertWithMessage(),
+            async_math_contract.functions.add(2, 5),
+        ]
+    )
+
+    assert [result.value for result in results] == [21, None, 7]
+    assert [result.success for result in results] == [True, False, True]
+    assert isinstance(results[1].error, ContractLogicError)
@@ -1233,3 +1233,56 @@ def test_get_all_entries_with_nested_tuple_event_non_strict(
     assert log_entry.blockNumber == txn_receipt["blockNumber"]
     assert log_entry.transactionIndex == txn_receipt["transactionIndex"]
     assert is_same_address(log_entry.address, non_strict_emitter.address)
+
+
+@pytest.mark.parametrize(
+    "contract_fn,event_name,call_args,expected_args",
+    (
+        ("logNoArgs", "LogNoArguments", [], {}),
+        ("logSingle", "LogSingleWithIndex", [12345], {"arg0": 12345}),
+        ("logDouble", "LogDoubleArg", [12345, 54321], {"arg0": 12345, "arg1": 54321}),
+        (
+            "logTriple",
+            "LogTripleWithIndex",
+            [12345, 54321, 98765],
+            {"arg0": 12345, "arg1": 54321, "arg2": 98765},
+        ),
+    ),
+)
+def test_contract_events_process_receipt(
+    w3,
+    emitter,
+    wait_for_transaction,
+    emitter_contract_event_ids,
+    contract_fn,
+    event_name,
+    call_args,
+    expected_args,
+):
+    event_id = getattr(emitter_contract_event_ids, event_name)
+    txn_hash = emitter.functions[contract_fn](event_id, *call_args).transact()
+    txn_receipt = wait_for_transaction(w3, txn_hash)
+
+    processed_logs = emitter.events.process_receipt(txn_receipt)
+    assert len(processed_logs) == 1
+    assert processed_logs[0].event == event_name
+    assert processed_logs[0].args == expected_args
+    assert emitter.events.process_log(txn_receipt["logs"][0]) == processed_logs[0]
+    assert processed_logs == emitter.events[event_name]().process_receipt(txn_receipt)
+
+
+def test_contract_events_process_receipt_with_unknown_logs(
+    indexed_event_contract, dup_txn_receipt
+):
+    # the first log is for a ``LogSingleWithIndex`` event with no indexed arguments,
+    # which matches no event in the ABI
+    with pytest.warns(UserWarning, match="did not match any of the event ABIs"):
+        processed_logs = indexed_event_contract.events.process_receipt(dup_txn_receipt)
+    assert [log.event for log in processed_logs] == ["LogSingleArg"]
+
+    processed_logs = indexed_event_contract.events.process_receipt(
+        dup_txn_receipt, errors=IGNORE
+    )
+    assert len(processed_logs) == 2
+    assert "errors" in processed_logs[0]
+    assert processed_logs[1].args == {"arg0": 12345}
@@ -0,0 +1,236 @@
+import asyncio
+import pytest
+import threading
+import time
+
+from web3 import (
+    AsyncWeb3,
+    Web3,
+)
+from web3.exceptions import (
+    Web3RPCError,
+    Web3ValueError,
+)
+from web3.providers.async_base import (
+    AsyncBaseProvider,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+
+NUM_TRANSACTIONS = 7
+
+
+def _transaction_hash(index):
+    return "0x" + f"{index:064x}"
+
+
+def _receipt(index):
+    return {
+        "blockHash": "0x" + "45" * 32,
+        "blockNumber": "0x1",
+        "transactionHash": _transaction_hash(index),
+        "transactionIndex": hex(index),
+        "status": "0x1",
+        "logs": [],
+    }
+
+
+class ReceiptsProvider:
+    """
+    Serves a block of ``NUM_TRANSACTIONS`` transactions and their receipts, rejecting
+    ``eth_getBlockReceipts`` requests with ``block_receipts_error`` if set.
+    """
+
+    def __init__(self, block_receipts_error=None):
+        super().__init__()
+        self.block_receipts_error = block_receipts_error
+        self.requests = []
+        self.batch_sizes = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _result(self, method, params):
+        self.requests.append(method)
+        if method == "eth_getBlockReceipts":
+            if self.block_receipts_error is not None:
+                return {"error": self.block_receipts_error}
+            return {"result": [_receipt(i) for i in range(NUM_TRANSACTIONS)]}
+        elif method == "eth_getBlockByNumber":
+            return {
+                "result": {
+                    "number": "0x1",
+                    "transactions": [
+                        _transaction_hash(i) for i in range(NUM_TRANSACTIONS)
+                    ],
+                }
+            }
+        elif method == "eth_getTransactionReceipt":
+            return {"result": _receipt(int(params[0], 16))}
+        raise NotImplementedError(f"Cannot make request for {method}:{params}")
+
+    def _response(self, method, params):
+        return {"jsonrpc": "2.0", "id": 0, **self._result(method, params)}
+
+    def _start_request(self):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _end_request(self, method, params):
+        with self._lock:
+            self.in_flight -= 1
+            return self._response(method, params)
+
+
+class SyncReceiptsProvider(ReceiptsProvider, BaseProvider):
+    def make_request(self, method, params):
+        self._start_request()
+        time.sleep(0.01)
+        return self._end_request(method, params)
+
+
+class SyncBatchReceiptsProvider(SyncReceiptsProvider):
+    def make_batch_request(self, requests):
+        self.batch_sizes.append(len(requests))
+        return [self._response(method, params) for method, params in requests]
+
+
+class AsyncReceiptsProvider(ReceiptsProvider, AsyncBaseProvider):
+    async def make_request(self, method, params):
+        self._start_request()
+        await asyncio.sleep(0.01)
+        return self._end_request(method, params)
+
+
+METHOD_NOT_FOUND = {"code": -32601, "message": "the method does not exist"}
+
+
+def _transaction_indexes(receipts):
+    return [receipt["transactionIndex"] for receipt in receipts]
+
+
+def test_get_block_receipts_with_fallback_uses_block_receipts():
+    provider = SyncReceiptsProvider()
+    w3 = Web3(provider)
+
+    receipts = w3.eth.get_block_receipts_with_fallback(1)
+
+    assert _transaction_indexes(receipts) == list(range(NUM_TRANSACTIONS))
+    assert provider.requests == ["eth_getBlockReceipts"]
+
+
+@pytest.mark.parametrize(
+    "error",
+    (
+        METHOD_NOT_FOUND,
+        {"code": -32004, "message": "Method not supported"},
+        {"code": -32000, "message": "eth_getBlockReceipts is not supported"},
+    ),
+)
+def test_get_block_receipts_with_fallback_fans_out_requests(error):
+    provider = SyncReceiptsProvider(block_receipts_error=error)
+    w3 = Web3(provider)
+
+    receipts = w3.eth.get_block_receipts_with_fallback(1, max_concurrent_requests=3)
+
+    assert _transaction_indexes(receipts) == list(range(NUM_TRANSACTIONS))
+    assert provider.max_in_flight == 3
+    assert provider.requests.count("eth_getTransactionReceipt") == NUM_TRANSACTIONS
+
+    # the provider is not probed again
+    provider.requests.clear()
+    w3.eth.get_block_receipts_with_fallback(1)
+    assert "eth_getBlockReceipts" not in provider.requests
+
+
+def test_get_block_receipts_with_fallback_reuses_threads_between_calls():
+    provider = SyncReceiptsProvider(block_receipts_error=METHOD_NOT_FOUND)
+    w3 = Web3(provider)
+    w3.eth.get_block_receipts_with_fallback(1, max_concurrent_requests=3)
+    # let the threads of the pool become idle
+    time.sleep(0.05)
+    threads = set(threading.enumerate())
+
+    receipts = w3.eth.get_block_receipts_with_fallback(1, max_concurrent_requests=3)
+
+    assert _transaction_indexes(receipts) == list(range(NUM_TRANSACTIONS))
+    assert provider.max_in_flight == 3
+    assert set(threading.enumerate()) <= threads
+
+
+def test_get_block_receipts_with_fallback_batches_requests():
+    provider = SyncBatchReceiptsProvider(block_receipts_error=METHOD_NOT_FOUND)
+    w3 = Web3(provider)
+
+    receipts = w3.eth.get_block_receipts_with_fallback(1, batch_size=3)
+
+    assert _transaction_indexes(receipts) == list(range(NUM_TRANSACTIONS))
+    assert provider.batch_sizes == [3, 3, 1]
+
+
+@pytest.mark.parametrize(
+    "message",
+    ("header not found", "historical state not available", "tracing not supported"),
+)
+def test_get_block_receipts_with_fallback_raises_other_errors(message):
+    provider = SyncReceiptsProvider(
+        block_receipts_error={"code": -32000, "message": message}
+    )
+    w3 = Web3(provider)
+
+    with pytest.raises(Web3RPCError, match=message):
+        w3.eth.get_block_receipts_with_fallback(1)
+    provider.block_receipts_error = None
+    assert len(w3.eth.get_block_receipts_with_fallback(1)) == NUM_TRANSACTIONS
+
+
+def test_get_block_receipts_with_fallback_validates_limits():
+    w3 = Web3(SyncReceiptsProvider())
+
+    with pytest.raises(Web3ValueError):
+        w3.eth.get_block_receipts_with_fallback(1, batch_size=0)
+
+
+def test_get_block_receipts_with_fallback_against_eth_tester(w3):
+    # eth-tester doesn't support ``eth_getBlockReceipts``
+    transaction_hashes = [
+        w3.eth.send_transaction(
+            {"from": w3.eth.accounts[0], "to": w3.eth.accounts[1], "value": value}
+        )
+        for value in range(1, 3)
+    ]
+    block_number = w3.eth.get_transaction_receipt(transaction_hashes[-1])["blockNumber"]
+
+    receipts = w3.eth.get_block_receipts_with_fallback(block_number)
+
+    assert receipts == [w3.eth.get_transaction_receipt(transaction_hashes[-1])]
+
+
+@pytest.mark.asyncio
+async def test_async_get_block_receipts_with_fallback_uses_block_receipts():
+    provider = AsyncReceiptsProvider()
+    async_w3 = AsyncWeb3(provider)
+
+    receipts = await async_w3.eth.get_block_receipts_with_fallback(1)
+
+    assert _transaction_indexes(receipts) == list(range(NUM_TRANSACTIONS))
+    assert provider.requests == ["eth_getBlockReceipts"]
+
+
+@pytest.mark.asyncio
+async def test_async_get_block_receipts_with_fallback_fans_out_requests():
+    provider = AsyncReceiptsProvider(block_receipts_error=METHOD_NOT_FOUND)
+    async_w3 = AsyncWeb3(provider)
+
+    receipts = await async_w3.eth.get_block_receipts_with_fallback(
+        1, max_concurrent_requests=3
+    )
+
+    assert _transaction_indexes(receipts) == list(range(NUM_TRANSACTIONS))
+    assert provider.max_in_flight == 3
+
+    provider.requests.clear()
+    await async_w3.eth.get_block_receipts_with_fallback(1)
+    assert "eth_getBlockReceipts" not in provider.requests
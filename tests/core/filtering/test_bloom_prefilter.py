@@ -0,0 +1,77 @@
+import pytest
+
+from web3 import (
+    EthereumTesterProvider,
+    Web3,
+)
+from web3._utils.bloom import (
+    LogsBloomFilter,
+    block_runs,
+)
+from web3.middleware import (
+    LocalFilterMiddleware,
+)
+
+OTHER_ADDRESS = Web3.to_checksum_address("0x" + "cd" * 20)
+
+
+@pytest.fixture
+def w3():
+    w3 = Web3(EthereumTesterProvider())
+    w3.middleware_onion.add(LocalFilterMiddleware.build(bloom_prefilter=True))
+    return w3
+
+
+def test_logs_bloom_filter_matches_the_blooms_of_blocks_with_logs(
+    w3, emitter, emitter_contract_event_ids
+):
+    event_id = emitter_contract_event_ids.LogTripleWithIndex
+    tx_hash = emitter.functions.logTriple(event_id, 1, 2, 3).transact()
+    receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
+    log = receipt["logs"][0]
+    block = w3.eth.get_block(receipt["blockNumber"])
+    empty_block = w3.eth.get_block(receipt["blockNumber"] - 1)
+
+    assert LogsBloomFilter(emitter.address).may_match(block["logsBloom"])
+    assert LogsBloomFilter(emitter.address, log["topics"]).may_match(block["logsBloom"])
+    assert LogsBloomFilter(
+        [OTHER_ADDRESS, emitter.address], [None, [bytes(32), log["topics"][1]]]
+    ).may_match(block["logsBloom"])
+
+    assert not LogsBloomFilter(emitter.address).may_match(empty_block["logsBloom"])
+    assert not LogsBloomFilter(OTHER_ADDRESS).may_match(block["logsBloom"])
+    assert not LogsBloomFilter(emitter.address, [None, bytes(32)]).may_match(
+        block["logsBloom"]
+    )
+    assert LogsBloomFilter().matches_all
+    assert LogsBloomFilter(None, [None, []]).may_match(empty_block["logsBloom"])
+
+
+def test_bloom_prefiltered_log_filter_returns_matching_logs(
+    w3, emitter, emitter_contract_event_ids
+):
+    event_id = emitter_contract_event_ids.LogTripleWithIndex
+    from_block = w3.eth.block_number + 1
+    for arg1 in range(3):
+        emitter.functions.logTriple(event_id, 1, arg1, 1).transact()
+        emitter.functions.logNoArgs(
+            emitter_contract_event_ids.LogNoArguments
+        ).transact()
+
+    event_filter = emitter.events.LogTripleWithIndex.create_filter(
+        from_block=from_block
+    )
+    assert [event.args.arg1 for event in event_filter.get_all_entries()] == [0, 1, 2]
+
+    other_filter = w3.eth.filter({"fromBlock": from_block, "address": OTHER_ADDRESS})
+    assert other_filter.get_all_entries() == []
+
+
+def test_block_runs():
+    assert block_runs([1, 2, 3, 5, 6, 9], max_blocks=2) == [
+        (1, 2),
+        (3, 3),
+        (5, 6),
+        (9, 9),
+    ]
+    assert block_runs([], max_blocks=2) == []
@@ -0,0 +1,184 @@
+import asyncio
+import pytest
+
+from hexbytes import (
+    HexBytes,
+)
+
+from web3.exceptions import (
+    Web3ValueError,
+)
+from web3.utils import (
+    EventCheckpoint,
+    SimpleCache,
+    get_checkpoint,
+    set_checkpoint,
+)
+
+
+async def _log_triples(async_emitter, event_id, *arg1s):
+    for arg1 in arg1s:
+        await async_emitter.functions.logTriple(event_id, 1, arg1, 1).transact()
+
+
+async def _collect(stream):
+    return [event.args.arg1 async for event in stream]
+
+
+def _checkpoint_key(async_emitter):
+    return f"{async_emitter.address}:LogTripleWithIndex(uint256,uint256,uint256)"
+
+
+@pytest.mark.asyncio
+async def test_async_contract_event_stream_over_block_range(
+    async_w3, async_emitter, emitter_contract_event_ids
+):
+    await _log_triples(
+        async_emitter, emitter_contract_event_ids.LogTripleWithIndex, 1, 2, 3
+    )
+    latest_block = await async_w3.eth.block_number
+
+    stream = async_emitter.events.LogTripleWithIndex.stream(
+        from_block=1, to_block=latest_block
+    )
+    assert await _collect(stream) == [1, 2, 3]
+
+    # with argument filters, up to the block before the last event
+    stream = async_emitter.events.LogTripleWithIndex.stream(
+        from_block=1,
+        to_block=latest_block - 1,
+        argument_filters={"arg1": [1, 2, 3]},
+    )
+    assert await _collect(stream) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_async_contract_event_stream_waits_for_confirmations(
+    async_w3, async_emitter, emitter_contract_event_ids
+):
+    event_id = emitter_contract_event_ids.LogTripleWithIndex
+    await _log_triples(async_emitter, event_id, 1)
+    latest_block = await async_w3.eth.block_number
+
+    stream_task = asyncio.ensure_future(
+        _collect(
+            async_emitter.events.LogTripleWithIndex.stream(
+                from_block=1,
+                to_block=latest_block + 1,
+                confirmations=1,
+                poll_interval=0.01,
+            )
+        )
+    )
+    await asyncio.sleep(0.1)
+    assert not stream_task.done()
+
+    # mine the last block of the range, and a block on top of it
+    await _log_triples(async_emitter, event_id, 2, 3)
+    assert await asyncio.wait_for(stream_task, 10) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_async_contract_event_stream_resumes_from_checkpoint(
+    async_w3, async_emitter, emitter_contract_event_ids
+):
+    event_id = emitter_contract_event_ids.LogTripleWithIndex
+    checkpoint_store = SimpleCache()
+    await _log_triples(async_emitter, event_id, 1, 2)
+    latest_block = await async_w3.eth.block_number
+
+    stream = async_emitter.events.LogTripleWithIndex.stream(
+        from_block=1, to_block=latest_block, checkpoint_store=checkpoint_store
+    )
+    assert await _collect(stream) == [1, 2]
+    block = await async_w3.eth.get_block(latest_block)
+    assert get_checkpoint(
+        checkpoint_store, _checkpoint_key(async_emitter)
+    ) == EventCheckpoint(latest_block, block["hash"])
+
+    await _log_triples(async_emitter, event_id, 3)
+    stream = async_emitter.events.LogTripleWithIndex.stream(
+        from_block=1,
+        to_block=await async_w3.eth.block_number,
+        checkpoint_store=checkpoint_store,
+    )
+    assert await _collect(stream) == [3]
+
+
+@pytest.mark.asyncio
+async def test_async_contract_event_stream_requests_replaced_ranges_again(
+    async_w3, async_emitter, emitter_contract_event_ids, monkeypatch
+):
+    checkpoint_store = SimpleCache()
+    await _log_triples(
+        async_emitter, emitter_contract_event_ids.LogTripleWithIndex, 1, 2
+    )
+    latest_block = await async_w3.eth.block_number
+    block = await async_w3.eth.get_block(latest_block)
+    get_block = async_w3.eth.get_block
+    replaced = []
+
+    async def get_replaced_block(block_identifier, *args):
+        # the last block is replaced after its header is fetched, the first time
+        result = await get_block(block_identifier, *args)
+        if block_identifier == latest_block and not replaced:
+            replaced.append(block_identifier)
+            return {**result, "hash": HexBytes(bytes(32))}
+        return result
+
+    monkeypatch.setattr(async_w3.eth, "get_block", get_replaced_block)
+    stream = async_emitter.events.LogTripleWithIndex.stream(
+        from_block=latest_block - 1,
+        to_block=latest_block,
+        checkpoint_store=checkpoint_store,
+    )
+
+    assert await _collect(stream) == [1, 2]
+    assert replaced == [latest_block]
+    assert get_checkpoint(
+        checkpoint_store, _checkpoint_key(async_emitter)
+    ) == EventCheckpoint(latest_block, block["hash"])
+
+
+@pytest.mark.asyncio
+async def test_async_contract_event_stream_checkpoints_processed_ranges_only(
+    async_w3, async_emitter, emitter_contract_event_ids
+):
+    checkpoint_store = SimpleCache()
+    await _log_triples(
+        async_emitter, emitter_contract_event_ids.LogTripleWithIndex, 1, 2
+    )
+
+    async for _event in async_emitter.events.LogTripleWithIndex.stream(
+        from_block=1,
+        to_block=await async_w3.eth.block_number,
+        checkpoint_store=checkpoint_store,
+    ):
+        break
+
+    assert get_checkpoint(checkpoint_store, _checkpoint_key(async_emitter)) is None
+
+
+@pytest.mark.asyncio
+async def test_async_contract_event_stream_rejects_reorganized_checkpoint(
+    async_w3, async_emitter
+):
+    checkpoint_store = SimpleCache()
+    set_checkpoint(
+        checkpoint_store,
+        "checkpoint",
+        EventCheckpoint(1, HexBytes(bytes(32))),
+    )
+
+    with pytest.raises(Web3ValueError, match="no longer part of the chain"):
+        await _collect(
+            async_emitter.events.LogTripleWithIndex.stream(
+                checkpoint_store=checkpoint_store, checkpoint_key="checkpoint"
+            )
+        )
+
+
+@pytest.mark.asyncio
+async def test_async_contract_event_stream_validates_confirmations(async_emitter):
+    with pytest.raises(Web3ValueError, match="confirmations must not be negative"):
+        await _collect(async_emitter.events.LogTripleWithIndex.stream(confirmations=-1))
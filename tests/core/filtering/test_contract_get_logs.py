@@ -6,6 +6,10 @@ from web3._utils.contract_sources.contract_data._custom_contract_data import (
 from web3.exceptions import (
     Web3ValidationError,
 )
+from web3.utils import (
+    AsyncLogScanner,
+    LogScanner,
+)
 
 
 def test_contract_get_available_events(
@@ -185,6 +189,40 @@ def test_get_logs_argument_filters_key_validation(
         )
 
 
+def test_contract_scan_logs(w3, emitter, emitter_contract_event_ids):
+    event_id = emitter_contract_event_ids.LogTripleWithIndex
+    for arg1 in range(1, 7):
+        emitter.functions.logTriple(event_id, 1, arg1, 1).transact()
+    log_scanner = LogScanner(w3, block_range=1, max_concurrent_requests=2)
+
+    all_logs = emitter.events.LogTripleWithIndex.get_logs(from_block=1)
+    scanned_logs = list(
+        emitter.events.LogTripleWithIndex.scan_logs(
+            from_block=1, log_scanner=log_scanner
+        )
+    )
+    assert scanned_logs == list(all_logs)
+    assert log_scanner.stats.requests > 1
+
+    # filter by indexed and non-indexed arguments
+    partial_logs = emitter.events.LogTripleWithIndex.scan_logs(
+        from_block=1, argument_filters={"arg0": 1, "arg1": [2, 5]}
+    )
+    assert [log.args.arg1 for log in partial_logs] == [2, 5]
+
+
+def test_contract_scan_logs_argument_filters_key_validation(emitter):
+    with pytest.raises(
+        Web3ValidationError,
+        match="all argument names must be present in the contract's event ABI",
+    ):
+        list(
+            emitter.events.LogIndexedAndNotIndexed.scan_logs(
+                argument_filters={"nonExistentKey": "Value shouldn't matter"},
+            )
+        )
+
+
 # --- async --- #
 
 
@@ -396,3 +434,32 @@ async def test_async_get_logs_argument_filters_key_validation(
         await async_emitter.events.LogIndexedAndNotIndexed.get_logs(
             argument_filters={"nonExistentKey": "Value shouldn't matter"},
         )
+
+
+@pytest.mark.asyncio
+async def test_async_contract_scan_logs(
+    async_w3, async_emitter, emitter_contract_event_ids
+):
+    event_id = emitter_contract_event_ids.LogTripleWithIndex
+    for arg1 in range(1, 7):
+        await async_emitter.functions.logTriple(event_id, 1, arg1, 1).transact()
+    log_scanner = AsyncLogScanner(async_w3, block_range=1, max_concurrent_requests=2)
+
+    all_logs = await async_emitter.events.LogTripleWithIndex.get_logs(from_block=1)
+    scanned_logs = [
+        log
+        async for log in async_emitter.events.LogTripleWithIndex.scan_logs(
+            from_block=1, log_scanner=log_scanner
+        )
+    ]
+    assert scanned_logs == list(all_logs)
+    assert log_scanner.stats.requests > 1
+
+    # filter by indexed and non-indexed arguments
+    partial_logs = [
+        log
+        async for log in async_emitter.events.LogTripleWithIndex.scan_logs(
+            from_block=1, argument_filters={"arg0": 1, "arg1": [2, 5]}
+        )
+    ]
+    assert [log.args.arg1 for log in partial_logs] == [2, 5]
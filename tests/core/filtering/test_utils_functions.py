@@ -6,8 +6,12 @@ import pytest
 from eth_abi.exceptions import (
     ValueOutOfBounds,
 )
+from hexbytes import (
+    HexBytes,
+)
 
 from web3._utils.filters import (
+    DataArgumentMatcher,
     match_fn,
 )
 from web3.exceptions import (
@@ -223,3 +227,62 @@ def test_wrong_type_match_data(w3):
     encoded_data = w3.codec.encode(abi_types, data)
     with pytest.raises(Web3ValueError):
         match_fn(w3.codec, match_data_and_abi, encoded_data)
+
+
+@pytest.mark.parametrize(
+    "match_data_and_abi,expected",
+    (
+        ((("uint256", (2, 3)), ("string", None), ("bytes2[2]", None)), True),
+        ((("uint256", (1, 3)), ("string", None), ("bytes2[2]", None)), False),
+        ((("uint256", None), ("string", ("b", "a")), ("bytes2[2]", None)), True),
+        ((("uint256", None), ("string", ("b",)), ("bytes2[2]", None)), False),
+        (
+            (
+                ("uint256", None),
+                ("string", None),
+                ("bytes2[2]", ((b"\x12\x34", b"\x56\x78"),)),
+            ),
+            True,
+        ),
+        (
+            (
+                ("uint256", (2,)),
+                ("string", ("a",)),
+                ("bytes2[2]", ((b"\x12\x34", b"\x56\x78"),)),
+            ),
+            True,
+        ),
+        ((("uint256", ()), ("string", None), ("bytes2[2]", None)), False),
+    ),
+)
+def test_data_argument_matcher(w3, match_data_and_abi, expected):
+    encoded_data = w3.codec.encode(
+        ("uint256", "string", "bytes2[2]"), (2, "a", (b"\x12\x34", b"\x56\x78"))
+    )
+    matcher = DataArgumentMatcher(w3.codec, match_data_and_abi)
+
+    assert matcher.match(encoded_data) is expected
+    assert matcher.match(HexBytes(encoded_data).to_0x_hex()) is expected
+    assert match_fn(w3.codec, match_data_and_abi, encoded_data) is expected
+
+
+def test_data_argument_matcher_only_decodes_filtered_arguments(w3):
+    encoded_data = bytearray(w3.codec.encode(("string", "uint256"), ("a", 2)))
+    # point the unfiltered string past the end of the data
+    encoded_data[:32] = (1000).to_bytes(32, "big")
+    matcher = DataArgumentMatcher(w3.codec, (("string", None), ("uint256", (2,))))
+
+    assert matcher.match(bytes(encoded_data))
+
+
+def test_data_argument_matcher_reports_wrong_type_values_when_reached(w3):
+    encoded_data = w3.codec.encode(("uint256", "string"), (2, "a"))
+
+    # matched before the value of the wrong type
+    assert DataArgumentMatcher(w3.codec, (("uint256", (2, "x")),)).match(encoded_data)
+    # the first argument doesn't match, so the second is not reached
+    assert not DataArgumentMatcher(
+        w3.codec, (("uint256", (1,)), ("string", (50505050,)))
+    ).match(encoded_data)
+    with pytest.raises(Web3ValueError):
+        DataArgumentMatcher(w3.codec, (("uint256", (3, "x")),)).match(encoded_data)
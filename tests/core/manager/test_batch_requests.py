@@ -0,0 +1,301 @@
+import asyncio
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import json
+import pytest
+from unittest.mock import (
+    patch,
+)
+
+from eth_utils import (
+    to_bytes,
+)
+
+from web3 import (
+    AsyncWeb3,
+    Web3,
+)
+from web3._utils.batching import (
+    sort_batch_response_by_response_ids,
+)
+from web3._utils.module_testing.module_testing_utils import (
+    WebSocketMessageStreamMock,
+)
+from web3.datastructures import (
+    AttributeDict,
+)
+from web3.exceptions import (
+    BadResponseFormat,
+    Web3RPCError,
+    Web3ValueError,
+)
+from web3.providers import (
+    HTTPProvider,
+)
+from web3.providers.eth_tester import (
+    AsyncEthereumTesterProvider,
+    EthereumTesterProvider,
+)
+from web3.providers.persistent import (
+    WebSocketProvider,
+)
+from web3.providers.rpc import (
+    AsyncHTTPProvider,
+)
+
+
+async def _coro():
+    return None
+
+
+def _batch_response(*results):
+    return [
+        {"jsonrpc": "2.0", "id": request_id, "result": result}
+        for request_id, result in enumerate(results)
+    ]
+
+
+def test_sort_batch_response_by_response_ids():
+    responses = [
+        {"jsonrpc": "2.0", "id": 2, "result": "0x2"},
+        {"jsonrpc": "2.0", "id": "0", "result": "0x0"},
+        {"jsonrpc": "2.0", "id": 1, "result": "0x1"},
+    ]
+    assert [r["result"] for r in sort_batch_response_by_response_ids(responses)] == [
+        "0x0",
+        "0x1",
+        "0x2",
+    ]
+
+
+def test_batch_requests_with_eth_tester():
+    w3 = Web3(EthereumTesterProvider())
+
+    with w3.batch_requests() as batch:
+        assert w3.provider._is_batching
+        batch.add(w3.eth.get_block(0))
+        batch.add(w3.eth.block_number)
+        batch.add(w3.eth.chain_id)
+        block, block_number, chain_id = batch.execute()
+
+    assert not w3.provider._is_batching
+    assert isinstance(block, AttributeDict)
+    assert block["number"] == 0
+    assert block_number == w3.eth.block_number
+    assert chain_id == w3.eth.chain_id
+
+
+def test_batch_requests_add_mapping():
+    w3 = Web3(EthereumTesterProvider())
+    batch = w3.batch_requests()
+    batch.add_mapping({w3.eth.get_block: [0, "latest"]})
+    genesis, latest = batch.execute()
+
+    assert genesis["number"] == 0
+    assert latest["number"] == w3.eth.block_number
+
+
+def test_batch_cannot_be_reused_after_execute_or_cancel():
+    w3 = Web3(EthereumTesterProvider())
+
+    batch = w3.batch_requests()
+    batch.add(w3.eth.block_number)
+    batch.execute()
+    with pytest.raises(Web3ValueError, match="already been executed or cancelled"):
+        batch.add(w3.eth.block_number)
+
+    batch = w3.batch_requests()
+    batch.add(w3.eth.block_number)
+    batch.cancel()
+    assert not w3.provider._is_batching
+    with pytest.raises(Web3ValueError, match="already been executed or cancelled"):
+        batch.execute()
+
+
+def test_batching_is_scoped_to_the_thread():
+    w3 = Web3(EthereumTesterProvider())
+    chain_id = w3.eth.chain_id
+
+    with w3.batch_requests() as batch:
+        batch.add(w3.eth.chain_id)
+        with ThreadPoolExecutor(1) as executor:
+            # requests made by other threads while batching are sent as usual
+            assert executor.submit(lambda: w3.eth.chain_id).result() == chain_id
+        assert batch.execute() == [chain_id]
+
+
+def test_http_provider_sends_batch_in_one_request_and_orders_responses():
+    w3 = Web3(HTTPProvider("http://mynode.local:8545"))
+    # responses may be returned in any order
+    response = list(reversed(_batch_response("0x539", "0x2a")))
+
+    with patch(
+        "web3.providers.rpc.rpc.make_post_request",
+        return_value=to_bytes(text=json.dumps(response)),
+    ) as mock_post:
+        with w3.batch_requests() as batch:
+            batch.add(w3.eth.chain_id)
+            batch.add(w3.eth.block_number)
+            chain_id, block_number = batch.execute()
+
+    assert mock_post.call_count == 1
+    sent = json.loads(mock_post.call_args[0][1])
+    assert [request["method"] for request in sent] == ["eth_chainId", "eth_blockNumber"]
+    assert chain_id == 1337
+    assert block_number == 42
+
+
+def test_http_provider_batch_rejected_as_a_whole_raises():
+    w3 = Web3(HTTPProvider("http://mynode.local:8545"))
+    response = {
+        "jsonrpc": "2.0",
+        "id": None,
+        "error": {"code": -32600, "message": "batch requests are not supported"},
+    }
+
+    with patch(
+        "web3.providers.rpc.rpc.make_post_request",
+        return_value=to_bytes(text=json.dumps(response)),
+    ):
+        with w3.batch_requests() as batch:
+            batch.add(w3.eth.chain_id)
+            with pytest.raises(Web3RPCError, match="batch requests are not supported"):
+                batch.execute()
+
+
+def test_http_provider_batch_with_missing_responses_raises():
+    w3 = Web3(HTTPProvider("http://mynode.local:8545"))
+
+    with patch(
+        "web3.providers.rpc.rpc.make_post_request",
+        return_value=to_bytes(text=json.dumps(_batch_response("0x539"))),
+    ):
+        with w3.batch_requests() as batch:
+            batch.add(w3.eth.chain_id)
+            batch.add(w3.eth.block_number)
+            with pytest.raises(BadResponseFormat, match="Expected 2 responses"):
+                batch.execute()
+
+
+# -- async -- #
+
+
+@pytest.mark.asyncio
+async def test_async_batch_requests_with_eth_tester():
+    w3 = AsyncWeb3(AsyncEthereumTesterProvider())
+
+    async with w3.batch_requests() as batch:
+        batch.add(w3.eth.get_block(0))
+        batch.add(w3.eth.block_number)
+        block, block_number = await batch.async_execute()
+
+    assert not w3.provider._is_batching
+    assert isinstance(block, AttributeDict)
+    assert block["number"] == 0
+    assert block_number == await w3.eth.block_number
+
+
+@pytest.mark.asyncio
+async def test_async_batching_is_scoped_to_the_task():
+    w3 = AsyncWeb3(AsyncEthereumTesterProvider())
+    chain_id = await w3.eth.chain_id
+    batching = asyncio.Event()
+    other_requests_done = asyncio.Event()
+
+    async def batch_requests():
+        async with w3.batch_requests() as batch:
+            batch.add(w3.eth.chain_id)
+            batching.set()
+            await other_requests_done.wait()
+            return await batch.async_execute()
+
+    batch_task = asyncio.ensure_future(batch_requests())
+    await batching.wait()
+    # requests made by other tasks while batching are sent as usual
+    assert await w3.eth.chain_id == chain_id
+    assert not w3.provider._is_batching
+    other_requests_done.set()
+    assert await batch_task == [chain_id]
+
+
+@pytest.mark.asyncio
+async def test_async_http_provider_sends_batch_in_one_request():
+    w3 = AsyncWeb3(AsyncHTTPProvider("http://mynode.local:8545"))
+    response = list(reversed(_batch_response("0x539", "0x2a")))
+
+    async def _post(*_args, **_kwargs):
+        return to_bytes(text=json.dumps(response))
+
+    with patch(
+        "web3.providers.rpc.async_rpc.async_make_post_request", side_effect=_post
+    ) as mock_post:
+        async with w3.batch_requests() as batch:
+            batch.add(w3.eth.chain_id)
+            batch.add(w3.eth.block_number)
+            chain_id, block_number = await batch.async_execute()
+
+    assert mock_post.call_count == 1
+    assert chain_id == 1337
+    assert block_number == 42
+
+
+@pytest.mark.asyncio
+async def test_websocket_provider_batch_requests():
+    provider = WebSocketProvider("ws://mocked")
+    with patch(
+        "web3.providers.persistent.websocket.connect", new=lambda *_1, **_2: _coro()
+    ):
+        await provider.connect()
+
+    response = list(reversed(_batch_response("0x539", {"number": "0x1"})))
+    provider._ws = WebSocketMessageStreamMock(
+        messages=[to_bytes(text=json.dumps(response))]
+    )
+    w3 = AsyncWeb3(provider)
+
+    async with w3.batch_requests() as batch:
+        batch.add(w3.eth.chain_id)
+        batch.add(w3.eth.get_block(1))
+        chain_id, block = await batch.async_execute()
+
+    assert chain_id == 1337
+    # middleware response processors are applied to each batched response
+    assert isinstance(block, AttributeDict)
+    assert block["number"] == 1
+    assert len(provider._request_processor._request_information_cache) == 0
+    assert len(provider._request_processor._request_response_cache) == 0
+
+    await provider.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_websocket_provider_batch_rejected_as_a_whole_raises():
+    provider = WebSocketProvider("ws://mocked", request_timeout=60)
+    with patch(
+        "web3.providers.persistent.websocket.connect", new=lambda *_1, **_2: _coro()
+    ):
+        await provider.connect()
+
+    response = {
+        "jsonrpc": "2.0",
+        "id": None,
+        "error": {"code": -32600, "message": "batch requests are not supported"},
+    }
+    provider._ws = WebSocketMessageStreamMock(
+        messages=[to_bytes(text=json.dumps(response))]
+    )
+    w3 = AsyncWeb3(provider)
+
+    async with w3.batch_requests() as batch:
+        batch.add(w3.eth.chain_id)
+        batch.add(w3.eth.get_block(1))
+        with pytest.raises(Web3RPCError, match="batch requests are not supported"):
+            # fails with the error response rather than waiting for the responses
+            await asyncio.wait_for(batch.async_execute(), 5)
+
+    assert len(provider._request_processor._request_information_cache) == 0
+    assert provider._request_processor._response_futures == {}
+    assert provider._request_processor._batch_error_futures == set()
+
+    await provider.disconnect()
@@ -9,6 +9,9 @@ from web3 import (
     AsyncWeb3,
     Web3,
 )
+from web3._utils.bloom import (
+    bloom_mask,
+)
 from web3.datastructures import (
     AttributeDict,
 )
@@ -17,6 +20,7 @@ from web3.middleware import (
     LocalFilterMiddleware,
 )
 from web3.middleware.filter import (
+    MAX_BLOCK_REQUEST,
     async_iter_latest_block_ranges,
     block_ranges,
     iter_latest_block_ranges,
@@ -90,7 +94,10 @@ def w3(request_mocker, iter_block_number):
         w3_base,
         mock_results={
             "eth_getLogs": lambda *_: FILTER_LOG,
-            "eth_getBlockByNumber": lambda *_: {"hash": BLOCK_HASH},
+            "eth_getBlockByNumber": lambda *_: {
+                "hash": BLOCK_HASH,
+                "parentHash": BLOCK_HASH,
+            },
             "net_version": lambda *_: 1,
             "eth_blockNumber": lambda *_: next(iter_block_number),
         },
@@ -243,6 +250,221 @@ def test_LocalFilterMiddleware(w3, iter_block_number):
     assert len(filter_ids) == len(set(filter_ids))
 
 
+LOG_ADDRESS = Web3.to_checksum_address("0x" + "ab" * 20)
+
+
+def _logs_bloom(has_log):
+    bloom = bloom_mask(HexBytes(LOG_ADDRESS)) if has_log else 0
+    return "0x" + bloom.to_bytes(256, "big").hex()
+
+
+class ChainProvider(BaseProvider):
+    """
+    Serves a chain of blocks with a log each, or only those in ``log_blocks`` if set,
+    which can be reorganized.
+    """
+
+    def __init__(self, num_blocks):
+        super().__init__()
+        self._init_chain(num_blocks)
+
+    def _init_chain(self, num_blocks):
+        self.blocks = []
+        self.batch_sizes = []
+        self.log_blocks = None
+        self.logs_requests = []
+        self.reorg(0, num_blocks)
+
+    def _has_log(self, block_number):
+        return self.log_blocks is None or block_number in self.log_blocks
+
+    def reorg(self, fork_block, num_blocks, fork="a"):
+        # replace the blocks from ``fork_block`` with ``num_blocks`` new ones
+        del self.blocks[fork_block:]
+        for block_number in range(fork_block, fork_block + num_blocks):
+            parent_hash = self.blocks[-1][0] if self.blocks else "0x" + "00" * 32
+            block_hash = "0x" + f"{fork}{block_number:063x}"
+            self.blocks.append((block_hash, parent_hash))
+
+    def _result(self, method, params):
+        if method == "eth_blockNumber":
+            return hex(len(self.blocks) - 1)
+        elif method == "eth_getBlockByNumber":
+            block_hash, parent_hash = self.blocks[int(params[0], 16)]
+            return {
+                "number": params[0],
+                "hash": block_hash,
+                "parentHash": parent_hash,
+                "logsBloom": _logs_bloom(self._has_log(int(params[0], 16))),
+            }
+        elif method == "eth_getLogs":
+            from_block = int(params[0]["fromBlock"], 16)
+            to_block = int(params[0]["toBlock"], 16)
+            self.logs_requests.append((from_block, to_block))
+            return [
+                {
+                    "address": LOG_ADDRESS,
+                    "topics": [],
+                    "data": "0x",
+                    "blockNumber": hex(block_number),
+                    "blockHash": self.blocks[block_number][0],
+                    "transactionHash": "0x" + "23" * 32,
+                    "transactionIndex": "0x0",
+                    "logIndex": "0x0",
+                    "removed": False,
+                }
+                for block_number in range(from_block, to_block + 1)
+                if self._has_log(block_number)
+            ]
+        raise NotImplementedError(f"Cannot make request for {method}:{params}")
+
+    def _response(self, method, params):
+        return {"jsonrpc": "2.0", "id": 0, "result": self._result(method, params)}
+
+    def _batch_response(self, requests):
+        self.batch_sizes.append(len(requests))
+        return [self._response(method, params) for method, params in requests]
+
+    def make_request(self, method, params):
+        return self._response(method, params)
+
+    def make_batch_request(self, requests):
+        return self._batch_response(requests)
+
+
+class AsyncChainProvider(AsyncBaseProvider, ChainProvider):
+    def __init__(self, num_blocks):
+        AsyncBaseProvider.__init__(self)
+        self._init_chain(num_blocks)
+
+    async def make_request(self, method, params):
+        return self._response(method, params)
+
+    async def make_batch_request(self, requests):
+        return self._batch_response(requests)
+
+
+def _log_blocks(logs):
+    return [
+        (log["blockNumber"], log["blockHash"].hex()[:1], log["removed"]) for log in logs
+    ]
+
+
+def test_local_log_filter_emits_removed_logs_on_reorg():
+    provider = ChainProvider(6)
+    w3 = Web3(provider, middleware=[LocalFilterMiddleware])
+    log_filter = w3.eth.filter({"fromBlock": 1})
+
+    assert _log_blocks(log_filter.get_new_entries()) == [
+        (block_number, "a", False) for block_number in range(1, 6)
+    ]
+    # the headers of the new blocks are fetched in a single batch request
+    assert provider.batch_sizes == [5]
+    assert log_filter.get_new_entries() == []
+
+    provider.reorg(4, 3, fork="b")
+    assert _log_blocks(log_filter.get_new_entries()) == [
+        (4, "a", True),
+        (5, "a", True),
+        (4, "b", False),
+        (5, "b", False),
+        (6, "b", False),
+    ]
+
+    # a reorg to a shorter chain
+    provider.reorg(6, 0)
+    provider.reorg(5, 1, fork="c")
+    assert _log_blocks(log_filter.get_new_entries()) == [
+        (5, "b", True),
+        (6, "b", True),
+        (5, "c", False),
+    ]
+
+
+def test_local_block_filter_fetches_blocks_in_batches_of_max_block_request():
+    provider = ChainProvider(1)
+    w3 = Web3(provider, middleware=[LocalFilterMiddleware])
+    block_filter = w3.eth.filter("latest")
+
+    provider.reorg(1, 2 * MAX_BLOCK_REQUEST + 20)
+    assert len(block_filter.get_new_entries()) == 2 * MAX_BLOCK_REQUEST + 20
+    assert provider.batch_sizes == [MAX_BLOCK_REQUEST, MAX_BLOCK_REQUEST, 20]
+
+
+def test_local_log_filter_stops_at_to_block():
+    provider = ChainProvider(4)
+    w3 = Web3(provider, middleware=[LocalFilterMiddleware])
+    log_filter = w3.eth.filter({"fromBlock": 1, "toBlock": 5})
+
+    assert len(log_filter.get_new_entries()) == 3
+    provider.reorg(4, 4)
+    assert _log_blocks(log_filter.get_new_entries()) == [
+        (4, "a", False),
+        (5, "a", False),
+    ]
+    provider.reorg(8, 2)
+    assert log_filter.get_new_entries() == []
+
+
+def test_local_block_filter_returns_replacement_blocks_on_reorg():
+    provider = ChainProvider(3)
+    w3 = Web3(provider, middleware=[LocalFilterMiddleware])
+    block_filter = w3.eth.filter("latest")
+
+    provider.reorg(3, 2)
+    assert block_filter.get_new_entries() == [
+        HexBytes(provider.blocks[3][0]),
+        HexBytes(provider.blocks[4][0]),
+    ]
+
+    provider.reorg(4, 2, fork="b")
+    assert block_filter.get_new_entries() == [
+        HexBytes(provider.blocks[4][0]),
+        HexBytes(provider.blocks[5][0]),
+    ]
+    assert block_filter.get_new_entries() == []
+
+
+def test_local_log_filter_bloom_prefilter_skips_blocks_without_matching_logs():
+    provider = ChainProvider(100)
+    provider.log_blocks = {3, 4, 5, 60, 90}
+    w3 = Web3(provider, middleware=[LocalFilterMiddleware.build(bloom_prefilter=True)])
+    log_filter = w3.eth.filter({"fromBlock": 1, "address": LOG_ADDRESS})
+
+    assert [log["blockNumber"] for log in log_filter.get_new_entries()] == [
+        3,
+        4,
+        5,
+        60,
+        90,
+    ]
+    assert provider.logs_requests == [(3, 5), (60, 60), (90, 90)]
+
+    provider.logs_requests.clear()
+    provider.reorg(100, 10)
+    provider.log_blocks.add(105)
+    assert [log["blockNumber"] for log in log_filter.get_new_entries()] == [105]
+    assert provider.logs_requests == [(105, 105)]
+
+    # a filter on another address skips every block
+    provider.logs_requests.clear()
+    other_filter = w3.eth.filter(
+        {"fromBlock": 1, "address": Web3.to_checksum_address("0x" + "cd" * 20)}
+    )
+    assert other_filter.get_all_entries() == []
+    assert provider.logs_requests == []
+
+
+def test_local_log_filter_without_addresses_or_topics_is_not_prefiltered():
+    provider = ChainProvider(10)
+    provider.log_blocks = {3}
+    w3 = Web3(provider, middleware=[LocalFilterMiddleware.build(bloom_prefilter=True)])
+    log_filter = w3.eth.filter({"fromBlock": 1})
+
+    assert len(log_filter.get_new_entries()) == 1
+    assert provider.logs_requests == [(1, 9)]
+
+
 # --- async --- #
 
 
@@ -261,7 +483,10 @@ async def async_w3(request_mocker, iter_block_number):
         async_w3_base,
         mock_results={
             "eth_getLogs": lambda *_: FILTER_LOG,
-            "eth_getBlockByNumber": lambda *_: {"hash": BLOCK_HASH},
+            "eth_getBlockByNumber": lambda *_: {
+                "hash": BLOCK_HASH,
+                "parentHash": BLOCK_HASH,
+            },
             "net_version": lambda *_: 1,
             "eth_blockNumber": lambda *_: next(iter_block_number),
         },
@@ -379,3 +604,72 @@ async def test_async_LocalFilterMiddleware(async_w3, iter_block_number):
 
     # Test that all ids are unique
     assert len(filter_ids) == len(set(filter_ids))
+
+
+@pytest.mark.asyncio
+async def test_async_local_log_filter_emits_removed_logs_on_reorg():
+    provider = AsyncChainProvider(6)
+    async_w3 = AsyncWeb3(provider, middleware=[LocalFilterMiddleware])
+    log_filter = await async_w3.eth.filter({"fromBlock": 1})
+
+    assert _log_blocks(await log_filter.get_new_entries()) == [
+        (block_number, "a", False) for block_number in range(1, 6)
+    ]
+    assert provider.batch_sizes == [5]
+
+    provider.reorg(4, 3, fork="b")
+    assert _log_blocks(await log_filter.get_new_entries()) == [
+        (4, "a", True),
+        (5, "a", True),
+        (4, "b", False),
+        (5, "b", False),
+        (6, "b", False),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_local_block_filter_fetches_blocks_in_batches():
+    provider = AsyncChainProvider(1)
+    async_w3 = AsyncWeb3(provider, middleware=[LocalFilterMiddleware])
+    block_filter = await async_w3.eth.filter("latest")
+
+    provider.reorg(1, 2 * MAX_BLOCK_REQUEST + 20)
+    assert len(await block_filter.get_new_entries()) == 2 * MAX_BLOCK_REQUEST + 20
+    assert provider.batch_sizes == [MAX_BLOCK_REQUEST, MAX_BLOCK_REQUEST, 20]
+
+
+@pytest.mark.asyncio
+async def test_async_local_block_filter_returns_replacement_blocks_on_reorg():
+    provider = AsyncChainProvider(3)
+    async_w3 = AsyncWeb3(provider, middleware=[LocalFilterMiddleware])
+    block_filter = await async_w3.eth.filter("latest")
+
+    provider.reorg(3, 2)
+    assert await block_filter.get_new_entries() == [
+        HexBytes(provider.blocks[3][0]),
+        HexBytes(provider.blocks[4][0]),
+    ]
+
+    provider.reorg(4, 2, fork="b")
+    assert await block_filter.get_new_entries() == [
+        HexBytes(provider.blocks[4][0]),
+        HexBytes(provider.blocks[5][0]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_local_log_filter_bloom_prefilter_skips_blocks():
+    provider = AsyncChainProvider(100)
+    provider.log_blocks = {3, 4, 5, 60, 90}
+    async_w3 = AsyncWeb3(
+        provider, middleware=[LocalFilterMiddleware.build(bloom_prefilter=True)]
+    )
+    log_filter = await async_w3.eth.filter({"fromBlock": 1, "address": LOG_ADDRESS})
+
+    logs = await log_filter.get_new_entries()
+    assert [log["blockNumber"] for log in logs] == [3, 4, 5, 60, 90]
+    assert provider.logs_requests == [(3, 5), (60, 60), (90, 90)]
+
+    provider.logs_requests.clear()
+    assert len(await log_filter.get_all_entries()) == 5
+    assert provider.logs_requests == [(3, 5), (60, 60), (90, 90)]
@@ -6,6 +6,10 @@ from unittest.mock import (
 
 import pytest_asyncio
 
+from web3._utils.head_polling import (
+    AsyncHeadPoller,
+    HeadPoller,
+)
 from web3.datastructures import (
     AttributeDict,
 )
@@ -31,6 +35,7 @@ def allowable_delay():
 @pytest.fixture
 def request_middleware(allowable_delay):
     web3 = Mock()
+    web3.head_poller = HeadPoller(web3)
     middleware = StalecheckMiddlewareBuilder.build(allowable_delay, web3)
     middleware._w3.provider.make_request = Mock()
     return middleware
@@ -149,6 +154,7 @@ async def async_request_middleware(allowable_delay):
     )
 
     async_web3 = AsyncMock()
+    async_web3.head_poller = AsyncHeadPoller(async_web3)
     middleware = StalecheckMiddlewareBuilder.build(allowable_delay, async_web3)
     middleware._w3.provider.make_request = Mock()
     return middleware
@@ -170,6 +170,42 @@ async def test_eth_subscription(jsonrpc_ipc_pipe_path, serve_subscription_result
         await w3.provider.disconnect()
 
 
+@pytest.fixture
+def serve_large_result(simple_ipc_server):
+    result = [{"data": "0x" + "ab" * 256, "topics": ["}]"]} for _ in range(2000)]
+    response = json.dumps({"jsonrpc": "2.0", "id": 0, "result": result}).encode()
+
+    def reply():
+        connection, client_address = simple_ipc_server.accept()
+        try:
+            connection.recv(1024)
+            # send the response in many small writes
+            for i in range(0, len(response), 4096):
+                connection.sendall(response[i : i + 4096])
+        finally:
+            connection.close()
+            simple_ipc_server.close()
+
+    thd = Thread(target=reply, daemon=True)
+    thd.start()
+
+    try:
+        yield result
+    finally:
+        thd.join()
+
+
+@pytest.mark.asyncio
+async def test_async_ipc_reads_large_result_across_reads(
+    jsonrpc_ipc_pipe_path, serve_large_result
+):
+    async with AsyncWeb3(
+        AsyncIPCProvider(pathlib.Path(jsonrpc_ipc_pipe_path), read_buffer_limit=1024)
+    ) as w3:
+        response = await w3.provider.make_request("eth_getLogs", [{}])
+        assert response["result"] == serve_large_result
+
+
 def test_get_endpoint_uri_or_ipc_path_returns_ipc_path():
     provider = AsyncIPCProvider(pathlib.Path("/path/to/file"))
     assert (
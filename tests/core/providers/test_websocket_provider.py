@@ -21,6 +21,7 @@ from web3._utils.module_testing.module_testing_utils import (
     WebSocketMessageStreamMock,
 )
 from web3.exceptions import (
+    ProviderConnectionError,
     TimeExhausted,
 )
 from web3.providers.persistent import (
@@ -108,6 +109,66 @@ async def test_async_make_request_times_out_of_while_loop_looking_for_response()
         await method_under_test(RPCEndpoint("some_method"), ["desired_params"])
 
 
+@pytest.mark.asyncio
+# some nodes echo numeric request ids as strings
+@pytest.mark.parametrize("response_id", (0, "0"))
+async def test_async_make_request_response_resolves_waiting_future_directly(
+    response_id,
+):
+    provider = WebSocketProvider("ws://mocked")
+    _mock_ws(provider)
+    request_processor = provider._request_processor
+
+    async def _respond_once_waiting():
+        # wait for the request to start waiting on its response future
+        while not request_processor._response_futures:
+            await asyncio.sleep(0)
+        await request_processor.cache_raw_response(
+            {"jsonrpc": "2.0", "id": response_id, "result": "0x1337"}
+        )
+
+    responder = asyncio.create_task(_respond_once_waiting())
+    response = await provider.make_request(RPCEndpoint("some_method"), [])
+    await responder
+
+    assert response == {"jsonrpc": "2.0", "id": response_id, "result": "0x1337"}
+    # the response was handed to the waiting request and never cached
+    assert len(request_processor._request_response_cache) == 0
+    assert request_processor._response_futures == {}
+
+
+@pytest.mark.asyncio
+async def test_async_make_request_pops_response_future_on_timeout():
+    provider = WebSocketProvider("ws://mocked", request_timeout=0.001)
+    _mock_ws(provider)
+
+    with pytest.raises(TimeExhausted):
+        await provider.make_request(RPCEndpoint("some_method"), [])
+
+    assert provider._request_processor._response_futures == {}
+
+
+@pytest.mark.asyncio
+async def test_async_make_request_fails_when_provider_disconnects():
+    provider = WebSocketProvider("ws://mocked", request_timeout=60)
+    with patch(
+        "web3.providers.persistent.websocket.connect", new=lambda *_1, **_2: _coro()
+    ):
+        await provider.connect()
+    _mock_ws(provider)
+    request_processor = provider._request_processor
+
+    request = asyncio.create_task(provider.make_request(RPCEndpoint("some_method"), []))
+    # wait for the request to start waiting on its response future
+    while not request_processor._response_futures:
+        await asyncio.sleep(0)
+    await provider.disconnect()
+
+    with pytest.raises(ProviderConnectionError, match="connection was closed"):
+        await asyncio.wait_for(request, 5)
+    assert request_processor._response_futures == {}
+
+
 @pytest.mark.asyncio
 async def test_msg_listener_task_starts_on_provider_connect_and_cancels_on_disconnect():
     provider = WebSocketProvider("ws://mocked")
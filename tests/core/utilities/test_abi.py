@@ -6,14 +6,18 @@ from typing import (
 
 from web3._utils.abi import (
     ExactLengthBytesEncoder,
+    _map_abi_data_tree,
     abi_data_tree,
     get_aligned_abi_inputs,
     get_tuple_type_str_parts,
     map_abi_data,
+    normalizes_basic_types,
     recursive_dict_to_namedtuple,
 )
 from web3._utils.normalizers import (
     BASE_RETURN_NORMALIZERS,
+    abi_bytes_to_hex,
+    abi_int_to_hex,
     abi_string_to_text,
     addresses_checksummed,
 )
@@ -353,6 +357,76 @@ def test_map_abi_data(types, data, funcs, expected):
     assert map_abi_data(funcs, types, data) == expected
 
 
+ADDRESS = "0x5b2063246f2191f18f2675cedb8b28102e957458"
+CHECKSUM_ADDRESS = "0x5B2063246F2191f18F2675ceDB8b28102e957458"
+
+
+@pytest.mark.parametrize(
+    "types, data, expected",
+    [
+        (
+            ["(address,(bytes32,string)[],uint256[2])[]", "address[2][]", None],
+            [
+                [
+                    (ADDRESS, ((b"\x01" * 32, b"one"), (b"\x02" * 32, b"two")), (1, 2)),
+                ]
+                * 2,
+                ((ADDRESS, ADDRESS),),
+                {"untyped": ADDRESS},
+            ],
+            [
+                [
+                    (
+                        CHECKSUM_ADDRESS,
+                        [(b"\x01" * 32, "one"), (b"\x02" * 32, "two")],
+                        [1, 2],
+                    )
+                ]
+                * 2,
+                [[CHECKSUM_ADDRESS, CHECKSUM_ADDRESS]],
+                {"untyped": ADDRESS},
+            ],
+        ),
+        (
+            ["(uint256,bytes)", "bool"],
+            [[1, b"\x02"], True],
+            [[1, b"\x02"], True],
+        ),
+    ],
+)
+def test_map_abi_data_normalization_plan(types, data, expected):
+    normalizers = [addresses_checksummed, abi_string_to_text]
+
+    assert map_abi_data(normalizers, types, data) == expected
+    assert _map_abi_data_tree(normalizers, types, data) == expected
+
+
+def test_map_abi_data_calls_declared_normalizers_with_their_types():
+    calls = []
+
+    @normalizes_basic_types("bytes", "uint")
+    def declared_normalizer(type_str, data):
+        calls.append(type_str)
+        return type_str, data
+
+    def undeclared_normalizer(type_str, data):
+        calls.append(type_str)
+        return type_str, data
+
+    types = ["(bytes4,string,uint256)[]", "uint8"]
+    data = [[(b"\x00" * 4, "a", 1)], 2]
+    normalizers = [declared_normalizer, abi_bytes_to_hex, abi_int_to_hex]
+    expected = [[("0x00000000", "a", "0x1")], "0x2"]
+
+    assert map_abi_data(normalizers, types, data) == expected
+    assert calls == ["bytes4", "uint256", "uint8"]
+
+    # normalizers not declaring their types are called with every typed value
+    calls.clear()
+    assert map_abi_data([undeclared_normalizer, *normalizers], types, data) == expected
+    assert "(bytes4,string,uint256)[]" in calls
+
+
 @pytest.mark.parametrize("arg", (6, 7, 9, 12, 20, 30))
 def test_exact_length_bytes_encoder_raises_on_non_multiples_of_8_bit_size(arg):
     with pytest.raises(Web3ValueError, match="multiple of 8"):
@@ -0,0 +1,323 @@
+import pytest
+
+from eth_abi.exceptions import (
+    NonEmptyPaddingBytes,
+)
+from eth_utils import (
+    event_abi_to_log_topic,
+)
+from hexbytes import (
+    HexBytes,
+)
+
+from web3 import (
+    Web3,
+)
+from web3._utils.events import (
+    EventDecoder,
+    MultiEventDecoder,
+    get_event_data,
+)
+from web3.datastructures import (
+    AttributeDict,
+)
+from web3.exceptions import (
+    InvalidEventABI,
+    LogTopicError,
+    MismatchedABI,
+)
+
+TRANSFER_ABI = {
+    "anonymous": False,
+    "inputs": [
+        {"indexed": True, "name": "from", "type": "address"},
+        {"indexed": True, "name": "to", "type": "address"},
+        {"indexed": False, "name": "value", "type": "uint256"},
+    ],
+    "name": "Transfer",
+    "type": "event",
+}
+TRANSFER_TOPIC = event_abi_to_log_topic(TRANSFER_ABI)
+
+NESTED_ABI = {
+    "anonymous": True,
+    "inputs": [
+        {"indexed": True, "name": "id", "type": "uint256"},
+        {
+            "indexed": False,
+            "name": "point",
+            "type": "tuple",
+            "components": [
+                {"name": "x", "type": "uint256"},
+                {"name": "owner", "type": "address"},
+            ],
+        },
+        {"indexed": False, "name": "values", "type": "uint256[]"},
+    ],
+    "name": "Nested",
+    "type": "event",
+}
+
+FROM = "0xd3CdA913deB6f67967B99D67aCDFa1712C293601"
+TO = "0x0F38F5a43a5bFe5D2d1c06Cb0fa5C2D7C7e2c8f1"
+
+
+def _log(topics, data, **kwargs):
+    return {
+        "address": FROM,
+        "topics": topics,
+        "data": data,
+        "blockNumber": 1,
+        "transactionHash": HexBytes("0x" + "01" * 32),
+        "transactionIndex": 0,
+        "blockHash": HexBytes("0x" + "02" * 32),
+        "logIndex": 3,
+        "removed": False,
+        **kwargs,
+    }
+
+
+def _transfer_log(value=12345):
+    return _log(
+        [
+            HexBytes(TRANSFER_TOPIC),
+            HexBytes(bytes(12) + bytes.fromhex(FROM[2:])),
+            # topics and data may also be hex strings
+            "0x" + "00" * 12 + TO[2:].lower(),
+        ],
+        "0x" + value.to_bytes(32, "big").hex(),
+    )
+
+
+@pytest.mark.parametrize("as_attribute_dict", (False, True))
+def test_event_decoder_decodes_logs_like_get_event_data(as_attribute_dict):
+    codec = Web3().codec
+    log = _transfer_log()
+    if as_attribute_dict:
+        log = AttributeDict(log)
+
+    decoder = EventDecoder(codec, TRANSFER_ABI)
+    event_data = decoder.decode(log)
+
+    assert decoder.topic == TRANSFER_TOPIC
+    assert decoder.topic_types == ("address", "address")
+    assert decoder.data_types == ("uint256",)
+    assert event_data["event"] == "Transfer"
+    assert event_data["args"] == {"from": FROM, "to": TO, "value": 12345}
+    assert event_data["logIndex"] == 3
+    assert isinstance(event_data, AttributeDict) is as_attribute_dict
+    assert isinstance(event_data["args"], AttributeDict) is as_attribute_dict
+    assert event_data == get_event_data(codec, TRANSFER_ABI, log)
+
+
+def test_event_decoder_decodes_nested_arguments():
+    codec = Web3().codec
+    log = AttributeDict(
+        _log(
+            [HexBytes((7).to_bytes(32, "big"))],
+            codec.encode(["(uint256,address)", "uint256[]"], [(1, TO.lower()), [2, 3]]),
+        )
+    )
+
+    event_data = EventDecoder(codec, NESTED_ABI).decode(log)
+
+    assert event_data.args == AttributeDict.recursive(
+        {"id": 7, "point": {"x": 1, "owner": TO}, "values": [2, 3]}
+    )
+    assert event_data.args.point.owner == TO
+
+
+def test_event_decoder_errors():
+    codec = Web3().codec
+    decoder = EventDecoder(codec, TRANSFER_ABI)
+
+    with pytest.raises(MismatchedABI, match="1 or more topics"):
+        decoder.decode(_log([], "0x"))
+    with pytest.raises(MismatchedABI, match="signature did not match"):
+        decoder.decode(_log([HexBytes("0x" + "00" * 32)], "0x"))
+    with pytest.raises(LogTopicError, match="Expected 2 log topics.  Got 1"):
+        decoder.decode(_log([HexBytes(TRANSFER_TOPIC), HexBytes(bytes(32))], "0x"))
+
+    duplicate_names_abi = {
+        **TRANSFER_ABI,
+        "inputs": [
+            {"indexed": True, "name": "from", "type": "address"},
+            {"indexed": True, "name": "to", "type": "address"},
+            {"indexed": False, "name": "from", "type": "uint256"},
+        ],
+    }
+    with pytest.raises(InvalidEventABI, match="duplicated between event inputs"):
+        EventDecoder(codec, duplicate_names_abi).decode(_transfer_log())
+
+
+def test_contract_events_share_one_decoder():
+    w3 = Web3()
+    contract = w3.eth.contract(address=FROM, abi=[TRANSFER_ABI])
+    log = AttributeDict(_transfer_log())
+
+    first = contract.events.Transfer()
+    assert first.process_log(log).args.value == 12345
+    decoder = first._get_event_decoder(first.abi)
+
+    second = contract.events.Transfer()
+    assert second.process_receipt({"logs": [log, log]})[1].args.to == TO
+    assert second._get_event_decoder(second.abi) is decoder
+
+
+ERC721_TRANSFER_ABI = {
+    **TRANSFER_ABI,
+    "inputs": [
+        {"indexed": True, "name": "from", "type": "address"},
+        {"indexed": True, "name": "to", "type": "address"},
+        {"indexed": True, "name": "tokenId", "type": "uint256"},
+    ],
+}
+APPROVAL_ABI = {**TRANSFER_ABI, "name": "Approval"}
+
+
+def test_multi_event_decoder_routes_logs_by_topic_and_topic_count():
+    codec = Web3().codec
+    decoder = MultiEventDecoder(
+        codec, [APPROVAL_ABI, TRANSFER_ABI, ERC721_TRANSFER_ABI, NESTED_ABI]
+    )
+
+    erc20_transfer = _transfer_log(5)
+    # an ERC-721 ``Transfer`` has the same event topic, with one more topic
+    erc721_transfer = _log(
+        erc20_transfer["topics"] + [HexBytes((5).to_bytes(32, "big"))], "0x"
+    )
+    approval = _log(
+        [HexBytes(event_abi_to_log_topic(APPROVAL_ABI))] + erc20_transfer["topics"][1:],
+        erc20_transfer["data"],
+    )
+    nested = _log(
+        [HexBytes((7).to_bytes(32, "big"))],
+        codec.encode(["(uint256,address)", "uint256[]"], [(1, TO), []]),
+    )
+
+    assert decoder.get_decoders(erc20_transfer) == [decoder.decoders[1]]
+    assert decoder.decode(erc20_transfer)["args"]["value"] == 5
+    assert decoder.decode(erc721_transfer)["args"]["tokenId"] == 5
+    assert decoder.decode(approval)["event"] == "Approval"
+    assert decoder.decode(nested)["args"]["id"] == 7
+
+    with pytest.raises(MismatchedABI, match="did not match any of the event ABIs"):
+        decoder.decode(_log([HexBytes(bytes(32)), HexBytes(bytes(32))], "0x"))
+
+
+def test_multi_event_decoder_tries_each_matching_event():
+    codec = Web3().codec
+    anonymous_abi = {
+        "anonymous": True,
+        "inputs": [{"indexed": True, "name": "id", "type": "uint256"}],
+        "name": "Anonymous",
+        "type": "event",
+    }
+    # the nested event matches the log too, but its data cannot be decoded
+    decoder = MultiEventDecoder(codec, [NESTED_ABI, anonymous_abi])
+
+    event_data = decoder.decode(_log([HexBytes((7).to_bytes(32, "big"))], "0x"))
+    assert event_data["event"] == "Anonymous"
+    assert event_data["args"] == {"id": 7}
+
+
+STATIC_TYPES_ABI = {
+    "anonymous": False,
+    "inputs": [
+        {"indexed": True, "name": "flag", "type": "bool"},
+        {"indexed": True, "name": "name", "type": "string"},
+        {"indexed": False, "name": "small", "type": "uint8"},
+        {"indexed": False, "name": "signed", "type": "int128"},
+        {"indexed": False, "name": "selector", "type": "bytes4"},
+        {"indexed": False, "name": "owner", "type": "address"},
+    ],
+    "name": "Static",
+    "type": "event",
+}
+
+
+def _columns_from_event_data(event_data):
+    return {
+        **{
+            key: [data[key] for data in event_data]
+            for key in (
+                "address",
+                "blockHash",
+                "blockNumber",
+                "logIndex",
+                "transactionHash",
+                "transactionIndex",
+            )
+        },
+        "args": {
+            name: [data["args"][name] for data in event_data]
+            for name in event_data[0]["args"]
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "event_abi,types,values",
+    (
+        (
+            STATIC_TYPES_ABI,
+            ["uint8", "int128", "bytes4", "address"],
+            [(255, -(2**127), b"\x01\x02\x03\x04", TO), (0, 5, b"\x00" * 4, FROM)],
+        ),
+        (
+            NESTED_ABI,
+            ["(uint256,address)", "uint256[]"],
+            [((1, TO), [2, 3]), ((2, FROM), [])],
+        ),
+    ),
+)
+def test_event_decoder_decodes_columns_like_decode(event_abi, types, values):
+    codec = Web3().codec
+    decoder = EventDecoder(codec, event_abi)
+    topics = [] if decoder.anonymous else [HexBytes(decoder.topic)]
+    logs = [
+        _log(
+            topics
+            + [HexBytes((index % 2).to_bytes(32, "big"))] * len(decoder.topic_types),
+            codec.encode(types, value),
+            logIndex=index,
+        )
+        for index, value in enumerate(values * 3)
+    ]
+
+    columns = decoder.decode_columns(logs)
+
+    assert columns == _columns_from_event_data([decoder.decode(log) for log in logs])
+    assert columns["logIndex"] == list(range(6))
+
+
+def test_event_decoder_decodes_no_columns():
+    decoder = EventDecoder(Web3().codec, TRANSFER_ABI)
+    assert decoder.decode_columns([]) == {
+        "address": [],
+        "blockHash": [],
+        "blockNumber": [],
+        "logIndex": [],
+        "transactionHash": [],
+        "transactionIndex": [],
+        "args": {"from": [], "to": [], "value": []},
+    }
+
+
+def test_event_decoder_decode_columns_errors():
+    codec = Web3().codec
+    decoder = EventDecoder(codec, STATIC_TYPES_ABI)
+    topics = [HexBytes(decoder.topic), HexBytes(bytes(32)), HexBytes(bytes(32))]
+    valid_log = _log(
+        topics,
+        codec.encode(["uint8", "int128", "bytes4", "address"], [1, 1, b"1234", TO]),
+    )
+
+    invalid_data = bytearray(valid_log["data"])
+    # a uint8 with non-zero padding
+    invalid_data[0] = 1
+    with pytest.raises(NonEmptyPaddingBytes):
+        decoder.decode_columns([valid_log, _log(topics, bytes(invalid_data))])
+
+    with pytest.raises(LogTopicError, match="Expected 2 log topics.  Got 1"):
+        decoder.decode_columns([valid_log, _log(topics[:2], valid_log["data"])])
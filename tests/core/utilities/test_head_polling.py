@@ -0,0 +1,214 @@
+import asyncio
+import pytest
+import threading
+import time
+
+from web3 import (
+    AsyncWeb3,
+    Web3,
+)
+from web3._utils.head_polling import (
+    AsyncHeadPoller,
+    HeadPoller,
+    HeadPollerStats,
+)
+from web3.middleware import (
+    LocalFilterMiddleware,
+    StalecheckMiddlewareBuilder,
+)
+from web3.providers.async_base import (
+    AsyncBaseProvider,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+from web3.providers.eth_tester import (
+    AsyncEthereumTesterProvider,
+)
+
+
+class HeadProvider:
+    """
+    Serves the number and the latest block of a chain whose head is ``head``.
+    """
+
+    def __init__(self, head=1, delay=0.0):
+        super().__init__()
+        self.head = head
+        self.delay = delay
+        self.requests = []
+
+    def _respond(self, method, params):
+        self.requests.append(method)
+        if method == "eth_blockNumber":
+            result = hex(self.head)
+        elif method == "eth_getBlockByNumber":
+            result = {"number": hex(self.head), "timestamp": "0x0"}
+        else:
+            raise NotImplementedError(f"Cannot make request for {method}:{params}")
+        return {"jsonrpc": "2.0", "id": 0, "result": result}
+
+
+class SyncHeadProvider(HeadProvider, BaseProvider):
+    def make_request(self, method, params):
+        time.sleep(self.delay)
+        return self._respond(method, params)
+
+
+class AsyncHeadProvider(HeadProvider, AsyncBaseProvider):
+    async def make_request(self, method, params):
+        await asyncio.sleep(self.delay)
+        return self._respond(method, params)
+
+
+def test_web3_has_a_head_poller():
+    w3 = Web3(SyncHeadProvider())
+
+    assert isinstance(w3.head_poller, HeadPoller)
+    assert w3.head_poller.poll_interval == 0
+    w3 = Web3(SyncHeadProvider(), head_poll_interval=0.5)
+    assert w3.head_poller.poll_interval == 0.5
+
+
+def test_head_poller_polls_for_every_read_by_default():
+    provider = SyncHeadProvider()
+    poller = HeadPoller(Web3(provider))
+
+    assert poller.get_block_number() == 1
+    provider.head = 2
+    assert poller.get_block_number() == 2
+    assert poller.stats == HeadPollerStats(polls=2, shared=0)
+
+
+def test_head_poller_shares_polls_within_the_poll_interval():
+    provider = SyncHeadProvider()
+    poller = HeadPoller(Web3(provider), poll_interval=60)
+
+    assert poller.get_block_number() == 1
+    provider.head = 2
+    assert poller.get_block_number() == 1
+    assert poller.get_latest_block()["number"] == 2
+    assert poller.get_latest_block()["number"] == 2
+    assert provider.requests == ["eth_blockNumber", "eth_getBlockByNumber"]
+    assert poller.stats == HeadPollerStats(polls=2, shared=2)
+
+    poller.reset_stats()
+    assert poller.stats == HeadPollerStats(polls=0, shared=0)
+
+
+def test_head_poller_shares_polls_in_flight_between_threads():
+    provider = SyncHeadProvider(delay=0.1)
+    poller = HeadPoller(Web3(provider))
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(poller.get_block_number()))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [1] * 4
+    assert poller.stats.polls + poller.stats.shared == 4
+    assert poller.stats.polls < 4
+
+
+def test_head_poller_calls_subscribers_with_new_heads():
+    provider = SyncHeadProvider()
+    poller = HeadPoller(Web3(provider))
+    heads = []
+    unsubscribe = poller.subscribe(heads.append)
+
+    poller.get_block_number()
+    poller.get_block_number()
+    provider.head = 3
+    poller.get_latest_block()
+    unsubscribe()
+    provider.head = 4
+    poller.get_block_number()
+
+    assert heads == [1, 3]
+
+
+def test_head_poller_is_used_by_local_filters():
+    provider = SyncHeadProvider()
+    w3 = Web3(provider)
+    w3.head_poller.poll_interval = 60
+    w3.middleware_onion.inject(LocalFilterMiddleware, layer=0)
+
+    w3.eth.filter("latest")
+    w3.eth.filter("latest")
+
+    assert provider.requests.count("eth_blockNumber") == 1
+    assert w3.head_poller.stats == HeadPollerStats(polls=1, shared=1)
+
+
+@pytest.mark.asyncio
+async def test_async_web3_has_a_head_poller():
+    w3 = AsyncWeb3(AsyncHeadProvider())
+
+    assert isinstance(w3.head_poller, AsyncHeadPoller)
+    assert w3.head_poller.poll_interval == 0
+    w3 = AsyncWeb3(AsyncHeadProvider(), head_poll_interval=0.5)
+    assert w3.head_poller.poll_interval == 0.5
+
+
+@pytest.mark.asyncio
+async def test_async_head_poller_shares_polls_within_the_poll_interval():
+    provider = AsyncHeadProvider()
+    poller = AsyncHeadPoller(AsyncWeb3(provider), poll_interval=60)
+
+    assert await poller.get_block_number() == 1
+    provider.head = 2
+    assert await poller.get_block_number() == 1
+    assert (await poller.get_latest_block())["number"] == 2
+    assert poller.stats == HeadPollerStats(polls=2, shared=1)
+
+
+@pytest.mark.asyncio
+async def test_async_head_poller_shares_polls_in_flight():
+    provider = AsyncHeadProvider(delay=0.05)
+    poller = AsyncHeadPoller(AsyncWeb3(provider))
+    heads = []
+    poller.subscribe(heads.append)
+
+    results = await asyncio.gather(*(poller.get_block_number() for _ in range(4)))
+
+    assert results == [1] * 4
+    assert poller.stats == HeadPollerStats(polls=1, shared=3)
+    assert heads == [1]
+
+
+@pytest.mark.asyncio
+async def test_async_head_poller_reads_while_polling_the_other_head_value():
+    # the stalecheck middleware reads the latest block while the block number is
+    # polled, and the local filters poll the block number through the middleware
+    w3 = AsyncWeb3(AsyncEthereumTesterProvider())
+    w3.middleware_onion.add(StalecheckMiddlewareBuilder.build(3600))
+    w3.middleware_onion.add(LocalFilterMiddleware)
+
+    block_number = await asyncio.wait_for(w3.head_poller.get_block_number(), 5)
+    block_filter = await asyncio.wait_for(w3.eth.filter("latest"), 5)
+
+    assert block_number == await w3.eth.block_number
+    assert await asyncio.wait_for(block_filter.get_new_entries(), 5) == []
+
+
+@pytest.mark.asyncio
+async def test_async_head_poller_read_made_by_its_own_poll_polls_again():
+    w3 = AsyncWeb3(AsyncHeadProvider())
+    poller = AsyncHeadPoller(w3)
+    fetch_block_number = poller._fetch_block_number
+
+    async def fetch_and_read_again():
+        # e.g. middleware reading the head the poll is being fetched for
+        poller._fetch_block_number = fetch_block_number
+        await asyncio.wait_for(poller.get_block_number(), 5)
+        return await fetch_block_number()
+
+    poller._fetch_block_number = fetch_and_read_again
+
+    assert await asyncio.wait_for(poller.get_block_number(), 5) == 1
+    assert poller.stats == HeadPollerStats(polls=2, shared=0)
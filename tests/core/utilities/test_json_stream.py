@@ -0,0 +1,64 @@
+import json
+import pytest
+
+from web3._utils.json_stream import (
+    JSONStreamDecoder,
+)
+
+MESSAGES = [
+    {"jsonrpc": "2.0", "id": 0, "result": "0x1"},
+    # brackets, quotes and escapes in strings are not message boundaries
+    {"jsonrpc": "2.0", "id": 1, "result": {"data": 'a "quoted" }] \\ {[ "'}},
+    {"jsonrpc": "2.0", "id": 2, "result": [{"logs": [[], {}]}, "é☃"]},
+    # batch responses are a list of responses
+    [{"jsonrpc": "2.0", "id": 3, "result": None}, {"jsonrpc": "2.0", "id": 4}],
+]
+STREAM = b"".join(
+    json.dumps(message).encode("utf-8") + separator
+    for message, separator in zip(MESSAGES, (b"", b"\n", b" \r\n ", b""))
+)
+
+
+@pytest.mark.parametrize("chunk_size", (1, 2, 7, 64, len(STREAM)))
+def test_json_stream_decoder_decodes_messages_across_reads(chunk_size):
+    decoder = JSONStreamDecoder()
+    decoded = []
+    for i in range(0, len(STREAM), chunk_size):
+        decoded.extend(decoder.decode(STREAM[i : i + chunk_size]))
+
+    assert decoded == MESSAGES
+    assert len(decoder) == 0
+
+
+def test_json_stream_decoder_buffers_incomplete_messages():
+    decoder = JSONStreamDecoder()
+    first, second = (json.dumps(message).encode() for message in MESSAGES[:2])
+
+    assert decoder.decode(first + second[:10]) == [MESSAGES[0]]
+    # only the incomplete message is kept in the buffer
+    assert len(decoder) == 10
+    assert decoder.decode(second[10:]) == [MESSAGES[1]]
+
+
+def test_json_stream_decoder_scans_incomplete_strings_once():
+    decoder = JSONStreamDecoder()
+    assert decoder.decode(b'{"id": 0, "result": "0x' + b"ab" * 1000) == []
+    # the string is scanned up to the end of the buffer, not again on the next read
+    assert decoder._position == len(decoder)
+    assert decoder.decode(b"ab\\") == []
+    assert decoder._position == len(decoder)
+    assert decoder.decode(b'"cd"}') == [{"id": 0, "result": "0x" + "ab" * 1001 + '"cd'}]
+
+
+def test_json_stream_decoder_reset():
+    decoder = JSONStreamDecoder()
+    decoder.decode(b'{"id": 0, "result": "unterminated')
+    decoder.reset()
+
+    assert len(decoder) == 0
+    assert decoder.decode(b'{"id": 1}') == [{"id": 1}]
+
+
+def test_json_stream_decoder_raises_for_invalid_messages():
+    with pytest.raises(json.JSONDecodeError):
+        JSONStreamDecoder().decode(b'{"id": 0, "result": nope}')
@@ -0,0 +1,290 @@
+import asyncio
+import pytest
+import threading
+import time
+
+from web3 import (
+    AsyncWeb3,
+    Web3,
+)
+from web3.exceptions import (
+    Web3RPCError,
+    Web3ValueError,
+)
+from web3.providers.async_base import (
+    AsyncBaseProvider,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+from web3.utils import (
+    AsyncLogScanner,
+    LogScanner,
+    LogScanStats,
+)
+from web3.utils.log_scanning import (
+    is_log_range_error,
+)
+
+LATEST_BLOCK = 999
+RANGE_ERROR = {"code": -32005, "message": "query returned more than 10000 results"}
+
+
+def _log(block_number, log_index):
+    return {
+        "address": "0x" + "ab" * 20,
+        "topics": ["0x" + "cd" * 32],
+        "data": "0x",
+        "blockNumber": hex(block_number),
+        "blockHash": "0x" + "45" * 32,
+        "transactionHash": "0x" + "23" * 32,
+        "transactionIndex": "0x0",
+        "logIndex": hex(log_index),
+        "removed": False,
+    }
+
+
+class LogsProvider:
+    """
+    Serves ``logs_per_block`` logs for every block up to ``LATEST_BLOCK``, and rejects
+    ``eth_getLogs`` requests over ranges of more than ``max_range`` blocks.
+    """
+
+    def __init__(self, logs_per_block=1, max_range=LATEST_BLOCK + 1, error=None):
+        super().__init__()
+        self.logs_per_block = logs_per_block
+        self.max_range = max_range
+        self.error = error
+        self.ranges = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _respond(self, method, params):
+        if method == "eth_getBlockByNumber":
+            return {"result": {"number": hex(LATEST_BLOCK)}}
+        elif method != "eth_getLogs":
+            raise NotImplementedError(f"Cannot make request for {method}:{params}")
+
+        from_block, to_block = int(params[0]["fromBlock"], 16), int(
+            params[0]["toBlock"], 16
+        )
+        self.ranges.append((from_block, to_block))
+        if self.error is not None:
+            return {"error": self.error}
+        elif to_block - from_block + 1 > self.max_range:
+            return {"error": RANGE_ERROR}
+        return {
+            "result": [
+                _log(block_number, log_index)
+                for block_number in range(from_block, to_block + 1)
+                for log_index in range(self.logs_per_block)
+            ]
+        }
+
+    def _start_request(self):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _end_request(self, method, params):
+        with self._lock:
+            self.in_flight -= 1
+            return {"jsonrpc": "2.0", "id": 0, **self._respond(method, params)}
+
+
+class SyncLogsProvider(LogsProvider, BaseProvider):
+    def make_request(self, method, params):
+        self._start_request()
+        time.sleep(0.001)
+        return self._end_request(method, params)
+
+
+class AsyncLogsProvider(LogsProvider, AsyncBaseProvider):
+    async def make_request(self, method, params):
+        self._start_request()
+        await asyncio.sleep(0.001)
+        return self._end_request(method, params)
+
+
+def _block_numbers(logs):
+    return [log["blockNumber"] for log in logs]
+
+
+def _assert_contiguous(ranges, from_block, to_block):
+    next_block = from_block
+    for range_from, range_to in sorted(ranges):
+        assert range_from == next_block
+        next_block = range_to + 1
+    assert next_block == to_block + 1
+
+
+def test_log_scanner_yields_the_logs_in_block_order():
+    provider = SyncLogsProvider()
+    scanner = LogScanner(Web3(provider), block_range=10, max_concurrent_requests=3)
+
+    logs = list(scanner.scan({"fromBlock": 100, "toBlock": 349}))
+
+    assert _block_numbers(logs) == list(range(100, 350))
+    _assert_contiguous(provider.ranges, 100, 349)
+    assert provider.max_in_flight <= 3
+    assert scanner.stats.requests == len(provider.ranges)
+    assert scanner.stats.range_errors == 0
+
+
+def test_log_scanner_scans_to_the_latest_block_by_default():
+    provider = SyncLogsProvider()
+    scanner = LogScanner(Web3(provider), block_range=100)
+
+    logs = list(scanner.scan({"fromBlock": "earliest"}))
+
+    assert _block_numbers(logs) == list(range(LATEST_BLOCK + 1))
+
+
+def test_log_scanner_grows_the_block_range_over_sparse_ranges():
+    provider = SyncLogsProvider()
+    scanner = LogScanner(
+        Web3(provider),
+        block_range=10,
+        max_block_range=160,
+        max_concurrent_requests=1,
+        target_logs_per_request=1000,
+    )
+
+    list(scanner.scan({"fromBlock": 0, "toBlock": 999}))
+
+    assert [to_block - from_block + 1 for from_block, to_block in provider.ranges][
+        :6
+    ] == [10, 20, 40, 80, 160, 160]
+    assert scanner.stats.block_range == 160
+
+
+def test_log_scanner_shrinks_the_block_range_over_dense_ranges():
+    provider = SyncLogsProvider(logs_per_block=10)
+    scanner = LogScanner(
+        Web3(provider),
+        block_range=64,
+        max_concurrent_requests=1,
+        target_logs_per_request=100,
+    )
+
+    logs = list(scanner.scan({"fromBlock": 0, "toBlock": 199}))
+
+    assert len(logs) == 2000
+    assert [to_block - from_block + 1 for from_block, to_block in provider.ranges][
+        :4
+    ] == [64, 32, 16, 8]
+
+
+def test_log_scanner_splits_ranges_rejected_by_the_node():
+    provider = SyncLogsProvider(max_range=7)
+    scanner = LogScanner(Web3(provider), block_range=100, max_concurrent_requests=2)
+
+    logs = list(scanner.scan({"fromBlock": 0, "toBlock": 299}))
+
+    assert _block_numbers(logs) == list(range(300))
+    assert scanner.stats.range_errors > 0
+    # split ranges wait for a free slot
+    assert provider.max_in_flight <= 2
+    assert scanner.stats.block_range <= 7
+    successful_ranges = [
+        (from_block, to_block)
+        for from_block, to_block in provider.ranges
+        if to_block - from_block + 1 <= 7
+    ]
+    _assert_contiguous(successful_ranges, 0, 299)
+
+
+def test_log_scanner_raises_range_errors_for_single_blocks():
+    provider = SyncLogsProvider(max_range=0)
+    scanner = LogScanner(Web3(provider), block_range=4)
+
+    with pytest.raises(Web3RPCError, match="more than 10000 results"):
+        list(scanner.scan({"fromBlock": 0, "toBlock": 9}))
+
+
+def test_log_scanner_raises_other_errors():
+    provider = SyncLogsProvider(error={"code": -32000, "message": "internal error"})
+    scanner = LogScanner(Web3(provider), block_range=4)
+
+    with pytest.raises(Web3RPCError, match="internal error"):
+        list(scanner.scan({"fromBlock": 0, "toBlock": 99}))
+    assert scanner.stats == LogScanStats(requests=4, range_errors=0, block_range=4)
+
+
+def test_log_scanner_rejects_block_hash_filters():
+    scanner = LogScanner(Web3(SyncLogsProvider()))
+
+    with pytest.raises(Web3ValueError):
+        list(scanner.scan({"blockHash": "0x" + "45" * 32}))
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {"block_range": 0, "min_block_range": 0},
+        {"block_range": 10, "min_block_range": 20},
+        {"block_range": 20, "max_block_range": 10},
+        {"max_concurrent_requests": 0},
+    ),
+)
+def test_log_scanner_validates_its_settings(kwargs):
+    with pytest.raises(Web3ValueError):
+        LogScanner(Web3(SyncLogsProvider()), **kwargs)
+
+
+@pytest.mark.parametrize(
+    "error,expected",
+    (
+        (RANGE_ERROR, True),
+        ({"code": -32600, "message": "query returned more than 10000 results"}, True),
+        ({"code": -32000, "message": "block range is too wide"}, True),
+        ({"code": -32000, "message": "exceed maximum block range: 2000"}, True),
+        ({"code": -32000, "message": "Log response size exceeded."}, True),
+        ({"code": -32000, "message": "execution reverted"}, False),
+    ),
+)
+def test_is_log_range_error(error, expected):
+    provider = SyncLogsProvider(error=error)
+
+    with pytest.raises(Web3RPCError) as exc_info:
+        Web3(provider).eth.get_logs({"fromBlock": 0, "toBlock": 1})
+    assert is_log_range_error(exc_info.value) is expected
+    assert is_log_range_error(ValueError("too many logs")) is False
+
+
+@pytest.mark.asyncio
+async def test_async_log_scanner_yields_the_logs_in_block_order():
+    provider = AsyncLogsProvider()
+    scanner = AsyncLogScanner(
+        AsyncWeb3(provider), block_range=10, max_concurrent_requests=3
+    )
+
+    logs = [log async for log in scanner.scan({"fromBlock": 100, "toBlock": 349})]
+
+    assert _block_numbers(logs) == list(range(100, 350))
+    _assert_contiguous(provider.ranges, 100, 349)
+    assert provider.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_async_log_scanner_splits_ranges_rejected_by_the_node():
+    provider = AsyncLogsProvider(max_range=7)
+    scanner = AsyncLogScanner(
+        AsyncWeb3(provider), block_range=100, max_concurrent_requests=2
+    )
+
+    logs = [log async for log in scanner.scan({"fromBlock": "earliest"})]
+
+    assert _block_numbers(logs) == list(range(LATEST_BLOCK + 1))
+    assert scanner.stats.range_errors > 0
+    assert provider.max_in_flight <= 2
+
+
+@pytest.mark.asyncio
+async def test_async_log_scanner_raises_other_errors():
+    provider = AsyncLogsProvider(error={"code": -32000, "message": "internal error"})
+    scanner = AsyncLogScanner(AsyncWeb3(provider), block_range=4)
+
+    with pytest.raises(Web3RPCError, match="internal error"):
+        [log async for log in scanner.scan({"fromBlock": 0, "toBlock": 99})]
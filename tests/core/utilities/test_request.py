@@ -10,6 +10,10 @@ import time
 from aiohttp import (
     ClientSession,
     ClientTimeout,
+    web,
+)
+from aiohttp.test_utils import (
+    TestServer,
 )
 from eth_typing import (
     URI,
@@ -30,9 +34,21 @@ from web3._utils.caching import (
     generate_cache_key,
 )
 from web3._utils.request import (
+    AsyncHTTPPoolStats,
     async_cache_and_return_session,
     cache_and_return_session,
 )
+from web3.providers.rpc import (
+    AsyncHTTPProvider,
+    HTTPProvider,
+)
+from web3.providers.rpc.utils import (
+    AsyncHTTPPoolConfiguration,
+    HTTPPoolConfiguration,
+)
+from web3.types import (
+    RPCEndpoint,
+)
 from web3.utils.caching import (
     SimpleCache,
 )
@@ -174,15 +190,15 @@ def test_cache_session_class():
     assert evicted_items is None
 
     _, evicted_items = cache.cache("3", "Hello3")
-    assert "2" in cache
+    assert "1" in cache
     assert "3" in cache
 
-    assert "1" not in cache
-    assert "1" in evicted_items
+    assert "2" not in cache
+    assert "2" in evicted_items
 
-    # Cache size is `3`. We should have "2" and "3" in the cache and "1" should have
-    # been evicted.
-    assert cache.get_cache_entry("1") is None
+    # Cache size is `2`. "1" was used more recently than "2", so we should have "1"
+    # and "3" in the cache and "2" should have been evicted.
+    assert cache.get_cache_entry("2") is None
 
 
 def test_cache_does_not_close_session_before_a_call_when_multithreading():
@@ -229,6 +245,103 @@ def test_unique_cache_keys_created_per_thread_with_same_uri():
     [session.result().close() for session in test_sessions]
 
 
+def test_pool_configuration_shares_connection_pool_across_threads():
+    provider = HTTPProvider(
+        TEST_URI,
+        pool_configuration=HTTPPoolConfiguration(pool_maxsize=64, keep_alive=False),
+    )
+
+    barrier = threading.Barrier(4)
+
+    def _call_from_own_thread(_):
+        session = cache_and_return_session(
+            TEST_URI, session_pool=provider._session_pool
+        )
+        barrier.wait(timeout=5)
+        return session
+
+    with ThreadPoolExecutor(max_workers=4) as exc:
+        sessions = list(exc.map(_call_from_own_thread, range(4)))
+
+    # a session per thread, sharing one pool
+    assert len({id(session) for session in sessions}) == 4
+    adapters = {id(session.get_adapter(TEST_URI)) for session in sessions}
+    assert len(adapters) == 1
+
+    adapter = sessions[0].get_adapter(TEST_URI)
+    check_adapters_mounted(sessions[0])
+    assert adapter._pool_maxsize == 64
+    assert sessions[0].headers["Connection"] == "close"
+
+    # closing a session does not close the shared pool
+    pool = adapter.poolmanager.connection_from_url(TEST_URI)
+    sessions[0].close()
+    assert adapter.poolmanager.connection_from_url(TEST_URI) is pool
+
+    # -- teardown -- #
+
+    request._http_session_pools.pop(provider._session_pool.key)
+    adapter.close_pool()
+
+
+def test_pools_are_keyed_by_endpoint_and_configuration(mocker):
+    response = MockedResponse()
+    response.content = b'{"jsonrpc": "2.0", "id": 0, "result": "0x1"}'
+    mocker.patch("requests.Session.post", return_value=response)
+    first = HTTPProvider(
+        TEST_URI, pool_configuration=HTTPPoolConfiguration(pool_maxsize=64)
+    )
+    same = HTTPProvider(
+        TEST_URI, pool_configuration=HTTPPoolConfiguration(pool_maxsize=64)
+    )
+    other = HTTPProvider(
+        TEST_URI, pool_configuration=HTTPPoolConfiguration(pool_maxsize=8)
+    )
+    default = HTTPProvider(TEST_URI)
+    try:
+        assert first._session_pool is same._session_pool
+        assert first._session_pool is not other._session_pool
+        assert default._session_pool is None
+
+        sessions = []
+        for provider in (first, other, default):
+            provider.make_request(RPCEndpoint("eth_chainId"), [])
+            sessions.append(
+                cache_and_return_session(TEST_URI, session_pool=provider._session_pool)
+            )
+        first_session, other_session, default_session = sessions
+
+        assert first_session.get_adapter(TEST_URI)._pool_maxsize == 64
+        assert other_session.get_adapter(TEST_URI)._pool_maxsize == 8
+        # the providers that did not opt in keep their own pool
+        assert not isinstance(
+            default_session.get_adapter(TEST_URI), request._SharedHTTPAdapter
+        )
+        assert len(request._session_cache) == 3
+    finally:
+        request._http_session_pools.pop(first._session_pool.key)
+        request._http_session_pools.pop(other._session_pool.key)
+
+
+def test_evicted_sessions_are_closed_by_one_reaper_thread(mocker):
+    timeout_default = request.DEFAULT_TIMEOUT
+    request.DEFAULT_TIMEOUT = 0.01
+    request._session_cache = SimpleCache(1)
+    close = mocker.patch.object(request, "_close_evicted_sessions")
+    threads_before = threading.active_count()
+
+    try:
+        sessions = [cache_and_return_session(uri) for uri in UNIQUE_URIS]
+
+        assert threading.active_count() <= threads_before + 1
+        time.sleep(0.5)
+        closed = [session for call in close.call_args_list for session in call[0][0]]
+        assert closed == sessions[:-1]
+    finally:
+        request._session_cache = SimpleCache()
+        request.DEFAULT_TIMEOUT = timeout_default
+
+
 # -- async -- #
 
 
@@ -469,3 +582,84 @@ async def test_async_use_new_session_if_session_closed_for_cached_session():
 
     # appropriately close the new session
     await session2.close()
+
+
+@pytest.mark.asyncio
+async def test_async_pool_configuration_caps_in_flight_requests():
+    in_flight = 0
+    peak_in_flight = 0
+
+    async def handler(_request):
+        nonlocal in_flight, peak_in_flight
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return web.Response(body=b"response")
+
+    app = web.Application()
+    app.router.add_post("/", handler)
+    server = TestServer(app)
+    await server.start_server()
+    uri = URI(str(server.make_url("/")))
+
+    provider = AsyncHTTPProvider(
+        uri,
+        pool_configuration=AsyncHTTPPoolConfiguration(
+            limit_per_host=4, max_in_flight_requests=2
+        ),
+    )
+    try:
+        responses = await asyncio.gather(
+            *[
+                provider._make_request(RPCEndpoint("eth_chainId"), b"request")
+                for _ in range(20)
+            ]
+        )
+        assert responses == [b"response"] * 20
+        assert peak_in_flight == 2
+
+        assert provider.pool_stats == AsyncHTTPPoolStats(
+            requests=20,
+            in_flight=0,
+            queued=0,
+            peak_in_flight=2,
+            limit=100,
+            limit_per_host=4,
+            max_in_flight_requests=2,
+        )
+
+        session = await async_cache_and_return_session(
+            uri, session_pool=provider._session_pool
+        )
+        assert session.connector.limit_per_host == 4
+    finally:
+        request._async_session_pools.pop(provider._session_pool.key)
+        await (
+            await async_cache_and_return_session(
+                uri, session_pool=provider._session_pool
+            )
+        ).close()
+        await server.close()
+    assert AsyncHTTPProvider(uri).pool_stats is None
+
+
+def test_async_pools_are_keyed_by_endpoint_and_configuration():
+    configuration = AsyncHTTPPoolConfiguration(max_in_flight_requests=2)
+    first = AsyncHTTPProvider(TEST_URI, pool_configuration=configuration)
+    same = AsyncHTTPProvider(
+        TEST_URI,
+        pool_configuration=AsyncHTTPPoolConfiguration(max_in_flight_requests=2),
+    )
+    other = AsyncHTTPProvider(
+        TEST_URI,
+        pool_configuration=AsyncHTTPPoolConfiguration(max_in_flight_requests=8),
+    )
+    try:
+        assert first._session_pool is same._session_pool
+        assert first._session_pool is not other._session_pool
+        assert other.pool_stats.max_in_flight_requests == 8
+        assert AsyncHTTPProvider(TEST_URI).pool_stats is None
+    finally:
+        request._async_session_pools.pop(first._session_pool.key)
+        request._async_session_pools.pop(other._session_pool.key)
@@ -4,6 +4,7 @@ from collections import (
     namedtuple,
 )
 import copy
+import functools
 import itertools
 import re
 from typing import (
@@ -13,6 +14,7 @@ from typing import (
     Collection,
     Coroutine,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Mapping,
@@ -20,6 +22,7 @@ from typing import (
     Sequence,
     Tuple,
     Type,
+    TypeVar,
     Union,
     cast,
 )
@@ -700,6 +703,123 @@ def abi_to_signature(abi: Union[ABIFunction, ABIEvent]) -> str:
 ########################################################
 
 
+TNormalizer = TypeVar("TNormalizer", bound=Callable[..., Tuple[TypeStr, Any]])
+
+
+def normalizes_basic_types(*bases: str) -> Callable[[TNormalizer], TNormalizer]:
+    """
+    Declare that a normalizer only modifies values of the basic, non-array, ABI types
+    with one of the ``bases``, e.g. ``"address"`` or ``"bytes"`` for ``bytes`` and
+    ``bytesN``, and returns their type unchanged. ``map_abi_data`` then only calls it
+    with values of those types, without building the typed data tree.
+    """
+
+    def decorator(normalizer: TNormalizer) -> TNormalizer:
+        normalizer._normalized_basic_types = frozenset(  # type: ignore[attr-defined]
+            bases
+        )
+        return normalizer
+
+    return decorator
+
+
+def _normalized_basic_types(
+    normalizer: Callable[[TypeStr, Any], Tuple[TypeStr, Any]]
+) -> Optional[FrozenSet[str]]:
+    bases = getattr(normalizer, "_normalized_basic_types", None)
+    if bases is None and isinstance(normalizer, curry):
+        # a normalizer curried with its leading arguments, e.g. ``abi_ens_resolver``
+        bases = getattr(normalizer.func, "_normalized_basic_types", None)
+    return bases
+
+
+ABIDataNormalizer = Callable[
+    [Sequence[Callable[[TypeStr, Any], Tuple[TypeStr, Any]]], Any], Any
+]
+
+
+def _compile_abi_data_normalizer(
+    normalized_basic_types: Tuple[FrozenSet[str], ...], abi_type: ABIType
+) -> Optional[ABIDataNormalizer]:
+    """
+    Compile the normalization of values of ``abi_type`` by normalizers normalizing
+    the basic types in ``normalized_basic_types``, as ``map_abi_data`` would
+    normalize them. Returns None if the values are left as they are.
+    """
+    if abi_type.is_array:
+        normalize_item = _compile_abi_data_normalizer(
+            normalized_basic_types, abi_type.item_type
+        )
+
+        if normalize_item is None:
+
+            def normalize_array(normalizers: Sequence[Any], value: Any) -> Any:
+                return list(value)
+
+        else:
+
+            def normalize_array(normalizers: Sequence[Any], value: Any) -> Any:
+                return [normalize_item(normalizers, item) for item in value]
+
+        return normalize_array
+
+    if isinstance(abi_type, TupleType):
+        type_str = abi_type.to_type_str()  # type: ignore[no-untyped-call]
+        normalize_components = [
+            _compile_abi_data_normalizer(normalized_basic_types, component)
+            for component in abi_type.components
+        ]
+
+        def normalize_tuple(normalizers: Sequence[Any], value: Any) -> Any:
+            if isinstance(value, abc.Mapping):
+                return _map_abi_data_tree(normalizers, [type_str], [value])[0]
+            return type(value)(
+                component if normalize is None else normalize(normalizers, component)
+                for normalize, component in zip(normalize_components, value)
+            )
+
+        return normalize_tuple
+
+    type_str = abi_type.to_type_str()  # type: ignore[no-untyped-call]
+    indexes = [
+        index
+        for index, bases in enumerate(normalized_basic_types)
+        if cast(BasicType, abi_type).base in bases
+    ]
+    if not indexes:
+        return None
+
+    def normalize_value(normalizers: Sequence[Any], value: Any) -> Any:
+        for index in indexes:
+            _, value = normalizers[index](type_str, value)
+        return value
+
+    return normalize_value
+
+
+def _compile_abi_data_normalizers(
+    normalized_basic_types: Tuple[FrozenSet[str], ...],
+    types: Tuple[Optional[Union[TypeStr, ABIType]], ...],
+) -> Tuple[Optional[ABIDataNormalizer], ...]:
+    return tuple(
+        None
+        if type_str_or_abi_type is None
+        else _compile_abi_data_normalizer(
+            normalized_basic_types,
+            parse(type_str_or_abi_type)
+            if isinstance(type_str_or_abi_type, str)
+            else type_str_or_abi_type,
+        )
+        for type_str_or_abi_type in types
+    )
+
+
+# the normalization plans of the normalizers and types mapped lately
+_cached_abi_data_normalizers = functools.lru_cache(maxsize=1024)(
+    _compile_abi_data_normalizers
+)
+
+
 @curry
 def map_abi_data(
     normalizers: Sequence[Callable[[TypeStr, Any], Tuple[TypeStr, Any]]],
@@ -722,12 +842,41 @@ def map_abi_data(
     Internals
     ---
 
-    This is accomplished by:
+    If every normalizer declares the basic types it normalizes, with
+    ``normalizes_basic_types``, a normalization plan is compiled once for the
+    types, which passes the values of those types to their normalizers, and
+    rebuilds arrays and tuples, in a single pass over the data.
+
+    Otherwise, this is accomplished by:
 
     1. Decorating the data tree with types
     2. Recursively mapping each of the normalizers to the data
     3. Stripping the types back out of the tree
     """
+    normalizers = tuple(normalizers)
+    normalized_basic_types = tuple(map(_normalized_basic_types, normalizers))
+    if None in normalized_basic_types:
+        return _map_abi_data_tree(normalizers, types, data)
+
+    types = tuple(types)
+    try:
+        plan = _cached_abi_data_normalizers(normalized_basic_types, types)
+    except TypeError:
+        # types that can't be hashed, compile the plan without caching it
+        plan = _compile_abi_data_normalizers(normalized_basic_types, types)
+
+    return [
+        value if normalize is None else normalize(normalizers, value)
+        for normalize, value in zip(plan, data)
+    ]
+
+
+def _map_abi_data_tree(
+    normalizers: Sequence[Callable[[TypeStr, Any], Tuple[TypeStr, Any]]],
+    types: Sequence[TypeStr],
+    data: Sequence[Any],
+) -> Any:
+    # ``map_abi_data`` over the typed data tree, for any normalizers
     pipeline = itertools.chain(
         [abi_data_tree(types)],
         map(data_tree_map, normalizers),
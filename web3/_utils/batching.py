@@ -0,0 +1,198 @@
+from contextvars import (
+    ContextVar,
+)
+from types import (
+    TracebackType,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+from web3._utils.compat import (
+    Self,
+)
+from web3.exceptions import (
+    Web3ValueError,
+)
+from web3.types import (
+    RPCEndpoint,
+    RPCResponse,
+    TReturn,
+)
+
+if TYPE_CHECKING:
+    from web3.main import (  # noqa: F401
+        AsyncWeb3,
+        Web3,
+    )
+    from web3.providers import (  # noqa: F401
+        AsyncBaseProvider,
+        BaseProvider,
+    )
+
+
+BatchRequestInformation = Tuple[Tuple[RPCEndpoint, Any], Sequence[Any]]
+
+# The batches collecting requests in the current context, i.e. thread or async task.
+# Requests made by other threads and tasks while a batch is collected are sent as usual.
+_active_batches: "ContextVar[Tuple[RequestBatcher, ...]]" = ContextVar(
+    "active_batches", default=()
+)
+
+
+def is_batching(provider: Union["BaseProvider", "AsyncBaseProvider"]) -> bool:
+    """
+    Whether a batch is collecting requests for ``provider`` in the current thread or
+    async task.
+    """
+    return any(batch._provider is provider for batch in _active_batches.get())
+
+
+class RequestBatcher:
+    """
+    Collects ``Method`` calls made against a ``Web3`` or ``AsyncWeb3`` instance and
+    sends them to the provider as a single JSON-RPC batch request.
+
+    While batching, calls to module methods (e.g. ``w3.eth.get_block(1)``) made in the
+    same thread or async task do not make a request. Instead, they return the request
+    information which is added to the batch via ``add()`` or ``add_mapping()``. The
+    batch is sent with ``execute()`` (``async_execute()`` for ``AsyncWeb3``) and the
+    formatted results are returned in the order the requests were added.
+    """
+
+    def __init__(self, web3: Union["AsyncWeb3", "Web3"]) -> None:
+        self.web3 = web3
+        self._is_batching = False
+        self._requests_info: List[BatchRequestInformation] = []
+        self._async_requests_info: List[
+            Coroutine[Any, Any, BatchRequestInformation]
+        ] = []
+        self._initialize_batching()
+
+    @property
+    def _provider(self) -> Union["BaseProvider", "AsyncBaseProvider"]:
+        return self.web3.provider
+
+    def _validate_is_batching(self) -> None:
+        if not self._is_batching:
+            raise Web3ValueError(
+                "Batch has already been executed or cancelled. Create a new batch to "
+                "issue batched requests."
+            )
+
+    def _initialize_batching(self) -> None:
+        if not self._is_batching:
+            self._is_batching = True
+            _active_batches.set(_active_batches.get() + (self,))
+        self.clear()
+
+    def _end_batching(self) -> None:
+        self._is_batching = False
+        _active_batches.set(
+            tuple(batch for batch in _active_batches.get() if batch is not self)
+        )
+
+    def add(self, batch_payload: TReturn) -> None:
+        self._validate_is_batching()
+        # When batching, module methods return the request information rather than
+        # making the request, so the "result" of the call is cast accordingly.
+        if self._provider.is_async:
+            self._async_requests_info.append(
+                cast(Coroutine[Any, Any, BatchRequestInformation], batch_payload)
+            )
+        else:
+            self._requests_info.append(cast(BatchRequestInformation, batch_payload))
+
+    def add_mapping(
+        self,
+        batch_payload: Dict[Callable[..., Any], List[Any]],
+    ) -> None:
+        self._validate_is_batching()
+        for method, params in batch_payload.items():
+            for param in params:
+                self.add(method(param))
+
+    def execute(self) -> List[RPCResponse]:
+        self._validate_is_batching()
+        requests_info = self._requests_info
+        # stop batching before sending so that any requests made by the middleware
+        # while processing the batch are sent normally
+        self._end_batching()
+        self.clear()
+        return self.web3.manager._make_batch_request(requests_info)
+
+    def clear(self) -> None:
+        self._requests_info = []
+        self._async_requests_info = []
+
+    def cancel(self) -> None:
+        self._end_batching()
+        for unsent_request in self._async_requests_info:
+            # async requests are collected as coroutines that are only awaited when
+            # the batch is executed
+            unsent_request.close()
+        self.clear()
+
+    # -- context manager -- #
+
+    def __enter__(self) -> Self:
+        self._initialize_batching()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Type[BaseException],
+        exc_val: BaseException,
+        exc_tb: TracebackType,
+    ) -> None:
+        self.cancel()
+
+    # -- async -- #
+
+    async def async_execute(self) -> List[RPCResponse]:
+        self._validate_is_batching()
+        # async requests are added to the batch as coroutines that return the request
+        # information when awaited, so they must be awaited while still batching
+        requests_info = [
+            await request_info_coroutine
+            for request_info_coroutine in self._async_requests_info
+        ]
+        self._end_batching()
+        self.clear()
+        return await self.web3.manager._async_make_batch_request(requests_info)
+
+    async def __aenter__(self) -> Self:
+        self._initialize_batching()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException],
+        exc_val: BaseException,
+        exc_tb: TracebackType,
+    ) -> None:
+        self.cancel()
+
+
+def sort_batch_response_by_response_ids(
+    responses: List[RPCResponse],
+) -> List[RPCResponse]:
+    """
+    The JSON-RPC spec allows batch responses to be returned in any order. Requests in
+    a batch are sent with increasing ids, so sorting the responses by id restores the
+    order of the requests.
+    """
+    if all(response.get("id") is not None for response in responses):
+        return sorted(responses, key=lambda response: int(response["id"]))
+    # responses without an id, e.g. errors with a null id, can't be matched
+    return responses
@@ -0,0 +1,269 @@
+import threading
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
+
+from eth_utils import (
+    is_hex,
+    is_integer,
+)
+
+from web3.types import (
+    RPCEndpoint,
+)
+
+# how a request's response depends on the chain
+BLOCK_HASH = "hash"
+BLOCK_NUMBER = "number"
+BLOCK_IN_RESULT = "result"
+CHAIN_HEAD = "head"
+
+HEAD_BLOCK_TAGS = ("latest", "safe", "finalized")
+
+# the index of the block identifier in the params of requests made at a given block
+BLOCK_ID_PARAM_INDEX: Dict[RPCEndpoint, int] = {
+    RPCEndpoint("eth_getBlockByNumber"): 0,
+    RPCEndpoint("eth_getBlockReceipts"): 0,
+    RPCEndpoint("eth_getBlockTransactionCountByNumber"): 0,
+    RPCEndpoint("eth_getTransactionByBlockNumberAndIndex"): 0,
+    RPCEndpoint("eth_getUncleByBlockNumberAndIndex"): 0,
+    RPCEndpoint("eth_getUncleCountByBlockNumber"): 0,
+    RPCEndpoint("eth_call"): 1,
+    RPCEndpoint("eth_getBalance"): 1,
+    RPCEndpoint("eth_getCode"): 1,
+    RPCEndpoint("eth_getTransactionCount"): 1,
+    RPCEndpoint("eth_getProof"): 2,
+    RPCEndpoint("eth_getStorageAt"): 2,
+}
+
+# requests whose response includes the block it depends on
+BLOCK_IN_RESULT_REQUESTS = (
+    RPCEndpoint("eth_getTransactionByHash"),
+    RPCEndpoint("eth_getTransactionReceipt"),
+)
+
+BLOCK_CACHEABLE_REQUESTS = cast(
+    Set[RPCEndpoint],
+    (
+        *BLOCK_ID_PARAM_INDEX,
+        *BLOCK_IN_RESULT_REQUESTS,
+        RPCEndpoint("eth_getLogs"),
+    ),
+)
+
+
+def _block_id_dependency(block_id: Any) -> Optional[Tuple[str, Optional[int]]]:
+    if isinstance(block_id, dict):
+        # EIP-1898 block parameter
+        if "blockHash" in block_id:
+            return BLOCK_HASH, None
+        block_id = block_id.get("blockNumber")
+
+    if is_integer(block_id):
+        return BLOCK_NUMBER, block_id
+    elif block_id is None or block_id in HEAD_BLOCK_TAGS:
+        # the block identifier defaults to "latest" when not provided
+        return CHAIN_HEAD, None
+    elif block_id == "earliest":
+        return BLOCK_NUMBER, 0
+    elif isinstance(block_id, str) and is_hex(block_id):
+        if len(block_id) == 66:
+            return BLOCK_HASH, None
+        return BLOCK_NUMBER, int(block_id, 16)
+
+    # "pending" results, e.g. nonces, change with every transaction and are not cached
+    return None
+
+
+def get_request_block_dependency(
+    method: RPCEndpoint, params: Any
+) -> Optional[Tuple[str, Optional[int]]]:
+    """
+    Returns how the response to a request depends on the chain, along with the block
+    number for requests made at a block number. Returns ``None`` if the request can't
+    be cached.
+
+    - ``BLOCK_HASH``: made at a block hash, the response never changes.
+    - ``BLOCK_NUMBER``: made at a block number, the response may change on a reorg.
+    - ``BLOCK_IN_RESULT``: the response includes the block number it depends on.
+    - ``CHAIN_HEAD``: made at a block tag, e.g. ``latest``, the response may change
+      with each new block.
+    """
+    params = params or []
+    if method in BLOCK_IN_RESULT_REQUESTS:
+        return BLOCK_IN_RESULT, None
+    elif method == "eth_getLogs":
+        filter_params = params[0] if len(params) > 0 else {}
+        if "blockHash" in filter_params:
+            return BLOCK_HASH, None
+
+        from_block = _block_id_dependency(filter_params.get("fromBlock"))
+        to_block = _block_id_dependency(filter_params.get("toBlock"))
+        if from_block is None or to_block is None:
+            return None
+        elif CHAIN_HEAD in (from_block[0], to_block[0]):
+            return CHAIN_HEAD, None
+        return BLOCK_NUMBER, max(from_block[1], to_block[1])
+    elif method in BLOCK_ID_PARAM_INDEX:
+        index = BLOCK_ID_PARAM_INDEX[method]
+        return _block_id_dependency(params[index] if len(params) > index else None)
+
+    return None
+
+
+def _to_block_number(value: Any) -> Optional[int]:
+    if isinstance(value, str):
+        return int(value, 16)
+    return value
+
+
+def get_result_block_number(result: Any) -> Optional[int]:
+    if isinstance(result, dict):
+        return _to_block_number(result.get("blockNumber"))
+    return None
+
+
+class BlockCacheTracker:
+    """
+    Tracks the chain head and the block dependencies of cached responses, so that
+    responses that may have changed are evicted from a provider's request cache.
+
+    Responses made at a block hash, or at a block number at least ``finality_depth``
+    blocks below the head, are final and are not tracked. Responses at more recent block
+    numbers are tracked until they are final and are evicted on a reorg. Responses that
+    depend on the chain head expire after a ttl or when a new head is observed.
+    """
+
+    def __init__(self) -> None:
+        # guards the bulk updates, which iterate over the tracked keys, and is held by
+        # callers to update the request cache along with the tracker
+        self.lock = threading.RLock()
+        self.head_number: Optional[int] = None
+        self.head_hash: Optional[str] = None
+        self.head_observed_at: Optional[float] = None
+        # cache keys of responses that are not yet final, by their block number
+        self._unfinalized_keys: Dict[Hashable, int] = {}
+        # cache keys of responses that depend on the chain head, by their expiry time
+        self._head_keys: Dict[Hashable, float] = {}
+
+    def is_head_stale(self, now: float, ttl: float) -> bool:
+        return self.head_observed_at is None or now >= self.head_observed_at + ttl
+
+    def is_final(self, block_number: int, finality_depth: int) -> bool:
+        return (
+            self.head_number is not None
+            and self.head_number - block_number >= finality_depth
+        )
+
+    def is_valid(self, cache_key: Hashable, now: float) -> bool:
+        expires_at = self._head_keys.get(cache_key)
+        return expires_at is None or now < expires_at
+
+    def track_unfinalized(self, cache_key: Hashable, block_number: int) -> None:
+        self._unfinalized_keys[cache_key] = block_number
+
+    def track_head_dependent(self, cache_key: Hashable, expires_at: float) -> None:
+        self._head_keys[cache_key] = expires_at
+
+    def forget(self, cache_keys: Iterable[Hashable]) -> None:
+        for cache_key in cache_keys:
+            self._unfinalized_keys.pop(cache_key, None)
+            self._head_keys.pop(cache_key, None)
+
+    def evict_from_block(self, block_number: int) -> List[Hashable]:
+        """
+        Stop tracking the responses that depend on ``block_number`` or later and
+        return their cache keys, to be evicted from the request cache.
+        """
+        with self.lock:
+            evicted = [
+                cache_key
+                for cache_key, cached_block_number in list(
+                    self._unfinalized_keys.items()
+                )
+                if cached_block_number >= block_number
+            ]
+            self.forget(evicted)
+            return evicted
+
+    def ancestor_to_verify(self, block: Dict[str, Any]) -> Optional[int]:
+        """
+        Returns the number of the block to request along with the new head ``block``
+        when it is more than one block ahead of the current head, to verify that it
+        descends from it.
+        """
+        number = _to_block_number(block["number"])
+        if self.head_number is not None and number > self.head_number + 1:
+            return self.head_number
+        return None
+
+    def _is_head(self, block: Optional[Dict[str, Any]]) -> bool:
+        return (
+            isinstance(block, dict)
+            and _to_block_number(block.get("number")) == self.head_number
+            and block.get("hash") == self.head_hash
+        )
+
+    def update_head(
+        self,
+        block: Dict[str, Any],
+        now: float,
+        finality_depth: int,
+        ancestor: Optional[Dict[str, Any]] = None,
+    ) -> List[Hashable]:
+        """
+        Observe a new chain head and return the cache keys of the responses that
+        should be evicted from the request cache because of it.
+
+        When the new head is more than one block ahead of the current head,
+        ``ancestor`` is the block requested at the number of the current head, see
+        ``ancestor_to_verify()``. If it is not the current head, or was not requested,
+        the current head is taken as replaced.
+        """
+        number = _to_block_number(block["number"])
+        block_hash = block["hash"]
+        evicted: List[Hashable] = []
+
+        with self.lock:
+            if self.head_number is not None and (number, block_hash) != (
+                self.head_number,
+                self.head_hash,
+            ):
+                replaced_from = None
+                if number <= self.head_number or (
+                    number == self.head_number + 1
+                    and block["parentHash"] != self.head_hash
+                ):
+                    replaced_from = number
+                elif number > self.head_number + 1 and not self._is_head(ancestor):
+                    # the current head was replaced in the blocks since
+                    replaced_from = self.head_number
+
+                if replaced_from is not None:
+                    # How deep the reorg goes is not known, so evict everything that
+                    # is not yet final relative to the replaced block.
+                    evicted.extend(
+                        self.evict_from_block(replaced_from - finality_depth + 1)
+                    )
+                # results at "latest" may have changed with the new head
+                evicted.extend(list(self._head_keys))
+                self._head_keys.clear()
+
+            self.head_number = number
+            self.head_hash = block_hash
+            self.head_observed_at = now
+
+            # responses that are now final no longer need to be tracked
+            for cache_key, block_number in list(self._unfinalized_keys.items()):
+                if self.is_final(block_number, finality_depth):
+                    self._unfinalized_keys.pop(cache_key, None)
+
+        return evicted
@@ -0,0 +1,136 @@
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from eth_typing import (
+    Address,
+    BlockNumber,
+    ChecksumAddress,
+)
+from eth_utils import (
+    keccak,
+)
+from hexbytes import (
+    HexBytes,
+)
+
+from web3.types import (
+    _Hash32,
+)
+
+# the number of bits of a ``logsBloom``, each value setting 3 of them
+BLOOM_BITS = 2048
+
+
+def bloom_mask(value: bytes) -> int:
+    """
+    The bits a value sets in a ``logsBloom``, as an integer: the 3 bits indexed by the
+    low 11 bits of the first 3 pairs of bytes of its keccak hash.
+    """
+    value_hash = keccak(value)
+    mask = 0
+    for i in range(0, 6, 2):
+        mask |= 1 << (((value_hash[i] << 8) | value_hash[i + 1]) % BLOOM_BITS)
+    return mask
+
+
+def _options(value: Any) -> Tuple[int, ...]:
+    # the masks of the values a filter accepts at an address or topic position, none if
+    # it accepts any value
+    if value is None:
+        return ()
+    values = value if isinstance(value, (list, tuple)) else [value]
+    return tuple(sorted({bloom_mask(HexBytes(option)) for option in values}))
+
+
+class LogsBloomFilter:
+    """
+    Tests the ``logsBloom`` of blocks against the addresses and topics of a log
+    filter, to skip the blocks that hold no log matching it.
+
+    The filter is compiled to the bits that must all be set in the bloom of a block
+    holding a matching log, tested in a single operation over all 2048 bits of the
+    bloom, and to the positions accepting any of several values, each tested against
+    the masks of its values. A bloom can give false positives, so a block that may
+    match is not sure to hold a matching log, but a block that does not match holds
+    none.
+    """
+
+    def __init__(
+        self,
+        address: Optional[
+            Union[Address, ChecksumAddress, List[Union[Address, ChecksumAddress]]]
+        ] = None,
+        topics: Optional[Sequence[Optional[Union[_Hash32, List[_Hash32]]]]] = None,
+    ) -> None:
+        positions = [_options(address)] + [_options(topic) for topic in topics or ()]
+        self.required_mask = 0
+        any_of = []
+        for options in positions:
+            if len(options) == 1:
+                self.required_mask |= options[0]
+            elif options:
+                any_of.append(options)
+        self.any_of_masks: Tuple[Tuple[int, ...], ...] = tuple(any_of)
+
+    @property
+    def matches_all(self) -> bool:
+        """
+        Whether the filter accepts any log, so that every block may match.
+        """
+        return not self.required_mask and not self.any_of_masks
+
+    def may_match(self, logs_bloom: Optional[bytes]) -> bool:
+        """
+        Whether a block with ``logs_bloom`` may hold a log matching the filter. A block
+        without a bloom may.
+        """
+        if logs_bloom is None:
+            return True
+
+        bloom = int.from_bytes(logs_bloom, "big")
+        if bloom & self.required_mask != self.required_mask:
+            return False
+        return all(
+            any(bloom & mask == mask for mask in options)
+            for options in self.any_of_masks
+        )
+
+    def matching_blocks(
+        self, blooms: Iterable[Tuple[BlockNumber, Optional[bytes]]]
+    ) -> List[BlockNumber]:
+        """
+        The numbers of the blocks, given with their ``logsBloom``, that may hold a log
+        matching the filter.
+        """
+        if self.matches_all:
+            return [block_number for block_number, _ in blooms]
+        return [
+            block_number
+            for block_number, logs_bloom in blooms
+            if self.may_match(logs_bloom)
+        ]
+
+
+def block_runs(
+    block_numbers: Sequence[BlockNumber], max_blocks: int
+) -> List[Tuple[BlockNumber, BlockNumber]]:
+    """
+    Group sorted block numbers into ranges of consecutive blocks, of at most
+    ``max_blocks`` blocks each.
+    """
+    runs: List[Tuple[BlockNumber, BlockNumber]] = []
+    for block_number in block_numbers:
+        if runs:
+            from_block, to_block = runs[-1]
+            if block_number == to_block + 1 and block_number - from_block < max_blocks:
+                runs[-1] = (from_block, block_number)
+                continue
+        runs.append((block_number, block_number))
+    return runs
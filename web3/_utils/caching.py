@@ -1,15 +1,20 @@
 import collections
 import hashlib
 import threading
+import time
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Coroutine,
+    Hashable,
+    Iterable,
     List,
+    Optional,
     Tuple,
     TypeVar,
     Union,
+    cast,
 )
 
 from eth_utils import (
@@ -23,6 +28,14 @@ from eth_utils import (
     to_bytes,
 )
 
+from web3._utils.block_caching import (
+    BLOCK_HASH,
+    BLOCK_IN_RESULT,
+    BLOCK_NUMBER,
+    CHAIN_HEAD,
+    get_request_block_dependency,
+    get_result_block_number,
+)
 from web3.exceptions import (
     Web3TypeError,
 )
@@ -32,6 +45,9 @@ if TYPE_CHECKING:
         AsyncBaseProvider,
         BaseProvider,
     )
+    from web3.providers.persistent import (  # noqa: F401
+        PersistentConnectionProvider,
+    )
     from web3.types import (  # noqa: F401
         AsyncMakeRequestFn,
         MakeRequestFn,
@@ -43,6 +59,24 @@ if TYPE_CHECKING:
 SYNC_PROVIDER_TYPE = TypeVar("SYNC_PROVIDER_TYPE", bound="BaseProvider")
 ASYNC_PROVIDER_TYPE = TypeVar("ASYNC_PROVIDER_TYPE", bound="AsyncBaseProvider")
 
+CacheKeyFn = Callable[[Any], Hashable]
+
+LATEST_BLOCK_REQUEST = (cast("RPCEndpoint", "eth_getBlockByNumber"), ["latest", False])
+
+# cacheable requests whose responses may change for the same endpoint, e.g. when the
+# node is upgraded or restarted on another chain, which are only cached in memory
+ENDPOINT_STATE_REQUESTS = {
+    "eth_chainId",
+    "net_version",
+    "web3_clientVersion",
+}
+
+# cacheable requests whose responses may change with the chain, but don't include the
+# block they depend on to decide whether they are final, which are only cached in memory
+UNTRACKED_CHAIN_STATE_REQUESTS = {
+    "eth_getRawTransactionByHash",
+}
+
 
 def generate_cache_key(value: Any) -> str:
     """
@@ -64,6 +98,79 @@ def generate_cache_key(value: Any) -> str:
         )
 
 
+def generate_structural_cache_key(value: Any) -> Hashable:
+    """
+    Generates a cache key for the *args and **kwargs without hashing them to text.
+
+    Strings and bytes, e.g. request and subscription ids, are used as the key
+    directly, and ints are keyed by their text, as ``generate_cache_key`` keys them,
+    so that a response echoing a request id as a string matches the request.
+    Containers are canonicalized into nested tuples, with dict items sorted by key, so
+    that the cache's own ``dict`` hashes and compares keys structurally.
+    """
+    # check the exact types of JSON-RPC values first, before the slower abc checks
+    value_type = type(value)
+    if value_type is str or value_type is bytes or value is None:
+        return value
+    elif value_type is int:
+        return str(value)
+    elif value_type is list or value_type is tuple:
+        return tuple([generate_structural_cache_key(item) for item in value])
+    elif value_type is dict:
+        return _structural_dict_key(value)
+    elif value_type is bool or isinstance(value, float):
+        # ``True == 1`` and ``1.0 == 1`` but they are not the same request param
+        return (value_type, value)
+    elif isinstance(value, int):
+        return str(int(value))
+    elif is_bytes(value) or is_text(value) or is_number(value):
+        return value
+    elif is_dict(value):
+        return _structural_dict_key(value)
+    elif is_list_like(value) or isinstance(value, collections.abc.Generator):
+        return tuple(generate_structural_cache_key(item) for item in value)
+    else:
+        raise Web3TypeError(
+            f"Cannot generate cache key for value {value} of type {type(value)}"
+        )
+
+
+def _structural_dict_key(value: Any) -> Hashable:
+    return (
+        dict,
+        tuple(
+            (key, generate_structural_cache_key(value[key]))
+            for key in sorted(value.keys())
+        ),
+    )
+
+
+def generate_request_cache_key(
+    provider: Union[ASYNC_PROVIDER_TYPE, SYNC_PROVIDER_TYPE],
+    method: "RPCEndpoint",
+    params: Any,
+) -> Hashable:
+    """
+    Generates the request cache key for a request using the provider's
+    ``cache_key_fn``. Cached responses are scoped to the thread making the request,
+    unless the cache is persistent and shared with other processes, in which case they
+    are scoped to the endpoint of the provider.
+    """
+    if provider._request_cache.is_persistent:
+        return provider.cache_key_fn((_request_cache_scope(provider), method, params))
+    return provider.cache_key_fn((threading.get_ident(), method, params))
+
+
+def _request_cache_scope(
+    provider: Union[ASYNC_PROVIDER_TYPE, SYNC_PROVIDER_TYPE]
+) -> str:
+    for attribute in ("endpoint_uri", "ipc_path"):
+        endpoint = getattr(provider, attribute, None)
+        if endpoint is not None:
+            return str(endpoint)
+    return type(provider).__name__
+
+
 class RequestInformation:
     def __init__(
         self,
@@ -83,6 +190,20 @@ def is_cacheable_request(
     provider: Union[ASYNC_PROVIDER_TYPE, SYNC_PROVIDER_TYPE], method: "RPCEndpoint"
 ) -> bool:
     if provider.cache_allowed_requests and method in provider.cacheable_requests:
+        return not (
+            provider._request_cache.is_persistent
+            and (
+                method in ENDPOINT_STATE_REQUESTS
+                or method in UNTRACKED_CHAIN_STATE_REQUESTS
+            )
+        )
+    return False
+
+
+def is_block_cacheable_request(
+    provider: Union[ASYNC_PROVIDER_TYPE, SYNC_PROVIDER_TYPE], method: "RPCEndpoint"
+) -> bool:
+    if provider.cache_allowed_requests and method in provider.block_cacheable_requests:
         return True
     return False
 
@@ -98,25 +219,166 @@ def _should_cache_response(response: "RPCResponse") -> bool:
     )
 
 
+def _get_valid_cache_entry(
+    provider: Union[ASYNC_PROVIDER_TYPE, SYNC_PROVIDER_TYPE], cache_key: Hashable
+) -> Optional["RPCResponse"]:
+    cache_result = provider._request_cache.get_cache_entry(cache_key)
+    if cache_result is not None and provider._request_cache_block_tracker.is_valid(
+        cache_key, time.monotonic()
+    ):
+        return cache_result
+    return None
+
+
+def _needs_head(
+    provider: Union[ASYNC_PROVIDER_TYPE, SYNC_PROVIDER_TYPE], dependency: str
+) -> bool:
+    # finality of responses at a block number is decided relative to the chain head
+    return dependency in (
+        BLOCK_NUMBER,
+        BLOCK_IN_RESULT,
+    ) and provider._request_cache_block_tracker.is_head_stale(
+        time.monotonic(), provider.request_cache_head_ttl
+    )
+
+
+def _evict_from_request_cache(
+    provider: Union[ASYNC_PROVIDER_TYPE, SYNC_PROVIDER_TYPE],
+    cache_keys: Iterable[Hashable],
+) -> None:
+    for cache_key in cache_keys:
+        provider._request_cache.pop(cache_key)
+
+
+def _ancestor_request(
+    provider: Union[ASYNC_PROVIDER_TYPE, SYNC_PROVIDER_TYPE],
+    head_response: "RPCResponse",
+) -> Optional[Tuple["RPCEndpoint", List[Any]]]:
+    # the request for the block at the number of the current head, when the new head
+    # is too far ahead of it for its parent hash to show whether it was replaced
+    if not _should_cache_response(head_response):
+        return None
+    block_number = provider._request_cache_block_tracker.ancestor_to_verify(
+        head_response["result"]
+    )
+    if block_number is None:
+        return None
+    return cast("RPCEndpoint", "eth_getBlockByNumber"), [hex(block_number), False]
+
+
+def _update_head(
+    provider: Union[ASYNC_PROVIDER_TYPE, SYNC_PROVIDER_TYPE],
+    head_response: "RPCResponse",
+    ancestor_response: Optional["RPCResponse"] = None,
+) -> None:
+    if not _should_cache_response(head_response):
+        return
+
+    ancestor = None
+    if ancestor_response is not None and _should_cache_response(ancestor_response):
+        ancestor = ancestor_response["result"]
+
+    tracker = provider._request_cache_block_tracker
+    # evict under the tracker's lock, so responses are not cached and tracked for the
+    # old head in between
+    with tracker.lock:
+        evicted = tracker.update_head(
+            head_response["result"],
+            time.monotonic(),
+            provider.request_cache_finality_depth,
+            ancestor,
+        )
+        _evict_from_request_cache(provider, evicted)
+
+
+def _cache_block_dependent_response(
+    provider: Union[ASYNC_PROVIDER_TYPE, SYNC_PROVIDER_TYPE],
+    cache_key: Hashable,
+    block_dependency: Tuple[str, Optional[int]],
+    response: "RPCResponse",
+) -> None:
+    tracker = provider._request_cache_block_tracker
+    dependency, block_number = block_dependency
+    # responses that may still change are only cached in memory, where they are tracked
+    is_persistent = provider._request_cache.is_persistent
+
+    # track and cache the response under the tracker's lock, so that a head update
+    # can't evict the tracked keys in between
+    with tracker.lock:
+        if dependency == CHAIN_HEAD:
+            # the head is not requested to serve these, so they may be served after it
+            # moved, until they expire
+            if provider.request_cache_latest_ttl <= 0 or is_persistent:
+                return
+            tracker.track_head_dependent(
+                cache_key, time.monotonic() + provider.request_cache_latest_ttl
+            )
+        elif dependency != BLOCK_HASH:
+            if dependency == BLOCK_IN_RESULT:
+                block_number = get_result_block_number(response["result"])
+                if block_number is None:
+                    # e.g. a pending transaction
+                    return
+            if not tracker.is_final(
+                block_number, provider.request_cache_finality_depth
+            ):
+                if is_persistent:
+                    return
+                tracker.track_unfinalized(cache_key, block_number)
+
+        _, evicted_items = provider._request_cache.cache(cache_key, response)
+        if evicted_items is not None:
+            tracker.forget(evicted_items)
+
+
+def _handle_block_cacheable_request(
+    provider: SYNC_PROVIDER_TYPE,
+    func: Callable[[SYNC_PROVIDER_TYPE, "RPCEndpoint", Any], "RPCResponse"],
+    method: "RPCEndpoint",
+    params: Any,
+) -> "RPCResponse":
+    block_dependency = get_request_block_dependency(method, params)
+    if block_dependency is None:
+        return func(provider, method, params)
+
+    if _needs_head(provider, block_dependency[0]):
+        # request the head directly, rather than from the request cache
+        head_response = func(provider, *LATEST_BLOCK_REQUEST)
+        ancestor_request = _ancestor_request(provider, head_response)
+        ancestor_response = (
+            func(provider, *ancestor_request) if ancestor_request is not None else None
+        )
+        _update_head(provider, head_response, ancestor_response)
+
+    cache_key = generate_request_cache_key(provider, method, params)
+    cache_result = _get_valid_cache_entry(provider, cache_key)
+    if cache_result is not None:
+        return cache_result
+
+    response = func(provider, method, params)
+    if _should_cache_response(response):
+        _cache_block_dependent_response(provider, cache_key, block_dependency, response)
+    return response
+
+
 def handle_request_caching(
     func: Callable[[SYNC_PROVIDER_TYPE, "RPCEndpoint", Any], "RPCResponse"]
 ) -> Callable[..., "RPCResponse"]:
     def wrapper(
         provider: SYNC_PROVIDER_TYPE, method: "RPCEndpoint", params: Any
     ) -> "RPCResponse":
-        if is_cacheable_request(provider, method):
+        if is_block_cacheable_request(provider, method):
+            return _handle_block_cacheable_request(provider, func, method, params)
+        elif is_cacheable_request(provider, method):
             request_cache = provider._request_cache
-            cache_key = generate_cache_key(
-                f"{threading.get_ident()}:{(method, params)}"
-            )
+            cache_key = generate_request_cache_key(provider, method, params)
             cache_result = request_cache.get_cache_entry(cache_key)
             if cache_result is not None:
                 return cache_result
             else:
                 response = func(provider, method, params)
                 if _should_cache_response(response):
-                    with provider._request_cache_lock:
-                        request_cache.cache(cache_key, response)
+                    request_cache.cache(cache_key, response)
                 return response
         else:
             return func(provider, method, params)
@@ -129,6 +391,107 @@ def handle_request_caching(
 # -- async -- #
 
 
+async def _async_request_head(
+    provider: ASYNC_PROVIDER_TYPE,
+    func: Callable[
+        [ASYNC_PROVIDER_TYPE, "RPCEndpoint", Any], Coroutine[Any, Any, "RPCResponse"]
+    ],
+    request: Tuple["RPCEndpoint", List[Any]] = LATEST_BLOCK_REQUEST,
+) -> "RPCResponse":
+    # request the head directly, rather than from the request cache
+    method, params = request
+    if not provider.has_persistent_connection:
+        return await func(provider, method, params)
+
+    # Persistent connection providers match responses to the request information
+    # cached for the next request id. The head is requested before the request being
+    # handled is sent, so cache request information for it, bumping that of the
+    # request being handled to the next id, and remove it once the head is received.
+    request_processor = cast(
+        "PersistentConnectionProvider", provider
+    )._request_processor
+    cache_key = request_processor.cache_request_information(
+        method, params, response_formatters=()
+    )
+    try:
+        return await func(provider, method, params)
+    finally:
+        if cache_key is not None:
+            request_processor.pop_cached_request_information(cache_key)
+
+
+async def _async_handle_block_cacheable_request(
+    provider: ASYNC_PROVIDER_TYPE,
+    func: Callable[
+        [ASYNC_PROVIDER_TYPE, "RPCEndpoint", Any], Coroutine[Any, Any, "RPCResponse"]
+    ],
+    method: "RPCEndpoint",
+    params: Any,
+) -> "RPCResponse":
+    block_dependency = get_request_block_dependency(method, params)
+    if block_dependency is None:
+        return await func(provider, method, params)
+
+    if _needs_head(provider, block_dependency[0]):
+        head_response = await _async_request_head(provider, func)
+        ancestor_request = _ancestor_request(provider, head_response)
+        ancestor_response = (
+            await _async_request_head(provider, func, ancestor_request)
+            if ancestor_request is not None
+            else None
+        )
+        _update_head(provider, head_response, ancestor_response)
+
+    cache_key = generate_request_cache_key(provider, method, params)
+    cache_result = _get_valid_cache_entry(provider, cache_key)
+    if cache_result is not None:
+        return cache_result
+
+    response = await func(provider, method, params)
+    if _should_cache_response(response):
+        _cache_block_dependent_response(provider, cache_key, block_dependency, response)
+    return response
+
+
+async def _async_make_request(
+    provider: ASYNC_PROVIDER_TYPE,
+    func: Callable[
+        [ASYNC_PROVIDER_TYPE, "RPCEndpoint", Any], Coroutine[Any, Any, "RPCResponse"]
+    ],
+    method: "RPCEndpoint",
+    params: Any,
+) -> "RPCResponse":
+    if is_block_cacheable_request(provider, method):
+        return await _async_handle_block_cacheable_request(
+            provider, func, method, params
+        )
+    elif is_cacheable_request(provider, method):
+        request_cache = provider._request_cache
+        cache_key = generate_request_cache_key(provider, method, params)
+        cache_result = request_cache.get_cache_entry(cache_key)
+        if cache_result is not None:
+            return cache_result
+        else:
+            response = await func(provider, method, params)
+            if _should_cache_response(response):
+                request_cache.cache(cache_key, response)
+            return response
+    else:
+        return await func(provider, method, params)
+
+
+def is_coalescable_request(
+    provider: ASYNC_PROVIDER_TYPE, method: "RPCEndpoint"
+) -> bool:
+    # Persistent connection providers match responses to the request information
+    # cached for each request sent, so their requests are not coalesced.
+    return (
+        provider.coalesce_requests
+        and method in provider.coalescable_requests
+        and not provider.has_persistent_connection
+    )
+
+
 def async_handle_request_caching(
     func: Callable[
         [ASYNC_PROVIDER_TYPE, "RPCEndpoint", Any], Coroutine[Any, Any, "RPCResponse"]
@@ -137,22 +500,12 @@ def async_handle_request_caching(
     async def wrapper(
         provider: ASYNC_PROVIDER_TYPE, method: "RPCEndpoint", params: Any
     ) -> "RPCResponse":
-        if is_cacheable_request(provider, method):
-            request_cache = provider._request_cache
-            cache_key = generate_cache_key(
-                f"{threading.get_ident()}:{(method, params)}"
+        if is_coalescable_request(provider, method):
+            return await provider._request_coalescer.coalesce(
+                provider.cache_key_fn((method, params)),
+                lambda: _async_make_request(provider, func, method, params),
             )
-            cache_result = request_cache.get_cache_entry(cache_key)
-            if cache_result is not None:
-                return cache_result
-            else:
-                response = await func(provider, method, params)
-                if _should_cache_response(response):
-                    async with provider._request_cache_lock:
-                        request_cache.cache(cache_key, response)
-                return response
-        else:
-            return await func(provider, method, params)
+        return await _async_make_request(provider, func, method, params)
 
     # save a reference to the decorator on the wrapped function
     wrapper._decorator = async_handle_request_caching  # type: ignore
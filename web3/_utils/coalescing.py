@@ -0,0 +1,124 @@
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Hashable,
+    NamedTuple,
+    Set,
+    Tuple,
+    cast,
+)
+
+from web3._utils.block_caching import (
+    BLOCK_CACHEABLE_REQUESTS,
+)
+from web3.types import (
+    RPCEndpoint,
+)
+
+if TYPE_CHECKING:
+    from web3.types import (  # noqa: F401
+        RPCResponse,
+    )
+
+
+# read-only requests whose concurrent, identical calls can share one response
+COALESCABLE_REQUESTS = cast(
+    Set[RPCEndpoint],
+    (
+        *BLOCK_CACHEABLE_REQUESTS,
+        "eth_blockNumber",
+        "eth_chainId",
+        "eth_estimateGas",
+        "eth_feeHistory",
+        "eth_gasPrice",
+        "eth_getBlockByHash",
+        "eth_getBlockTransactionCountByHash",
+        "eth_getRawTransactionByHash",
+        "eth_getTransactionByBlockHashAndIndex",
+        "eth_getTransactionByHash",
+        "eth_getUncleByBlockHashAndIndex",
+        "eth_getUncleCountByBlockHash",
+        "eth_maxPriorityFeePerGas",
+        "eth_syncing",
+        "net_version",
+        "web3_clientVersion",
+    ),
+)
+
+
+class CoalescingStats(NamedTuple):
+    # requests sent to the provider
+    requests: int
+    # requests that shared the response of an identical in-flight request
+    coalesced: int
+
+
+class RequestCoalescer:
+    """
+    Shares the response of an in-flight request with the identical requests made while
+    it is in flight, so that only the first of them is sent ("single-flight").
+
+    If the request being shared is cancelled, the requests waiting on it are sent
+    instead. Errors are raised to every request sharing it. Requests are only shared
+    within an event loop, as futures can't be awaited from another loop.
+    """
+
+    def __init__(self) -> None:
+        # in-flight requests by the id of their event loop and their key
+        self._in_flight: Dict[Tuple[int, Hashable], "asyncio.Future[RPCResponse]"] = {}
+        self._requests = 0
+        self._coalesced = 0
+
+    @property
+    def stats(self) -> CoalescingStats:
+        return CoalescingStats(self._requests, self._coalesced)
+
+    def reset_stats(self) -> None:
+        self._requests = self._coalesced = 0
+
+    async def coalesce(
+        self,
+        key: Hashable,
+        make_request: Callable[[], Coroutine[Any, Any, "RPCResponse"]],
+    ) -> "RPCResponse":
+        loop = asyncio.get_running_loop()
+        in_flight_key = (id(loop), key)
+        future = self._in_flight.get(in_flight_key)
+        while future is not None:
+            try:
+                # shield the shared request from the cancellation of this one
+                response = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    # this request was cancelled
+                    raise
+                # the shared request was cancelled, send this request if no other
+                # request has taken its place
+                future = self._in_flight.get(in_flight_key)
+            else:
+                self._coalesced += 1
+                return response
+
+        future = loop.create_future()
+        self._in_flight[in_flight_key] = future
+        self._requests += 1
+        try:
+            response = await make_request()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # mark the exception as retrieved, in case no requests are waiting on it
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            if self._in_flight.get(in_flight_key) is future:
+                del self._in_flight[in_flight_key]
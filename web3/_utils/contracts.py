@@ -4,6 +4,8 @@ from typing import (
     Any,
     Callable,
     Dict,
+    List,
+    Mapping,
     Optional,
     Sequence,
     Tuple,
@@ -15,6 +17,17 @@ from typing import (
 from eth_abi.codec import (
     ABICodec,
 )
+from eth_abi.encoding import (
+    TupleEncoder,
+)
+from eth_abi.exceptions import (
+    EncodingError,
+    ParseError,
+)
+from eth_abi.grammar import (
+    BasicType,
+    parse,
+)
 from eth_abi.registry import (
     registry as default_registry,
 )
@@ -31,6 +44,7 @@ from eth_utils import (
     is_checksum_address,
     is_list_like,
     is_text,
+    to_bytes,
 )
 from eth_utils.toolz import (
     pipe,
@@ -41,7 +55,6 @@ from hexbytes import (
 
 from web3._utils.abi import (
     abi_to_signature,
-    check_if_arguments_can_be_encoded,
     filter_by_argument_count,
     filter_by_argument_name,
     filter_by_encodability,
@@ -59,6 +72,7 @@ from web3._utils.blocks import (
     is_hex_encoded_block_hash,
 )
 from web3._utils.encoding import (
+    hexstr_if_str,
     to_hex,
 )
 from web3._utils.function_identifiers import (
@@ -88,6 +102,9 @@ from web3.types import (
     BlockNumber,
     TxParams,
 )
+from web3.utils.caching import (
+    SimpleCache,
+)
 
 if TYPE_CHECKING:
     from web3 import (  # noqa: F401
@@ -210,20 +227,118 @@ def find_matching_fn_abi(
         raise Web3ValidationError(message)
 
 
-def encode_abi(
-    w3: Union["AsyncWeb3", "Web3"],
-    abi: ABIFunction,
-    arguments: Sequence[Any],
-    data: Optional[HexStr] = None,
-) -> HexStr:
-    argument_types = get_abi_input_types(abi)
+class FunctionABIResolver:
+    """
+    Resolves the functions of a contract ABI called by name with some arguments, as
+    ``find_matching_fn_abi`` does, caching the functions with each name and number
+    of arguments, and their selectors.
+
+    A call to a function that isn't overloaded for that number of arguments resolves
+    to it without checking that the arguments can be encoded, which encoding them
+    does anyway. Only the overloads of a function are checked against the arguments,
+    since whether a value can be encoded with a type depends on the value and not
+    only on its type.
+    """
 
-    if not check_if_arguments_can_be_encoded(abi, w3.codec, arguments, {}):
-        raise Web3TypeError(
-            "One or more arguments could not be encoded to the necessary "
-            f"ABI type. Expected types are: {', '.join(argument_types)}"
+    def __init__(self, abi: ABI) -> None:
+        self.abi = abi
+        self._candidates: Dict[Tuple[str, int], Tuple[ABIFunction, ...]] = {}
+        self._selectors: Dict[int, Tuple[ABIFunction, HexStr]] = {}
+
+    def candidates(self, fn_name: str, num_arguments: int) -> Tuple[ABIFunction, ...]:
+        """
+        The functions named ``fn_name`` taking ``num_arguments`` arguments.
+        """
+        key = (fn_name, num_arguments)
+        candidates = self._candidates.get(key)
+        if candidates is None:
+            candidates = tuple(
+                cast(ABIFunction, fn_abi)
+                for fn_abi in filter_by_argument_count(
+                    num_arguments, filter_by_name(fn_name, self.abi)
+                )
+            )
+            self._candidates[key] = candidates
+        return candidates
+
+    def selector(self, fn_abi: ABIFunction) -> HexStr:
+        # keyed by the identity of the function ABIs, held by the contract ABI
+        cached = self._selectors.get(id(fn_abi))
+        if cached is not None and cached[0] is fn_abi:
+            return cached[1]
+        selector = encode_hex(
+            function_abi_to_4byte_selector(cast(Dict[str, Any], fn_abi))
         )
+        self._selectors[id(fn_abi)] = (fn_abi, selector)
+        return selector
+
+    def resolve(
+        self,
+        abi_codec: ABICodec,
+        fn_name: str,
+        args: Optional[Sequence[Any]] = None,
+        kwargs: Optional[Any] = None,
+    ) -> Tuple[ABIFunction, bool]:
+        """
+        The function called by name with the arguments, and whether the arguments
+        were checked to be encodable with it. Raises the errors of
+        ``find_matching_fn_abi`` if no function or several match.
+        """
+        args = args or tuple()
+        kwargs = kwargs or dict()
+        candidates = self.candidates(fn_name, len(args) + len(kwargs))
+        if len(candidates) == 1:
+            return candidates[0], False
+
+        matching = filter_by_encodability(abi_codec, args, kwargs, list(candidates))
+        if len(matching) != 1:
+            # raise the diagnosis of the failed resolution
+            find_matching_fn_abi(self.abi, abi_codec, fn_name, args, kwargs)
+        return matching[0], True
+
+    def function_info(
+        self,
+        abi_codec: ABICodec,
+        fn_name: str,
+        args: Optional[Sequence[Any]] = None,
+        kwargs: Optional[Any] = None,
+    ) -> Tuple[ABIFunction, HexStr, Tuple[Any, ...]]:
+        """
+        ``get_function_info`` for the function resolved from the arguments, raising
+        the errors of ``find_matching_fn_abi`` if they cannot be encoded with it.
+        """
+        args = args or tuple()
+        kwargs = kwargs or dict()
+        fn_abi, checked = self.resolve(abi_codec, fn_name, args, kwargs)
+        try:
+            fn_arguments = merge_args_and_kwargs(fn_abi, args, kwargs)
+            _, aligned_fn_arguments = get_aligned_abi_inputs(fn_abi, fn_arguments)
+        except TypeError:
+            if not checked:
+                find_matching_fn_abi(self.abi, abi_codec, fn_name, args, kwargs)
+            raise
+        return fn_abi, self.selector(fn_abi), aligned_fn_arguments
+
+
+def _normalize_address_argument(w3: Union["AsyncWeb3", "Web3"], value: Any) -> Any:
+    _, value = abi_address_to_hex("address", value)
+    if not w3.eth.is_async:
+        _, value = abi_ens_resolver(w3, "address", value)
+    return value
+
+
+def _normalize_bytes_argument(w3: Union["AsyncWeb3", "Web3"], value: Any) -> Any:
+    # ``abi_bytes_to_bytes`` for a type already known to be ``bytes`` or ``bytesN``
+    return hexstr_if_str(to_bytes, value)
+
+
+def _normalize_string_argument(w3: Union["AsyncWeb3", "Web3"], value: Any) -> Any:
+    return abi_string_to_text("string", value)[1]
+
 
+def _argument_normalizers(
+    w3: Union["AsyncWeb3", "Web3"]
+) -> List[Callable[[TypeStr, Any], Tuple[TypeStr, Any]]]:
     normalizers = [
         abi_address_to_hex,
         abi_bytes_to_bytes,
@@ -231,15 +346,152 @@ def encode_abi(
     ]
     if not w3.eth.is_async:
         normalizers.append(abi_ens_resolver(w3))
+    return normalizers
+
+
+def _compile_argument_normalizer(
+    type_str: TypeStr,
+) -> Optional[Callable[[Union["AsyncWeb3", "Web3"], Any], Any]]:
+    # the normalization of arguments of type ``type_str`` by the argument normalizers,
+    # or None if none of them applies to the type
+    if type_str == "address":
+        return _normalize_address_argument
+    elif type_str == "string":
+        return _normalize_string_argument
+
+    try:
+        abi_type = parse(type_str)
+    except ParseError:
+        abi_type = None
+    if isinstance(abi_type, BasicType) and not abi_type.is_array:
+        return _normalize_bytes_argument if abi_type.base == "bytes" else None
+
+    def normalize_argument_tree(w3: Union["AsyncWeb3", "Web3"], value: Any) -> Any:
+        # the elements of arrays and tuples are normalized by their own types
+        return map_abi_data(_argument_normalizers(w3), [type_str], [value])[0]
+
+    return normalize_argument_tree
+
+
+def _is_encodable(encoder: Any, value: Any) -> bool:
+    # ``ABICodec.is_encodable`` with the encoder of the type already looked up
+    try:
+        encoder.validate_value(value)
+    except EncodingError:
+        return False
+    except AttributeError:
+        try:
+            encoder(value)
+        except EncodingError:
+            return False
+    return True
+
+
+class FunctionEncoder:
+    """
+    Encodes the arguments of calls to a function, or constructor, ABI. The encoders
+    of its argument types are looked up in the registry of the codec once, along with
+    the normalizers that apply to each argument type, and the function selector is
+    computed once.
+    """
 
-    normalized_arguments = map_abi_data(
-        normalizers,
-        argument_types,
-        arguments,
-    )
-    encoded_arguments = w3.codec.encode(
-        argument_types,
-        normalized_arguments,
+    def __init__(self, abi_codec: ABICodec, abi: ABIFunction) -> None:
+        self.abi_codec = abi_codec
+        self.abi = abi
+        self.types = get_abi_input_types(abi)
+        self.selector = (
+            function_abi_to_4byte_selector(cast(Dict[str, Any], abi))
+            if abi.get("type", "function") == "function"
+            else b""
+        )
+
+        self._encoders: Optional[Tuple[Any, ...]] = None
+        self._tuple_encoder: Optional[TupleEncoder] = None
+        if all(abi_codec.is_encodable_type(type_str) for type_str in self.types):
+            self._encoders = tuple(
+                abi_codec._registry.get_encoder(type_str) for type_str in self.types
+            )
+            self._tuple_encoder = TupleEncoder(  # type: ignore[no-untyped-call]
+                encoders=self._encoders
+            )
+        self._aligns_arguments = any(
+            input_abi["type"].startswith("tuple") for input_abi in abi.get("inputs", [])
+        )
+        self._normalizers = tuple(
+            _compile_argument_normalizer(type_str) for type_str in self.types
+        )
+
+    def can_encode(self, arguments: Sequence[Any]) -> bool:
+        """
+        ``check_if_arguments_can_be_encoded`` for the arguments of a call.
+        """
+        if self._encoders is None or len(arguments) != len(self.types):
+            return False
+
+        if self._aligns_arguments or isinstance(arguments, Mapping):
+            try:
+                _, arguments = get_aligned_abi_inputs(
+                    self.abi, cast(Tuple[Any, ...], arguments)
+                )
+            except TypeError:
+                return False
+
+        return all(
+            _is_encodable(encoder, argument)
+            for encoder, argument in zip(self._encoders, arguments)
+        )
+
+    def encode_arguments(
+        self, w3: Union["AsyncWeb3", "Web3"], arguments: Sequence[Any]
+    ) -> bytes:
+        """
+        The ABI encoding of the arguments of a call, normalized as ``encode_abi``
+        normalizes them.
+        """
+        if not self.can_encode(arguments):
+            raise Web3TypeError(
+                "One or more arguments could not be encoded to the necessary "
+                f"ABI type. Expected types are: {', '.join(self.types)}"
+            )
+
+        normalized_arguments = [
+            argument if normalizer is None else normalizer(w3, argument)
+            for normalizer, argument in zip(self._normalizers, arguments)
+        ]
+        return cast(TupleEncoder, self._tuple_encoder)(normalized_arguments)
+
+    def encode_call(
+        self, w3: Union["AsyncWeb3", "Web3"], arguments: Sequence[Any]
+    ) -> HexStr:
+        """
+        The calldata of a call to the function: its selector followed by the
+        encoding of the arguments.
+        """
+        return encode_hex(self.selector + self.encode_arguments(w3, arguments))
+
+
+# the encoders of the function ABIs encoded lately, keyed by the identity of the ABI
+# and of the codec, which the encoders hold on to
+_function_encoders = SimpleCache(1000)
+
+
+def get_function_encoder(abi_codec: ABICodec, abi: ABIFunction) -> FunctionEncoder:
+    key = (id(abi), id(abi_codec))
+    encoder = _function_encoders.get_cache_entry(key)
+    if encoder is None or encoder.abi is not abi or encoder.abi_codec is not abi_codec:
+        encoder = FunctionEncoder(abi_codec, abi)
+        _function_encoders.cache(key, encoder)
+    return encoder
+
+
+def encode_abi(
+    w3: Union["AsyncWeb3", "Web3"],
+    abi: ABIFunction,
+    arguments: Sequence[Any],
+    data: Optional[HexStr] = None,
+) -> HexStr:
+    encoded_arguments = get_function_encoder(w3.codec, abi).encode_arguments(
+        w3, arguments
     )
     if data:
         return to_hex(HexBytes(data) + encoded_arguments)
@@ -309,14 +561,14 @@ def encode_transaction_data(
             contract_abi, fn_abi
         )
     elif is_text(fn_identifier):
-        fn_abi, fn_selector, fn_arguments = get_function_info(
-            # type ignored b/c fn_id here is always str b/c FallbackFn is handled above
-            fn_identifier,  # type: ignore
-            w3.codec,
-            contract_abi,
-            fn_abi,
-            args,
-            kwargs,
+        if fn_abi is None:
+            fn_abi = find_matching_fn_abi(
+                contract_abi, w3.codec, fn_identifier, args, kwargs
+            )
+        fn_arguments = merge_args_and_kwargs(fn_abi, args or tuple(), kwargs or {})
+        _, aligned_fn_arguments = get_aligned_abi_inputs(fn_abi, fn_arguments)
+        return get_function_encoder(w3.codec, fn_abi).encode_call(
+            w3, aligned_fn_arguments
         )
     else:
         raise Web3TypeError("Unsupported function identifier")
@@ -5,10 +5,12 @@ from abc import (
 from enum import (
     Enum,
 )
+import functools
 import itertools
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Collection,
     Dict,
     Iterable,
@@ -26,6 +28,13 @@ from eth_abi import (
 from eth_abi.codec import (
     ABICodec,
 )
+from eth_abi.decoding import (
+    ContextFramesBytesIO,
+    TupleDecoder,
+)
+from eth_abi.exceptions import (
+    DecodingError,
+)
 from eth_typing import (
     ChecksumAddress,
     HexStr,
@@ -55,11 +64,11 @@ from eth_utils.toolz import (
 
 import web3
 from web3._utils.abi import (
+    _named_subtree,
     exclude_indexed_event_inputs,
     get_indexed_event_inputs,
     get_normalized_abi_arg_type,
     map_abi_data,
-    named_tree,
     normalize_event_input_types,
 )
 from web3._utils.encoding import (
@@ -104,6 +113,8 @@ if TYPE_CHECKING:
 def _log_entry_data_to_bytes(
     log_entry_data: Union[Primitives, HexStr, str],
 ) -> bytes:
+    if isinstance(log_entry_data, bytes):
+        return log_entry_data
     return hexstr_if_str(to_bytes, log_entry_data)
 
 
@@ -220,92 +231,401 @@ def get_event_abi_types_for_decoding(
             yield get_normalized_abi_arg_type(input_abi)
 
 
-@curry
-def get_event_data(
-    abi_codec: ABICodec,
-    event_abi: ABIEvent,
-    log_entry: LogReceipt,
-) -> EventData:
+def _is_array_or_tuple_type(type_str: TypeStr) -> bool:
+    abi_type = grammar.parse(type_str)
+    return abi_type.is_array or isinstance(abi_type, grammar.TupleType)
+
+
+def _compile_type_normalizer(
+    normalizers: Sequence[Callable[[TypeStr, Any], Tuple[TypeStr, Any]]],
+    type_str: TypeStr,
+) -> Callable[[Any], Any]:
     """
-    Given an event ABI and a log entry for that event, return the decoded
-    event data
+    Return a function applying ``normalizers`` to values of type ``type_str``, as
+    ``map_abi_data`` would. Arrays and tuples are handed to ``map_abi_data``, values
+    of other types are passed to the normalizers directly.
     """
-    if event_abi["anonymous"]:
-        log_topics = log_entry["topics"]
-    elif not log_entry["topics"]:
-        raise MismatchedABI("Expected non-anonymous event to have 1 or more topics")
-    elif event_abi_to_log_topic(dict(event_abi)) != _log_entry_data_to_bytes(
-        log_entry["topics"][0]
-    ):
-        raise MismatchedABI("The event signature did not match the provided ABI")
+    if _is_array_or_tuple_type(type_str):
+        return lambda value: map_abi_data(normalizers, [type_str], [value])[0]
+
+    def normalize(value: Any) -> Any:
+        for normalizer in normalizers:
+            _, value = normalizer(type_str, value)
+        return value
+
+    if type_str == "address":
+        # checksumming an address hashes it, and the same addresses recur across logs
+        return functools.lru_cache(maxsize=1024)(normalize)
+    return normalize
+
+
+_ZERO_PADDING = bytes(32)
+
+
+def _compile_word_decoder(
+    type_str: TypeStr, decode_word: Callable[[bytes], Any]
+) -> Optional[Callable[[bytes], Any]]:
+    """
+    Return a function decoding a 32 byte word of an integer, address, boolean or
+    fixed size bytes type, or ``None`` for other types. Words that the ABI decoder for
+    the type would reject are handed to ``decode_word``, which raises its error.
+    """
+    abi_type = grammar.parse(type_str)
+    if not isinstance(abi_type, grammar.BasicType) or abi_type.is_array:
+        return None
+
+    base, sub = abi_type.base, abi_type.sub
+    if base == "uint":
+        upper_bound = 2**sub
+
+        def decode(word: bytes) -> Any:
+            value = int.from_bytes(word, "big")
+            return value if value < upper_bound else decode_word(word)
+
+    elif base == "int":
+        bound = 2 ** (sub - 1)
+
+        def decode(word: bytes) -> Any:
+            value = int.from_bytes(word, "big", signed=True)
+            return value if -bound <= value < bound else decode_word(word)
+
+    elif base == "address":
+        address_padding = _ZERO_PADDING[:12]
+
+        def decode(word: bytes) -> Any:
+            if word[:12] != address_padding:
+                return decode_word(word)
+            return "0x" + word[12:].hex()
+
+    elif base == "bool":
+
+        def decode(word: bytes) -> Any:
+            if word[:31] != _ZERO_PADDING[:31] or word[31] > 1:
+                return decode_word(word)
+            return word[31] == 1
+
+    elif base == "bytes" and sub is not None:
+        bytes_padding = _ZERO_PADDING[sub:]
+
+        def decode(word: bytes) -> Any:
+            if word[sub:] != bytes_padding:
+                return decode_word(word)
+            return word[:sub]
+
     else:
-        log_topics = log_entry["topics"][1:]
+        return None
+
+    return decode
 
-    log_topics_bytes = [_log_entry_data_to_bytes(topic) for topic in log_topics]
-    log_topics_abi = get_indexed_event_inputs(event_abi)
-    log_topic_normalized_inputs = normalize_event_input_types(log_topics_abi)
-    log_topic_types = get_event_abi_types_for_decoding(log_topic_normalized_inputs)
-    log_topic_names = get_abi_input_names(ABIEvent({"inputs": log_topics_abi}))
 
-    if len(log_topics_bytes) != len(log_topic_types):
-        raise LogTopicError(
-            f"Expected {len(log_topic_types)} log topics.  Got {len(log_topics_bytes)}"
+class EventDecoder:
+    """
+    Decodes the logs of a single event.
+
+    Everything that depends on the event ABI alone -- the event topic, the types and
+    names of the indexed and non-indexed inputs and the decoders and normalizers for
+    them -- is computed when the decoder is built, rather than for every log.
+    """
+
+    def __init__(self, abi_codec: ABICodec, event_abi: ABIEvent) -> None:
+        self.abi_codec = abi_codec
+        self.event_abi = event_abi
+        self.event_name = event_abi["name"]
+        self.anonymous = event_abi["anonymous"]
+        self.topic = None if self.anonymous else event_abi_to_log_topic(dict(event_abi))
+
+        topics_abi = get_indexed_event_inputs(event_abi)
+        self.topic_types = get_event_abi_types_for_decoding(
+            normalize_event_input_types(topics_abi)
         )
+        self.topic_names = tuple(get_abi_input_names(ABIEvent({"inputs": topics_abi})))
 
-    log_data = _log_entry_data_to_bytes(log_entry["data"])
-    log_data_abi = exclude_indexed_event_inputs(event_abi)
-    log_data_normalized_inputs = normalize_event_input_types(log_data_abi)
-    log_data_types = get_event_abi_types_for_decoding(log_data_normalized_inputs)
-    log_data_names = get_abi_input_names(ABIEvent({"inputs": log_data_abi}))
-
-    # sanity check that there are not name intersections between the topic
-    # names and the data argument names.
-    duplicate_names = set(log_topic_names).intersection(log_data_names)
-    if duplicate_names:
-        raise InvalidEventABI(
+        data_abi = exclude_indexed_event_inputs(event_abi)
+        self._data_inputs = normalize_event_input_types(data_abi)
+        self.data_types = get_event_abi_types_for_decoding(self._data_inputs)
+        self.data_names = tuple(get_abi_input_names(ABIEvent({"inputs": data_abi})))
+
+        # sanity check that there are not name intersections between the topic
+        # names and the data argument names, raised when a log is decoded
+        duplicate_names = set(self.topic_names).intersection(self.data_names)
+        self._duplicate_names_message = (
             "The following argument names are duplicated "
             f"between event inputs: '{', '.join(duplicate_names)}'"
+            if duplicate_names
+            else None
         )
 
-    decoded_log_data = abi_codec.decode(log_data_types, log_data)
-    normalized_log_data = map_abi_data(
-        BASE_RETURN_NORMALIZERS, log_data_types, decoded_log_data
-    )
-    named_log_data = named_tree(
-        log_data_normalized_inputs,
-        normalized_log_data,
-    )
+        # ``ABICodec.decode`` looks up the decoders for the types it is given on every
+        # call, these are looked up once instead
+        registry = abi_codec._registry
+        self._stream_class: Callable[
+            [bytes], ContextFramesBytesIO
+        ] = abi_codec.stream_class
+        self._topic_decoders: Tuple[Callable[[ContextFramesBytesIO], Any], ...] = tuple(
+            registry.get_decoder(topic_type) for topic_type in self.topic_types
+        )
+        self._data_decoder: Callable[
+            [ContextFramesBytesIO], Tuple[Any, ...]
+        ] = TupleDecoder(  # type: ignore[no-untyped-call]
+            decoders=[registry.get_decoder(data_type) for data_type in self.data_types]
+        )
 
-    decoded_topic_data = [
-        abi_codec.decode([topic_type], topic_data)[0]
-        for topic_type, topic_data in zip(log_topic_types, log_topics_bytes)
-    ]
-    normalized_topic_data = map_abi_data(
-        BASE_RETURN_NORMALIZERS, log_topic_types, decoded_topic_data
-    )
+        self._topic_normalizers = tuple(
+            _compile_type_normalizer(BASE_RETURN_NORMALIZERS, topic_type)
+            for topic_type in self.topic_types
+        )
+        self._data_normalizers = tuple(
+            _compile_type_normalizer(BASE_RETURN_NORMALIZERS, data_type)
+            for data_type in self.data_types
+        )
+        # only arrays and tuples need naming by ``named_tree``
+        self._data_is_named_tree = tuple(
+            _is_array_or_tuple_type(data_type) for data_type in self.data_types
+        )
+        self._has_nested_args = any(
+            _is_array_or_tuple_type(abi_type)
+            for abi_type in self.topic_types + self.data_types
+        )
 
-    event_args = dict(
-        itertools.chain(
-            zip(log_topic_names, normalized_topic_data),
-            named_log_data.items(),
+        # decoders of single words, for decoding columns of values
+        self._topic_word_decoders = tuple(
+            _compile_word_decoder(topic_type, decode_word) or decode_word
+            for topic_type, decode_word in zip(
+                self.topic_types, map(self._word_decoder, self._topic_decoders)
+            )
+        )
+        data_word_decoders = tuple(
+            _compile_word_decoder(data_type, self._word_decoder(decoder))
+            for data_type, decoder in zip(
+                self.data_types,
+                (registry.get_decoder(data_type) for data_type in self.data_types),
+            )
+        )
+        # the data is decoded a word per argument if all arguments are a word wide
+        self._data_word_decoders = (
+            data_word_decoders if all(data_word_decoders) else None
         )
-    )
 
-    event_data = EventData(
-        args=event_args,
-        event=event_abi["name"],
-        logIndex=log_entry["logIndex"],
-        transactionIndex=log_entry["transactionIndex"],
-        transactionHash=log_entry["transactionHash"],
-        address=log_entry["address"],
-        blockHash=log_entry["blockHash"],
-        blockNumber=log_entry["blockNumber"],
-    )
+    def _word_decoder(
+        self, decoder: Callable[[ContextFramesBytesIO], Any]
+    ) -> Callable[[bytes], Any]:
+        stream_class = self._stream_class
+        return lambda word: decoder(stream_class(word))
+
+    def _get_log_topics(self, log_entry: LogReceipt) -> Sequence[Any]:
+        """
+        Return the topics of the log entry holding the indexed arguments.
+        """
+        log_topics = log_entry["topics"]
+        if not self.anonymous:
+            if not log_topics:
+                raise MismatchedABI(
+                    "Expected non-anonymous event to have 1 or more topics"
+                )
+            elif self.topic != _log_entry_data_to_bytes(log_topics[0]):
+                raise MismatchedABI(
+                    "The event signature did not match the provided ABI"
+                )
+            log_topics = log_topics[1:]
+
+        if len(log_topics) != len(self.topic_types):
+            raise LogTopicError(
+                f"Expected {len(self.topic_types)} log topics.  Got {len(log_topics)}"
+            )
+        return log_topics
+
+    def decode(self, log_entry: LogReceipt) -> EventData:
+        """
+        Given a log entry for the event, return the decoded event data.
+        """
+        log_topics = self._get_log_topics(log_entry)
+        if self._duplicate_names_message is not None:
+            raise InvalidEventABI(self._duplicate_names_message)
+
+        stream_class = self._stream_class
+        decoded_log_data = self._data_decoder(
+            stream_class(_log_entry_data_to_bytes(log_entry["data"]))
+        )
+        event_args = {
+            name: normalize(decoder(stream_class(_log_entry_data_to_bytes(topic))))
+            for name, normalize, decoder, topic in zip(
+                self.topic_names,
+                self._topic_normalizers,
+                self._topic_decoders,
+                log_topics,
+            )
+        }
+        for data_input, normalize, is_named_tree, value in zip(
+            self._data_inputs,
+            self._data_normalizers,
+            self._data_is_named_tree,
+            decoded_log_data,
+        ):
+            value = normalize(value)
+            event_args[data_input["name"]] = (
+                _named_subtree(data_input, value) if is_named_tree else value
+            )
+
+        event_data = EventData(
+            args=event_args,
+            event=self.event_name,
+            logIndex=log_entry["logIndex"],
+            transactionIndex=log_entry["transactionIndex"],
+            transactionHash=log_entry["transactionHash"],
+            address=log_entry["address"],
+            blockHash=log_entry["blockHash"],
+            blockNumber=log_entry["blockNumber"],
+        )
+
+        if isinstance(log_entry, AttributeDict):
+            if self._has_nested_args:
+                return cast(EventData, AttributeDict.recursive(event_data))
+            # without arrays or tuples to convert, only the args need wrapping
+            return cast(
+                EventData,
+                AttributeDict({**event_data, "args": AttributeDict(event_args)}),
+            )
 
-    if isinstance(log_entry, AttributeDict):
-        return cast(EventData, AttributeDict.recursive(event_data))
+        return event_data
+
+    def decode_columns(self, log_entries: Sequence[LogReceipt]) -> Dict[str, Any]:
+        """
+        Given log entries for the event, return the decoded event data as columns: a
+        list of the ``address``, ``blockHash``, ``blockNumber``, ``logIndex``,
+        ``transactionHash`` and ``transactionIndex`` values of the logs, and under
+        ``args``, a list of the values of each argument.
+
+        Rather than decoding log by log, arguments of integer, address, boolean and
+        fixed size bytes types are decoded a column at a time, from the words at the
+        same offset in each topic, or in the data of all the logs joined together.
+        """
+        all_log_topics = [
+            [
+                _log_entry_data_to_bytes(topic)
+                for topic in self._get_log_topics(log_entry)
+            ]
+            for log_entry in log_entries
+        ]
+        if self._duplicate_names_message is not None:
+            raise InvalidEventABI(self._duplicate_names_message)
+
+        args: Dict[str, List[Any]] = {}
+        for index, (name, normalize, decode_word) in enumerate(
+            zip(self.topic_names, self._topic_normalizers, self._topic_word_decoders)
+        ):
+            values = map(decode_word, [topics[index] for topics in all_log_topics])
+            args[name] = list(map(normalize, values))
+
+        log_data = [_log_entry_data_to_bytes(entry["data"]) for entry in log_entries]
+        data_size = 32 * len(self.data_types)
+        if self._data_word_decoders is not None and all(
+            len(data) == data_size for data in log_data
+        ):
+            joined_data = b"".join(log_data)
+            for offset, (name, normalize, decode_word) in enumerate(
+                zip(self.data_names, self._data_normalizers, self._data_word_decoders),
+            ):
+                words = [
+                    joined_data[start : start + 32]
+                    for start in range(32 * offset, len(joined_data), data_size)
+                ]
+                args[name] = list(map(normalize, map(decode_word, words)))
+        else:
+            stream_class = self._stream_class
+            decoded_log_data = [
+                self._data_decoder(stream_class(data)) for data in log_data
+            ]
+            for index, (data_input, normalize, is_named_tree) in enumerate(
+                zip(self._data_inputs, self._data_normalizers, self._data_is_named_tree)
+            ):
+                values = map(normalize, [data[index] for data in decoded_log_data])
+                args[data_input["name"]] = (
+                    [_named_subtree(data_input, value) for value in values]
+                    if is_named_tree
+                    else list(values)
+                )
+
+        columns: Dict[str, Any] = {
+            "address": [log_entry["address"] for log_entry in log_entries],
+            "blockHash": [log_entry["blockHash"] for log_entry in log_entries],
+            "blockNumber": [log_entry["blockNumber"] for log_entry in log_entries],
+            "logIndex": [log_entry["logIndex"] for log_entry in log_entries],
+            "transactionHash": [
+                log_entry["transactionHash"] for log_entry in log_entries
+            ],
+            "transactionIndex": [
+                log_entry["transactionIndex"] for log_entry in log_entries
+            ],
+        }
+        columns["args"] = args
+        return columns
 
-    return event_data
+
+@curry
+def get_event_data(
+    abi_codec: ABICodec,
+    event_abi: ABIEvent,
+    log_entry: LogReceipt,
+) -> EventData:
+    """
+    Given an event ABI and a log entry for that event, return the decoded
+    event data.
+
+    To decode many logs of the same event, build an ``EventDecoder`` once and
+    decode them with it instead.
+    """
+    return EventDecoder(abi_codec, event_abi).decode(log_entry)
+
+
+class MultiEventDecoder:
+    """
+    Decodes the logs of any of a set of events, e.g. all the events of a contract ABI.
+
+    Each log is routed by its first topic and number of topics to the ``EventDecoder``
+    for its event, rather than being tried against every event. Anonymous events,
+    which have no event topic, are matched by their number of topics alone. Should
+    several events match a log, e.g. anonymous events with the same number of indexed
+    inputs, they are tried in the order of the ABI.
+    """
+
+    def __init__(self, abi_codec: ABICodec, event_abis: Iterable[ABIEvent]) -> None:
+        self.abi_codec = abi_codec
+        self.decoders = tuple(
+            EventDecoder(abi_codec, event_abi) for event_abi in event_abis
+        )
+        # decoders by event topic, or ``None`` for anonymous events, and the number of
+        # topics of their logs
+        self._decoders: Dict[Tuple[Optional[bytes], int], List[EventDecoder]] = {}
+        for decoder in self.decoders:
+            num_topics = len(decoder.topic_types) + (0 if decoder.anonymous else 1)
+            self._decoders.setdefault((decoder.topic, num_topics), []).append(decoder)
+
+    def get_decoders(self, log_entry: LogReceipt) -> List[EventDecoder]:
+        """
+        Return the decoders for the events the log entry may be for.
+        """
+        log_topics = log_entry["topics"]
+        num_topics = len(log_topics)
+        decoders = self._decoders.get((None, num_topics), [])
+        if log_topics:
+            topic = _log_entry_data_to_bytes(log_topics[0])
+            decoders = self._decoders.get((topic, num_topics), []) + decoders
+        return decoders
+
+    def decode(self, log_entry: LogReceipt) -> EventData:
+        """
+        Given a log entry for any of the events, return the decoded event data.
+        """
+        decoders = self.get_decoders(log_entry)
+        if not decoders:
+            raise MismatchedABI("The log did not match any of the event ABIs")
+
+        for decoder in decoders[:-1]:
+            try:
+                return decoder.decode(log_entry)
+            except (DecodingError, InvalidEventABI, LogTopicError, MismatchedABI):
+                continue
+        return decoders[-1].decode(log_entry)
 
 
 @to_tuple
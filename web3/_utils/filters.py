@@ -4,8 +4,10 @@ from typing import (
     Callable,
     Collection,
     Dict,
+    FrozenSet,
     Iterator,
     List,
+    NamedTuple,
     Optional,
     Sequence,
     Tuple,
@@ -16,6 +18,8 @@ from eth_abi.codec import (
     ABICodec,
 )
 from eth_abi.grammar import (
+    ABIType,
+    TupleType,
     parse as parse_type_string,
 )
 from eth_typing import (
@@ -229,7 +233,7 @@ class AsyncTransactionFilter(AsyncFilter):
 class LogFilter(Filter):
     data_filter_set = None
     data_filter_set_regex = None
-    data_filter_set_function = None
+    data_filter_set_function: Callable[[Any], bool] = None
     log_entry_formatter = None
     filter_params: FilterParams = None
     builder: EventFilterBuilder = None
@@ -259,9 +263,9 @@ class LogFilter(Filter):
         """
         self.data_filter_set = data_filter_set
         if any(data_filter_set):
-            self.data_filter_set_function = match_fn(
+            self.data_filter_set_function = DataArgumentMatcher(
                 self.eth_module.codec, data_filter_set
-            )
+            ).match
 
     def is_valid_entry(self, entry: LogReceipt) -> bool:
         if not self.data_filter_set:
@@ -272,7 +276,7 @@ class LogFilter(Filter):
 class AsyncLogFilter(AsyncFilter):
     data_filter_set = None
     data_filter_set_regex = None
-    data_filter_set_function = None
+    data_filter_set_function: Callable[[Any], bool] = None
     log_entry_formatter = None
     filter_params: FilterParams = None
     builder: AsyncEventFilterBuilder = None
@@ -302,9 +306,9 @@ class AsyncLogFilter(AsyncFilter):
         """
         self.data_filter_set = data_filter_set
         if any(data_filter_set):
-            self.data_filter_set_function = match_fn(
+            self.data_filter_set_function = DataArgumentMatcher(
                 self.eth_module.codec, data_filter_set
-            )
+            ).match
 
     def is_valid_entry(self, entry: LogReceipt) -> bool:
         if not self.data_filter_set:
@@ -336,6 +340,127 @@ def normalize_data_values(type_string: TypeStr, data_value: Any) -> Any:
     return data_value
 
 
+def _static_size(abi_type: ABIType) -> int:
+    # the number of bytes a value of a static type takes up in the head of the data
+    if abi_type.arrlist:
+        return abi_type.arrlist[-1][0] * _static_size(abi_type.item_type)
+    elif isinstance(abi_type, TupleType):
+        return sum(_static_size(component) for component in abi_type.components)
+    return 32
+
+
+class _DataSlot(NamedTuple):
+    abi_type: TypeStr
+    # the offset of the value, or of the pointer to it if dynamic, in the data
+    offset: int
+    size: int
+    is_dynamic: bool
+    normalize: Callable[[Any], Any]
+    # the hashable match values, and the others, before the first of the wrong type
+    match_set: FrozenSet[Any]
+    unhashable_match_values: Tuple[Any, ...]
+    # raised for values matching none of those, if a match value is of the wrong type
+    error: Optional[Web3ValueError]
+
+
+def _normalizer(abi_type: TypeStr) -> Callable[[Any], Any]:
+    _type = parse_type_string(abi_type)
+    if _type.base == "string":
+        if _type.arrlist is not None:
+            return lambda data_value: tuple(
+                normalize_to_text(value) for value in data_value
+            )
+        return normalize_to_text
+    return lambda data_value: data_value
+
+
+def _split_hashable(values: Sequence[Any]) -> Tuple[FrozenSet[Any], Tuple[Any, ...]]:
+    hashable, unhashable = set(), []
+    for value in values:
+        try:
+            hashable.add(value)
+        except TypeError:
+            unhashable.append(value)
+    return frozenset(hashable), tuple(unhashable)
+
+
+def _valid_match_values(
+    codec: ABICodec, abi_type: TypeStr, match_values: Sequence[Any]
+) -> Tuple[Sequence[Any], Optional[Web3ValueError]]:
+    # the values are matched in order, so those after one of the wrong type are only
+    # reported as an error, when no value before it matched
+    match_values = tuple(match_values)
+    for index, value in enumerate(match_values):
+        if not codec.is_encodable(abi_type, value):
+            return match_values[:index], Web3ValueError(
+                f"Value {value} is of the wrong abi type. "
+                f"Expected {abi_type} typed value."
+            )
+    return match_values, None
+
+
+class DataArgumentMatcher:
+    """
+    Matches the data of logs against the values of their non-indexed arguments, as
+    given to ``LogFilter.set_data_filters``.
+
+    The filters are compiled once: the match values are validated and split into a
+    set of hashable values and the others, and the offset of each filtered argument
+    in the data is computed. Matching a log then only decodes the filtered arguments,
+    and stops at the first that matches none of its values.
+    """
+
+    def __init__(
+        self, codec: ABICodec, match_values_and_abi: Collection[Tuple[str, Any]]
+    ) -> None:
+        self.codec = codec
+        slots = []
+        offset = 0
+        for abi_type, match_values in match_values_and_abi:
+            parsed_type = parse_type_string(abi_type)
+            size = 32 if parsed_type.is_dynamic else _static_size(parsed_type)
+            if match_values is not None:
+                valid_values, error = _valid_match_values(codec, abi_type, match_values)
+                slots.append(
+                    _DataSlot(
+                        abi_type,
+                        offset,
+                        size,
+                        parsed_type.is_dynamic,
+                        _normalizer(abi_type),
+                        *_split_hashable(valid_values),
+                        error,
+                    )
+                )
+            offset += size
+        self._slots = tuple(slots)
+
+    def _decode(self, slot: _DataSlot, data: bytes) -> Any:
+        if slot.is_dynamic:
+            pointer = int.from_bytes(data[slot.offset : slot.offset + 32], "big")
+            # decode the value as the only value of data pointing to it
+            value_data = (32).to_bytes(32, "big") + data[pointer:]
+        else:
+            value_data = data[slot.offset : slot.offset + slot.size]
+        (value,) = self.codec.decode([slot.abi_type], value_data)
+        return slot.normalize(value)
+
+    def match(self, data: Any) -> bool:
+        data = HexBytes(data)
+        for slot in self._slots:
+            value = self._decode(slot, data)
+            try:
+                if value in slot.match_set:
+                    continue
+            except TypeError:
+                pass
+            if not any(value == match for match in slot.unhashable_match_values):
+                if slot.error is not None:
+                    raise slot.error
+                return False
+        return True
+
+
 @curry
 def match_fn(
     codec: ABICodec, match_values_and_abi: Collection[Tuple[str, Any]], data: Any
@@ -344,29 +469,10 @@ def match_fn(
     Match function used for filtering non-indexed event arguments.
 
     Values provided through the match_values_and_abi parameter are
-    compared to the abi decoded log data.
+    compared to the abi decoded log data. To match many logs against the same
+    values, compile them once with ``DataArgumentMatcher`` instead.
     """
-    abi_types, all_match_values = zip(*match_values_and_abi)
-
-    decoded_values = codec.decode(abi_types, HexBytes(data))
-    for data_value, match_values, abi_type in zip(
-        decoded_values, all_match_values, abi_types
-    ):
-        if match_values is None:
-            continue
-        normalized_data = normalize_data_values(abi_type, data_value)
-        for value in match_values:
-            if not codec.is_encodable(abi_type, value):
-                raise Web3ValueError(
-                    f"Value {value} is of the wrong abi type. "
-                    f"Expected {abi_type} typed value."
-                )
-            if value == normalized_data:
-                break
-        else:
-            return False
-
-    return True
+    return DataArgumentMatcher(codec, match_values_and_abi).match(data)
 
 
 class _UseExistingFilter(Exception):
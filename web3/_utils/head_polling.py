@@ -0,0 +1,237 @@
+import asyncio
+from contextvars import (
+    ContextVar,
+)
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from eth_typing import (
+    BlockNumber,
+)
+
+from web3.types import (
+    BlockData,
+)
+
+if TYPE_CHECKING:
+    from web3 import (  # noqa: F401
+        AsyncWeb3,
+        Web3,
+    )
+
+TValue = TypeVar("TValue")
+
+HeadSubscriber = Callable[[BlockNumber], None]
+
+DEFAULT_HEAD_POLL_INTERVAL = 0.0
+
+# the async polls being fetched in the current context, including the tasks started
+# while fetching them
+_fetching: "ContextVar[Tuple[_Poll[Any], ...]]" = ContextVar("fetching", default=())
+
+
+class HeadPollerStats(NamedTuple):
+    # requests sent to the node
+    polls: int
+    # reads served by a poll made for another reader
+    shared: int
+
+
+class _Poll(Generic[TValue]):
+    # the last value polled, when its request was sent and when it was received
+    value: TValue
+    polled_at: Optional[float] = None
+    received_at: Optional[float] = None
+
+    def __init__(self) -> None:
+        # the sync reads of this poll, which may be made again while it is fetched
+        # (e.g. by middleware), wait on each other
+        self.lock = threading.RLock()
+        # the async request of this poll in flight, awaited by the reads requested
+        # while it is, instead of holding a lock across the request
+        self.in_flight: Optional["asyncio.Task[TValue]"] = None
+
+    def is_fresh(self, requested_at: float, poll_interval: float) -> bool:
+        if self.polled_at is None or self.received_at is None:
+            return False
+        # polls sent within ``poll_interval`` of a read, or in flight when it was
+        # requested, are shared with it
+        return (
+            self.polled_at >= requested_at - poll_interval
+            or self.received_at >= requested_at
+        )
+
+
+def _retrieve_exception(task: "asyncio.Task[Any]") -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+def _get_block_number(block: BlockData) -> Optional[BlockNumber]:
+    return block.get("number") if isinstance(block, Mapping) else None
+
+
+class _BaseHeadPoller:
+    def __init__(self, poll_interval: float = DEFAULT_HEAD_POLL_INTERVAL) -> None:
+        self.poll_interval = poll_interval
+        self._subscribers: List[HeadSubscriber] = []
+        self._head: Optional[BlockNumber] = None
+        self._polls = 0
+        self._shared = 0
+
+    @property
+    def stats(self) -> HeadPollerStats:
+        return HeadPollerStats(self._polls, self._shared)
+
+    def reset_stats(self) -> None:
+        self._polls = self._shared = 0
+
+    def subscribe(self, subscriber: HeadSubscriber) -> Callable[[], None]:
+        """
+        Call ``subscriber`` with the number of each new head polled, until the
+        returned function is called.
+        """
+        self._subscribers.append(subscriber)
+        return lambda: self._subscribers.remove(subscriber)
+
+    def _set_head(self, block_number: BlockNumber) -> None:
+        if self._head is None or block_number > self._head:
+            self._head = block_number
+            for subscriber in list(self._subscribers):
+                subscriber(block_number)
+
+
+class HeadPoller(_BaseHeadPoller):
+    """
+    Polls the head of the chain on behalf of the filters, waiters and middleware of a
+    ``Web3`` instance, so that they can share polls.
+
+    A poll is shared by the reads requested up to ``poll_interval`` seconds after it
+    was sent, 0 by default, and by the reads requested while it is in flight.
+    Subscribers are called with the number of each new head polled.
+    """
+
+    def __init__(
+        self, w3: "Web3", poll_interval: float = DEFAULT_HEAD_POLL_INTERVAL
+    ) -> None:
+        super().__init__(poll_interval)
+        self.w3 = w3
+        self._block_number_poll: _Poll[BlockNumber] = _Poll()
+        self._latest_block_poll: _Poll[BlockData] = _Poll()
+
+    def _read(self, poll: _Poll[TValue], fetch: Callable[[], TValue]) -> TValue:
+        requested_at = time.monotonic()
+        with poll.lock:
+            if poll.is_fresh(requested_at, self.poll_interval):
+                self._shared += 1
+                return poll.value
+
+            polled_at = time.monotonic()
+            self._polls += 1
+            poll.value = fetch()
+            poll.polled_at = polled_at
+            poll.received_at = time.monotonic()
+            return poll.value
+
+    def _fetch_block_number(self) -> BlockNumber:
+        block_number = self.w3.eth.block_number
+        self._set_head(block_number)
+        return block_number
+
+    def _fetch_latest_block(self) -> BlockData:
+        block = self.w3.eth.get_block("latest")
+        block_number = _get_block_number(block)
+        if block_number is not None:
+            self._set_head(block_number)
+        return block
+
+    def get_block_number(self) -> BlockNumber:
+        return self._read(self._block_number_poll, self._fetch_block_number)
+
+    def get_latest_block(self) -> BlockData:
+        return self._read(self._latest_block_poll, self._fetch_latest_block)
+
+
+class AsyncHeadPoller(_BaseHeadPoller):
+    """
+    The async version of ``HeadPoller``, for an ``AsyncWeb3`` instance.
+    """
+
+    def __init__(
+        self, w3: "AsyncWeb3", poll_interval: float = DEFAULT_HEAD_POLL_INTERVAL
+    ) -> None:
+        super().__init__(poll_interval)
+        self.w3 = w3
+        self._block_number_poll: _Poll[BlockNumber] = _Poll()
+        self._latest_block_poll: _Poll[BlockData] = _Poll()
+
+    async def _read(
+        self, poll: _Poll[TValue], fetch: Callable[[], Awaitable[TValue]]
+    ) -> TValue:
+        requested_at = time.monotonic()
+        if poll.is_fresh(requested_at, self.poll_interval):
+            self._shared += 1
+            return poll.value
+
+        in_flight = poll.in_flight
+        if (
+            in_flight is not None
+            and not in_flight.done()
+            # a read made while fetching the poll itself can't wait for it
+            and poll not in _fetching.get()
+            and in_flight.get_loop() is asyncio.get_running_loop()
+        ):
+            self._shared += 1
+            return await asyncio.shield(in_flight)
+
+        self._polls += 1
+        poll_task = asyncio.ensure_future(self._poll(poll, fetch))
+        poll.in_flight = poll_task
+        # its error is raised by the reads waiting for it, if there are any left
+        poll_task.add_done_callback(_retrieve_exception)
+        # the poll is not cancelled along with the read that sent it, as other reads
+        # may be waiting for it
+        return await asyncio.shield(poll_task)
+
+    @staticmethod
+    async def _poll(
+        poll: _Poll[TValue], fetch: Callable[[], Awaitable[TValue]]
+    ) -> TValue:
+        _fetching.set(_fetching.get() + (poll,))
+        polled_at = time.monotonic()
+        value = await fetch()
+        poll.value = value
+        poll.polled_at = polled_at
+        poll.received_at = time.monotonic()
+        return value
+
+    async def _fetch_block_number(self) -> BlockNumber:
+        block_number = await self.w3.eth.block_number
+        self._set_head(block_number)
+        return block_number
+
+    async def _fetch_latest_block(self) -> BlockData:
+        block = await self.w3.eth.get_block("latest")
+        block_number = _get_block_number(block)
+        if block_number is not None:
+            self._set_head(block_number)
+        return block
+
+    async def get_block_number(self) -> BlockNumber:
+        return await self._read(self._block_number_poll, self._fetch_block_number)
+
+    async def get_latest_block(self) -> BlockData:
+        return await self._read(self._latest_block_poll, self._fetch_latest_block)
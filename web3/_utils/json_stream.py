@@ -0,0 +1,120 @@
+import json
+import re
+from typing import (
+    Any,
+    List,
+)
+
+# Skips over everything but the brackets outside of JSON strings, with complete strings
+# skipped in one go. Stops before the opening quote of an incomplete string.
+_SKIP_TO_BRACKET = re.compile(
+    rb'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*', re.DOTALL
+)
+# Skips over the rest of a string, up to its closing quote, or up to a backslash that
+# ends the buffer.
+_SKIP_STRING = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+_OPENING_BRACKETS = frozenset(b"[{")
+_CLOSING_BRACKETS = frozenset(b"]}")
+_QUOTE = ord('"')
+_BACKSLASH = ord("\\")
+
+
+class JSONStreamDecoder:
+    """
+    Decodes a stream of concatenated JSON objects and arrays, e.g. the JSON-RPC
+    messages read from a socket, as the bytes arrive.
+
+    Bytes are buffered in a ``bytearray`` and scanned for message boundaries
+    incrementally: each byte is scanned once, including the bytes of strings that span
+    reads, and each message is decoded once it is complete. The time to decode a
+    message is then linear in its size, however many reads it spans.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        # where to resume scanning the buffer, and the nesting depth at that position
+        self._position = 0
+        self._depth = 0
+        # whether that position is in a string, and right after a backslash in it
+        self._in_string = False
+        self._escaped = False
+        # the start of the message being scanned
+        self._message_start = 0
+
+    def __len__(self) -> int:
+        # the number of bytes buffered
+        return len(self._buffer)
+
+    def reset(self) -> None:
+        self._buffer.clear()
+        self._position = self._depth = self._message_start = 0
+        self._in_string = self._escaped = False
+
+    def decode(self, data: bytes) -> List[Any]:
+        """
+        Buffer ``data`` and return the messages that are now complete.
+        """
+        buffer = self._buffer
+        buffer += data
+        messages = []
+        position = self._position
+        depth = self._depth
+        in_string = self._in_string
+        escaped = self._escaped
+        buffer_length = len(buffer)
+
+        while position < buffer_length:
+            if in_string:
+                if escaped:
+                    # the escaped character
+                    position += 1
+                    escaped = False
+                position = _SKIP_STRING.match(buffer, position).end()
+                if position == buffer_length:
+                    break
+                if buffer[position] == _BACKSLASH:
+                    # the buffer ends in an escape, wait for the escaped character
+                    escaped = True
+                    position += 1
+                    break
+                # the closing quote
+                in_string = False
+                position += 1
+                continue
+
+            position = _SKIP_TO_BRACKET.match(buffer, position).end()
+            if position == buffer_length:
+                break
+            if buffer[position] == _QUOTE:
+                # a string that is not complete yet, scanned up to where it ends
+                in_string = True
+                position += 1
+                continue
+
+            bracket = buffer[position]
+            if bracket in _OPENING_BRACKETS:
+                if depth == 0:
+                    self._message_start = position
+                depth += 1
+            elif depth > 0:
+                depth -= 1
+                if depth == 0:
+                    messages.append(
+                        json.loads(buffer[self._message_start : position + 1])
+                    )
+                    self._message_start = position + 1
+            position += 1
+
+        # drop the bytes scanned before the next message, once per read
+        consumed = position if depth == 0 else self._message_start
+        if consumed:
+            del buffer[:consumed]
+            position -= consumed
+            self._message_start = 0
+
+        self._position = position
+        self._depth = depth
+        self._in_string = in_string
+        self._escaped = escaped
+        return messages
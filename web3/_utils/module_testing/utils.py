@@ -113,7 +113,7 @@ class RequestMocker:
         self.w3.provider._request_func_cache = (None, None)
 
     def _mock_request_handler(
-        self, method: "RPCEndpoint", params: Any
+        self, method: "RPCEndpoint", params: Any, apply_decorator: bool = True
     ) -> "RPCResponse":
         self.w3 = cast("Web3", self.w3)
         self._make_request = cast("MakeRequestFn", self._make_request)
@@ -156,13 +156,21 @@ class RequestMocker:
             raise Exception("Invariant: unreachable code path")
 
         decorator = getattr(self._make_request, "_decorator", None)
-        if decorator is not None:
+        if decorator is not None and apply_decorator:
             # If the original make_request was decorated, we need to re-apply
             # the decorator to the mocked make_request. This is necessary for
             # the request caching decorator to work properly.
-            return decorator(lambda *_: mocked_response)(
-                self.w3.provider, method, params
-            )
+            def _mocked_request(
+                _provider: Any, _method: "RPCEndpoint", _params: Any
+            ) -> "RPCResponse":
+                if (_method, _params) != (method, params):
+                    # a request made by the decorator itself, e.g. for the chain head
+                    return self._mock_request_handler(
+                        _method, _params, apply_decorator=False
+                    )
+                return mocked_response
+
+            return decorator(_mocked_request)(self.w3.provider, method, params)
         else:
             return mocked_response
 
@@ -181,7 +189,7 @@ class RequestMocker:
         self.w3.provider._request_func_cache = (None, None)
 
     async def _async_mock_request_handler(
-        self, method: "RPCEndpoint", params: Any
+        self, method: "RPCEndpoint", params: Any, apply_decorator: bool = True
     ) -> "RPCResponse":
         self.w3 = cast("AsyncWeb3", self.w3)
         self._make_request = cast("AsyncMakeRequestFn", self._make_request)
@@ -237,7 +245,7 @@ class RequestMocker:
             raise Exception("Invariant: unreachable code path")
 
         decorator = getattr(self._make_request, "_decorator", None)
-        if decorator is not None:
+        if decorator is not None and apply_decorator:
             # If the original make_request was decorated, we need to re-apply
             # the decorator to the mocked make_request. This is necessary for
             # the request caching decorator to work properly.
@@ -245,6 +253,11 @@ class RequestMocker:
             async def _coro(
                 _provider: Any, _method: "RPCEndpoint", _params: Any
             ) -> "RPCResponse":
+                if (_method, _params) != (method, params):
+                    # a request made by the decorator itself, e.g. for the chain head
+                    return await self._async_mock_request_handler(
+                        _method, _params, apply_decorator=False
+                    )
                 return mocked_result
 
             return await decorator(_coro)(self.w3.provider, method, params)
@@ -43,6 +43,9 @@ from ens import (
     ENS,
     AsyncENS,
 )
+from web3._utils.abi import (
+    normalizes_basic_types,
+)
 from web3._utils.encoding import (
     hexstr_if_str,
     text_if_str,
@@ -92,6 +95,7 @@ def implicitly_identity(
 #
 
 
+@normalizes_basic_types("address")
 @implicitly_identity
 def addresses_checksummed(
     type_str: TypeStr, data: Any
@@ -101,6 +105,7 @@ def addresses_checksummed(
     return None
 
 
+@normalizes_basic_types("string")
 @implicitly_identity
 def decode_abi_strings(type_str: TypeStr, data: Any) -> Tuple[TypeStr, str]:
     if type_str == "string":
@@ -138,6 +143,7 @@ def parse_basic_type_str(
     return new_normalizer
 
 
+@normalizes_basic_types("bytes")
 @implicitly_identity
 @parse_basic_type_str
 def abi_bytes_to_hex(
@@ -161,6 +167,7 @@ def abi_bytes_to_hex(
     return type_str, to_hex(padded)
 
 
+@normalizes_basic_types("uint")
 @implicitly_identity
 @parse_basic_type_str
 def abi_int_to_hex(
@@ -172,6 +179,7 @@ def abi_int_to_hex(
     return None
 
 
+@normalizes_basic_types("string")
 @implicitly_identity
 def abi_string_to_hex(type_str: TypeStr, data: Any) -> Optional[Tuple[TypeStr, str]]:
     if type_str == "string":
@@ -179,6 +187,7 @@ def abi_string_to_hex(type_str: TypeStr, data: Any) -> Optional[Tuple[TypeStr, s
     return None
 
 
+@normalizes_basic_types("string")
 @implicitly_identity
 def abi_string_to_text(type_str: TypeStr, data: Any) -> Optional[Tuple[TypeStr, str]]:
     if type_str == "string":
@@ -186,6 +195,7 @@ def abi_string_to_text(type_str: TypeStr, data: Any) -> Optional[Tuple[TypeStr,
     return None
 
 
+@normalizes_basic_types("bytes")
 @implicitly_identity
 @parse_basic_type_str
 def abi_bytes_to_bytes(
@@ -196,6 +206,7 @@ def abi_bytes_to_bytes(
     return None
 
 
+@normalizes_basic_types("address")
 @implicitly_identity
 def abi_address_to_hex(
     type_str: TypeStr, data: Any
@@ -208,6 +219,7 @@ def abi_address_to_hex(
 
 
 @curry
+@normalizes_basic_types("address")
 def abi_ens_resolver(
     w3: "Web3",
     type_str: TypeStr,
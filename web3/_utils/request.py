@@ -2,26 +2,41 @@ import asyncio
 from concurrent.futures import (
     ThreadPoolExecutor,
 )
+import contextlib
+import heapq
+import itertools
 import logging
 import os
 import threading
+import time
 from typing import (
+    TYPE_CHECKING,
     Any,
+    AsyncGenerator,
+    Callable,
     Dict,
     List,
+    MutableMapping,
+    NamedTuple,
     Optional,
+    Tuple,
     Union,
 )
+import weakref
 
 from aiohttp import (
     ClientResponse,
     ClientSession,
     ClientTimeout,
+    TCPConnector,
 )
 from eth_typing import (
     URI,
 )
 import requests
+from requests.adapters import (
+    HTTPAdapter,
+)
 
 from web3._utils.async_caching import (
     async_lock,
@@ -33,6 +48,12 @@ from web3.utils.caching import (
     SimpleCache,
 )
 
+if TYPE_CHECKING:
+    from web3.providers.rpc.utils import (  # noqa: F401
+        AsyncHTTPPoolConfiguration,
+        HTTPPoolConfiguration,
+    )
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = 30
@@ -42,15 +63,156 @@ def get_default_http_endpoint() -> URI:
     return URI(os.environ.get("WEB3_HTTP_PROVIDER_URI", "http://localhost:8545"))
 
 
+class _SessionReaper:
+    """
+    Closes evicted sessions on a single daemon thread once the requests made with them
+    have had time to complete, rather than starting a timer thread per eviction. The
+    thread exits when it has been idle for ``IDLE_TIMEOUT`` seconds.
+    """
+
+    IDLE_TIMEOUT = 60.0
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._scheduled: List[Tuple[float, int, Callable[[List[Any]], None], Any]] = []
+        self._counter = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(
+        self, delay: float, close_sessions: Callable[[List[Any]], None], sessions: Any
+    ) -> None:
+        with self._condition:
+            heapq.heappush(
+                self._scheduled,
+                (
+                    time.monotonic() + delay,
+                    next(self._counter),
+                    close_sessions,
+                    sessions,
+                ),
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="web3-session-reaper", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._scheduled:
+                    self._condition.wait(self.IDLE_TIMEOUT)
+                    if not self._scheduled:
+                        self._thread = None
+                        return
+                    continue
+
+                close_at, _, close_sessions, sessions = self._scheduled[0]
+                delay = close_at - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+                heapq.heappop(self._scheduled)
+
+            try:
+                close_sessions(sessions)
+            except Exception as e:
+                logger.debug(f"Failed to close evicted sessions: {e!r}")
+
+
+_session_reaper = _SessionReaper()
+
+
+class _SharedHTTPAdapter(HTTPAdapter):
+    """
+    A connection pool shared by the sessions of every thread making requests to an
+    endpoint. Closing one of the sessions does not close the shared pool.
+    """
+
+    def close(self) -> None:
+        pass
+
+    def close_pool(self) -> None:
+        super().close()
+
+
+def _http_session_pool_key(
+    endpoint_uri: URI, configuration: "HTTPPoolConfiguration"
+) -> Tuple[URI, Tuple[Tuple[str, Any], ...]]:
+    return endpoint_uri, tuple(configuration.model_dump().items())
+
+
+class _HTTPSessionPool:
+    """
+    Creates the sessions for an endpoint, in every thread, on one connection pool with
+    the settings of an ``HTTPPoolConfiguration``.
+    """
+
+    def __init__(
+        self, endpoint_uri: URI, configuration: "HTTPPoolConfiguration"
+    ) -> None:
+        self.configuration = configuration
+        self.key = _http_session_pool_key(endpoint_uri, configuration)
+        self.adapter = _SharedHTTPAdapter(
+            pool_connections=configuration.pool_connections,
+            pool_maxsize=configuration.pool_maxsize,
+            pool_block=configuration.pool_block,
+        )
+
+    def new_session(self) -> requests.Session:
+        session = requests.Session()
+        session.mount("http://", self.adapter)
+        session.mount("https://", self.adapter)
+        if not self.configuration.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+
+_http_session_pools: Dict[
+    Tuple[URI, Tuple[Tuple[str, Any], ...]], _HTTPSessionPool
+] = {}
+_http_session_pools_lock = threading.Lock()
+
+
+def get_http_session_pool(
+    endpoint_uri: URI, pool_configuration: "HTTPPoolConfiguration"
+) -> _HTTPSessionPool:
+    """
+    The pool of sessions for ``endpoint_uri`` with ``pool_configuration``, shared by
+    the providers for the endpoint with an equal configuration.
+    """
+    key = _http_session_pool_key(endpoint_uri, pool_configuration)
+    with _http_session_pools_lock:
+        pool = _http_session_pools.get(key)
+        if pool is None:
+            pool = _http_session_pools[key] = _HTTPSessionPool(
+                endpoint_uri, pool_configuration
+            )
+        return pool
+
+
+def _new_session(session_pool: Optional[_HTTPSessionPool]) -> requests.Session:
+    if session_pool is not None:
+        return session_pool.new_session()
+    return requests.Session()
+
+
 _session_cache = SimpleCache()
 _session_cache_lock = threading.Lock()
 
 
 def cache_and_return_session(
-    endpoint_uri: URI, session: requests.Session = None
+    endpoint_uri: URI,
+    session: requests.Session = None,
+    session_pool: Optional[_HTTPSessionPool] = None,
 ) -> requests.Session:
     # cache key should have a unique thread identifier
-    cache_key = generate_cache_key(f"{threading.get_ident()}:{endpoint_uri}")
+    cache_key = generate_cache_key(
+        f"{threading.get_ident()}:{endpoint_uri}"
+        if session_pool is None
+        else f"{threading.get_ident()}:{session_pool.key}"
+    )
 
     cached_session = _session_cache.get_cache_entry(cache_key)
     if cached_session is not None:
@@ -61,57 +223,71 @@ def cache_and_return_session(
         return cached_session
 
     if session is None:
-        session = requests.Session()
+        session = _new_session(session_pool)
 
     with _session_cache_lock:
         cached_session, evicted_items = _session_cache.cache(cache_key, session)
         logger.debug(f"Session cached: {endpoint_uri}, {cached_session}")
 
     if evicted_items is not None:
-        evicted_sessions = evicted_items.values()
+        evicted_sessions = list(evicted_items.values())
         for evicted_session in evicted_sessions:
             logger.debug(
                 f"Session cache full. Session evicted from cache: {evicted_session}",
             )
-        threading.Timer(
-            DEFAULT_TIMEOUT + 0.1,
-            _close_evicted_sessions,
-            args=[evicted_sessions],
-        ).start()
+        _session_reaper.schedule(
+            DEFAULT_TIMEOUT + 0.1, _close_evicted_sessions, evicted_sessions
+        )
 
     return cached_session
 
 
 def get_response_from_get_request(
-    endpoint_uri: URI, *args: Any, **kwargs: Any
+    endpoint_uri: URI,
+    *args: Any,
+    session_pool: Optional[_HTTPSessionPool] = None,
+    **kwargs: Any,
 ) -> requests.Response:
     kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
-    session = cache_and_return_session(endpoint_uri)
+    session = cache_and_return_session(endpoint_uri, session_pool=session_pool)
     response = session.get(endpoint_uri, *args, **kwargs)
     return response
 
 
 def json_make_get_request(
-    endpoint_uri: URI, *args: Any, **kwargs: Any
+    endpoint_uri: URI,
+    *args: Any,
+    session_pool: Optional[_HTTPSessionPool] = None,
+    **kwargs: Any,
 ) -> Dict[str, Any]:
-    response = get_response_from_get_request(endpoint_uri, *args, **kwargs)
+    response = get_response_from_get_request(
+        endpoint_uri, *args, session_pool=session_pool, **kwargs
+    )
     response.raise_for_status()
     return response.json()
 
 
 def get_response_from_post_request(
-    endpoint_uri: URI, *args: Any, **kwargs: Any
+    endpoint_uri: URI,
+    *args: Any,
+    session_pool: Optional[_HTTPSessionPool] = None,
+    **kwargs: Any,
 ) -> requests.Response:
     kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
-    session = cache_and_return_session(endpoint_uri)
+    session = cache_and_return_session(endpoint_uri, session_pool=session_pool)
     response = session.post(endpoint_uri, *args, **kwargs)
     return response
 
 
 def make_post_request(
-    endpoint_uri: URI, data: Union[bytes, Dict[str, Any]], **kwargs: Any
+    endpoint_uri: URI,
+    data: Union[bytes, Dict[str, Any]],
+    session_pool: Optional[_HTTPSessionPool] = None,
+    **kwargs: Any,
 ) -> bytes:
-    response = get_response_from_post_request(endpoint_uri, data=data, **kwargs)
+    response = get_response_from_post_request(
+        endpoint_uri, data=data, session_pool=session_pool, **kwargs
+    )
     response.raise_for_status()
     return response.content
 
@@ -125,6 +301,139 @@ def _close_evicted_sessions(evicted_sessions: List[requests.Session]) -> None:
 # --- async --- #
 
 
+class AsyncHTTPPoolStats(NamedTuple):
+    # requests made to the endpoint
+    requests: int
+    # requests in flight, and queued for a free slot
+    in_flight: int
+    queued: int
+    # the most requests that were in flight at once
+    peak_in_flight: int
+    # the configured limits on connections, per session, and on requests in flight
+    limit: int
+    limit_per_host: int
+    max_in_flight_requests: Optional[int]
+
+
+class _AsyncSessionPool:
+    """
+    Creates the async sessions for an endpoint with the connection limits of an
+    ``AsyncHTTPPoolConfiguration``, caps the requests in flight to the endpoint and
+    tracks the pool utilization.
+    """
+
+    def __init__(
+        self, endpoint_uri: URI, configuration: "AsyncHTTPPoolConfiguration"
+    ) -> None:
+        self.configuration = configuration
+        self.key = _async_session_pool_key(endpoint_uri, configuration)
+        # semaphores are bound to an event loop, so there is one per loop
+        self._semaphores: MutableMapping[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+        self._requests = 0
+        self._in_flight = 0
+        self._queued = 0
+        self._peak_in_flight = 0
+
+    def new_session(self) -> ClientSession:
+        connector = TCPConnector(
+            limit=self.configuration.limit,
+            limit_per_host=self.configuration.limit_per_host,
+            ttl_dns_cache=self.configuration.ttl_dns_cache,
+            keepalive_timeout=self.configuration.keepalive_timeout,
+        )
+        return ClientSession(connector=connector, raise_for_status=True)
+
+    def _get_semaphore(self) -> Optional[asyncio.Semaphore]:
+        max_in_flight_requests = self.configuration.max_in_flight_requests
+        if max_in_flight_requests is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(
+                max_in_flight_requests
+            )
+        return semaphore
+
+    @contextlib.asynccontextmanager
+    async def request_slot(self) -> AsyncGenerator[None, None]:
+        semaphore = self._get_semaphore()
+        if semaphore is not None:
+            self._queued += 1
+            try:
+                await semaphore.acquire()
+            finally:
+                self._queued -= 1
+
+        self._requests += 1
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            if semaphore is not None:
+                semaphore.release()
+
+    @property
+    def stats(self) -> AsyncHTTPPoolStats:
+        return AsyncHTTPPoolStats(
+            requests=self._requests,
+            in_flight=self._in_flight,
+            queued=self._queued,
+            peak_in_flight=self._peak_in_flight,
+            limit=self.configuration.limit,
+            limit_per_host=self.configuration.limit_per_host,
+            max_in_flight_requests=self.configuration.max_in_flight_requests,
+        )
+
+
+def _async_session_pool_key(
+    endpoint_uri: URI, configuration: "AsyncHTTPPoolConfiguration"
+) -> Tuple[URI, Tuple[Tuple[str, Any], ...]]:
+    return endpoint_uri, tuple(configuration.model_dump().items())
+
+
+_async_session_pools: Dict[
+    Tuple[URI, Tuple[Tuple[str, Any], ...]], _AsyncSessionPool
+] = {}
+_async_session_pools_lock = threading.Lock()
+
+
+def get_async_http_session_pool(
+    endpoint_uri: URI, pool_configuration: "AsyncHTTPPoolConfiguration"
+) -> _AsyncSessionPool:
+    """
+    The pool of async sessions for ``endpoint_uri`` with ``pool_configuration``, shared
+    by the providers for the endpoint with an equal configuration.
+    """
+    key = _async_session_pool_key(endpoint_uri, pool_configuration)
+    with _async_session_pools_lock:
+        pool = _async_session_pools.get(key)
+        if pool is None:
+            pool = _async_session_pools[key] = _AsyncSessionPool(
+                endpoint_uri, pool_configuration
+            )
+        return pool
+
+
+def _new_async_session(session_pool: Optional[_AsyncSessionPool]) -> ClientSession:
+    if session_pool is not None:
+        return session_pool.new_session()
+    return ClientSession(raise_for_status=True)
+
+
+def _async_request_slot(
+    session_pool: Optional[_AsyncSessionPool],
+) -> "contextlib.AbstractAsyncContextManager[None]":
+    if session_pool is not None:
+        return session_pool.request_slot()
+    return contextlib.nullcontext()
+
+
 _async_session_cache = SimpleCache()
 _async_session_cache_lock = threading.Lock()
 _async_session_pool = ThreadPoolExecutor(max_workers=1)
@@ -133,15 +442,20 @@ _async_session_pool = ThreadPoolExecutor(max_workers=1)
 async def async_cache_and_return_session(
     endpoint_uri: URI,
     session: Optional[ClientSession] = None,
+    session_pool: Optional[_AsyncSessionPool] = None,
 ) -> ClientSession:
     # cache key should have a unique thread identifier
-    cache_key = generate_cache_key(f"{threading.get_ident()}:{endpoint_uri}")
+    cache_key = generate_cache_key(
+        f"{threading.get_ident()}:{endpoint_uri}"
+        if session_pool is None
+        else f"{threading.get_ident()}:{session_pool.key}"
+    )
 
     evicted_items = None
     async with async_lock(_async_session_pool, _async_session_cache_lock):
         if cache_key not in _async_session_cache:
             if session is None:
-                session = ClientSession(raise_for_status=True)
+                session = _new_async_session(session_pool)
 
             cached_session, evicted_items = _async_session_cache.cache(
                 cache_key, session
@@ -178,7 +492,7 @@ async def async_cache_and_return_session(
                 )
 
                 # replace stale session with a new session at the cache key
-                _session = ClientSession(raise_for_status=True)
+                _session = _new_async_session(session_pool)
                 cached_session, evicted_items = _async_session_cache.cache(
                     cache_key, _session
                 )
@@ -194,55 +508,74 @@ async def async_cache_and_return_session(
                 "Async session cache full. Session evicted from cache: "
                 f"{evicted_session}",
             )
-        # Kick off a future task, in a separate thread, to close the evicted
-        # sessions. In the case that the cache filled very quickly and some
-        # sessions have been evicted before their original request has been made,
-        # we set the timer to a bit more than the `DEFAULT_TIMEOUT` for a call. This
-        # should make it so that any call from an evicted session can still be made
-        # before the session is closed.
-        threading.Timer(
+        # Close the evicted sessions on the reaper thread. In the case that the cache
+        # filled very quickly and some sessions have been evicted before their
+        # original request has been made, we wait a bit more than the
+        # `DEFAULT_TIMEOUT` for a call. This should make it so that any call from an
+        # evicted session can still be made before the session is closed.
+        _session_reaper.schedule(
             DEFAULT_TIMEOUT + 0.1,
             _async_close_evicted_sessions,
-            args=[evicted_sessions],
-        ).start()
+            list(evicted_sessions),
+        )
 
     return cached_session
 
 
 async def async_get_response_from_get_request(
-    endpoint_uri: URI, *args: Any, **kwargs: Any
+    endpoint_uri: URI,
+    *args: Any,
+    session_pool: Optional[_AsyncSessionPool] = None,
+    **kwargs: Any,
 ) -> ClientResponse:
     kwargs.setdefault("timeout", ClientTimeout(DEFAULT_TIMEOUT))
-    session = await async_cache_and_return_session(endpoint_uri)
+    session = await async_cache_and_return_session(
+        endpoint_uri, session_pool=session_pool
+    )
     response = await session.get(endpoint_uri, *args, **kwargs)
     return response
 
 
 async def async_json_make_get_request(
-    endpoint_uri: URI, *args: Any, **kwargs: Any
+    endpoint_uri: URI,
+    *args: Any,
+    session_pool: Optional[_AsyncSessionPool] = None,
+    **kwargs: Any,
 ) -> Dict[str, Any]:
-    response = await async_get_response_from_get_request(endpoint_uri, *args, **kwargs)
-    response.raise_for_status()
-    return await response.json()
+    async with _async_request_slot(session_pool):
+        response = await async_get_response_from_get_request(
+            endpoint_uri, *args, session_pool=session_pool, **kwargs
+        )
+        response.raise_for_status()
+        return await response.json()
 
 
 async def async_get_response_from_post_request(
-    endpoint_uri: URI, *args: Any, **kwargs: Any
+    endpoint_uri: URI,
+    *args: Any,
+    session_pool: Optional[_AsyncSessionPool] = None,
+    **kwargs: Any,
 ) -> ClientResponse:
     kwargs.setdefault("timeout", ClientTimeout(DEFAULT_TIMEOUT))
-    session = await async_cache_and_return_session(endpoint_uri)
+    session = await async_cache_and_return_session(
+        endpoint_uri, session_pool=session_pool
+    )
     response = await session.post(endpoint_uri, *args, **kwargs)
     return response
 
 
 async def async_make_post_request(
-    endpoint_uri: URI, data: Union[bytes, Dict[str, Any]], **kwargs: Any
+    endpoint_uri: URI,
+    data: Union[bytes, Dict[str, Any]],
+    session_pool: Optional[_AsyncSessionPool] = None,
+    **kwargs: Any,
 ) -> bytes:
-    response = await async_get_response_from_post_request(
-        endpoint_uri, data=data, **kwargs
-    )
-    response.raise_for_status()
-    return await response.read()
+    async with _async_request_slot(session_pool):
+        response = await async_get_response_from_post_request(
+            endpoint_uri, data=data, session_pool=session_pool, **kwargs
+        )
+        response.raise_for_status()
+        return await response.read()
 
 
 async def async_get_json_from_client_response(
@@ -7,3 +7,8 @@ from web3.contract.contract import (
     ContractCaller,
     ContractConstructor,
 )
+from web3.contract.multicall import (
+    AsyncMulticall,
+    Multicall,
+    MulticallResult,
+)
@@ -1,7 +1,9 @@
+import asyncio
 import copy
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     Awaitable,
     Callable,
     Dict,
@@ -14,21 +16,20 @@ from typing import (
 )
 
 from eth_typing import (
+    BlockNumber,
     ChecksumAddress,
 )
 from eth_utils import (
     combomethod,
-)
-from eth_utils.toolz import (
-    partial,
+    is_integer,
 )
 from hexbytes import (
     HexBytes,
 )
 
 from web3._utils.abi import (
+    abi_to_signature,
     fallback_func_abi_exists,
-    filter_by_type,
     receive_func_abi_exists,
 )
 from web3._utils.async_transactions import (
@@ -38,6 +39,7 @@ from web3._utils.compat import (
     Self,
 )
 from web3._utils.contracts import (
+    FunctionABIResolver,
     async_parse_block_identifier,
 )
 from web3._utils.datatypes import (
@@ -45,7 +47,6 @@ from web3._utils.datatypes import (
 )
 from web3._utils.events import (
     AsyncEventFilterBuilder,
-    get_event_data,
 )
 from web3._utils.filters import (
     AsyncLogFilter,
@@ -67,8 +68,10 @@ from web3.contract.base_contract import (
     BaseContractEvents,
     BaseContractFunction,
     BaseContractFunctions,
+    ContractFunctionTemplates,
     NonExistentFallbackFunction,
     NonExistentReceiveFunction,
+    get_function_templates,
 )
 from web3.contract.utils import (
     async_build_transaction_for_function,
@@ -84,9 +87,13 @@ from web3.exceptions import (
     NoABIFunctionsFound,
     Web3AttributeError,
     Web3TypeError,
-    Web3ValidationError,
     Web3ValueError,
 )
+from web3.middleware.filter import (
+    MAX_BLOCK_REQUEST,
+    AsyncRequestLogs,
+    block_ranges,
+)
 from web3.types import (
     ABI,
     BlockIdentifier,
@@ -95,7 +102,11 @@ from web3.types import (
     TxParams,
 )
 from web3.utils import (
-    get_abi_input_names,
+    AsyncLogScanner,
+    CacheBackend,
+    EventCheckpoint,
+    get_checkpoint,
+    set_checkpoint,
 )
 
 if TYPE_CHECKING:
@@ -173,14 +184,7 @@ class AsyncContractEvent(BaseContractEvent):
         """
         event_abi = self._get_event_abi()
 
-        # validate ``argument_filters`` if present
-        if argument_filters is not None:
-            event_arg_names = get_abi_input_names(event_abi)
-            if not all(arg in event_arg_names for arg in argument_filters.keys()):
-                raise Web3ValidationError(
-                    "When filtering by argument names, all argument names must be "
-                    "present in the contract's event ABI."
-                )
+        self._validate_argument_filters(event_abi, argument_filters)
 
         _filter_params = self._get_event_filter_params(
             event_abi, argument_filters, from_block, to_block, block_hash
@@ -190,7 +194,7 @@ class AsyncContractEvent(BaseContractEvent):
 
         # convert raw binary data to Python proxy objects as described by ABI:
         all_event_logs = tuple(
-            get_event_data(self.w3.codec, event_abi, entry) for entry in logs
+            self._get_event_decoder(event_abi).decode(entry) for entry in logs
         )
         filtered_logs = self._process_get_logs_argument_filters(
             event_abi,
@@ -199,6 +203,169 @@ class AsyncContractEvent(BaseContractEvent):
         )
         return cast(Awaitable[Iterable[EventData]], filtered_logs)
 
+    @combomethod
+    async def scan_logs(
+        self,
+        argument_filters: Optional[Dict[str, Any]] = None,
+        from_block: Optional[BlockIdentifier] = None,
+        to_block: Optional[BlockIdentifier] = None,
+        log_scanner: Optional[AsyncLogScanner] = None,
+    ) -> AsyncIterator[EventData]:
+        """
+        Yield the events for this contract instance from ``from_block`` to
+        ``to_block``, as ``get_logs`` returns them, fetched with an ``AsyncLogScanner``.
+
+        The block range is scanned with concurrent ``eth_getLogs`` requests over
+        sub-ranges whose size adapts to the number of logs, and the events are yielded
+        in order as the requests complete, rather than once all the logs are fetched.
+
+        :param argument_filters: Filter by argument values, as for ``get_logs``
+        :param from_block: block number or "latest", defaults to "latest"
+        :param to_block: block number or "latest", defaults to "latest"
+        :param log_scanner: the ``AsyncLogScanner`` to scan the block range with,
+          defaults to one with the default settings
+        :yield: :class:`AttributeDict` instances
+        """
+        event_abi = self._get_event_abi()
+        self._validate_argument_filters(event_abi, argument_filters)
+        _filter_params = self._get_event_filter_params(
+            event_abi, argument_filters, from_block, to_block
+        )
+        if log_scanner is None:
+            log_scanner = AsyncLogScanner(self.w3)
+
+        decode = self._get_event_decoder(event_abi).decode
+        async for log in log_scanner.scan(_filter_params):
+            for event in self._process_get_logs_argument_filters(
+                event_abi, [decode(log)], argument_filters
+            ):
+                yield event
+
+    @combomethod
+    async def stream(
+        self,
+        from_block: Optional[BlockIdentifier] = None,
+        to_block: Optional[BlockIdentifier] = "latest",
+        confirmations: int = 0,
+        argument_filters: Optional[Dict[str, Any]] = None,
+        checkpoint_store: Optional[CacheBackend] = None,
+        checkpoint_key: Optional[str] = None,
+        poll_interval: float = 1.0,
+    ) -> AsyncIterator[EventData]:
+        """
+        Yield the events for this contract instance as the blocks holding them get
+        ``confirmations`` blocks deep, from ``from_block`` until ``to_block``, or
+        indefinitely if ``to_block`` is "latest".
+
+        The logs are fetched at most ``MAX_BLOCK_REQUEST`` blocks at a time, so only
+        the events of one such range are held in memory. Once the events of a range
+        are processed, i.e. the next event is requested, the last block of the range
+        and its hash are saved as an ``EventCheckpoint`` in ``checkpoint_store`` by
+        ``checkpoint_key``. A stream started with a checkpoint saved in its store
+        resumes from the block after it, rather than from ``from_block``.
+
+        :param from_block: block number or tag to start from if there is no
+          checkpoint. Defaults to the next block to get ``confirmations`` deep
+        :param to_block: block number or tag to stop at, or "latest" to keep
+          streaming new blocks
+        :param confirmations: the number of blocks mined on top of a block before its
+          events are yielded
+        :param argument_filters: Filter by argument values, as for ``get_logs``
+        :param checkpoint_store: the ``CacheBackend`` to save checkpoints in, e.g. a
+          ``SQLiteCache`` to resume after a restart
+        :param checkpoint_key: the key to save checkpoints by. Defaults to the contract
+          address and the event signature, so set it for streams of the same event
+          with different ``argument_filters``
+        :param poll_interval: the number of seconds to wait for new blocks
+        :yield: :class:`AttributeDict` instances
+        """
+        if confirmations < 0:
+            raise Web3ValueError("confirmations must not be negative")
+
+        event_abi = self._get_event_abi()
+        self._validate_argument_filters(event_abi, argument_filters)
+        _filter_params = self._get_event_filter_params(event_abi, argument_filters)
+        decode = self._get_event_decoder(event_abi).decode
+        if checkpoint_key is None:
+            checkpoint_key = f"{self.address}:{abi_to_signature(event_abi)}"
+
+        async def get_block_number(block_identifier: BlockIdentifier) -> BlockNumber:
+            if is_integer(block_identifier):
+                return cast(BlockNumber, block_identifier)
+            return (await self.w3.eth.get_block(block_identifier))["number"]
+
+        checkpoint = (
+            get_checkpoint(checkpoint_store, checkpoint_key)
+            if checkpoint_store is not None
+            else None
+        )
+        if checkpoint is not None:
+            block = await self.w3.eth.get_block(checkpoint.block_number)
+            if block["hash"] != checkpoint.block_hash:
+                raise Web3ValueError(
+                    f"Block {checkpoint.block_number} of the checkpoint "
+                    f"{checkpoint_key!r} is no longer part of the chain. It was "
+                    "reorganized out after being processed."
+                )
+            next_block = BlockNumber(checkpoint.block_number + 1)
+        elif from_block is None or from_block == "latest":
+            next_block = BlockNumber(
+                max(0, await self.w3.head_poller.get_block_number() - confirmations + 1)
+            )
+        else:
+            next_block = await get_block_number(from_block)
+
+        last_block = (
+            None
+            if to_block is None or to_block == "latest"
+            else await get_block_number(to_block)
+        )
+
+        while last_block is None or next_block <= last_block:
+            confirmed_block = (
+                await self.w3.head_poller.get_block_number() - confirmations
+            )
+            if last_block is not None:
+                confirmed_block = min(confirmed_block, last_block)
+            if next_block > confirmed_block:
+                await asyncio.sleep(poll_interval)
+                continue
+
+            for range_from, range_to in block_ranges(
+                next_block, BlockNumber(confirmed_block), MAX_BLOCK_REQUEST
+            ):
+                request_logs = await AsyncRequestLogs(
+                    self.w3,
+                    range_from,
+                    range_to,
+                    _filter_params["address"],
+                    _filter_params.get("topics"),
+                )
+                if checkpoint_store is not None:
+                    # the hash of the last block is fetched before the logs, so the
+                    # checkpoint is never of a block newer than the logs processed
+                    block_hash = (await self.w3.eth.get_block(range_to))["hash"]
+                logs = await request_logs.get_logs()
+                if checkpoint_store is not None and any(
+                    log["blockNumber"] == range_to and log["blockHash"] != block_hash
+                    for log in logs
+                ):
+                    # the last block was replaced in between, request the range again
+                    break
+
+                for event in self._process_get_logs_argument_filters(
+                    event_abi, [decode(log) for log in logs], argument_filters
+                ):
+                    yield event
+
+                if checkpoint_store is not None:
+                    set_checkpoint(
+                        checkpoint_store,
+                        checkpoint_key,
+                        EventCheckpoint(range_to, block_hash),
+                    )
+                next_block = BlockNumber(range_to + 1)
+
     @combomethod
     async def create_filter(
         self,
@@ -222,9 +389,9 @@ class AsyncContractEvent(BaseContractEvent):
             filter_builder,
         )
         log_filter = await filter_builder.deploy(self.w3)
-        log_filter.log_entry_formatter = get_event_data(
-            self.w3.codec, self._get_event_abi()
-        )
+        log_filter.log_entry_formatter = self._get_event_decoder(
+            self._get_event_abi()
+        ).decode
         log_filter.builder = filter_builder
 
         return log_filter
@@ -234,7 +401,7 @@ class AsyncContractEvent(BaseContractEvent):
         builder = AsyncEventFilterBuilder(
             self._get_event_abi(),
             self.w3.codec,
-            formatter=get_event_data(self.w3.codec, self._get_event_abi()),
+            formatter=self._get_event_decoder(self._get_event_abi()).decode,
         )
         builder.address = self.address
         return builder
@@ -307,34 +474,36 @@ class AsyncContractFunction(BaseContractFunction):
 
         block_id = await async_parse_block_identifier(self.w3, block_identifier)
 
-        return await async_call_contract_function(
-            self.w3,
-            self.address,
-            self._return_data_normalizers,
-            self.function_identifier,
-            call_transaction,
-            block_id,
-            self.contract_abi,
-            self.abi,
-            state_override,
-            ccip_read_enabled,
-            self.decode_tuples,
-            *self.args,
-            **self.kwargs,
-        )
+        with self._resolution_errors():
+            return await async_call_contract_function(
+                self.w3,
+                self.address,
+                self._return_data_normalizers,
+                self.function_identifier,
+                call_transaction,
+                block_id,
+                self.contract_abi,
+                self.abi,
+                state_override,
+                ccip_read_enabled,
+                self.decode_tuples,
+                *self.args,
+                **self.kwargs,
+            )
 
     async def transact(self, transaction: Optional[TxParams] = None) -> HexBytes:
         setup_transaction = self._transact(transaction)
-        return await async_transact_with_contract_function(
-            self.address,
-            self.w3,
-            self.function_identifier,
-            setup_transaction,
-            self.contract_abi,
-            self.abi,
-            *self.args,
-            **self.kwargs,
-        )
+        with self._resolution_errors():
+            return await async_transact_with_contract_function(
+                self.address,
+                self.w3,
+                self.function_identifier,
+                setup_transaction,
+                self.contract_abi,
+                self.abi,
+                *self.args,
+                **self.kwargs,
+            )
 
     async def estimate_gas(
         self,
@@ -343,33 +512,35 @@ class AsyncContractFunction(BaseContractFunction):
         state_override: Optional[StateOverride] = None,
     ) -> int:
         setup_transaction = self._estimate_gas(transaction)
-        return await async_estimate_gas_for_function(
-            self.address,
-            self.w3,
-            self.function_identifier,
-            setup_transaction,
-            self.contract_abi,
-            self.abi,
-            block_identifier,
-            state_override,
-            *self.args,
-            **self.kwargs,
-        )
+        with self._resolution_errors():
+            return await async_estimate_gas_for_function(
+                self.address,
+                self.w3,
+                self.function_identifier,
+                setup_transaction,
+                self.contract_abi,
+                self.abi,
+                block_identifier,
+                state_override,
+                *self.args,
+                **self.kwargs,
+            )
 
     async def build_transaction(
         self, transaction: Optional[TxParams] = None
     ) -> TxParams:
         built_transaction = self._build_transaction(transaction)
-        return await async_build_transaction_for_function(
-            self.address,
-            self.w3,
-            self.function_identifier,
-            built_transaction,
-            self.contract_abi,
-            self.abi,
-            *self.args,
-            **self.kwargs,
-        )
+        with self._resolution_errors():
+            return await async_build_transaction_for_function(
+                self.address,
+                self.w3,
+                self.function_identifier,
+                built_transaction,
+                self.contract_abi,
+                self.abi,
+                *self.args,
+                **self.kwargs,
+            )
 
     @staticmethod
     def get_fallback_function(
@@ -411,8 +582,18 @@ class AsyncContractFunctions(BaseContractFunctions):
         w3: "AsyncWeb3",
         address: Optional[ChecksumAddress] = None,
         decode_tuples: Optional[bool] = False,
+        function_abi_resolver: Optional[FunctionABIResolver] = None,
+        function_templates: Optional[ContractFunctionTemplates] = None,
     ) -> None:
-        super().__init__(abi, w3, AsyncContractFunction, address, decode_tuples)
+        super().__init__(
+            abi,
+            w3,
+            AsyncContractFunction,
+            address,
+            decode_tuples,
+            function_abi_resolver,
+            function_templates,
+        )
 
     def __getattr__(self, function_name: str) -> "AsyncContractFunction":
         if self.abi is None:
@@ -424,13 +605,13 @@ class AsyncContractFunctions(BaseContractFunctions):
                 "The abi for this contract contains no function definitions. ",
                 "Are you sure you provided the correct contract abi?",
             )
-        elif function_name not in self.__dict__["_functions"]:
+        elif function_name not in self.__dict__["_function_templates"].names:
             raise ABIFunctionNotFound(
                 f"The function '{function_name}' was not found in this contract's abi.",
                 " Are you sure you provided the correct contract abi?",
             )
         else:
-            return super().__getattribute__(function_name)
+            return cast("AsyncContractFunction", self._get_function(function_name))
 
 
 class AsyncContract(BaseContract):
@@ -462,11 +643,20 @@ class AsyncContract(BaseContract):
             raise Web3TypeError(
                 "The address argument is required to instantiate a contract."
             )
+        function_templates = self._get_function_templates(AsyncContractFunction)
         self.functions = AsyncContractFunctions(
-            self.abi, self.w3, self.address, decode_tuples=self.decode_tuples
+            self.abi,
+            self.w3,
+            self.address,
+            decode_tuples=self.decode_tuples,
+            function_templates=function_templates,
         )
         self.caller = AsyncContractCaller(
-            self.abi, self.w3, self.address, decode_tuples=self.decode_tuples
+            self.abi,
+            self.w3,
+            self.address,
+            decode_tuples=self.decode_tuples,
+            function_templates=function_templates,
         )
         self.events = AsyncContractEvents(self.abi, self.w3, self.address)
         self.fallback = AsyncContract.get_fallback_function(
@@ -498,14 +688,27 @@ class AsyncContract(BaseContract):
                 normalizers=normalizers,
             ),
         )
+        contract._function_templates = get_function_templates(
+            contract.abi,
+            contract.w3,
+            AsyncContractFunction,
+            contract.decode_tuples,
+        )
+        contract._function_abi_resolver = (
+            contract._function_templates.function_abi_resolver
+        )
         contract.functions = AsyncContractFunctions(
-            contract.abi, contract.w3, decode_tuples=contract.decode_tuples
+            contract.abi,
+            contract.w3,
+            decode_tuples=contract.decode_tuples,
+            function_templates=contract._function_templates,
         )
         contract.caller = AsyncContractCaller(
             contract.abi,
             contract.w3,
             contract.address,
             decode_tuples=contract.decode_tuples,
+            function_templates=contract._function_templates,
         )
         contract.events = AsyncContractEvents(contract.abi, contract.w3)
         contract.fallback = AsyncContract.get_fallback_function(
@@ -570,33 +773,24 @@ class AsyncContractCaller(BaseContractCaller):
         block_identifier: BlockIdentifier = None,
         ccip_read_enabled: Optional[bool] = None,
         decode_tuples: Optional[bool] = False,
+        function_abi_resolver: Optional[FunctionABIResolver] = None,
+        function_templates: Optional[ContractFunctionTemplates] = None,
     ) -> None:
-        super().__init__(abi, w3, address, decode_tuples=decode_tuples)
-
-        if self.abi:
-            if transaction is None:
-                transaction = {}
-
-            self._functions = filter_by_type("function", self.abi)
-            for func in self._functions:
-                fn = AsyncContractFunction.factory(
-                    func["name"],
-                    w3=w3,
-                    contract_abi=self.abi,
-                    address=self.address,
-                    function_identifier=func["name"],
-                    decode_tuples=decode_tuples,
-                )
-
-                caller_method = partial(
-                    self.call_function,
-                    fn,
-                    transaction=transaction,
-                    block_identifier=block_identifier,
-                    ccip_read_enabled=ccip_read_enabled,
-                )
-
-                setattr(self, func["name"], caller_method)
+        if function_templates is None:
+            function_templates = ContractFunctionTemplates(
+                abi, w3, AsyncContractFunction, decode_tuples, function_abi_resolver
+            )
+        super().__init__(
+            abi,
+            w3,
+            address,
+            decode_tuples=decode_tuples,
+            function_abi_resolver=function_abi_resolver,
+            transaction=transaction,
+            block_identifier=block_identifier,
+            ccip_read_enabled=ccip_read_enabled,
+            function_templates=function_templates,
+        )
 
     def __call__(
         self,
@@ -614,6 +808,8 @@ class AsyncContractCaller(BaseContractCaller):
             block_identifier=block_identifier,
             ccip_read_enabled=ccip_read_enabled,
             decode_tuples=self.decode_tuples,
+            function_abi_resolver=self._function_abi_resolver,
+            function_templates=self._function_templates,
         )
 
 
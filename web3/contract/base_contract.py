@@ -1,3 +1,7 @@
+from contextlib import (
+    contextmanager,
+)
+import copy
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -5,10 +9,12 @@ from typing import (
     Collection,
     Dict,
     Iterable,
+    Iterator,
     List,
     NoReturn,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
@@ -30,6 +36,9 @@ from eth_utils import (
     is_text,
     to_tuple,
 )
+from eth_utils.toolz import (
+    partial,
+)
 from hexbytes import (
     HexBytes,
 )
@@ -45,11 +54,11 @@ from web3._utils.abi import (
     receive_func_abi_exists,
 )
 from web3._utils.contracts import (
+    FunctionABIResolver,
     decode_transaction_data,
     encode_abi,
     find_matching_event_abi,
     find_matching_fn_abi,
-    get_function_info,
     prepare_transaction,
 )
 from web3._utils.datatypes import (
@@ -64,8 +73,9 @@ from web3._utils.encoding import (
 )
 from web3._utils.events import (
     AsyncEventFilterBuilder,
+    EventDecoder,
     EventFilterBuilder,
-    get_event_data,
+    MultiEventDecoder,
     is_dynamic_sized_type,
 )
 from web3._utils.filters import (
@@ -112,10 +122,17 @@ from web3.types import (
     EventData,
     FilterParams,
     FunctionIdentifier,
+    LogReceipt,
     TContractFn,
     TxParams,
     TxReceipt,
 )
+from web3.utils import (
+    get_abi_input_names,
+)
+from web3.utils.caching import (
+    SimpleCache,
+)
 
 if TYPE_CHECKING:
     from web3 import (  # noqa: F401
@@ -127,6 +144,55 @@ if TYPE_CHECKING:
     from .contract import ContractFunction  # noqa: F401
 
 
+def _shadowed_names(obj: Any, names: Set[str]) -> Set[str]:
+    # the names ``obj`` already has an attribute with, which are found without
+    # falling back to its ``__getattr__``, leaving out the names its ``__dir__``
+    # lists from the ABI
+    return names.intersection(object.__dir__(obj))
+
+
+@to_tuple
+def _parse_logs(
+    decode: Callable[[LogReceipt], EventData],
+    txn_receipt: TxReceipt,
+    errors: EventLogErrorFlags,
+) -> Iterable[EventData]:
+    """
+    Decode the logs of ``txn_receipt`` with ``decode``, handling the logs that cannot
+    be decoded as set by ``errors``.
+    """
+    try:
+        errors.name
+    except AttributeError:
+        raise Web3AttributeError(
+            f"Error flag must be one of: {EventLogErrorFlags.flag_options()}"
+        )
+
+    for log in txn_receipt["logs"]:
+        try:
+            rich_log = decode(log)
+        except (MismatchedABI, LogTopicError, InvalidEventABI, TypeError) as e:
+            if errors == DISCARD:
+                continue
+            elif errors == IGNORE:
+                # type ignores b/c rich_log set on 1092 conflicts with mutated types
+                new_log = MutableAttributeDict(log)  # type: ignore
+                new_log["errors"] = e
+                rich_log = AttributeDict(new_log)  # type: ignore
+            elif errors == STRICT:
+                raise e
+            else:
+                warnings.warn(
+                    f"The log with transaction hash: {log['transactionHash']!r} "
+                    f"and logIndex: {log['logIndex']} encountered the following "
+                    f"error during processing: {type(e).__name__}({e}). It has "
+                    "been discarded.",
+                    stacklevel=2,
+                )
+                continue
+        yield rich_log
+
+
 class BaseContractEvent:
     """
     Base class for contract events
@@ -140,6 +206,7 @@ class BaseContractEvent:
     w3: Union["Web3", "AsyncWeb3"] = None
     contract_abi: ABI = None
     abi: ABIEvent = None
+    _event_decoder: Optional[EventDecoder] = None
 
     def __init__(self, *argument_names: Tuple[str]) -> None:
         if argument_names is None:
@@ -154,50 +221,41 @@ class BaseContractEvent:
     def _get_event_abi(cls) -> ABIEvent:
         return find_matching_event_abi(cls.contract_abi, event_name=cls.event_name)
 
+    @combomethod
+    def _get_event_decoder(self, event_abi: ABIEvent) -> EventDecoder:
+        """
+        Return the decoder for ``event_abi``, built once and shared by the instances
+        of this event class.
+        """
+        event_class = cast(
+            Type["BaseContractEvent"], self if isinstance(self, type) else type(self)
+        )
+        decoder = event_class._event_decoder
+        if (
+            decoder is None
+            or decoder.event_abi is not event_abi
+            or decoder.abi_codec is not self.w3.codec
+        ):
+            decoder = EventDecoder(self.w3.codec, event_abi)
+            event_class._event_decoder = decoder
+        return decoder
+
     @combomethod
     def process_receipt(
         self, txn_receipt: TxReceipt, errors: EventLogErrorFlags = WARN
     ) -> Iterable[EventData]:
         return self._parse_logs(txn_receipt, errors)
 
-    @to_tuple
     def _parse_logs(
         self, txn_receipt: TxReceipt, errors: EventLogErrorFlags
     ) -> Iterable[EventData]:
-        try:
-            errors.name
-        except AttributeError:
-            raise Web3AttributeError(
-                f"Error flag must be one of: {EventLogErrorFlags.flag_options()}"
-            )
-
-        for log in txn_receipt["logs"]:
-            try:
-                rich_log = get_event_data(self.w3.codec, self.abi, log)
-            except (MismatchedABI, LogTopicError, InvalidEventABI, TypeError) as e:
-                if errors == DISCARD:
-                    continue
-                elif errors == IGNORE:
-                    # type ignores b/c rich_log set on 1092 conflicts with mutated types
-                    new_log = MutableAttributeDict(log)  # type: ignore
-                    new_log["errors"] = e
-                    rich_log = AttributeDict(new_log)  # type: ignore
-                elif errors == STRICT:
-                    raise e
-                else:
-                    warnings.warn(
-                        f"The log with transaction hash: {log['transactionHash']!r} "
-                        f"and logIndex: {log['logIndex']} encountered the following "
-                        f"error during processing: {type(e).__name__}({e}). It has "
-                        "been discarded.",
-                        stacklevel=2,
-                    )
-                    continue
-            yield rich_log
+        return _parse_logs(
+            self._get_event_decoder(self.abi).decode, txn_receipt, errors
+        )
 
     @combomethod
     def process_log(self, log: HexStr) -> EventData:
-        return get_event_data(self.w3.codec, self.abi, log)
+        return self._get_event_decoder(self.abi).decode(log)
 
     @combomethod
     def _get_event_filter_params(
@@ -268,6 +326,18 @@ class BaseContractEvent:
                     "filters with the match_any method."
                 )
 
+    @staticmethod
+    def _validate_argument_filters(
+        event_abi: ABIEvent, argument_filters: Optional[Dict[str, Any]]
+    ) -> None:
+        if argument_filters is not None:
+            event_arg_names = get_abi_input_names(event_abi)
+            if not all(arg in event_arg_names for arg in argument_filters.keys()):
+                raise Web3ValidationError(
+                    "When filtering by argument names, all argument names must be "
+                    "present in the contract's event ABI."
+                )
+
     @staticmethod
     def _process_get_logs_argument_filters(
         event_abi: ABIEvent,
@@ -404,21 +474,18 @@ class BaseContractEvents:
         contract_event_type: Type["BaseContractEvent"],
         address: Optional[ChecksumAddress] = None,
     ) -> None:
+        self.w3 = w3
+        self._events_decoder: Optional[MultiEventDecoder] = None
         if abi:
             self.abi = abi
             self._events = filter_by_type("event", self.abi)
-            for event in self._events:
-                setattr(
-                    self,
-                    event["name"],
-                    contract_event_type.factory(
-                        event["name"],
-                        w3=w3,
-                        contract_abi=self.abi,
-                        address=address,
-                        event_name=event["name"],
-                    ),
-                )
+            self._event_names = {event["name"] for event in self._events}
+            self._contract_event_type = contract_event_type
+            self._address = address
+            # the event classes are built on first access, but for the events named
+            # like an attribute of this object
+            for event_name in _shadowed_names(self, self._event_names):
+                self._get_event(event_name)
 
     def __getattr__(self, event_name: str) -> Type["BaseContractEvent"]:
         if "_events" not in self.__dict__:
@@ -426,17 +493,36 @@ class BaseContractEvents:
                 "The abi for this contract contains no event definitions. ",
                 "Are you sure you provided the correct contract abi?",
             )
-        elif event_name not in self.__dict__["_events"]:
+        elif event_name not in self.__dict__["_event_names"]:
             raise ABIEventFunctionNotFound(
                 f"The event '{event_name}' was not found in this contract's abi. ",
                 "Are you sure you provided the correct contract abi?",
             )
         else:
-            return super().__getattribute__(event_name)
+            return self._get_event(event_name)
+
+    def _get_event(self, event_name: str) -> Type["BaseContractEvent"]:
+        # event classes hold their address, so they are built for each contract
+        event = cast(
+            Type["BaseContractEvent"],
+            self._contract_event_type.factory(
+                event_name,
+                w3=self.w3,
+                contract_abi=self.abi,
+                address=self._address,
+                event_name=event_name,
+            ),
+        )
+        setattr(self, event_name, event)
+        return event
 
     def __getitem__(self, event_name: str) -> Type["BaseContractEvent"]:
         return getattr(self, event_name)
 
+    def __dir__(self) -> List[str]:
+        # the events are built on first access, so they are listed from the ABI
+        return sorted(set(super().__dir__()) | self.__dict__.get("_event_names", set()))
+
     def __iter__(self) -> Iterable[Type["BaseContractEvent"]]:
         """
         Iterate over supported
@@ -452,6 +538,30 @@ class BaseContractEvents:
         except ABIEventFunctionNotFound:
             return False
 
+    def _get_events_decoder(self) -> MultiEventDecoder:
+        decoder = self._events_decoder
+        if decoder is None or decoder.abi_codec is not self.w3.codec:
+            decoder = MultiEventDecoder(
+                self.w3.codec, cast(List[ABIEvent], self._events)
+            )
+            self._events_decoder = decoder
+        return decoder
+
+    def process_receipt(
+        self, txn_receipt: TxReceipt, errors: EventLogErrorFlags = WARN
+    ) -> Iterable[EventData]:
+        """
+        Decode the logs of a transaction receipt for any of the events in the ABI, in
+        one pass over the logs.
+        """
+        return _parse_logs(self._get_events_decoder().decode, txn_receipt, errors)
+
+    def process_log(self, log: LogReceipt) -> EventData:
+        """
+        Decode a log for any of the events in the ABI.
+        """
+        return self._get_events_decoder().decode(log)
+
 
 class BaseContractFunction:
     """
@@ -471,28 +581,67 @@ class BaseContractFunction:
     decode_tuples: Optional[bool] = False
     args: Any = None
     kwargs: Any = None
+    _function_abi_resolver: Optional[FunctionABIResolver] = None
+    _deferred_arguments_check: bool = False
 
     def __init__(self, abi: Optional[ABIFunction] = None) -> None:
         self.abi = abi
         self.fn_name = type(self).__name__
 
     def _set_function_info(self) -> None:
+        resolver = self._function_abi_resolver
+        if resolver is not None and not is_text(self.function_identifier):
+            resolver = None
+
+        self._deferred_arguments_check = False
         if not self.abi:
-            self.abi = find_matching_fn_abi(
-                self.contract_abi,
-                self.w3.codec,
-                self.function_identifier,
-                self.args,
-                self.kwargs,
-            )
+            if resolver is None:
+                self.abi = find_matching_fn_abi(
+                    self.contract_abi,
+                    self.w3.codec,
+                    self.function_identifier,
+                    self.args,
+                    self.kwargs,
+                )
+            else:
+                self.abi, checked = resolver.resolve(
+                    self.w3.codec,
+                    cast(str, self.function_identifier),
+                    self.args,
+                    self.kwargs,
+                )
+                self._deferred_arguments_check = not checked
         if self.function_identifier in [FallbackFn, ReceiveFn]:
             self.selector = encode_hex(b"")
+        elif resolver is not None:
+            self.selector = resolver.selector(self.abi)
         elif is_text(self.function_identifier):
             self.selector = encode_hex(function_abi_to_4byte_selector(self.abi))
         else:
             raise Web3TypeError("Unsupported function identifier")
 
-        self.arguments = merge_args_and_kwargs(self.abi, self.args, self.kwargs)
+        with self._resolution_errors():
+            self.arguments = merge_args_and_kwargs(self.abi, self.args, self.kwargs)
+
+    @contextmanager
+    def _resolution_errors(self) -> Iterator[None]:
+        """
+        The arguments of a call to a function that isn't overloaded are only checked
+        when encoded: raise the errors resolving the function would have raised for
+        arguments that cannot be encoded.
+        """
+        try:
+            yield
+        except TypeError:
+            if self._deferred_arguments_check:
+                find_matching_fn_abi(
+                    self.contract_abi,
+                    self.w3.codec,
+                    self.function_identifier,
+                    self.args,
+                    self.kwargs,
+                )
+            raise
 
     def _get_call_txparams(self, transaction: Optional[TxParams] = None) -> TxParams:
         if transaction is None:
@@ -629,6 +778,87 @@ class BaseContractFunction:
         return PropertyCheckingFactory(class_name, (cls,), kwargs)(kwargs.get("abi"))
 
 
+class ContractFunctionTemplates:
+    """
+    The functions of a contract ABI, built once for a contract class and copied for
+    each of its contract objects, which only differ by their address.
+    """
+
+    def __init__(
+        self,
+        abi: ABI,
+        w3: Union["Web3", "AsyncWeb3"],
+        contract_function_class: Union[
+            Type["ContractFunction"], Type["AsyncContractFunction"]
+        ],
+        decode_tuples: Optional[bool] = False,
+        function_abi_resolver: Optional[FunctionABIResolver] = None,
+    ) -> None:
+        self.abi = abi
+        self.w3 = w3
+        self.contract_function_class = contract_function_class
+        self.decode_tuples = decode_tuples
+        if function_abi_resolver is None:
+            function_abi_resolver = FunctionABIResolver(abi)
+        self.function_abi_resolver = function_abi_resolver
+        self.functions = filter_by_type("function", abi) if abi else []
+        self.names = {func["name"] for func in self.functions}
+        self._templates: Dict[
+            str, Union["ContractFunction", "AsyncContractFunction"]
+        ] = {}
+
+    def function(
+        self, function_name: str, address: Optional[ChecksumAddress]
+    ) -> Union["ContractFunction", "AsyncContractFunction"]:
+        """
+        The function named ``function_name`` of the contract at ``address``.
+        """
+        template = self._templates.get(function_name)
+        if template is None:
+            template = self.contract_function_class.factory(
+                function_name,
+                w3=self.w3,
+                contract_abi=self.abi,
+                decode_tuples=self.decode_tuples,
+                function_identifier=function_name,
+                _function_abi_resolver=self.function_abi_resolver,
+            )
+            self._templates[function_name] = template
+        function = copy.copy(template)
+        function.address = address
+        return function
+
+
+# the functions of the contract ABIs used lately, keyed by the identity of the ABI and
+# of the ``w3`` instance, which the templates hold on to, so that the contract classes
+# made from the same ABI, e.g. by each ``w3.eth.contract(address, abi=abi)``, share them
+_function_templates = SimpleCache(256)
+
+
+def get_function_templates(
+    abi: ABI,
+    w3: Union["Web3", "AsyncWeb3"],
+    contract_function_class: Union[
+        Type["ContractFunction"], Type["AsyncContractFunction"]
+    ],
+    decode_tuples: Optional[bool] = False,
+) -> ContractFunctionTemplates:
+    key = (id(abi), id(w3), id(contract_function_class), bool(decode_tuples))
+    templates = _function_templates.get_cache_entry(key)
+    if templates is None or templates.abi is not abi or templates.w3 is not w3:
+        templates = ContractFunctionTemplates(
+            abi, w3, contract_function_class, decode_tuples
+        )
+        _function_templates.cache(key, templates)
+    return templates
+
+
+def _dir_with_function_names(obj: Any, attributes: Iterable[str]) -> List[str]:
+    function_templates = obj.__dict__.get("_function_templates")
+    names = function_templates.names if function_templates is not None else set()
+    return sorted(set(attributes) | names)
+
+
 class BaseContractFunctions:
     """Class containing contract function objects"""
 
@@ -641,26 +871,35 @@ class BaseContractFunctions:
         ],
         address: Optional[ChecksumAddress] = None,
         decode_tuples: Optional[bool] = False,
+        function_abi_resolver: Optional[FunctionABIResolver] = None,
+        function_templates: Optional[ContractFunctionTemplates] = None,
     ) -> None:
         self.abi = abi
         self.w3 = w3
         self.address = address
 
         if self.abi:
-            self._functions = filter_by_type("function", self.abi)
-            for func in self._functions:
-                setattr(
-                    self,
-                    func["name"],
-                    contract_function_class.factory(
-                        func["name"],
-                        w3=self.w3,
-                        contract_abi=self.abi,
-                        address=self.address,
-                        decode_tuples=decode_tuples,
-                        function_identifier=func["name"],
-                    ),
+            if function_templates is None:
+                function_templates = ContractFunctionTemplates(
+                    self.abi,
+                    self.w3,
+                    contract_function_class,
+                    decode_tuples,
+                    function_abi_resolver,
                 )
+            self._function_templates = function_templates
+            self._functions = function_templates.functions
+            # the functions are built on first access, but for the functions named
+            # like an attribute of this object
+            for function_name in _shadowed_names(self, function_templates.names):
+                self._get_function(function_name)
+
+    def _get_function(
+        self, function_name: str
+    ) -> Union["ContractFunction", "AsyncContractFunction"]:
+        function = self._function_templates.function(function_name, self.address)
+        setattr(self, function_name, function)
+        return function
 
     def __iter__(self) -> Iterable["ABIFunction"]:
         if not hasattr(self, "_functions") or not self._functions:
@@ -672,6 +911,10 @@ class BaseContractFunctions:
     def __getitem__(self, function_name: str) -> ABIFunction:
         return getattr(self, function_name)
 
+    def __dir__(self) -> List[str]:
+        # the functions are built on first access, so they are listed from the ABI
+        return _dir_with_function_names(self, super().__dir__())
+
     def __hasattr__(self, function_name: str) -> bool:
         try:
             return function_name in self.__dict__["_functions"]
@@ -738,18 +981,21 @@ class BaseContract:
 
         :param data: defaults to function selector
         """
-        fn_abi, fn_selector, fn_arguments = get_function_info(
-            fn_name,
-            cls.w3.codec,
-            contract_abi=cls.abi,
-            args=args,
-            kwargs=kwargs,
+        resolver = cls._get_function_abi_resolver()
+        fn_abi, fn_selector, fn_arguments = resolver.function_info(
+            cls.w3.codec, fn_name, args, kwargs
         )
 
         if data is None:
             data = fn_selector
 
-        return encode_abi(cls.w3, fn_abi, fn_arguments, data)
+        try:
+            return encode_abi(cls.w3, fn_abi, fn_arguments, data)
+        except TypeError:
+            # the arguments of functions that aren't overloaded are only checked
+            # when encoded, raise the error of their resolution
+            cls._find_matching_fn_abi(fn_name, args, kwargs)
+            raise
 
     @combomethod
     def all_functions(
@@ -834,6 +1080,42 @@ class BaseContract:
     # Private Helpers
     #
     _return_data_normalizers: Tuple[Callable[..., Any], ...] = tuple()
+    _function_abi_resolver: Optional[FunctionABIResolver] = None
+
+    @combomethod
+    def _get_function_abi_resolver(cls) -> FunctionABIResolver:
+        # the resolver shared by the functions of the contract class
+        resolver = cls._function_abi_resolver
+        if resolver is None or resolver.abi is not cls.abi:
+            return FunctionABIResolver(cls.abi)
+        return resolver
+
+    _function_templates: Optional[ContractFunctionTemplates] = None
+
+    @combomethod
+    def _get_function_templates(
+        cls,
+        contract_function_class: Union[
+            Type["ContractFunction"], Type["AsyncContractFunction"]
+        ],
+    ) -> ContractFunctionTemplates:
+        # the functions shared by the contract objects of the contract class
+        templates = cls._function_templates
+        if (
+            templates is None
+            or templates.abi is not cls.abi
+            or templates.w3 is not cls.w3
+            or templates.decode_tuples != cls.decode_tuples
+            or templates.contract_function_class is not contract_function_class
+        ):
+            return ContractFunctionTemplates(
+                cls.abi,
+                cls.w3,
+                contract_function_class,
+                cls.decode_tuples,
+                cls._get_function_abi_resolver(),
+            )
+        return templates
 
     @classmethod
     def _prepare_transaction(
@@ -982,6 +1264,7 @@ class BaseContractCaller:
 
     # mypy types
     _functions: List[Union[ABIFunction, ABIEvent]]
+    _function_templates: ContractFunctionTemplates
 
     def __init__(
         self,
@@ -989,12 +1272,34 @@ class BaseContractCaller:
         w3: Union["Web3", "AsyncWeb3"],
         address: ChecksumAddress,
         decode_tuples: Optional[bool] = False,
+        function_abi_resolver: Optional[FunctionABIResolver] = None,
+        transaction: Optional[TxParams] = None,
+        block_identifier: BlockIdentifier = None,
+        ccip_read_enabled: Optional[bool] = None,
+        function_templates: Optional[ContractFunctionTemplates] = None,
     ) -> None:
         self.w3 = w3
         self.address = address
         self.abi = abi
         self.decode_tuples = decode_tuples
         self._functions = []
+        if function_templates is not None:
+            function_abi_resolver = function_templates.function_abi_resolver
+        elif function_abi_resolver is None and abi:
+            function_abi_resolver = FunctionABIResolver(abi)
+        self._function_abi_resolver = function_abi_resolver
+        self._transaction = transaction if transaction is not None else {}
+        self._block_identifier = block_identifier
+        self._ccip_read_enabled = ccip_read_enabled
+
+        if function_templates is not None:
+            self._function_templates = function_templates
+        if self.abi and function_templates is not None:
+            self._functions = function_templates.functions
+            # the caller methods are built on first access, but for the functions
+            # named like an attribute of this object
+            for function_name in _shadowed_names(self, function_templates.names):
+                self._get_caller_method(function_name)
 
     def __getattr__(self, function_name: str) -> Any:
         if self.abi is None:
@@ -1006,7 +1311,7 @@ class BaseContractCaller:
                 "The ABI for this contract contains no function definitions. ",
                 "Are you sure you provided the correct contract ABI?",
             )
-        elif function_name not in {fn["name"] for fn in self._functions}:
+        elif function_name not in self._function_templates.names:
             functions_available = ", ".join([fn["name"] for fn in self._functions])
             raise ABIFunctionNotFound(
                 f"The function '{function_name}' was not found in this contract's ABI.",
@@ -1015,7 +1320,22 @@ class BaseContractCaller:
                 "Did you mean to call one of those functions?",
             )
         else:
-            return super().__getattribute__(function_name)
+            return self._get_caller_method(function_name)
+
+    def __dir__(self) -> List[str]:
+        # the caller methods are built on first access, so they are listed from the ABI
+        return _dir_with_function_names(self, super().__dir__())
+
+    def _get_caller_method(self, function_name: str) -> Callable[..., Any]:
+        caller_method = partial(
+            self.call_function,
+            self._function_templates.function(function_name, self.address),
+            transaction=self._transaction,
+            block_identifier=self._block_identifier,
+            ccip_read_enabled=self._ccip_read_enabled,
+        )
+        setattr(self, function_name, caller_method)
+        return caller_method
 
     def __hasattr__(self, event_name: str) -> bool:
         try:
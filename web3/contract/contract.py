@@ -5,6 +5,7 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -27,21 +28,23 @@ from hexbytes import (
 
 from web3._utils.abi import (
     fallback_func_abi_exists,
-    filter_by_type,
     receive_func_abi_exists,
 )
 from web3._utils.compat import (
     Self,
 )
 from web3._utils.contracts import (
+    FunctionABIResolver,
     parse_block_identifier,
 )
 from web3._utils.datatypes import (
     PropertyCheckingFactory,
 )
+from web3._utils.ens import (
+    is_ens_name,
+)
 from web3._utils.events import (
     EventFilterBuilder,
-    get_event_data,
 )
 from web3._utils.filters import (
     LogFilter,
@@ -53,6 +56,7 @@ from web3._utils.function_identifiers import (
 from web3._utils.normalizers import (
     normalize_abi,
     normalize_address,
+    normalize_address_no_ens,
     normalize_bytecode,
 )
 from web3._utils.transactions import (
@@ -66,8 +70,10 @@ from web3.contract.base_contract import (
     BaseContractEvents,
     BaseContractFunction,
     BaseContractFunctions,
+    ContractFunctionTemplates,
     NonExistentFallbackFunction,
     NonExistentReceiveFunction,
+    get_function_templates,
 )
 from web3.contract.utils import (
     build_transaction_for_function,
@@ -83,7 +89,6 @@ from web3.exceptions import (
     NoABIFunctionsFound,
     Web3AttributeError,
     Web3TypeError,
-    Web3ValidationError,
     Web3ValueError,
 )
 from web3.types import (
@@ -94,7 +99,7 @@ from web3.types import (
     TxParams,
 )
 from web3.utils import (
-    get_abi_input_names,
+    LogScanner,
 )
 
 if TYPE_CHECKING:
@@ -172,14 +177,7 @@ class ContractEvent(BaseContractEvent):
         """
         event_abi = self._get_event_abi()
 
-        # validate ``argument_filters`` if present
-        if argument_filters is not None:
-            event_arg_names = get_abi_input_names(event_abi)
-            if not all(arg in event_arg_names for arg in argument_filters.keys()):
-                raise Web3ValidationError(
-                    "When filtering by argument names, all argument names must be "
-                    "present in the contract's event ABI."
-                )
+        self._validate_argument_filters(event_abi, argument_filters)
 
         _filter_params = self._get_event_filter_params(
             event_abi, argument_filters, from_block, to_block, block_hash
@@ -189,7 +187,7 @@ class ContractEvent(BaseContractEvent):
 
         # convert raw binary data to Python proxy objects as described by ABI:
         all_event_logs = tuple(
-            get_event_data(self.w3.codec, event_abi, entry) for entry in logs
+            self._get_event_decoder(event_abi).decode(entry) for entry in logs
         )
         filtered_logs = self._process_get_logs_argument_filters(
             event_abi,
@@ -200,6 +198,43 @@ class ContractEvent(BaseContractEvent):
         sorted_logs = sorted(sorted_logs, key=lambda e: e["blockNumber"])
         return sorted_logs
 
+    @combomethod
+    def scan_logs(
+        self,
+        argument_filters: Optional[Dict[str, Any]] = None,
+        from_block: Optional[BlockIdentifier] = None,
+        to_block: Optional[BlockIdentifier] = None,
+        log_scanner: Optional[LogScanner] = None,
+    ) -> Iterator[EventData]:
+        """
+        Yield the events for this contract instance from ``from_block`` to
+        ``to_block``, as ``get_logs`` returns them, fetched with a ``LogScanner``.
+
+        The block range is scanned with concurrent ``eth_getLogs`` requests over
+        sub-ranges whose size adapts to the number of logs, and the events are yielded
+        in order as the requests complete, rather than once all the logs are fetched.
+
+        :param argument_filters: Filter by argument values, as for ``get_logs``
+        :param from_block: block number or "latest", defaults to "latest"
+        :param to_block: block number or "latest", defaults to "latest"
+        :param log_scanner: the ``LogScanner`` to scan the block range with,
+          defaults to one with the default settings
+        :yield: :class:`AttributeDict` instances
+        """
+        event_abi = self._get_event_abi()
+        self._validate_argument_filters(event_abi, argument_filters)
+        _filter_params = self._get_event_filter_params(
+            event_abi, argument_filters, from_block, to_block
+        )
+        if log_scanner is None:
+            log_scanner = LogScanner(self.w3)
+
+        decode = self._get_event_decoder(event_abi).decode
+        for log in log_scanner.scan(_filter_params):
+            yield from self._process_get_logs_argument_filters(
+                event_abi, [decode(log)], argument_filters
+            )
+
     @combomethod
     def create_filter(
         self,
@@ -223,9 +258,9 @@ class ContractEvent(BaseContractEvent):
             filter_builder,
         )
         log_filter = filter_builder.deploy(self.w3)
-        log_filter.log_entry_formatter = get_event_data(
-            self.w3.codec, self._get_event_abi()
-        )
+        log_filter.log_entry_formatter = self._get_event_decoder(
+            self._get_event_abi()
+        ).decode
         log_filter.builder = filter_builder
 
         return log_filter
@@ -235,7 +270,7 @@ class ContractEvent(BaseContractEvent):
         builder = EventFilterBuilder(
             self._get_event_abi(),
             self.w3.codec,
-            formatter=get_event_data(self.w3.codec, self._get_event_abi()),
+            formatter=self._get_event_decoder(self._get_event_abi()).decode,
         )
         builder.address = self.address
         return builder
@@ -308,34 +343,36 @@ class ContractFunction(BaseContractFunction):
 
         block_id = parse_block_identifier(self.w3, block_identifier)
 
-        return call_contract_function(
-            self.w3,
-            self.address,
-            self._return_data_normalizers,
-            self.function_identifier,
-            call_transaction,
-            block_id,
-            self.contract_abi,
-            self.abi,
-            state_override,
-            ccip_read_enabled,
-            self.decode_tuples,
-            *self.args,
-            **self.kwargs,
-        )
+        with self._resolution_errors():
+            return call_contract_function(
+                self.w3,
+                self.address,
+                self._return_data_normalizers,
+                self.function_identifier,
+                call_transaction,
+                block_id,
+                self.contract_abi,
+                self.abi,
+                state_override,
+                ccip_read_enabled,
+                self.decode_tuples,
+                *self.args,
+                **self.kwargs,
+            )
 
     def transact(self, transaction: Optional[TxParams] = None) -> HexBytes:
         setup_transaction = self._transact(transaction)
-        return transact_with_contract_function(
-            self.address,
-            self.w3,
-            self.function_identifier,
-            setup_transaction,
-            self.contract_abi,
-            self.abi,
-            *self.args,
-            **self.kwargs,
-        )
+        with self._resolution_errors():
+            return transact_with_contract_function(
+                self.address,
+                self.w3,
+                self.function_identifier,
+                setup_transaction,
+                self.contract_abi,
+                self.abi,
+                *self.args,
+                **self.kwargs,
+            )
 
     def estimate_gas(
         self,
@@ -344,31 +381,33 @@ class ContractFunction(BaseContractFunction):
         state_override: Optional[StateOverride] = None,
     ) -> int:
         setup_transaction = self._estimate_gas(transaction)
-        return estimate_gas_for_function(
-            self.address,
-            self.w3,
-            self.function_identifier,
-            setup_transaction,
-            self.contract_abi,
-            self.abi,
-            block_identifier,
-            state_override,
-            *self.args,
-            **self.kwargs,
-        )
+        with self._resolution_errors():
+            return estimate_gas_for_function(
+                self.address,
+                self.w3,
+                self.function_identifier,
+                setup_transaction,
+                self.contract_abi,
+                self.abi,
+                block_identifier,
+                state_override,
+                *self.args,
+                **self.kwargs,
+            )
 
     def build_transaction(self, transaction: Optional[TxParams] = None) -> TxParams:
         built_transaction = self._build_transaction(transaction)
-        return build_transaction_for_function(
-            self.address,
-            self.w3,
-            self.function_identifier,
-            built_transaction,
-            self.contract_abi,
-            self.abi,
-            *self.args,
-            **self.kwargs,
-        )
+        with self._resolution_errors():
+            return build_transaction_for_function(
+                self.address,
+                self.w3,
+                self.function_identifier,
+                built_transaction,
+                self.contract_abi,
+                self.abi,
+                *self.args,
+                **self.kwargs,
+            )
 
     @staticmethod
     def get_fallback_function(
@@ -410,8 +449,18 @@ class ContractFunctions(BaseContractFunctions):
         w3: "Web3",
         address: Optional[ChecksumAddress] = None,
         decode_tuples: Optional[bool] = False,
+        function_abi_resolver: Optional[FunctionABIResolver] = None,
+        function_templates: Optional[ContractFunctionTemplates] = None,
     ) -> None:
-        super().__init__(abi, w3, ContractFunction, address, decode_tuples)
+        super().__init__(
+            abi,
+            w3,
+            ContractFunction,
+            address,
+            decode_tuples,
+            function_abi_resolver,
+            function_templates,
+        )
 
     def __getattr__(self, function_name: str) -> "ContractFunction":
         if self.abi is None:
@@ -423,13 +472,13 @@ class ContractFunctions(BaseContractFunctions):
                 "The abi for this contract contains no function definitions. ",
                 "Are you sure you provided the correct contract abi?",
             )
-        elif function_name not in self.__dict__["_functions"]:
+        elif function_name not in self.__dict__["_function_templates"].names:
             raise ABIFunctionNotFound(
                 f"The function '{function_name}' was not found in this contract's abi.",
                 " Are you sure you provided the correct contract abi?",
             )
         else:
-            return super().__getattribute__(function_name)
+            return cast("ContractFunction", self._get_function(function_name))
 
 
 class Contract(BaseContract):
@@ -454,18 +503,31 @@ class Contract(BaseContract):
             )
 
         if address:
-            self.address = normalize_address(cast("ENS", _w3.ens), address)
+            if is_ens_name(address):
+                self.address = normalize_address(cast("ENS", _w3.ens), address)
+            else:
+                # ``w3.ens`` sets up an ENS instance on each access unless one is set
+                self.address = normalize_address_no_ens(address)
 
         if not self.address:
             raise Web3TypeError(
                 "The address argument is required to instantiate a contract."
             )
 
+        function_templates = self._get_function_templates(ContractFunction)
         self.functions = ContractFunctions(
-            self.abi, _w3, self.address, decode_tuples=self.decode_tuples
+            self.abi,
+            _w3,
+            self.address,
+            decode_tuples=self.decode_tuples,
+            function_templates=function_templates,
         )
         self.caller = ContractCaller(
-            self.abi, _w3, self.address, decode_tuples=self.decode_tuples
+            self.abi,
+            _w3,
+            self.address,
+            decode_tuples=self.decode_tuples,
+            function_templates=function_templates,
         )
         self.events = ContractEvents(self.abi, _w3, self.address)
         self.fallback = Contract.get_fallback_function(
@@ -503,14 +565,27 @@ class Contract(BaseContract):
                 normalizers=normalizers,
             ),
         )
+        contract._function_templates = get_function_templates(
+            contract.abi,
+            contract.w3,
+            ContractFunction,
+            contract.decode_tuples,
+        )
+        contract._function_abi_resolver = (
+            contract._function_templates.function_abi_resolver
+        )
         contract.functions = ContractFunctions(
-            contract.abi, contract.w3, decode_tuples=contract.decode_tuples
+            contract.abi,
+            contract.w3,
+            decode_tuples=contract.decode_tuples,
+            function_templates=contract._function_templates,
         )
         contract.caller = ContractCaller(
             contract.abi,
             contract.w3,
             contract.address,
             decode_tuples=contract.decode_tuples,
+            function_templates=contract._function_templates,
         )
         contract.events = ContractEvents(contract.abi, contract.w3)
         contract.fallback = Contract.get_fallback_function(
@@ -576,33 +651,24 @@ class ContractCaller(BaseContractCaller):
         block_identifier: BlockIdentifier = None,
         ccip_read_enabled: Optional[bool] = None,
         decode_tuples: Optional[bool] = False,
+        function_abi_resolver: Optional[FunctionABIResolver] = None,
+        function_templates: Optional[ContractFunctionTemplates] = None,
     ) -> None:
-        super().__init__(abi, w3, address, decode_tuples=decode_tuples)
-
-        if self.abi:
-            if transaction is None:
-                transaction = {}
-
-            self._functions = filter_by_type("function", self.abi)
-            for func in self._functions:
-                fn = ContractFunction.factory(
-                    func["name"],
-                    w3=w3,
-                    contract_abi=self.abi,
-                    address=self.address,
-                    function_identifier=func["name"],
-                    decode_tuples=decode_tuples,
-                )
-
-                caller_method = partial(
-                    self.call_function,
-                    fn,
-                    transaction=transaction,
-                    block_identifier=block_identifier,
-                    ccip_read_enabled=ccip_read_enabled,
-                )
-
-                setattr(self, func["name"], caller_method)
+        if function_templates is None:
+            function_templates = ContractFunctionTemplates(
+                abi, w3, ContractFunction, decode_tuples, function_abi_resolver
+            )
+        super().__init__(
+            abi,
+            w3,
+            address,
+            decode_tuples=decode_tuples,
+            function_abi_resolver=function_abi_resolver,
+            transaction=transaction,
+            block_identifier=block_identifier,
+            ccip_read_enabled=ccip_read_enabled,
+            function_templates=function_templates,
+        )
 
     def __call__(
         self,
@@ -621,6 +687,8 @@ class ContractCaller(BaseContractCaller):
             block_identifier=block_identifier,
             ccip_read_enabled=ccip_read_enabled,
             decode_tuples=self.decode_tuples,
+            function_abi_resolver=self._function_abi_resolver,
+            function_templates=self._function_templates,
         )
 
 
@@ -0,0 +1,422 @@
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from eth_abi import (
+    abi,
+)
+from eth_abi.exceptions import (
+    DecodingError,
+)
+from eth_typing import (
+    ChecksumAddress,
+    HexStr,
+)
+from eth_utils import (
+    encode_hex,
+    to_bytes,
+    to_checksum_address,
+)
+
+from web3._utils.abi import (
+    get_abi_output_types,
+)
+from web3._utils.contracts import (
+    encode_transaction_data,
+)
+from web3._utils.error_formatters_utils import (
+    SOLIDITY_ERROR_FUNC_SELECTOR,
+    raise_contract_logic_error_on_revert,
+)
+from web3.contract.utils import (
+    decode_function_output,
+)
+from web3.exceptions import (
+    BadFunctionCallOutput,
+    ContractLogicError,
+    Web3RPCError,
+    Web3ValueError,
+)
+from web3.types import (
+    ABI,
+    ABIFunction,
+    BlockIdentifier,
+    RPCResponse,
+    StateOverride,
+    TxParams,
+)
+
+if TYPE_CHECKING:
+    from web3 import (  # noqa: F401
+        AsyncWeb3,
+        Web3,
+    )
+    from web3.contract.async_contract import (  # noqa: F401
+        AsyncContractFunction,
+    )
+    from web3.contract.contract import (  # noqa: F401
+        ContractFunction,
+    )
+
+# the address Multicall3 is deployed at on most chains
+MULTICALL3_ADDRESS = to_checksum_address("0xcA11bde05977b3631167028862bE2a173976CA11")
+
+MULTICALL3_ABI: ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
+
+DEFAULT_MAX_CALLDATA_SIZE = 100_000
+
+# the size of a call in ``aggregate3`` calldata besides its own calldata: its offset,
+# target, allowFailure, calldata offset and calldata length words, and the padding of
+# its calldata to a whole word
+CALL_ENCODING_OVERHEAD = 6 * 32
+
+
+class MulticallResult(NamedTuple):
+    """
+    The outcome of a call aggregated in a multicall: the decoded value it returned if
+    it succeeded, or the error it failed with.
+    """
+
+    success: bool
+    value: Any
+    error: Optional[Exception]
+
+
+class _Call(NamedTuple):
+    target: ChecksumAddress
+    calldata: bytes
+    fn_abi: ABIFunction
+    normalizers: Tuple[Callable[..., Any], ...]
+    decode_tuples: Optional[bool]
+
+
+def _revert_error(return_data: bytes) -> ContractLogicError:
+    # the error ``eth_call`` would raise for a call reverting with ``return_data``
+    message = "execution reverted"
+    data = HexStr(encode_hex(return_data))
+    if data[:10] == SOLIDITY_ERROR_FUNC_SELECTOR:
+        try:
+            message += f": {abi.decode(['string'], return_data[4:])[0]}"
+        except DecodingError:
+            pass
+    response = cast(
+        RPCResponse, {"error": {"code": 3, "message": message, "data": data}}
+    )
+    try:
+        raise_contract_logic_error_on_revert(response)
+    except ContractLogicError as e:
+        return e
+    return ContractLogicError(message, data=data)
+
+
+class BaseMulticall:
+    """
+    Aggregates calls to contract functions into calls to the ``aggregate3`` function
+    of a Multicall3 contract, making many reads in a few ``eth_call`` requests.
+
+    The calls are split into batches of at most ``max_calldata_size`` bytes of
+    calldata. The calls of a batch that fails as a whole, and, if ``gas`` is set, the
+    calls that fail without revert data, as when they run out of it, are retried in
+    smaller batches, so that only the calls failing on their own are reported failed.
+    All batches are called at the same block, the latest one when the calls are made
+    if no block is given. The value of each call is decoded as
+    ``ContractFunction.call()`` would decode it. Calls are made from the Multicall3
+    contract, and any ``from`` address is ignored.
+    """
+
+    w3: Union["Web3", "AsyncWeb3"]
+    _aggregate3: Union["ContractFunction", "AsyncContractFunction"]
+
+    def __init__(
+        self,
+        w3: Union["Web3", "AsyncWeb3"],
+        address: ChecksumAddress = MULTICALL3_ADDRESS,
+        max_calldata_size: int = DEFAULT_MAX_CALLDATA_SIZE,
+        gas: Optional[int] = None,
+    ) -> None:
+        if max_calldata_size < 1:
+            raise Web3ValueError("max_calldata_size must be a positive integer")
+
+        self.w3 = w3
+        self.address = address
+        self.max_calldata_size = max_calldata_size
+        self.gas = gas
+        self._aggregate3 = w3.eth.contract(
+            address=address, abi=MULTICALL3_ABI
+        ).functions.aggregate3
+
+    @staticmethod
+    def _prepare_calls(
+        functions: Sequence[Union["ContractFunction", "AsyncContractFunction"]]
+    ) -> List[_Call]:
+        calls = []
+        for function in functions:
+            if function.arguments is None:
+                raise Web3ValueError(
+                    f"Cannot aggregate {function!r}: call the contract function with "
+                    "its arguments first"
+                )
+            if not function.address:
+                raise Web3ValueError(
+                    f"Cannot aggregate {function!r}: the contract has no address"
+                )
+            with function._resolution_errors():
+                calldata = encode_transaction_data(
+                    function.w3,
+                    function.function_identifier,
+                    function.contract_abi,
+                    function.abi,
+                    function.args,
+                    function.kwargs,
+                )
+            calls.append(
+                _Call(
+                    function.address,
+                    to_bytes(hexstr=calldata),
+                    function.abi,
+                    function._return_data_normalizers or (),
+                    function.decode_tuples,
+                )
+            )
+        return calls
+
+    def _batches(self, calls: List[_Call]) -> List[List[_Call]]:
+        batches: List[List[_Call]] = []
+        size = 0
+        for call in calls:
+            call_size = len(call.calldata) + CALL_ENCODING_OVERHEAD
+            if not batches or size + call_size > self.max_calldata_size:
+                batches.append([])
+                size = 0
+            batches[-1].append(call)
+            size += call_size
+        return batches
+
+    @staticmethod
+    def _aggregate3_args(
+        batch: List[_Call],
+    ) -> List[Tuple[ChecksumAddress, bool, bytes]]:
+        return [(call.target, True, call.calldata) for call in batch]
+
+    def _transaction(self) -> TxParams:
+        return {"gas": self.gas} if self.gas is not None else {}
+
+    def _retried_calls(
+        self, batch: List[_Call], results: List[Tuple[bool, bytes]], batch_failed: bool
+    ) -> List[List[int]]:
+        # the calls of a batch failing as a whole, e.g. over the gas cap of the node,
+        # or failing without revert data when the ``gas`` of the batch is set, as they
+        # may have run out of it, are retried in two smaller batches, until they fail
+        # on their own
+        if len(batch) == 1:
+            return []
+        if batch_failed:
+            indexes = list(range(len(batch)))
+        elif self.gas is not None:
+            indexes = [
+                i
+                for i, (success, return_data) in enumerate(results)
+                if not success and not return_data
+            ]
+        else:
+            return []
+        half = (len(indexes) + 1) // 2
+        return [part for part in (indexes[:half], indexes[half:]) if part]
+
+    def _decode_results(
+        self, batch: List[_Call], results: List[Tuple[bool, bytes]]
+    ) -> List[MulticallResult]:
+        outcomes = []
+        for call, (success, return_data) in zip(batch, results):
+            if not success:
+                outcomes.append(
+                    MulticallResult(False, None, _revert_error(return_data))
+                )
+                continue
+            try:
+                value = decode_function_output(
+                    self.w3.codec,
+                    call.fn_abi,
+                    call.normalizers,
+                    return_data,
+                    call.decode_tuples,
+                )
+            except DecodingError as e:
+                error = BadFunctionCallOutput(
+                    f"Could not decode contract function call to "
+                    f"{call.fn_abi.get('name')} at {call.target} with return data: "
+                    f"{str(return_data)}, output_types: "
+                    f"{get_abi_output_types(call.fn_abi)}"
+                )
+                error.__cause__ = e
+                outcomes.append(MulticallResult(False, None, error))
+            else:
+                outcomes.append(MulticallResult(True, value, None))
+        return outcomes
+
+
+class Multicall(BaseMulticall):
+    """
+    Aggregates calls to ``ContractFunction`` objects with Multicall3:
+
+    .. code-block:: python
+
+        >>> multicall = Multicall(w3)
+        >>> results = multicall.call(
+        ...     [token.functions.balanceOf(account) for account in accounts]
+        ... )
+        >>> [result.value for result in results if result.success]
+    """
+
+    w3: "Web3"
+    _aggregate3: "ContractFunction"
+
+    def call(
+        self,
+        functions: Sequence["ContractFunction"],
+        block_identifier: Optional[BlockIdentifier] = None,
+        state_override: Optional[StateOverride] = None,
+    ) -> List[MulticallResult]:
+        """
+        Call the contract functions, bound to their arguments, with as few
+        ``eth_call`` requests as the batch limits allow, and return the outcome of
+        each call in order.
+        """
+        if block_identifier is None:
+            block_identifier = self.w3.eth.default_block
+        if block_identifier == "latest":
+            block_identifier = self.w3.eth.block_number
+
+        results: List[MulticallResult] = []
+        for batch in self._batches(self._prepare_calls(functions)):
+            results.extend(self._call_batch(batch, block_identifier, state_override))
+        return results
+
+    def _call_batch(
+        self,
+        batch: List[_Call],
+        block_identifier: Optional[BlockIdentifier],
+        state_override: Optional[StateOverride],
+    ) -> List[MulticallResult]:
+        batch_failed = False
+        try:
+            results = self._aggregate3(self._aggregate3_args(batch)).call(
+                self._transaction(), block_identifier, state_override
+            )
+        except (ContractLogicError, Web3RPCError) as e:
+            if len(batch) == 1:
+                return [MulticallResult(False, None, e)]
+            results = [(False, b"")] * len(batch)
+            batch_failed = True
+
+        outcomes = self._decode_results(batch, results)
+        for indexes in self._retried_calls(batch, results, batch_failed):
+            retried = self._call_batch(
+                [batch[i] for i in indexes], block_identifier, state_override
+            )
+            for i, outcome in zip(indexes, retried):
+                outcomes[i] = outcome
+        return outcomes
+
+
+class AsyncMulticall(BaseMulticall):
+    """
+    Aggregates calls to ``AsyncContractFunction`` objects with Multicall3, making the
+    ``eth_call`` requests of the batches concurrently.
+    """
+
+    w3: "AsyncWeb3"
+    _aggregate3: "AsyncContractFunction"
+
+    async def call(
+        self,
+        functions: Sequence["AsyncContractFunction"],
+        block_identifier: Optional[BlockIdentifier] = None,
+        state_override: Optional[StateOverride] = None,
+    ) -> List[MulticallResult]:
+        """
+        Call the contract functions, bound to their arguments, with as few
+        ``eth_call`` requests as the batch limits allow, and return the outcome of
+        each call in order.
+        """
+        if block_identifier is None:
+            block_identifier = self.w3.eth.default_block
+        if block_identifier == "latest":
+            block_identifier = await self.w3.eth.block_number
+
+        batch_results = await asyncio.gather(
+            *(
+                self._call_batch(batch, block_identifier, state_override)
+                for batch in self._batches(self._prepare_calls(functions))
+            )
+        )
+        return [result for results in batch_results for result in results]
+
+    async def _call_batch(
+        self,
+        batch: List[_Call],
+        block_identifier: Optional[BlockIdentifier],
+        state_override: Optional[StateOverride],
+    ) -> List[MulticallResult]:
+        batch_failed = False
+        try:
+            results = await self._aggregate3(self._aggregate3_args(batch)).call(
+                self._transaction(), block_identifier, state_override
+            )
+        except (ContractLogicError, Web3RPCError) as e:
+            if len(batch) == 1:
+                return [MulticallResult(False, None, e)]
+            results = [(False, b"")] * len(batch)
+            batch_failed = True
+
+        outcomes = self._decode_results(batch, results)
+        retried_calls = self._retried_calls(batch, results, batch_failed)
+        retried = await asyncio.gather(
+            *(
+                self._call_batch(
+                    [batch[i] for i in indexes], block_identifier, state_override
+                )
+                for indexes in retried_calls
+            )
+        )
+        for indexes, retried_outcomes in zip(retried_calls, retried):
+            for i, outcome in zip(indexes, retried_outcomes):
+                outcomes[i] = outcome
+        return outcomes
@@ -11,6 +11,9 @@ from typing import (
     Union,
 )
 
+from eth_abi.codec import (
+    ABICodec,
+)
 from eth_abi.exceptions import (
     DecodingError,
 )
@@ -64,6 +67,36 @@ if TYPE_CHECKING:
 ACCEPTABLE_EMPTY_STRINGS = ["0x", b"0x", "", b""]
 
 
+def decode_function_output(
+    codec: ABICodec,
+    fn_abi: ABIFunction,
+    normalizers: Tuple[Callable[..., Any], ...],
+    return_data: bytes,
+    decode_tuples: Optional[bool] = False,
+) -> Any:
+    """
+    Decode the data returned by a call to a contract function with its output types,
+    and normalize it. Raises ``DecodingError`` if the data cannot be decoded.
+    """
+    output_types = get_abi_output_types(fn_abi)
+    output_data = codec.decode(output_types, return_data)
+
+    _normalizers = itertools.chain(
+        BASE_RETURN_NORMALIZERS,
+        normalizers,
+    )
+    normalized_data = map_abi_data(_normalizers, output_types, output_data)
+
+    if decode_tuples:
+        decoded = named_tree(fn_abi["outputs"], normalized_data)
+        normalized_data = recursive_dict_to_namedtuple(decoded)
+
+    if len(normalized_data) == 1:
+        return normalized_data[0]
+    else:
+        return normalized_data
+
+
 def call_contract_function(
     w3: "Web3",
     address: ChecksumAddress,
@@ -106,10 +139,10 @@ def call_contract_function(
             contract_abi, w3.codec, function_identifier, args, kwargs
         )
 
-    output_types = get_abi_output_types(fn_abi)
-
     try:
-        output_data = w3.codec.decode(output_types, return_data)
+        return decode_function_output(
+            w3.codec, fn_abi, normalizers, return_data, decode_tuples
+        )
     except DecodingError as e:
         # Provide a more helpful error message than the one provided by
         # eth-abi-utils
@@ -125,25 +158,11 @@ def call_contract_function(
         else:
             msg = (
                 f"Could not decode contract function call to {function_identifier} "
-                f"with return data: {str(return_data)}, output_types: {output_types}"
+                f"with return data: {str(return_data)}, "
+                f"output_types: {get_abi_output_types(fn_abi)}"
             )
         raise BadFunctionCallOutput(msg) from e
 
-    _normalizers = itertools.chain(
-        BASE_RETURN_NORMALIZERS,
-        normalizers,
-    )
-    normalized_data = map_abi_data(_normalizers, output_types, output_data)
-
-    if decode_tuples:
-        decoded = named_tree(fn_abi["outputs"], normalized_data)
-        normalized_data = recursive_dict_to_namedtuple(decoded)
-
-    if len(normalized_data) == 1:
-        return normalized_data[0]
-    else:
-        return normalized_data
-
 
 def transact_with_contract_function(
     address: ChecksumAddress,
@@ -317,10 +336,10 @@ async def async_call_contract_function(
             contract_abi, async_w3.codec, function_identifier, args, kwargs
         )
 
-    output_types = get_abi_output_types(fn_abi)
-
     try:
-        output_data = async_w3.codec.decode(output_types, return_data)
+        return decode_function_output(
+            async_w3.codec, fn_abi, normalizers, return_data, decode_tuples
+        )
     except DecodingError as e:
         # Provide a more helpful error message than the one provided by
         # eth-abi-utils
@@ -336,25 +355,11 @@ async def async_call_contract_function(
         else:
             msg = (
                 f"Could not decode contract function call to {function_identifier} "
-                f"with return data: {str(return_data)}, output_types: {output_types}"
+                f"with return data: {str(return_data)}, "
+                f"output_types: {get_abi_output_types(fn_abi)}"
             )
         raise BadFunctionCallOutput(msg) from e
 
-    _normalizers = itertools.chain(
-        BASE_RETURN_NORMALIZERS,
-        normalizers,
-    )
-    normalized_data = map_abi_data(_normalizers, output_types, output_data)
-
-    if decode_tuples:
-        decoded = named_tree(fn_abi["outputs"], normalized_data)
-        normalized_data = recursive_dict_to_namedtuple(decoded)
-
-    if len(normalized_data) == 1:
-        return normalized_data[0]
-    else:
-        return normalized_data
-
 
 async def async_transact_with_contract_function(
     address: ChecksumAddress,
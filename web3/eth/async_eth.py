@@ -58,6 +58,9 @@ from web3.contract import (
 )
 from web3.eth.base_eth import (
     BaseEth,
+    _block_receipts_support,
+    _validate_receipt_request_limits,
+    is_unsupported_method_error,
 )
 from web3.exceptions import (
     MethodNotSupported,
@@ -462,6 +465,67 @@ class AsyncEth(BaseEth):
     ) -> BlockReceipts:
         return await self._get_block_receipts(block_identifier)
 
+    async def get_block_receipts_with_fallback(
+        self,
+        block_identifier: BlockIdentifier,
+        batch_size: int = 100,
+        max_concurrent_requests: int = 10,
+    ) -> BlockReceipts:
+        """
+        Return the receipts of the transactions of a block with ``eth_getBlockReceipts``
+        or, if the provider doesn't support it, with an ``eth_getTransactionReceipt``
+        request per transaction. These are sent in batch requests of up to
+        ``batch_size`` requests or, if the provider doesn't support batch requests,
+        up to ``max_concurrent_requests`` at a time.
+
+        Whether the provider supports ``eth_getBlockReceipts`` is only probed once.
+        """
+        _validate_receipt_request_limits(batch_size, max_concurrent_requests)
+        provider = self.w3.provider
+        if _block_receipts_support.get(provider, True):
+            try:
+                receipts = await self.get_block_receipts(block_identifier)
+            except Web3RPCError as e:
+                if not is_unsupported_method_error(e, RPC.eth_getBlockReceipts):
+                    raise
+                _block_receipts_support[provider] = False
+            else:
+                _block_receipts_support[provider] = True
+                return receipts
+
+        block = await self.get_block(block_identifier)
+        transaction_hashes = cast(List[_Hash32], block["transactions"])
+        if not transaction_hashes:
+            return []
+
+        try:
+            receipts = []
+            for start in range(0, len(transaction_hashes), batch_size):
+                async with self.w3.batch_requests() as batch:
+                    for transaction_hash in transaction_hashes[
+                        start : start + batch_size
+                    ]:
+                        batch.add(self.get_transaction_receipt(transaction_hash))
+                    receipts.extend(cast(BlockReceipts, await batch.async_execute()))
+            return receipts
+        except NotImplementedError:
+            pass
+
+        semaphore = asyncio.Semaphore(max_concurrent_requests)
+
+        async def get_receipt(transaction_hash: _Hash32) -> TxReceipt:
+            async with semaphore:
+                return await self.get_transaction_receipt(transaction_hash)
+
+        return list(
+            await asyncio.gather(
+                *(
+                    get_receipt(transaction_hash)
+                    for transaction_hash in transaction_hashes
+                )
+            )
+        )
+
     # eth_getBalance
 
     _get_balance: Method[
@@ -1,3 +1,4 @@
+import re
 from typing import (
     Any,
     List,
@@ -6,6 +7,9 @@ from typing import (
     Tuple,
     Union,
 )
+from weakref import (
+    WeakKeyDictionary,
+)
 
 from eth_account import (
     Account,
@@ -31,6 +35,8 @@ from web3._utils.encoding import (
     to_hex,
 )
 from web3.exceptions import (
+    MethodUnavailable,
+    Web3RPCError,
     Web3TypeError,
     Web3ValueError,
 )
@@ -47,6 +53,49 @@ from web3.types import (
     Wei,
 )
 
+# the JSON-RPC "method not found" code, and the "method not supported" code of EIP-1474
+UNSUPPORTED_METHOD_ERROR_CODES = (-32601, -32004)
+# the errors naming a method that nodes and node providers return when they don't
+# support it, without either code
+UNSUPPORTED_METHOD_ERROR_PATTERN = re.compile(
+    r"not found|not supported|not available|does not exist|unsupported|unknown",
+    re.IGNORECASE,
+)
+
+
+def is_unsupported_method_error(exception: BaseException, method: str) -> bool:
+    """
+    Whether ``exception`` was raised for a request to ``method`` because the node or
+    node provider doesn't support it.
+    """
+    if isinstance(exception, MethodUnavailable):
+        return True
+    if not isinstance(exception, Web3RPCError):
+        return False
+
+    error = (exception.rpc_response or {}).get("error")
+    if isinstance(error, dict) and error.get("code") in UNSUPPORTED_METHOD_ERROR_CODES:
+        return True
+    # other errors, e.g. "header not found", are only taken to be about the method
+    # when they name it
+    return (
+        method in exception.message
+        and UNSUPPORTED_METHOD_ERROR_PATTERN.search(exception.message) is not None
+    )
+
+
+# whether each provider supports ``eth_getBlockReceipts``, once probed
+_block_receipts_support: "WeakKeyDictionary[Any, bool]" = WeakKeyDictionary()
+
+
+def _validate_receipt_request_limits(
+    batch_size: int, max_concurrent_requests: int
+) -> None:
+    if batch_size < 1 or max_concurrent_requests < 1:
+        raise Web3ValueError(
+            "batch_size and max_concurrent_requests must be at least 1"
+        )
+
 
 class BaseEth(Module):
     _default_account: Union[ChecksumAddress, Empty] = empty
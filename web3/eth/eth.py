@@ -1,3 +1,8 @@
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
+import threading
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -58,6 +63,9 @@ from web3.contract import (
 )
 from web3.eth.base_eth import (
     BaseEth,
+    _block_receipts_support,
+    _validate_receipt_request_limits,
+    is_unsupported_method_error,
 )
 from web3.exceptions import (
     OffchainLookup,
@@ -101,6 +109,25 @@ from web3.utils import (
 if TYPE_CHECKING:
     from web3 import Web3  # noqa: F401
 
+# the most threads receipts are fetched from, when the provider doesn't support batch
+# requests, by all calls of ``get_block_receipts_with_fallback``
+RECEIPT_FETCH_MAX_THREADS = 32
+
+_receipt_executor: Optional[ThreadPoolExecutor] = None
+_receipt_executor_lock = threading.Lock()
+
+
+def _get_receipt_executor() -> ThreadPoolExecutor:
+    # the threads are shared by all calls and kept between them, so that providers
+    # that keep state per thread, e.g. the session of ``HTTPProvider``, reuse it
+    global _receipt_executor
+    with _receipt_executor_lock:
+        if _receipt_executor is None:
+            _receipt_executor = ThreadPoolExecutor(
+                RECEIPT_FETCH_MAX_THREADS, thread_name_prefix="web3-receipts"
+            )
+        return _receipt_executor
+
 
 class Eth(BaseEth):
     # mypy types
@@ -428,6 +455,65 @@ class Eth(BaseEth):
     def get_block_receipts(self, block_identifier: BlockIdentifier) -> BlockReceipts:
         return self._get_block_receipts(block_identifier)
 
+    def get_block_receipts_with_fallback(
+        self,
+        block_identifier: BlockIdentifier,
+        batch_size: int = 100,
+        max_concurrent_requests: int = 10,
+    ) -> BlockReceipts:
+        """
+        Return the receipts of the transactions of a block with ``eth_getBlockReceipts``
+        or, if the provider doesn't support it, with an ``eth_getTransactionReceipt``
+        request per transaction. These are sent in batch requests of up to
+        ``batch_size`` requests or, if the provider doesn't support batch requests,
+        up to ``max_concurrent_requests`` at a time from a thread pool shared by all
+        calls, of up to ``RECEIPT_FETCH_MAX_THREADS`` threads.
+
+        Whether the provider supports ``eth_getBlockReceipts`` is only probed once.
+        """
+        _validate_receipt_request_limits(batch_size, max_concurrent_requests)
+        provider = self.w3.provider
+        if _block_receipts_support.get(provider, True):
+            try:
+                receipts = self.get_block_receipts(block_identifier)
+            except Web3RPCError as e:
+                if not is_unsupported_method_error(e, RPC.eth_getBlockReceipts):
+                    raise
+                _block_receipts_support[provider] = False
+            else:
+                _block_receipts_support[provider] = True
+                return receipts
+
+        transaction_hashes = cast(
+            List[_Hash32], self.get_block(block_identifier)["transactions"]
+        )
+        if not transaction_hashes:
+            return []
+
+        try:
+            receipts = []
+            for start in range(0, len(transaction_hashes), batch_size):
+                with self.w3.batch_requests() as batch:
+                    for transaction_hash in transaction_hashes[
+                        start : start + batch_size
+                    ]:
+                        batch.add(self.get_transaction_receipt(transaction_hash))
+                    receipts.extend(cast(BlockReceipts, batch.execute()))
+            return receipts
+        except NotImplementedError:
+            pass
+
+        executor = _get_receipt_executor()
+        # keep up to ``max_concurrent_requests`` requests in flight
+        in_flight = threading.BoundedSemaphore(max_concurrent_requests)
+        futures: List["Future[TxReceipt]"] = []
+        for transaction_hash in transaction_hashes:
+            in_flight.acquire()
+            future = executor.submit(self.get_transaction_receipt, transaction_hash)
+            future.add_done_callback(lambda _: in_flight.release())
+            futures.append(future)
+        return [future.result() for future in futures]
+
     # eth_getBalance
 
     _get_balance: Method[
@@ -60,6 +60,9 @@ from web3._utils.abi import (
     build_strict_registry,
     map_abi_data,
 )
+from web3._utils.batching import (
+    RequestBatcher,
+)
 from web3._utils.compat import (
     Self,
 )
@@ -74,6 +77,11 @@ from web3._utils.encoding import (
 from web3._utils.rpc_abi import (
     RPC,
 )
+from web3._utils.head_polling import (
+    DEFAULT_HEAD_POLL_INTERVAL,
+    AsyncHeadPoller,
+    HeadPoller,
+)
 from web3._utils.module import (
     attach_modules as _attach_modules,
 )
@@ -336,6 +344,11 @@ class BaseWeb3:
     def is_encodable(self, _type: TypeStr, value: Any) -> bool:
         return self.codec.is_encodable(_type, value)
 
+    # -- APIs for high-level requests -- #
+
+    def batch_requests(self) -> RequestBatcher:
+        return RequestBatcher(cast(Union["Web3", "AsyncWeb3"], self))
+
 
 class Web3(BaseWeb3):
     # mypy types
@@ -358,9 +371,11 @@ class Web3(BaseWeb3):
             Dict[str, Union[Type[Module], Sequence[Any]]]
         ] = None,
         ens: Union[ENS, "Empty"] = empty,
+        head_poll_interval: float = DEFAULT_HEAD_POLL_INTERVAL,
     ) -> None:
         self.manager = self.RequestManager(self, provider, middleware)
         self.codec = ABICodec(build_strict_registry())
+        self.head_poller = HeadPoller(self, head_poll_interval)
 
         if modules is None:
             modules = get_default_modules()
@@ -426,9 +441,11 @@ class AsyncWeb3(BaseWeb3):
             Dict[str, Union[Type[Module], Sequence[Any]]]
         ] = None,
         ens: Union[AsyncENS, "Empty"] = empty,
+        head_poll_interval: float = DEFAULT_HEAD_POLL_INTERVAL,
     ) -> None:
         self.manager = self.RequestManager(self, provider, middleware)
         self.codec = ABICodec(build_strict_registry())
+        self.head_poller = AsyncHeadPoller(self, head_poll_interval)
 
         self._modules = get_async_default_modules() if modules is None else modules
         self._external_modules = None if external_modules is None else external_modules
@@ -5,6 +5,7 @@ from typing import (
     AsyncGenerator,
     Callable,
     List,
+    NoReturn,
     Optional,
     Sequence,
     Tuple,
@@ -22,9 +23,6 @@ from websockets.exceptions import (
     ConnectionClosedOK,
 )
 
-from web3._utils.caching import (
-    generate_cache_key,
-)
 from web3._utils.compat import (
     Self,
 )
@@ -62,6 +60,9 @@ from web3.types import (
 )
 
 if TYPE_CHECKING:
+    from web3._utils.batching import (  # noqa: F401
+        BatchRequestInformation,
+    )
     from web3.main import (  # noqa: F401
         AsyncWeb3,
         Web3,
@@ -223,6 +224,21 @@ def _validate_response(
         _raise_bad_response_format(response)
 
 
+def _raise_error_for_batch_response(
+    response: RPCResponse,
+    logger: Optional[logging.Logger] = None,
+) -> NoReturn:
+    if "error" in response:
+        # raises the appropriate exception for the error response
+        _validate_response(response, None, logger=logger)
+
+    raise BadResponseFormat(
+        "The batch response was in an unexpected format and unable to be parsed. "
+        "Batch response must be formatted as a list of responses or as a single "
+        f"JSON-RPC error response. The raw response is: {response}"
+    )
+
+
 class RequestManager:
     logger = logging.getLogger("web3.manager.RequestManager")
 
@@ -375,8 +391,101 @@ class RequestManager:
             response, params, error_formatters, null_result_formatters
         )
 
+    # -- batch requests -- #
+
+    def _format_batched_response(
+        self,
+        request_info: "BatchRequestInformation",
+        response: RPCResponse,
+    ) -> Any:
+        (_method, params), response_formatters = request_info
+        (
+            result_formatters,
+            error_formatters,
+            null_result_formatters,
+        ) = response_formatters
+        return apply_result_formatters(
+            result_formatters,
+            self.formatted_response(
+                response, params, error_formatters, null_result_formatters
+            ),
+        )
+
+    def _format_batched_responses(
+        self,
+        requests_info: List["BatchRequestInformation"],
+        response: Union[List[RPCResponse], RPCResponse],
+    ) -> List[Any]:
+        if not isinstance(response, list):
+            # the batch was rejected as a whole, expect a single error response
+            _raise_error_for_batch_response(response, self.logger)
+
+        if len(response) != len(requests_info):
+            _raise_bad_response_format(
+                cast(RPCResponse, response),
+                f"Expected {len(requests_info)} responses in the batch response but "
+                f"received {len(response)}.",
+            )
+
+        return [
+            self._format_batched_response(request_info, batched_response)
+            for request_info, batched_response in zip(requests_info, response)
+        ]
+
+    def _make_batch_request(
+        self, requests_info: List["BatchRequestInformation"]
+    ) -> List[Any]:
+        """
+        Make a batch request using the provider and format each response in the
+        order the requests were added to the batch.
+        """
+        provider = cast("BaseProvider", self.provider)
+        request_func = provider.batch_request_func(
+            cast("Web3", self.w3), cast("MiddlewareOnion", self.middleware_onion)
+        )
+        self.logger.debug(f"Making batch request. Batch size: {len(requests_info)}")
+        response = request_func([request for request, _ in requests_info])
+        return self._format_batched_responses(requests_info, response)
+
+    async def _async_make_batch_request(
+        self,
+        requests_info: List["BatchRequestInformation"],
+    ) -> List[Any]:
+        """
+        Coroutine for making a batch request using the provider and formatting each
+        response in the order the requests were added to the batch.
+        """
+        provider = cast("AsyncBaseProvider", self.provider)
+        request_func = await provider.batch_request_func(
+            cast("AsyncWeb3", self.w3), cast("MiddlewareOnion", self.middleware_onion)
+        )
+        self.logger.debug(f"Making batch request. Batch size: {len(requests_info)}")
+        response = await request_func([request for request, _ in requests_info])
+
+        if isinstance(self._provider, PersistentConnectionProvider) and isinstance(
+            response, list
+        ):
+            # pipe each response through the middleware response processors that
+            # were registered for its request id
+            response = [
+                self._apply_middleware_response_processors(batched_response)
+                for batched_response in response
+            ]
+
+        return self._format_batched_responses(requests_info, response)
+
     # -- persistent connection -- #
 
+    def _apply_middleware_response_processors(
+        self, response: RPCResponse
+    ) -> RPCResponse:
+        request_info = self._request_processor.get_request_information_for_response(
+            response
+        )
+        if request_info is not None and request_info.middleware_response_processors:
+            return pipe(response, *request_info.middleware_response_processors)
+        return response
+
     async def send(self, method: RPCEndpoint, params: Any) -> RPCResponse:
         provider = cast(PersistentConnectionProvider, self._provider)
         request_func = await provider.request_func(
@@ -431,7 +540,7 @@ class RequestManager:
                 # if response for the initial eth_subscribe request, which returns the
                 # subscription id
                 subscription_id = response["result"]
-                cache_key = generate_cache_key(subscription_id)
+                cache_key = provider.cache_key_fn(subscription_id)
                 if cache_key not in self._request_processor._request_information_cache:
                     # cache by subscription id in order to process each response for the
                     # subscription as it comes in
@@ -3,7 +3,9 @@ from typing import (
     Any,
     Callable,
     Coroutine,
+    List,
     Sequence,
+    Union,
 )
 
 from .attrdict import (
@@ -44,7 +46,9 @@ from .validation import (
     ValidationMiddleware,
 )
 from ..types import (
+    AsyncMakeBatchRequestFn,
     AsyncMakeRequestFn,
+    MakeBatchRequestFn,
     MakeRequestFn,
 )
 
@@ -92,3 +96,36 @@ async def async_combine_middleware(
         initialized = mw(async_w3)
         accumulator_fn = await initialized.async_wrap_make_request(accumulator_fn)
     return accumulator_fn
+
+
+def combine_batch_middleware(
+    middleware: Sequence[Middleware],
+    w3: "Web3",
+    provider_batch_request_fn: MakeBatchRequestFn,
+) -> Callable[..., Union[List["RPCResponse"], "RPCResponse"]]:
+    """
+    Returns a callable function which takes a list of (method, params) tuples and
+    passes each request through the request processors, makes the batch request, and
+    passes each response through the response processors.
+    """
+    accumulator_fn = provider_batch_request_fn
+    for mw in reversed(middleware):
+        accumulator_fn = mw(w3).wrap_make_batch_request(accumulator_fn)
+    return accumulator_fn
+
+
+async def async_combine_batch_middleware(
+    middleware: Sequence[Middleware],
+    async_w3: "AsyncWeb3",
+    provider_batch_request_fn: AsyncMakeBatchRequestFn,
+) -> Callable[..., Coroutine[Any, Any, Union[List["RPCResponse"], "RPCResponse"]]]:
+    """
+    Returns a callable function which takes a list of (method, params) tuples and
+    passes each request through the request processors, makes the batch request, and
+    passes each response through the response processors.
+    """
+    accumulator_fn = provider_batch_request_fn
+    for mw in reversed(middleware):
+        initialized = mw(async_w3)
+        accumulator_fn = await initialized.async_wrap_make_batch_request(accumulator_fn)
+    return accumulator_fn
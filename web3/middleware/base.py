@@ -4,6 +4,8 @@ from abc import (
 from typing import (
     TYPE_CHECKING,
     Any,
+    List,
+    Tuple,
     Type,
     Union,
 )
@@ -18,7 +20,9 @@ if TYPE_CHECKING:
         Web3,
     )
     from web3.types import (  # noqa: F401
+        AsyncMakeBatchRequestFn,
         AsyncMakeRequestFn,
+        MakeBatchRequestFn,
         MakeRequestFn,
         RPCEndpoint,
         RPCResponse,
@@ -45,6 +49,30 @@ class Web3Middleware:
 
         return middleware
 
+    def wrap_make_batch_request(
+        self, make_batch_request: "MakeBatchRequestFn"
+    ) -> "MakeBatchRequestFn":
+        def middleware(
+            requests_info: List[Tuple["RPCEndpoint", Any]]
+        ) -> Union[List["RPCResponse"], "RPCResponse"]:
+            processed_requests = [
+                self.request_processor(method, params)
+                for method, params in requests_info
+            ]
+            response = make_batch_request(processed_requests)
+            if not isinstance(response, list):
+                # a batch that fails as a whole returns a single error response
+                return response
+
+            return [
+                self.response_processor(method, method_response)
+                for (method, _params), method_response in zip(
+                    processed_requests, response
+                )
+            ]
+
+        return middleware
+
     def request_processor(self, method: "RPCEndpoint", params: Any) -> Any:
         return method, params
 
@@ -67,6 +95,30 @@ class Web3Middleware:
 
         return middleware
 
+    async def async_wrap_make_batch_request(
+        self, make_batch_request: "AsyncMakeBatchRequestFn"
+    ) -> "AsyncMakeBatchRequestFn":
+        async def middleware(
+            requests_info: List[Tuple["RPCEndpoint", Any]]
+        ) -> Union[List["RPCResponse"], "RPCResponse"]:
+            processed_requests = [
+                await self.async_request_processor(method, params)
+                for method, params in requests_info
+            ]
+            response = await make_batch_request(processed_requests)
+            if not isinstance(response, list):
+                # a batch that fails as a whole returns a single error response
+                return response
+
+            return [
+                await self.async_response_processor(method, method_response)
+                for (method, _params), method_response in zip(
+                    processed_requests, response
+                )
+            ]
+
+        return middleware
+
     async def async_request_processor(
         self,
         method: "RPCEndpoint",
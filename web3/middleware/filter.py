@@ -1,3 +1,6 @@
+from collections import (
+    deque,
+)
 import itertools
 import os
 from typing import (
@@ -5,12 +8,15 @@ from typing import (
     Any,
     AsyncIterable,
     AsyncIterator,
+    Deque,
     Dict,
     Generator,
     Iterable,
     Iterator,
     List,
+    NamedTuple,
     Optional,
+    Sequence,
     Tuple,
     Union,
     cast,
@@ -29,13 +35,22 @@ from eth_utils import (
     is_string,
     to_hex,
     to_int,
-    to_list,
 )
 from eth_utils.toolz import (
     concat,
     valfilter,
 )
+from hexbytes import (
+    HexBytes,
+)
+from toolz import (
+    curry,
+)
 
+from web3._utils.bloom import (
+    LogsBloomFilter,
+    block_runs,
+)
 from web3._utils.formatters import (
     hex_to_integer,
 )
@@ -46,10 +61,11 @@ from web3.exceptions import (
     Web3TypeError,
 )
 from web3.middleware.base import (
-    Web3Middleware,
+    Web3MiddlewareBuilder,
 )
 from web3.types import (
     AsyncMakeRequestFn,
+    BlockData,
     FilterParams,
     LatestBlockParam,
     LogReceipt,
@@ -72,6 +88,9 @@ if "WEB3_MAX_BLOCK_REQUEST" in os.environ:
 else:
     MAX_BLOCK_REQUEST = 50
 
+# the number of most recent blocks a filter tracks to detect reorgs
+MAX_REORG_DEPTH = 64
+
 
 def segment_count(start: int, stop: int, step: int = 5) -> Iterable[Tuple[int, int]]:
     """
@@ -166,7 +185,7 @@ def iter_latest_block(
     is_bounded_range = to_block is not None and to_block != "latest"
 
     while True:
-        latest_block = w3.eth.block_number
+        latest_block = w3.head_poller.get_block_number()
         if is_bounded_range and latest_block > to_block:
             yield None
         #  No new blocks since last iteration.
@@ -236,6 +255,293 @@ def get_logs_multipart(
         yield w3.eth.get_logs(cast(FilterParams, drop_items_with_none_value(params)))
 
 
+class BlockHeader(NamedTuple):
+    number: BlockNumber
+    hash: HexBytes
+    parent_hash: HexBytes
+    logs_bloom: Optional[HexBytes] = None
+
+
+def _block_header(block_number: BlockNumber, block: BlockData) -> BlockHeader:
+    return BlockHeader(
+        block_number, block["hash"], block["parentHash"], block.get("logsBloom")
+    )
+
+
+class HeadUpdate(NamedTuple):
+    # the headers of the blocks reorganized out of the chain, oldest first
+    removed: Tuple[BlockHeader, ...]
+    # the headers fetched for the new blocks of the chain, oldest first
+    added: Tuple[BlockHeader, ...]
+    # the first block not yet processed, before ``next_block`` if there was a reorg
+    next_block: BlockNumber
+
+
+class _BaseHeadTracker:
+    """
+    Keeps the number, hash and parent hash of the most recent blocks processed by a
+    filter, up to ``max_depth`` of them, to detect when they are reorganized out of
+    the chain.
+
+    Each update fetches the headers of the new blocks, in a single batch request. The
+    chain is unchanged if the new headers link up, by their parent hash, to the last
+    header tracked. Otherwise, the headers at the tracked block numbers are fetched,
+    again in a single batch request, to find the last tracked block still in the
+    chain. The blocks tracked after it are reported as removed.
+    """
+
+    def __init__(self, max_depth: int = MAX_REORG_DEPTH) -> None:
+        self.headers: Deque[BlockHeader] = deque(maxlen=max_depth)
+
+    def _new_block_numbers(
+        self, next_block: BlockNumber, latest_block: BlockNumber, fetch_all: bool
+    ) -> List[BlockNumber]:
+        if not fetch_all:
+            # only the most recent blocks are tracked
+            next_block = BlockNumber(
+                max(next_block, latest_block - self.headers.maxlen + 1)
+            )
+        block_numbers = [
+            BlockNumber(block_number)
+            for block_number in range(next_block, latest_block + 1)
+        ]
+        if self.headers and block_numbers:
+            last_number = self.headers[-1].number
+            if last_number < latest_block and block_numbers[0] != last_number + 1:
+                # the new blocks can't be linked to the last block tracked, so the
+                # last block is fetched to check it is still in the chain
+                block_numbers.insert(0, last_number)
+        return block_numbers
+
+    def _links_up(
+        self, latest_block: BlockNumber, headers: Dict[BlockNumber, BlockHeader]
+    ) -> bool:
+        if not self.headers:
+            return True
+
+        last_header = self.headers[-1]
+        if last_header.number > latest_block:
+            return False
+        elif last_header.number in headers:
+            return headers[last_header.number].hash == last_header.hash
+        elif last_header.number + 1 in headers:
+            return headers[BlockNumber(last_header.number + 1)].parent_hash == (
+                last_header.hash
+            )
+        # no new blocks
+        return True
+
+    def _tracked_block_numbers(
+        self, latest_block: BlockNumber, headers: Dict[BlockNumber, BlockHeader]
+    ) -> List[BlockNumber]:
+        return [
+            header.number
+            for header in self.headers
+            if header.number <= latest_block and header.number not in headers
+        ]
+
+    def _update(
+        self,
+        next_block: BlockNumber,
+        headers: Dict[BlockNumber, BlockHeader],
+        reorganized: bool,
+    ) -> HeadUpdate:
+        removed: List[BlockHeader] = []
+        if reorganized:
+            while self.headers:
+                header = self.headers[-1]
+                canonical_header = headers.get(header.number)
+                if (
+                    canonical_header is not None
+                    and canonical_header.hash == header.hash
+                ):
+                    break
+                removed.insert(0, self.headers.pop())
+            if removed:
+                next_block = removed[0].number
+
+        added = tuple(
+            headers[block_number]
+            for block_number in sorted(headers)
+            if block_number >= next_block
+        )
+        self.headers.extend(added)
+        return HeadUpdate(tuple(removed), added, next_block)
+
+
+def _block_number_chunks(
+    block_numbers: Sequence[BlockNumber],
+) -> Iterable[Sequence[BlockNumber]]:
+    for start in range(0, len(block_numbers), MAX_BLOCK_REQUEST):
+        yield block_numbers[start : start + MAX_BLOCK_REQUEST]
+
+
+def get_blocks(w3: "Web3", block_numbers: Sequence[BlockNumber]) -> List[BlockData]:
+    """
+    Fetch the blocks in batch requests of up to ``MAX_BLOCK_REQUEST`` blocks, or one at
+    a time if the provider does not support batch requests.
+    """
+    blocks: List[BlockData] = []
+    for chunk in _block_number_chunks(block_numbers):
+        if len(chunk) > 1:
+            try:
+                with w3.batch_requests() as batch:
+                    for block_number in chunk:
+                        batch.add(w3.eth.get_block(block_number))
+                    blocks.extend(cast(List[BlockData], batch.execute()))
+                continue
+            except NotImplementedError:
+                pass
+        blocks.extend(w3.eth.get_block(block_number) for block_number in chunk)
+    return blocks
+
+
+def _blocks_without_bloom(
+    from_block: BlockNumber,
+    to_block: BlockNumber,
+    known_blooms: Dict[BlockNumber, Optional[HexBytes]],
+) -> List[BlockNumber]:
+    return [
+        BlockNumber(block_number)
+        for block_number in range(from_block, to_block + 1)
+        if block_number not in known_blooms
+    ]
+
+
+def _matching_ranges(
+    bloom_filter: LogsBloomFilter,
+    from_block: BlockNumber,
+    to_block: BlockNumber,
+    blooms: Dict[BlockNumber, Optional[HexBytes]],
+    max_blocks: int,
+) -> List[Tuple[BlockNumber, BlockNumber]]:
+    # the ranges of consecutive blocks whose bloom may match the filter
+    matching_blocks = bloom_filter.matching_blocks(
+        (BlockNumber(block_number), blooms[BlockNumber(block_number)])
+        for block_number in range(from_block, to_block + 1)
+    )
+    return block_runs(matching_blocks, max_blocks)
+
+
+def get_logs_prefiltered(
+    w3: "Web3",
+    start_block: BlockNumber,
+    stop_block: BlockNumber,
+    address: Union[Address, ChecksumAddress, List[Union[Address, ChecksumAddress]]],
+    topics: List[Optional[Union[_Hash32, List[_Hash32]]]],
+    bloom_filter: LogsBloomFilter,
+    max_blocks: int,
+    known_blooms: Optional[Dict[BlockNumber, Optional[HexBytes]]] = None,
+) -> Iterable[List[LogReceipt]]:
+    """
+    Like ``get_logs_multipart``, but only requests the logs of the blocks whose
+    ``logsBloom`` may match ``bloom_filter``.
+
+    The blocks are fetched ``max_blocks`` at a time, in a single batch request, unless
+    their bloom is in ``known_blooms``.
+    """
+    known_blooms = known_blooms or {}
+    for from_block, to_block in block_ranges(start_block, stop_block, max_blocks):
+        block_numbers = _blocks_without_bloom(from_block, to_block, known_blooms)
+        blocks = get_blocks(w3, block_numbers)
+        blooms = {
+            **known_blooms,
+            **{
+                block_number: block.get("logsBloom")
+                for block_number, block in zip(block_numbers, blocks)
+            },
+        }
+        for range_from, range_to in _matching_ranges(
+            bloom_filter, from_block, to_block, blooms, max_blocks
+        ):
+            params = {
+                "fromBlock": range_from,
+                "toBlock": range_to,
+                "address": address,
+                "topics": topics,
+            }
+            yield w3.eth.get_logs(
+                cast(FilterParams, drop_items_with_none_value(params))
+            )
+
+
+class HeadTracker(_BaseHeadTracker):
+    def __init__(self, w3: "Web3", max_depth: int = MAX_REORG_DEPTH) -> None:
+        super().__init__(max_depth)
+        self.w3 = w3
+
+    def _get_headers(
+        self, block_numbers: Sequence[BlockNumber]
+    ) -> Dict[BlockNumber, BlockHeader]:
+        blocks = get_blocks(self.w3, block_numbers)
+        return {
+            block_number: _block_header(block_number, block)
+            for block_number, block in zip(block_numbers, blocks)
+        }
+
+    def update(
+        self,
+        next_block: BlockNumber,
+        latest_block: BlockNumber,
+        fetch_all: bool = False,
+    ) -> HeadUpdate:
+        """
+        Track the blocks from ``next_block`` to ``latest_block``, or only the most
+        recent of them unless ``fetch_all`` is set, checking for reorgs of the blocks
+        tracked so far.
+        """
+        headers = self._get_headers(
+            self._new_block_numbers(next_block, latest_block, fetch_all)
+        )
+        reorganized = not self._links_up(latest_block, headers)
+        if reorganized:
+            headers.update(
+                self._get_headers(self._tracked_block_numbers(latest_block, headers))
+            )
+        return self._update(next_block, headers, reorganized)
+
+
+def _removed_logs(
+    logs_by_block: Dict[HexBytes, List[LogReceipt]],
+    removed_headers: Sequence[BlockHeader],
+) -> List[LogReceipt]:
+    # the logs returned for blocks reorganized out of the chain, marked as removed
+    return [
+        cast(LogReceipt, {**log, "removed": True})
+        for header in removed_headers
+        for log in logs_by_block.pop(header.hash, ())
+    ]
+
+
+def _track_logs(
+    logs_by_block: Dict[HexBytes, List[LogReceipt]],
+    headers: Iterable[BlockHeader],
+    logs: Iterable[LogReceipt],
+) -> None:
+    # keep the logs returned for the blocks tracked, to mark them as removed if the
+    # blocks are reorganized out of the chain
+    tracked_hashes = {header.hash for header in headers}
+    for log in logs:
+        if log["blockHash"] in tracked_hashes:
+            logs_by_block.setdefault(log["blockHash"], []).append(log)
+    for block_hash in logs_by_block.keys() - tracked_hashes:
+        del logs_by_block[block_hash]
+
+
+def _bloom_filter(
+    address: Optional[
+        Union[Address, ChecksumAddress, List[Union[Address, ChecksumAddress]]]
+    ],
+    topics: Optional[List[Optional[Union[_Hash32, List[_Hash32]]]]],
+    bloom_prefilter: bool,
+) -> Optional[LogsBloomFilter]:
+    if not bloom_prefilter:
+        return None
+    bloom_filter = LogsBloomFilter(address, topics)
+    # the blooms of a filter accepting any log can't rule out any block
+    return None if bloom_filter.matches_all else bloom_filter
+
+
 class RequestLogs:
     _from_block: BlockNumber
 
@@ -248,17 +554,21 @@ class RequestLogs:
             Union[Address, ChecksumAddress, List[Union[Address, ChecksumAddress]]]
         ] = None,
         topics: Optional[List[Optional[Union[_Hash32, List[_Hash32]]]]] = None,
+        bloom_prefilter: bool = False,
     ) -> None:
         self.address = address
         self.topics = topics
         self.w3 = w3
+        self._bloom_filter = _bloom_filter(address, topics, bloom_prefilter)
         if from_block is None or from_block == "latest":
-            self._from_block = BlockNumber(w3.eth.block_number + 1)
+            self._from_block = BlockNumber(w3.head_poller.get_block_number() + 1)
         elif is_string(from_block) and is_hex(from_block):
             self._from_block = BlockNumber(hex_to_integer(from_block))
         else:
             self._from_block = from_block
         self._to_block = to_block
+        self._head_tracker = HeadTracker(w3)
+        self._logs_by_block: Dict[HexBytes, List[LogReceipt]] = {}
         self.filter_changes = self._get_filter_changes()
 
     @property
@@ -268,9 +578,9 @@ class RequestLogs:
     @property
     def to_block(self) -> BlockNumber:
         if self._to_block is None:
-            to_block = self.w3.eth.block_number
+            to_block = self.w3.head_poller.get_block_number()
         elif self._to_block == "latest":
-            to_block = self.w3.eth.block_number
+            to_block = self.w3.head_poller.get_block_number()
         elif is_string(self._to_block) and is_hex(self._to_block):
             to_block = BlockNumber(hex_to_integer(self._to_block))
         else:
@@ -279,39 +589,61 @@ class RequestLogs:
         return to_block
 
     def _get_filter_changes(self) -> Iterator[List[LogReceipt]]:
-        for start, stop in iter_latest_block_ranges(
-            self.w3, self.from_block, self.to_block
-        ):
-            if None in (start, stop):
-                yield []
-            else:
-                yield list(
-                    concat(
-                        get_logs_multipart(
-                            self.w3,
-                            start,
-                            stop,
-                            self.address,
-                            self.topics,
-                            max_blocks=MAX_BLOCK_REQUEST,
-                        )
-                    )
-                )
-
-    def get_logs(self) -> List[LogReceipt]:
-        return list(
-            concat(
-                get_logs_multipart(
-                    self.w3,
-                    self.from_block,
-                    self.to_block,
-                    self.address,
-                    self.topics,
-                    max_blocks=MAX_BLOCK_REQUEST,
-                )
+        next_block = self.from_block
+        while True:
+            latest_block = self.w3.head_poller.get_block_number()
+            if self._to_block is not None and self._to_block != "latest":
+                latest_block = min(latest_block, self.to_block)
+
+            update = self._head_tracker.update(next_block, latest_block)
+            removed_logs = _removed_logs(self._logs_by_block, update.removed)
+            next_block = update.next_block
+            if next_block > latest_block:
+                yield removed_logs
+                continue
+
+            known_blooms = {header.number: header.logs_bloom for header in update.added}
+            logs = list(concat(self._get_logs(next_block, latest_block, known_blooms)))
+            _track_logs(self._logs_by_block, self._head_tracker.headers, logs)
+            next_block = BlockNumber(latest_block + 1)
+            yield removed_logs + logs
+
+    def iter_logs(self) -> Iterator[List[LogReceipt]]:
+        """
+        Yield the logs in the block range one ``eth_getLogs`` request, of at most
+        ``MAX_BLOCK_REQUEST`` blocks, at a time.
+        """
+        yield from self._get_logs(self.from_block, self.to_block)
+
+    def _get_logs(
+        self,
+        from_block: BlockNumber,
+        to_block: BlockNumber,
+        known_blooms: Optional[Dict[BlockNumber, Optional[HexBytes]]] = None,
+    ) -> Iterable[List[LogReceipt]]:
+        if self._bloom_filter is None:
+            return get_logs_multipart(
+                self.w3,
+                from_block,
+                to_block,
+                self.address,
+                self.topics,
+                max_blocks=MAX_BLOCK_REQUEST,
             )
+        return get_logs_prefiltered(
+            self.w3,
+            from_block,
+            to_block,
+            self.address,
+            self.topics,
+            self._bloom_filter,
+            max_blocks=MAX_BLOCK_REQUEST,
+            known_blooms=known_blooms,
         )
 
+    def get_logs(self) -> List[LogReceipt]:
+        return list(concat(self.iter_logs()))
+
 
 FILTER_PARAMS_KEY_MAP = {"toBlock": "to_block", "fromBlock": "from_block"}
 
@@ -329,28 +661,31 @@ FILTER_CHANGES_METHODS = {
 class RequestBlocks:
     def __init__(self, w3: "Web3") -> None:
         self.w3 = w3
-        self.start_block = BlockNumber(w3.eth.block_number + 1)
-
-    @property
-    def filter_changes(self) -> Iterator[List[Hash32]]:
-        return self.get_filter_changes()
+        self.start_block = BlockNumber(w3.head_poller.get_block_number() + 1)
+        self._head_tracker = HeadTracker(w3)
+        self.filter_changes = self.get_filter_changes()
 
     def get_filter_changes(self) -> Iterator[List[Hash32]]:
-        block_range_iter = iter_latest_block_ranges(self.w3, self.start_block, None)
-
-        for block_range in block_range_iter:
-            yield (block_hashes_in_range(self.w3, block_range))
+        next_block = self.start_block
+        while True:
+            latest_block = self.w3.head_poller.get_block_number()
+            update = self._head_tracker.update(next_block, latest_block, fetch_all=True)
+            next_block = BlockNumber(max(update.next_block, latest_block + 1))
+            # the blocks that replaced those reorganized out of the chain are new too
+            yield [cast(Hash32, header.hash) for header in update.added]
 
 
-@to_list
 def block_hashes_in_range(
     w3: "Web3", block_range: Tuple[BlockNumber, BlockNumber]
-) -> Iterable[Hash32]:
+) -> List[Hash32]:
     from_block, to_block = block_range
     if from_block is None or to_block is None:
-        return
-    for block_number in range(from_block, to_block + 1):
-        yield getattr(w3.eth.get_block(BlockNumber(block_number)), "hash", None)
+        return []
+    blocks = get_blocks(
+        w3,
+        [BlockNumber(block_number) for block_number in range(from_block, to_block + 1)],
+    )
+    return [getattr(block, "hash", None) for block in blocks]
 
 
 # --- async --- #
@@ -381,7 +716,7 @@ async def async_iter_latest_block(
     is_bounded_range = to_block is not None and to_block != "latest"
 
     while True:
-        latest_block = await w3.eth.block_number
+        latest_block = await w3.head_poller.get_block_number()
         # type ignored b/c is_bounded_range prevents unsupported comparison
         if is_bounded_range and latest_block > cast(int, to_block):
             yield None
@@ -453,6 +788,109 @@ async def async_get_logs_multipart(
         yield next_logs
 
 
+async def async_get_blocks(
+    w3: "AsyncWeb3", block_numbers: Sequence[BlockNumber]
+) -> List[BlockData]:
+    """
+    Fetch the blocks in batch requests of up to ``MAX_BLOCK_REQUEST`` blocks, or one at
+    a time if the provider does not support batch requests.
+    """
+    blocks: List[BlockData] = []
+    for chunk in _block_number_chunks(block_numbers):
+        if len(chunk) > 1:
+            try:
+                async with w3.batch_requests() as batch:
+                    for block_number in chunk:
+                        batch.add(w3.eth.get_block(block_number))
+                    blocks.extend(cast(List[BlockData], await batch.async_execute()))
+                continue
+            except NotImplementedError:
+                pass
+        for block_number in chunk:
+            blocks.append(await w3.eth.get_block(block_number))
+    return blocks
+
+
+async def async_get_logs_prefiltered(
+    w3: "AsyncWeb3",
+    start_block: BlockNumber,
+    stop_block: BlockNumber,
+    address: Union[Address, ChecksumAddress, List[Union[Address, ChecksumAddress]]],
+    topics: List[Optional[Union[_Hash32, List[_Hash32]]]],
+    bloom_filter: LogsBloomFilter,
+    max_blocks: int,
+    known_blooms: Optional[Dict[BlockNumber, Optional[HexBytes]]] = None,
+) -> AsyncIterable[List[LogReceipt]]:
+    """
+    Like ``async_get_logs_multipart``, but only requests the logs of the blocks whose
+    ``logsBloom`` may match ``bloom_filter``.
+
+    The blocks are fetched ``max_blocks`` at a time, in a single batch request, unless
+    their bloom is in ``known_blooms``.
+    """
+    known_blooms = known_blooms or {}
+    for from_block, to_block in block_ranges(start_block, stop_block, max_blocks):
+        block_numbers = _blocks_without_bloom(from_block, to_block, known_blooms)
+        blocks = await async_get_blocks(w3, block_numbers)
+        blooms = {
+            **known_blooms,
+            **{
+                block_number: block.get("logsBloom")
+                for block_number, block in zip(block_numbers, blocks)
+            },
+        }
+        for range_from, range_to in _matching_ranges(
+            bloom_filter, from_block, to_block, blooms, max_blocks
+        ):
+            params = {
+                "fromBlock": range_from,
+                "toBlock": range_to,
+                "address": address,
+                "topics": topics,
+            }
+            yield await w3.eth.get_logs(
+                cast(FilterParams, drop_items_with_none_value(params))
+            )
+
+
+class AsyncHeadTracker(_BaseHeadTracker):
+    def __init__(self, w3: "AsyncWeb3", max_depth: int = MAX_REORG_DEPTH) -> None:
+        super().__init__(max_depth)
+        self.w3 = w3
+
+    async def _get_headers(
+        self, block_numbers: Sequence[BlockNumber]
+    ) -> Dict[BlockNumber, BlockHeader]:
+        blocks = await async_get_blocks(self.w3, block_numbers)
+        return {
+            block_number: _block_header(block_number, block)
+            for block_number, block in zip(block_numbers, blocks)
+        }
+
+    async def update(
+        self,
+        next_block: BlockNumber,
+        latest_block: BlockNumber,
+        fetch_all: bool = False,
+    ) -> HeadUpdate:
+        """
+        Track the blocks from ``next_block`` to ``latest_block``, or only the most
+        recent of them unless ``fetch_all`` is set, checking for reorgs of the blocks
+        tracked so far.
+        """
+        headers = await self._get_headers(
+            self._new_block_numbers(next_block, latest_block, fetch_all)
+        )
+        reorganized = not self._links_up(latest_block, headers)
+        if reorganized:
+            headers.update(
+                await self._get_headers(
+                    self._tracked_block_numbers(latest_block, headers)
+                )
+            )
+        return self._update(next_block, headers, reorganized)
+
+
 class AsyncRequestLogs:
     _from_block: BlockNumber
 
@@ -465,18 +903,22 @@ class AsyncRequestLogs:
             Union[Address, ChecksumAddress, List[Union[Address, ChecksumAddress]]]
         ] = None,
         topics: Optional[List[Optional[Union[_Hash32, List[_Hash32]]]]] = None,
+        bloom_prefilter: bool = False,
     ) -> None:
         self.address = address
         self.topics = topics
         self.w3 = w3
+        self._bloom_filter = _bloom_filter(address, topics, bloom_prefilter)
         self._from_block_arg = from_block
         self._to_block = to_block
+        self._head_tracker = AsyncHeadTracker(w3)
+        self._logs_by_block: Dict[HexBytes, List[LogReceipt]] = {}
         self.filter_changes = self._get_filter_changes()
 
     def __await__(self) -> Generator[Any, None, "AsyncRequestLogs"]:
         async def closure() -> "AsyncRequestLogs":
             if self._from_block_arg is None or self._from_block_arg == "latest":
-                self.block_number = await self.w3.eth.block_number
+                self.block_number = await self.w3.head_poller.get_block_number()
                 self._from_block = BlockNumber(self.block_number + 1)
             elif is_string(self._from_block_arg) and is_hex(self._from_block_arg):
                 self._from_block = BlockNumber(
@@ -496,7 +938,7 @@ class AsyncRequestLogs:
     @property
     async def to_block(self) -> BlockNumber:
         if self._to_block is None or self._to_block == "latest":
-            to_block = await self.w3.eth.block_number
+            to_block = await self.w3.head_poller.get_block_number()
         elif is_string(self._to_block) and is_hex(self._to_block):
             to_block = BlockNumber(hex_to_integer(cast(HexStr, self._to_block)))
         else:
@@ -505,42 +947,69 @@ class AsyncRequestLogs:
         return to_block
 
     async def _get_filter_changes(self) -> AsyncIterator[List[LogReceipt]]:
+        next_block = await self.from_block
+        while True:
+            latest_block = await self.w3.head_poller.get_block_number()
+            if self._to_block is not None and self._to_block != "latest":
+                latest_block = min(latest_block, await self.to_block)
+
+            update = await self._head_tracker.update(next_block, latest_block)
+            removed_logs = _removed_logs(self._logs_by_block, update.removed)
+            next_block = update.next_block
+            if next_block > latest_block:
+                yield removed_logs
+                continue
+
+            known_blooms = {header.number: header.logs_bloom for header in update.added}
+            logs = [
+                item
+                async for sublist in self._get_logs(
+                    next_block, latest_block, known_blooms
+                )
+                for item in sublist
+            ]
+            _track_logs(self._logs_by_block, self._head_tracker.headers, logs)
+            next_block = BlockNumber(latest_block + 1)
+            yield removed_logs + logs
+
+    async def iter_logs(self) -> AsyncIterator[List[LogReceipt]]:
+        """
+        Yield the logs in the block range one ``eth_getLogs`` request, of at most
+        ``MAX_BLOCK_REQUEST`` blocks, at a time.
+        """
         self_from_block = await self.from_block
         self_to_block = await self.to_block
-        async for start, stop in async_iter_latest_block_ranges(
-            self.w3, self_from_block, self_to_block
-        ):
-            if None in (start, stop):
-                yield []
-            else:
-                yield [
-                    item
-                    async for sublist in async_get_logs_multipart(
-                        self.w3,
-                        start,
-                        stop,
-                        self.address,
-                        self.topics,
-                        max_blocks=MAX_BLOCK_REQUEST,
-                    )
-                    for item in sublist
-                ]
+        async for logs in self._get_logs(self_from_block, self_to_block):
+            yield logs
 
-    async def get_logs(self) -> List[LogReceipt]:
-        self_from_block = await self.from_block
-        self_to_block = await self.to_block
-        return [
-            item
-            async for sublist in async_get_logs_multipart(
+    def _get_logs(
+        self,
+        from_block: BlockNumber,
+        to_block: BlockNumber,
+        known_blooms: Optional[Dict[BlockNumber, Optional[HexBytes]]] = None,
+    ) -> AsyncIterable[List[LogReceipt]]:
+        if self._bloom_filter is None:
+            return async_get_logs_multipart(
                 self.w3,
-                self_from_block,
-                self_to_block,
+                from_block,
+                to_block,
                 self.address,
                 self.topics,
                 max_blocks=MAX_BLOCK_REQUEST,
             )
-            for item in sublist
-        ]
+        return async_get_logs_prefiltered(
+            self.w3,
+            from_block,
+            to_block,
+            self.address,
+            self.topics,
+            self._bloom_filter,
+            max_blocks=MAX_BLOCK_REQUEST,
+            known_blooms=known_blooms,
+        )
+
+    async def get_logs(self) -> List[LogReceipt]:
+        return [item async for sublist in self.iter_logs() for item in sublist]
 
 
 class AsyncRequestBlocks:
@@ -549,23 +1018,24 @@ class AsyncRequestBlocks:
 
     def __await__(self) -> Generator[Any, None, "AsyncRequestBlocks"]:
         async def closure() -> "AsyncRequestBlocks":
-            self.block_number = await self.w3.eth.block_number
+            self.block_number = await self.w3.head_poller.get_block_number()
             self.start_block = BlockNumber(self.block_number + 1)
+            self._head_tracker = AsyncHeadTracker(self.w3)
+            self.filter_changes = self.get_filter_changes()
             return self
 
         return closure().__await__()
 
-    @property
-    def filter_changes(self) -> AsyncIterator[List[Hash32]]:
-        return self.get_filter_changes()
-
     async def get_filter_changes(self) -> AsyncIterator[List[Hash32]]:
-        block_range_iter = async_iter_latest_block_ranges(
-            self.w3, self.start_block, None
-        )
-        async for block_range in block_range_iter:
-            hash = await async_block_hashes_in_range(self.w3, block_range)
-            yield hash
+        next_block = self.start_block
+        while True:
+            latest_block = await self.w3.head_poller.get_block_number()
+            update = await self._head_tracker.update(
+                next_block, latest_block, fetch_all=True
+            )
+            next_block = BlockNumber(max(update.next_block, latest_block + 1))
+            # the blocks that replaced those reorganized out of the chain are new too
+            yield [cast(Hash32, header.hash) for header in update.added]
 
 
 async def async_block_hashes_in_range(
@@ -575,12 +1045,11 @@ async def async_block_hashes_in_range(
     if from_block is None or to_block is None:
         return []
 
-    block_hashes = []
-    for block_number in range(from_block, to_block + 1):
-        w3_get_block = await w3.eth.get_block(BlockNumber(block_number))
-        block_hashes.append(getattr(w3_get_block, "hash", None))
-
-    return block_hashes
+    blocks = await async_get_blocks(
+        w3,
+        [BlockNumber(block_number) for block_number in range(from_block, to_block + 1)],
+    )
+    return [getattr(block, "hash", None) for block in blocks]
 
 
 # -- middleware -- #
@@ -593,13 +1062,29 @@ def _simulate_rpc_response_with_result(filter_id: str) -> "RPCResponse":
     return {"jsonrpc": "2.0", "id": -1, "result": filter_id}
 
 
-class LocalFilterMiddleware(Web3Middleware):
+class LocalFilterMiddleware(Web3MiddlewareBuilder):
+    bloom_prefilter: bool = False
+
     def __init__(self, w3: Union["Web3", "AsyncWeb3"]):
         self.filters: Dict[str, SyncFilter] = {}
         self.async_filters: Dict[str, AsyncFilter] = {}
         self.filter_id_counter = itertools.count()
         super().__init__(w3)
 
+    @staticmethod
+    @curry
+    def build(
+        w3: Union["Web3", "AsyncWeb3"], bloom_prefilter: bool = False
+    ) -> "LocalFilterMiddleware":
+        """
+        Build the middleware with ``bloom_prefilter`` set to check the ``logsBloom``
+        of the blocks in range against the addresses and topics of log filters, and
+        only request the logs of the blocks that may hold matching logs.
+        """
+        middleware = LocalFilterMiddleware(w3)
+        middleware.bloom_prefilter = bloom_prefilter
+        return middleware
+
     def wrap_make_request(self, make_request: MakeRequestFn) -> MakeRequestFn:
         def middleware(method: "RPCEndpoint", params: Any) -> "RPCResponse":
             if method in NEW_FILTER_METHODS:
@@ -609,6 +1094,7 @@ class LocalFilterMiddleware(Web3Middleware):
                 if method == RPC.eth_newFilter:
                     _filter = RequestLogs(
                         cast("Web3", self._w3),
+                        bloom_prefilter=self.bloom_prefilter,
                         **apply_key_map(FILTER_PARAMS_KEY_MAP, params[0])
                     )
 
@@ -661,6 +1147,7 @@ class LocalFilterMiddleware(Web3Middleware):
                 if method == RPC.eth_newFilter:
                     _filter = await AsyncRequestLogs(
                         cast("AsyncWeb3", self._w3),
+                        bloom_prefilter=self.bloom_prefilter,
                         **apply_key_map(FILTER_PARAMS_KEY_MAP, params[0])
                     )
 
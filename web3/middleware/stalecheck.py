@@ -68,7 +68,7 @@ class StalecheckMiddlewareBuilder(Web3MiddlewareBuilder):
         if method not in self.skip_stalecheck_for_methods:
             if not _is_fresh(self.cache["latest"], self.allowable_delay):
                 w3 = cast("Web3", self._w3)
-                latest = w3.eth.get_block("latest")
+                latest = w3.head_poller.get_latest_block()
 
                 if _is_fresh(latest, self.allowable_delay):
                     self.cache["latest"] = latest
@@ -83,7 +83,7 @@ class StalecheckMiddlewareBuilder(Web3MiddlewareBuilder):
         if method not in self.skip_stalecheck_for_methods:
             if not _is_fresh(self.cache["latest"], self.allowable_delay):
                 w3 = cast("AsyncWeb3", self._w3)
-                latest = await w3.eth.get_block("latest")
+                latest = await w3.head_poller.get_latest_block()
 
                 if _is_fresh(latest, self.allowable_delay):
                     self.cache["latest"] = latest
@@ -67,6 +67,13 @@ def retrieve_blocking_method_call_fn(
         except _UseExistingFilter as err:
             return LogFilter(eth_module=module, filter_id=err.filter_id)
 
+        if w3.provider._is_batching:
+            # when batching, return the request information to be sent with the batch
+            return (  # type: ignore
+                (method_str, params),
+                response_formatters,
+            )
+
         (
             result_formatters,
             error_formatters,
@@ -92,6 +99,13 @@ def retrieve_async_method_call_fn(
         except _UseExistingFilter as err:
             return AsyncLogFilter(eth_module=module, filter_id=err.filter_id)
 
+        if async_w3.provider._is_batching:
+            # when batching, return the request information to be sent with the batch
+            return (  # type: ignore
+                (method_str, params),
+                response_formatters,
+            )
+
         if isinstance(async_w3.provider, PersistentConnectionProvider):
             # TODO: The typing does not seem to be correct for response_formatters.
             #   For now, keep the expected typing but ignore it here.
@@ -5,9 +5,11 @@ from typing import (
     Any,
     Callable,
     Coroutine,
+    List,
     Optional,
     Set,
     Tuple,
+    Union,
     cast,
 )
 
@@ -17,8 +19,23 @@ from eth_utils import (
     to_text,
 )
 
+from web3._utils.batching import (
+    is_batching,
+    sort_batch_response_by_response_ids,
+)
+from web3._utils.block_caching import (
+    BLOCK_CACHEABLE_REQUESTS,
+    BlockCacheTracker,
+)
 from web3._utils.caching import (
+    CacheKeyFn,
     async_handle_request_caching,
+    generate_structural_cache_key,
+)
+from web3._utils.coalescing import (
+    COALESCABLE_REQUESTS,
+    CoalescingStats,
+    RequestCoalescer,
 )
 from web3._utils.encoding import (
     FriendlyJsonSerde,
@@ -28,6 +45,7 @@ from web3.exceptions import (
     ProviderConnectionError,
 )
 from web3.middleware import (
+    async_combine_batch_middleware,
     async_combine_middleware,
 )
 from web3.middleware.base import (
@@ -39,6 +57,7 @@ from web3.types import (
     RPCResponse,
 )
 from web3.utils import (
+    CacheBackend,
     SimpleCache,
 )
 
@@ -77,6 +96,10 @@ class AsyncBaseProvider:
     _request_func_cache: Tuple[
         Tuple[Middleware, ...], Callable[..., Coroutine[Any, Any, RPCResponse]]
     ] = (None, None)
+    _batch_request_func_cache: Tuple[
+        Tuple[Middleware, ...],
+        Callable[..., Coroutine[Any, Any, Union[List[RPCResponse], RPCResponse]]],
+    ] = (None, None)
 
     is_async = True
     has_persistent_connection = False
@@ -86,11 +109,44 @@ class AsyncBaseProvider:
     # request caching
     cache_allowed_requests: bool = False
     cacheable_requests: Set[RPCEndpoint] = CACHEABLE_REQUESTS
-    _request_cache: SimpleCache
-    _request_cache_lock: asyncio.Lock = asyncio.Lock()
+    block_cacheable_requests: Set[RPCEndpoint] = BLOCK_CACHEABLE_REQUESTS
+    request_cache_finality_depth: int = 64
+    request_cache_head_ttl: float = 1.0
+    request_cache_latest_ttl: float = 0.0
+    _request_cache: CacheBackend
+    cache_key_fn: CacheKeyFn
+    _request_cache_block_tracker: BlockCacheTracker
+
+    # request coalescing
+    coalesce_requests: bool = False
+    coalescable_requests: Set[RPCEndpoint] = COALESCABLE_REQUESTS
+    _request_coalescer: RequestCoalescer
 
     def __init__(self) -> None:
         self._request_cache = SimpleCache(1000)
+        self.cache_key_fn = generate_structural_cache_key
+        self._request_cache_block_tracker = BlockCacheTracker()
+        self._request_coalescer = RequestCoalescer()
+
+    @property
+    def _is_batching(self) -> bool:
+        # whether a ``RequestBatcher`` is collecting requests for this provider in the
+        # current thread or async task
+        return is_batching(self)
+
+    @property
+    def request_cache(self) -> CacheBackend:
+        return self._request_cache
+
+    @request_cache.setter
+    def request_cache(self, cache: CacheBackend) -> None:
+        self._request_cache = cache
+        # start tracking block dependencies anew for the new cache
+        self._request_cache_block_tracker = BlockCacheTracker()
+
+    @property
+    def request_coalescing_stats(self) -> CoalescingStats:
+        return self._request_coalescer.stats
 
     async def request_func(
         self, async_w3: "AsyncWeb3", middleware_onion: MiddlewareOnion
@@ -113,6 +169,28 @@ class AsyncBaseProvider:
     async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
         raise NotImplementedError("Providers must implement this method")
 
+    async def batch_request_func(
+        self, async_w3: "AsyncWeb3", middleware_onion: MiddlewareOnion
+    ) -> Callable[..., Coroutine[Any, Any, Union[List[RPCResponse], RPCResponse]]]:
+        middleware: Tuple[Middleware, ...] = middleware_onion.as_tuple_of_middleware()
+
+        cache_key = self._batch_request_func_cache[0]
+        if cache_key != middleware:
+            self._batch_request_func_cache = (
+                middleware,
+                await async_combine_batch_middleware(
+                    middleware=middleware,
+                    async_w3=async_w3,
+                    provider_batch_request_fn=self.make_batch_request,
+                ),
+            )
+        return self._batch_request_func_cache[-1]
+
+    async def make_batch_request(
+        self, requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> Union[List[RPCResponse], RPCResponse]:
+        raise NotImplementedError("Providers must implement this method")
+
     async def is_connected(self, show_traceback: bool = False) -> bool:
         raise NotImplementedError("Providers must implement this method")
 
@@ -156,12 +234,32 @@ class AsyncJSONBaseProvider(AsyncBaseProvider):
         encoded = FriendlyJsonSerde().json_encode(rpc_dict, cls=Web3JsonEncoder)
         return to_bytes(text=encoded)
 
+    def encode_batch_rpc_request(
+        self, requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> bytes:
+        return (
+            b"["
+            + b", ".join(
+                self.encode_rpc_request(method, params) for method, params in requests
+            )
+            + b"]"
+        )
+
     def decode_rpc_response(self, raw_response: bytes) -> RPCResponse:
         text_response = str(
             to_text(raw_response) if not is_text(raw_response) else raw_response
         )
         return cast(RPCResponse, FriendlyJsonSerde().json_decode(text_response))
 
+    def decode_batch_rpc_response(
+        self, raw_response: bytes
+    ) -> Union[List[RPCResponse], RPCResponse]:
+        response = self.decode_rpc_response(raw_response)
+        if isinstance(response, list):
+            return sort_batch_response_by_response_ids(response)
+        # a single error response is returned if the batch as a whole is rejected
+        return response
+
     async def is_connected(self, show_traceback: bool = False) -> bool:
         try:
             response = await self.make_request(RPCEndpoint("web3_clientVersion"), [])
@@ -1,11 +1,12 @@
 import itertools
-import threading
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    List,
     Set,
     Tuple,
+    Union,
     cast,
 )
 
@@ -14,7 +15,17 @@ from eth_utils import (
     to_text,
 )
 
+from web3._utils.batching import (
+    is_batching,
+    sort_batch_response_by_response_ids,
+)
+from web3._utils.block_caching import (
+    BLOCK_CACHEABLE_REQUESTS,
+    BlockCacheTracker,
+)
 from web3._utils.caching import (
+    CacheKeyFn,
+    generate_structural_cache_key,
     handle_request_caching,
 )
 from web3._utils.encoding import (
@@ -25,6 +36,7 @@ from web3.exceptions import (
     ProviderConnectionError,
 )
 from web3.middleware import (
+    combine_batch_middleware,
     combine_middleware,
 )
 from web3.middleware.base import (
@@ -36,6 +48,7 @@ from web3.types import (
     RPCResponse,
 )
 from web3.utils import (
+    CacheBackend,
     SimpleCache,
 )
 
@@ -66,6 +79,9 @@ class BaseProvider:
         None,
         None,
     )
+    _batch_request_func_cache: Tuple[
+        Tuple[Middleware, ...], Callable[..., Union[List[RPCResponse], RPCResponse]]
+    ] = (None, None)
 
     is_async = False
     has_persistent_connection = False
@@ -75,11 +91,34 @@ class BaseProvider:
     # request caching
     cache_allowed_requests: bool = False
     cacheable_requests: Set[RPCEndpoint] = CACHEABLE_REQUESTS
-    _request_cache: SimpleCache
-    _request_cache_lock: threading.Lock = threading.Lock()
+    block_cacheable_requests: Set[RPCEndpoint] = BLOCK_CACHEABLE_REQUESTS
+    request_cache_finality_depth: int = 64
+    request_cache_head_ttl: float = 1.0
+    request_cache_latest_ttl: float = 0.0
+    _request_cache: CacheBackend
+    cache_key_fn: CacheKeyFn
+    _request_cache_block_tracker: BlockCacheTracker
 
     def __init__(self) -> None:
         self._request_cache = SimpleCache(1000)
+        self.cache_key_fn = generate_structural_cache_key
+        self._request_cache_block_tracker = BlockCacheTracker()
+
+    @property
+    def _is_batching(self) -> bool:
+        # whether a ``RequestBatcher`` is collecting requests for this provider in the
+        # current thread or async task
+        return is_batching(self)
+
+    @property
+    def request_cache(self) -> CacheBackend:
+        return self._request_cache
+
+    @request_cache.setter
+    def request_cache(self, cache: CacheBackend) -> None:
+        self._request_cache = cache
+        # start tracking block dependencies anew for the new cache
+        self._request_cache_block_tracker = BlockCacheTracker()
 
     def request_func(
         self, w3: "Web3", middleware_onion: MiddlewareOnion
@@ -110,6 +149,29 @@ class BaseProvider:
     def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
         raise NotImplementedError("Providers must implement this method")
 
+    def batch_request_func(
+        self, w3: "Web3", middleware_onion: MiddlewareOnion
+    ) -> Callable[..., Union[List[RPCResponse], RPCResponse]]:
+        middleware: Tuple[Middleware, ...] = middleware_onion.as_tuple_of_middleware()
+
+        cache_key = self._batch_request_func_cache[0]
+        if cache_key != middleware:
+            self._batch_request_func_cache = (
+                middleware,
+                combine_batch_middleware(
+                    middleware=middleware,
+                    w3=w3,
+                    provider_batch_request_fn=self.make_batch_request,
+                ),
+            )
+
+        return self._batch_request_func_cache[-1]
+
+    def make_batch_request(
+        self, requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> Union[List[RPCResponse], RPCResponse]:
+        raise NotImplementedError("Providers must implement this method")
+
     def is_connected(self, show_traceback: bool = False) -> bool:
         raise NotImplementedError("Providers must implement this method")
 
@@ -133,6 +195,26 @@ class JSONBaseProvider(BaseProvider):
         encoded = FriendlyJsonSerde().json_encode(rpc_dict, Web3JsonEncoder)
         return to_bytes(text=encoded)
 
+    def encode_batch_rpc_request(
+        self, requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> bytes:
+        return (
+            b"["
+            + b", ".join(
+                self.encode_rpc_request(method, params) for method, params in requests
+            )
+            + b"]"
+        )
+
+    def decode_batch_rpc_response(
+        self, raw_response: bytes
+    ) -> Union[List[RPCResponse], RPCResponse]:
+        response = self.decode_rpc_response(raw_response)
+        if isinstance(response, list):
+            return sort_batch_response_by_response_ids(response)
+        # a single error response is returned if the batch as a whole is rejected
+        return response
+
     def is_connected(self, show_traceback: bool = False) -> bool:
         try:
             response = self.make_request(RPCEndpoint("web3_clientVersion"), [])
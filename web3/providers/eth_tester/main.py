@@ -4,8 +4,10 @@ from typing import (
     Callable,
     Coroutine,
     Dict,
+    List,
     Literal,
     Optional,
+    Tuple,
     Union,
     cast,
 )
@@ -36,7 +38,9 @@ from ...exceptions import (
     Web3TypeError,
 )
 from ...middleware import (
+    async_combine_batch_middleware,
     async_combine_middleware,
+    combine_batch_middleware,
     combine_middleware,
 )
 from .middleware import (
@@ -100,6 +104,25 @@ class AsyncEthereumTesterProvider(AsyncBaseProvider):
             )
         return self._request_func_cache[-1]
 
+    async def batch_request_func(
+        self, async_w3: "AsyncWeb3", middleware_onion: "MiddlewareOnion"
+    ) -> Callable[..., Coroutine[Any, Any, Union[List[RPCResponse], RPCResponse]]]:
+        # override the batch_request_func to add the ethereum_tester_middleware
+
+        middleware = middleware_onion.as_tuple_of_middleware() + tuple(self._middleware)
+
+        cache_key = self._batch_request_func_cache[0]
+        if cache_key != middleware:
+            self._batch_request_func_cache = (
+                middleware,
+                await async_combine_batch_middleware(
+                    middleware=middleware,
+                    async_w3=async_w3,
+                    provider_batch_request_fn=self.make_batch_request,
+                ),
+            )
+        return self._batch_request_func_cache[-1]
+
     async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
         response = _make_request(
             method,
@@ -111,6 +134,12 @@ class AsyncEthereumTesterProvider(AsyncBaseProvider):
         self._current_request_id += 1
         return response
 
+    async def make_batch_request(
+        self, requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> List[RPCResponse]:
+        # eth-tester has no notion of a batch, so each request is made in turn
+        return [await self.make_request(method, params) for method, params in requests]
+
     async def is_connected(self, show_traceback: bool = False) -> Literal[True]:
         return True
 
@@ -183,6 +212,25 @@ class EthereumTesterProvider(BaseProvider):
             )
         return self._request_func_cache[-1]
 
+    def batch_request_func(
+        self, w3: "Web3", middleware_onion: "MiddlewareOnion"
+    ) -> Callable[..., Union[List[RPCResponse], RPCResponse]]:
+        # override the batch_request_func to add the ethereum_tester_middleware
+
+        middleware = middleware_onion.as_tuple_of_middleware() + tuple(self._middleware)
+
+        cache_key = self._batch_request_func_cache[0]
+        if cache_key != middleware:
+            self._batch_request_func_cache = (
+                middleware,
+                combine_batch_middleware(
+                    middleware=middleware,
+                    w3=w3,
+                    provider_batch_request_fn=self.make_batch_request,
+                ),
+            )
+        return self._batch_request_func_cache[-1]
+
     def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
         response = _make_request(
             method,
@@ -194,6 +242,12 @@ class EthereumTesterProvider(BaseProvider):
         self._current_request_id += 1
         return response
 
+    def make_batch_request(
+        self, requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> List[RPCResponse]:
+        # eth-tester has no notion of a batch, so each request is made in turn
+        return [self.make_request(method, params) for method, params in requests]
+
     def is_connected(self, show_traceback: bool = False) -> Literal[True]:
         return True
 
@@ -1,9 +1,6 @@
 import asyncio
 import errno
 import json
-from json import (
-    JSONDecodeError,
-)
 import logging
 from pathlib import (
     Path,
@@ -16,10 +13,9 @@ from typing import (
     Union,
 )
 
-from eth_utils import (
-    to_text,
+from web3._utils.json_stream import (
+    JSONStreamDecoder,
 )
-
 from web3.types import (
     RPCEndpoint,
     RPCResponse,
@@ -39,9 +35,11 @@ from ..ipc import (
     get_default_ipc_path,
 )
 
+DEFAULT_READ_BUFFER_LIMIT = 2**20
+
 
 async def async_get_ipc_socket(
-    ipc_path: str,
+    ipc_path: str, read_buffer_limit: int = DEFAULT_READ_BUFFER_LIMIT
 ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
     if sys.platform == "win32":
         # On Windows named pipe is used. Simulate socket with it.
@@ -51,7 +49,7 @@ async def async_get_ipc_socket(
 
         return NamedPipe(ipc_path)
     else:
-        return await asyncio.open_unix_connection(ipc_path)
+        return await asyncio.open_unix_connection(ipc_path, limit=read_buffer_limit)
 
 
 class AsyncIPCProvider(PersistentConnectionProvider):
@@ -64,6 +62,7 @@ class AsyncIPCProvider(PersistentConnectionProvider):
         self,
         ipc_path: Optional[Union[str, Path]] = None,
         max_connection_retries: int = 5,
+        read_buffer_limit: int = DEFAULT_READ_BUFFER_LIMIT,
         # `PersistentConnectionProvider` kwargs can be passed through
         **kwargs: Any,
     ) -> None:
@@ -75,6 +74,7 @@ class AsyncIPCProvider(PersistentConnectionProvider):
             raise Web3TypeError("ipc_path must be of type string or pathlib.Path")
 
         self._max_connection_retries = max_connection_retries
+        self.read_buffer_limit = read_buffer_limit
         super().__init__(**kwargs)
 
     def __str__(self) -> str:
@@ -107,7 +107,9 @@ class AsyncIPCProvider(PersistentConnectionProvider):
         while _connection_attempts != self._max_connection_retries:
             try:
                 _connection_attempts += 1
-                self._reader, self._writer = await async_get_ipc_socket(self.ipc_path)
+                self._reader, self._writer = await async_get_ipc_socket(
+                    self.ipc_path, self.read_buffer_limit
+                )
                 self._message_listener_task = asyncio.create_task(
                     self._message_listener()
                 )
@@ -145,12 +147,11 @@ class AsyncIPCProvider(PersistentConnectionProvider):
     async def _reset_socket(self) -> None:
         self._writer.close()
         await self._writer.wait_closed()
-        self._reader, self._writer = await async_get_ipc_socket(self.ipc_path)
-
-    @async_handle_request_caching
-    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
-        request_data = self.encode_rpc_request(method, params)
+        self._reader, self._writer = await async_get_ipc_socket(
+            self.ipc_path, self.read_buffer_limit
+        )
 
+    async def _send_raw_request(self, request_data: bytes) -> None:
         if self._writer is None:
             raise ProviderConnectionError(
                 "Connection to ipc socket has not been initiated for the provider."
@@ -167,6 +168,11 @@ class AsyncIPCProvider(PersistentConnectionProvider):
                 self._writer.write(request_data)
                 await self._writer.drain()
 
+    @async_handle_request_caching
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        request_data = self.encode_rpc_request(method, params)
+        await self._send_raw_request(request_data)
+
         current_request_id = json.loads(request_data)["id"]
         response = await self._get_response_for_request_id(current_request_id)
 
@@ -177,8 +183,7 @@ class AsyncIPCProvider(PersistentConnectionProvider):
             "IPC socket listener background task started. Storing all messages in "
             "appropriate request processor queues / caches to be processed."
         )
-        raw_message = ""
-        decoder = json.JSONDecoder()
+        decoder = JSONStreamDecoder()
 
         while True:
             # the use of sleep(0) seems to be the most efficient way to yield control
@@ -186,21 +191,26 @@ class AsyncIPCProvider(PersistentConnectionProvider):
             await asyncio.sleep(0)
 
             try:
-                raw_message += to_text(await self._reader.read(4096)).lstrip()
-
-                while raw_message:
-                    try:
-                        response, pos = decoder.raw_decode(raw_message)
-                    except JSONDecodeError:
-                        break
-
-                    is_subscription = response.get("method") == "eth_subscription"
+                responses = decoder.decode(
+                    await self._reader.read(self.read_buffer_limit)
+                )
+                for response in responses:
+                    # batch responses are a list of responses
+                    is_subscription = (
+                        isinstance(response, dict)
+                        and response.get("method") == "eth_subscription"
+                    )
                     await self._request_processor.cache_raw_response(
                         response, subscription=is_subscription
                     )
-                    raw_message = raw_message[pos:].lstrip()
             except Exception as e:
                 if not self.silence_listener_task_exceptions:
+                    self._request_processor.fail_response_futures(
+                        ProviderConnectionError(
+                            "The listener background task stopped before the response "
+                            f"was received.\n    error={e.__class__.__name__}: {e}"
+                        )
+                    )
                     loop = asyncio.get_event_loop()
                     for task in asyncio.all_tasks(loop=loop):
                         task.cancel()
@@ -210,5 +220,5 @@ class AsyncIPCProvider(PersistentConnectionProvider):
                     "Exception caught in listener, error logging and keeping listener "
                     f"background task alive.\n    error={e}"
                 )
-                # if only error logging, reset the ``raw_message`` buffer and continue
-                raw_message = ""
+                # if only error logging, reset the decoder's buffer and continue
+                decoder.reset()
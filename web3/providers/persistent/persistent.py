@@ -2,14 +2,16 @@ from abc import (
     ABC,
 )
 import asyncio
+import json
 import logging
 from typing import (
+    Any,
+    List,
     Optional,
+    Tuple,
+    Union,
 )
 
-from web3._utils.caching import (
-    generate_cache_key,
-)
 from web3.exceptions import (
     TimeExhausted,
 )
@@ -20,6 +22,7 @@ from web3.providers.persistent.request_processor import (
     RequestProcessor,
 )
 from web3.types import (
+    RPCEndpoint,
     RPCId,
     RPCResponse,
 )
@@ -69,35 +72,75 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
     async def _message_listener(self) -> None:
         raise NotImplementedError("Must be implemented by subclasses")
 
+    async def _send_raw_request(self, request_data: bytes) -> None:
+        raise NotImplementedError("Must be implemented by subclasses")
+
+    async def make_batch_request(
+        self, requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> Union[List[RPCResponse], RPCResponse]:
+        request_data = self.encode_batch_rpc_request(requests)
+        request_ids = [request["id"] for request in json.loads(request_data)]
+
+        # cache the request information by the ids the batch is sent with so that
+        # middleware can register response processors for each response
+        self._request_processor.cache_batch_request_information(requests, request_ids)
+        batch_error_future = self._request_processor.get_batch_error_future()
+        # responses in a batch are cached individually, by id, as they come in
+        responses_future = asyncio.gather(
+            *(
+                self._get_response_for_request_id(request_id)
+                for request_id in request_ids
+            )
+        )
+        try:
+            await self._send_raw_request(request_data)
+            await asyncio.wait(
+                (responses_future, batch_error_future),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not batch_error_future.done():
+                return list(responses_future.result())
+        except Exception:
+            self._pop_batch_request_information(request_ids)
+            raise
+        finally:
+            self._request_processor.discard_batch_error_future(batch_error_future)
+            if not responses_future.done():
+                responses_future.cancel()
+                # let the cancelled waits remove their response futures
+                await asyncio.wait((responses_future,))
+
+        # the batch was rejected as a whole, with a single error response
+        self._pop_batch_request_information(request_ids)
+        return batch_error_future.result()
+
+    def _pop_batch_request_information(self, request_ids: List[RPCId]) -> None:
+        for request_id in request_ids:
+            self._request_processor.pop_cached_request_information(
+                self.cache_key_fn(request_id)
+            )
+
     async def _get_response_for_request_id(
         self, request_id: RPCId, timeout: Optional[float] = None
     ) -> RPCResponse:
         if timeout is None:
             timeout = self.request_timeout
 
-        async def _match_response_id_to_request_id() -> RPCResponse:
-            request_cache_key = generate_cache_key(request_id)
-
-            while True:
-                # sleep(0) here seems to be the most efficient way to yield control
-                # back to the event loop while waiting for the response to be in the
-                # queue.
-                await asyncio.sleep(0)
-
-                if request_cache_key in self._request_processor._request_response_cache:
-                    self.logger.debug(
-                        f"Popping response for id {request_id} from cache."
-                    )
-                    popped_response = await self._request_processor.pop_raw_response(
-                        cache_key=request_cache_key,
-                    )
-                    return popped_response
+        request_cache_key = self.cache_key_fn(request_id)
+        if request_cache_key in self._request_processor._request_response_cache:
+            # the response was received before we started waiting for it
+            self.logger.debug(f"Popping response for id {request_id} from cache.")
+            return await self._request_processor.pop_raw_response(
+                cache_key=request_cache_key,
+            )
 
+        # the request processor resolves the future as soon as the listener receives
+        # the response, so there is no need to poll the response cache
+        response_future = self._request_processor.get_response_future(request_cache_key)
         try:
-            # Add the request timeout around the while loop that checks the request
-            # cache and tried to recv(). If the request is neither in the cache, nor
-            # received within the request_timeout, raise ``TimeExhausted``.
-            return await asyncio.wait_for(_match_response_id_to_request_id(), timeout)
+            # If the response is not received within the request_timeout, raise
+            # ``TimeExhausted``.
+            return await asyncio.wait_for(response_future, timeout)
         except asyncio.TimeoutError:
             raise TimeExhausted(
                 f"Timed out waiting for response with request id `{request_id}` after "
@@ -106,3 +149,5 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
                 "request or an exception raised during the request was caught and "
                 "allowed to continue."
             )
+        finally:
+            self._request_processor.pop_response_future(request_cache_key)
@@ -7,15 +7,18 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Hashable,
+    List,
     Optional,
+    Set,
     Tuple,
 )
 
 from web3._utils.caching import (
     RequestInformation,
-    generate_cache_key,
 )
 from web3.exceptions import (
+    ProviderConnectionError,
     Web3ValueError,
 )
 from web3.types import (
@@ -44,6 +47,10 @@ class RequestProcessor:
 
         self._request_information_cache: SimpleCache = SimpleCache(500)
         self._request_response_cache: SimpleCache = SimpleCache(500)
+        self._response_futures: Dict[Hashable, "asyncio.Future[RPCResponse]"] = {}
+        # resolved with the error response to a batch rejected as a whole, which has
+        # no id to match it to its batch
+        self._batch_error_futures: Set["asyncio.Future[RPCResponse]"] = set()
         self._subscription_response_queue: asyncio.Queue[RPCResponse] = asyncio.Queue(
             maxsize=subscription_response_queue_size
         )
@@ -63,12 +70,14 @@ class RequestProcessor:
         method: RPCEndpoint,
         params: Any,
         response_formatters: Tuple[Callable[..., Any], ...],
-    ) -> Optional[str]:
-        cached_requests_key = generate_cache_key((method, params))
-        if cached_requests_key in self._provider._request_cache._data:
-            cached_response = self._provider._request_cache._data[cached_requests_key]
+    ) -> Optional[Hashable]:
+        cached_requests_key = self._provider.cache_key_fn((method, params))
+        if cached_requests_key in self._provider._request_cache:
+            cached_response = self._provider._request_cache.get_cache_entry(
+                cached_requests_key
+            )
             cached_response_id = cached_response.get("id")
-            cache_key = generate_cache_key(cached_response_id)
+            cache_key = self._provider.cache_key_fn(cached_response_id)
             if cache_key in self._request_information_cache:
                 self._provider.logger.debug(
                     "This is a cached request, not caching request info because it is "
@@ -79,7 +88,7 @@ class RequestProcessor:
         # copy the request counter and find the next request id without incrementing
         # since this is done when / if the request is successfully sent
         request_id = next(copy(self._provider.request_counter))
-        cache_key = generate_cache_key(request_id)
+        cache_key = self._provider.cache_key_fn(request_id)
 
         self._bump_cache_if_key_present(cache_key, request_id)
 
@@ -98,7 +107,29 @@ class RequestProcessor:
         )
         return cache_key
 
-    def _bump_cache_if_key_present(self, cache_key: str, request_id: int) -> None:
+    def cache_batch_request_information(
+        self,
+        requests: List[Tuple[RPCEndpoint, Any]],
+        request_ids: List[int],
+    ) -> None:
+        """
+        Cache the request information for each request in a batch by the id it is
+        sent with. Batched responses are formatted by the request manager, so no
+        response formatters are stored here. The cached information is used to
+        collect middleware response processors for each response in the batch.
+        """
+        for (method, params), request_id in zip(requests, request_ids):
+            cache_key = self._provider.cache_key_fn(request_id)
+            self._bump_cache_if_key_present(cache_key, request_id)
+
+            request_info = RequestInformation(method, params, response_formatters=())
+            self._provider.logger.debug(
+                f"Caching batch request info:\n    request_id={request_id},\n"
+                f"    cache_key={cache_key},\n    request_info={request_info.__dict__}"
+            )
+            self._request_information_cache.cache(cache_key, request_info)
+
+    def _bump_cache_if_key_present(self, cache_key: Hashable, request_id: int) -> None:
         """
         If the cache key is present in the cache, bump the cache key and request id
         by one to make room for the new request. This behavior is necessary when a
@@ -109,7 +140,7 @@ class RequestProcessor:
             original_request_info = self._request_information_cache.get_cache_entry(
                 cache_key
             )
-            bump = generate_cache_key(request_id + 1)
+            bump = self._provider.cache_key_fn(request_id + 1)
 
             # recursively bump the cache if the new key is also present
             self._bump_cache_if_key_present(bump, request_id + 1)
@@ -123,7 +154,7 @@ class RequestProcessor:
             self._request_information_cache.cache(bump, original_request_info)
 
     def pop_cached_request_information(
-        self, cache_key: str
+        self, cache_key: Hashable
     ) -> Optional[RequestInformation]:
         request_info = self._request_information_cache.pop(cache_key)
         if request_info is not None:
@@ -146,7 +177,7 @@ class RequestProcessor:
                 )
 
             # retrieve the request info from the cache using the subscription id
-            cache_key = generate_cache_key(response["params"]["subscription"])
+            cache_key = self._provider.cache_key_fn(response["params"]["subscription"])
             request_info = (
                 # don't pop the request info from the cache, since we need to keep it
                 # to process future subscription responses
@@ -156,8 +187,11 @@ class RequestProcessor:
 
         else:
             # retrieve the request info from the cache using the request id
-            cache_key = generate_cache_key(response["id"])
-            if response in self._provider._request_cache._data.values():
+            cache_key = self._provider.cache_key_fn(response["id"])
+            if any(
+                response == cached_response
+                for _, cached_response in self._provider._request_cache.items()
+            ):
                 request_info = (
                     # don't pop the request info from the cache, since we need to keep
                     # it to process future responses
@@ -179,7 +213,7 @@ class RequestProcessor:
                 # if successful unsubscribe request, remove the subscription request
                 # information from the cache since it is no longer needed
                 subscription_id = request_info.params[0]
-                subscribe_cache_key = generate_cache_key(subscription_id)
+                subscribe_cache_key = self._provider.cache_key_fn(subscription_id)
                 self.pop_cached_request_information(subscribe_cache_key)
 
         return request_info
@@ -192,7 +226,7 @@ class RequestProcessor:
         response_id = response.get("id", None)
 
         if response_id is not None:
-            cache_key = generate_cache_key(response_id)
+            cache_key = self._provider.cache_key_fn(response_id)
             cached_request_info_for_id: RequestInformation = (
                 self._request_information_cache.get_cache_entry(cache_key)
             )
@@ -229,17 +263,83 @@ class RequestProcessor:
                 f"Caching subscription response:\n    response={raw_response}"
             )
             await self._subscription_response_queue.put(raw_response)
+        elif isinstance(raw_response, list):
+            # batch response, cache each response by its own id
+            for response in raw_response:
+                await self.cache_raw_response(response)
         else:
             response_id = raw_response.get("id")
-            cache_key = generate_cache_key(response_id)
+            if response_id is None and self._batch_error_futures:
+                # a batch was rejected as a whole. Which one is not known, so every
+                # batch waiting for responses is failed with the error.
+                self._provider.logger.debug(
+                    f"Resolving batch error futures:\n    response={raw_response}"
+                )
+                for batch_error_future in self._batch_error_futures:
+                    if not batch_error_future.done():
+                        batch_error_future.set_result(raw_response)
+                return
+
+            cache_key = self._provider.cache_key_fn(response_id)
+
+            response_future = self._response_futures.get(cache_key)
+            if response_future is not None and not response_future.done():
+                # a request is waiting on this response, hand it over directly
+                self._provider.logger.debug(
+                    f"Resolving response future:\n    response_id={response_id},\n"
+                    f"    cache_key={cache_key},\n    response={raw_response}"
+                )
+                response_future.set_result(raw_response)
+                return
+
             self._provider.logger.debug(
                 f"Caching response:\n    response_id={response_id},\n"
                 f"    cache_key={cache_key},\n    response={raw_response}"
             )
             self._request_response_cache.cache(cache_key, raw_response)
 
+    def get_response_future(self, cache_key: Hashable) -> "asyncio.Future[RPCResponse]":
+        """
+        Get the future that is resolved with the response for ``cache_key`` once it
+        is received, creating it if it does not yet exist.
+        """
+        response_future = self._response_futures.get(cache_key)
+        if response_future is None:
+            response_future = asyncio.get_running_loop().create_future()
+            self._response_futures[cache_key] = response_future
+        return response_future
+
+    def pop_response_future(
+        self, cache_key: Hashable
+    ) -> Optional["asyncio.Future[RPCResponse]"]:
+        return self._response_futures.pop(cache_key, None)
+
+    def fail_response_futures(self, exception: Exception) -> None:
+        """
+        Fail the requests waiting for their responses with ``exception``, e.g. when the
+        connection is closed and the responses will not be received.
+        """
+        for response_future in self._response_futures.values():
+            if not response_future.done():
+                response_future.set_exception(exception)
+        self._response_futures.clear()
+
+    def get_batch_error_future(self) -> "asyncio.Future[RPCResponse]":
+        """
+        Get a future that is resolved with the error response to a batch rejected as
+        a whole, received while it is awaited.
+        """
+        batch_error_future = asyncio.get_running_loop().create_future()
+        self._batch_error_futures.add(batch_error_future)
+        return batch_error_future
+
+    def discard_batch_error_future(
+        self, batch_error_future: "asyncio.Future[RPCResponse]"
+    ) -> None:
+        self._batch_error_futures.discard(batch_error_future)
+
     async def pop_raw_response(
-        self, cache_key: str = None, subscription: bool = False
+        self, cache_key: Hashable = None, subscription: bool = False
     ) -> Any:
         if subscription:
             qsize = self._subscription_response_queue.qsize()
@@ -268,7 +368,7 @@ class RequestProcessor:
                 f"    raw_response={raw_response}"
             )
         else:
-            if not cache_key:
+            if cache_key is None:
                 raise Web3ValueError(
                     "Must provide cache key when popping a non-subscription response."
                 )
@@ -286,7 +386,15 @@ class RequestProcessor:
     # request processor class methods
 
     def clear_caches(self) -> None:
-        """Clear the request processor caches."""
+        """
+        Clear the request processor caches. The requests waiting for their responses
+        fail with a ``ProviderConnectionError``.
+        """
+        self.fail_response_futures(
+            ProviderConnectionError(
+                "The connection was closed before the response was received."
+            )
+        )
         self._request_information_cache.clear()
         self._request_response_cache.clear()
         self._subscription_response_queue = asyncio.Queue(
@@ -158,10 +158,7 @@ class WebSocketProvider(PersistentConnectionProvider):
             pass
         self._request_processor.clear_caches()
 
-    @async_handle_request_caching
-    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
-        request_data = self.encode_rpc_request(method, params)
-
+    async def _send_raw_request(self, request_data: bytes) -> None:
         if self._ws is None:
             raise ProviderConnectionError(
                 "Connection to websocket has not been initiated for the provider."
@@ -171,6 +168,11 @@ class WebSocketProvider(PersistentConnectionProvider):
             self._ws.send(request_data), timeout=self.request_timeout
         )
 
+    @async_handle_request_caching
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        request_data = self.encode_rpc_request(method, params)
+        await self._send_raw_request(request_data)
+
         current_request_id = json.loads(request_data)["id"]
         response = await self._get_response_for_request_id(current_request_id)
 
@@ -191,12 +193,22 @@ class WebSocketProvider(PersistentConnectionProvider):
                     await asyncio.sleep(0)
 
                     response = json.loads(raw_message)
-                    subscription = response.get("method") == "eth_subscription"
+                    # batch responses are a list of responses
+                    subscription = (
+                        isinstance(response, dict)
+                        and response.get("method") == "eth_subscription"
+                    )
                     await self._request_processor.cache_raw_response(
                         response, subscription=subscription
                     )
             except Exception as e:
                 if not self.silence_listener_task_exceptions:
+                    self._request_processor.fail_response_futures(
+                        ProviderConnectionError(
+                            "The listener background task stopped before the response "
+                            f"was received.\n    error={e.__class__.__name__}: {e}"
+                        )
+                    )
                     loop = asyncio.get_event_loop()
                     for task in asyncio.all_tasks(loop=loop):
                         task.cancel()
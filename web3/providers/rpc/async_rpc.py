@@ -4,6 +4,7 @@ from typing import (
     Any,
     Dict,
     Iterable,
+    List,
     Optional,
     Tuple,
     Union,
@@ -28,8 +29,10 @@ from web3._utils.http import (
     construct_user_agent,
 )
 from web3._utils.request import (
+    AsyncHTTPPoolStats,
     async_cache_and_return_session as _async_cache_and_return_session,
     async_make_post_request,
+    get_async_http_session_pool,
     get_default_http_endpoint,
 )
 from web3.types import (
@@ -44,6 +47,7 @@ from ..async_base import (
     AsyncJSONBaseProvider,
 )
 from .utils import (
+    AsyncHTTPPoolConfiguration,
     ExceptionRetryConfiguration,
     check_if_retry_on_failure,
 )
@@ -61,6 +65,7 @@ class AsyncHTTPProvider(AsyncJSONBaseProvider):
         exception_retry_configuration: Union[
             ExceptionRetryConfiguration, Empty
         ] = empty,
+        pool_configuration: Optional[AsyncHTTPPoolConfiguration] = None,
     ) -> None:
         if endpoint_uri is None:
             self.endpoint_uri = get_default_http_endpoint()
@@ -70,10 +75,27 @@ class AsyncHTTPProvider(AsyncJSONBaseProvider):
         self._request_kwargs = request_kwargs or {}
         self._exception_retry_configuration = exception_retry_configuration
 
+        # providers for the endpoint with an equal pool configuration share its pool
+        self._session_pool = (
+            get_async_http_session_pool(self.endpoint_uri, pool_configuration)
+            if pool_configuration is not None
+            else None
+        )
+
         super().__init__()
 
     async def cache_async_session(self, session: ClientSession) -> ClientSession:
-        return await _async_cache_and_return_session(self.endpoint_uri, session)
+        return await _async_cache_and_return_session(
+            self.endpoint_uri, session, self._session_pool
+        )
+
+    @property
+    def pool_stats(self) -> Optional[AsyncHTTPPoolStats]:
+        """
+        The utilization of the connection pool for the endpoint, if a
+        ``pool_configuration`` was set for the provider.
+        """
+        return self._session_pool.stats if self._session_pool is not None else None
 
     def __str__(self) -> str:
         return f"RPC connection {self.endpoint_uri}"
@@ -118,7 +140,10 @@ class AsyncHTTPProvider(AsyncJSONBaseProvider):
             for i in range(self.exception_retry_configuration.retries):
                 try:
                     return await async_make_post_request(
-                        self.endpoint_uri, request_data, **self.get_request_kwargs()
+                        self.endpoint_uri,
+                        request_data,
+                        session_pool=self._session_pool,
+                        **self.get_request_kwargs(),
                     )
                 except tuple(self.exception_retry_configuration.errors):
                     if i < self.exception_retry_configuration.retries - 1:
@@ -131,7 +156,10 @@ class AsyncHTTPProvider(AsyncJSONBaseProvider):
             return None
         else:
             return await async_make_post_request(
-                self.endpoint_uri, request_data, **self.get_request_kwargs()
+                self.endpoint_uri,
+                request_data,
+                session_pool=self._session_pool,
+                **self.get_request_kwargs(),
             )
 
     @async_handle_request_caching
@@ -147,3 +175,20 @@ class AsyncHTTPProvider(AsyncJSONBaseProvider):
             f"Method: {method}, Response: {response}"
         )
         return response
+
+    async def make_batch_request(
+        self, requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> Union[List[RPCResponse], RPCResponse]:
+        self.logger.debug(
+            f"Making batch request HTTP. URI: {self.endpoint_uri}, "
+            f"Batch size: {len(requests)}"
+        )
+        request_data = self.encode_batch_rpc_request(requests)
+        raw_response = await async_make_post_request(
+            self.endpoint_uri,
+            request_data,
+            session_pool=self._session_pool,
+            **self.get_request_kwargs(),
+        )
+        self.logger.debug(f"Getting batch response HTTP. URI: {self.endpoint_uri}")
+        return self.decode_batch_rpc_response(raw_response)
@@ -5,6 +5,7 @@ from typing import (
     Any,
     Dict,
     Iterable,
+    List,
     Optional,
     Tuple,
     Union,
@@ -28,6 +29,7 @@ from web3._utils.http import (
 from web3._utils.request import (
     cache_and_return_session,
     get_default_http_endpoint,
+    get_http_session_pool,
     make_post_request,
 )
 from web3.types import (
@@ -43,6 +45,7 @@ from ..base import (
 )
 from .utils import (
     ExceptionRetryConfiguration,
+    HTTPPoolConfiguration,
     check_if_retry_on_failure,
 )
 
@@ -65,6 +68,7 @@ class HTTPProvider(JSONBaseProvider):
         exception_retry_configuration: Union[
             ExceptionRetryConfiguration, Empty
         ] = empty,
+        pool_configuration: Optional[HTTPPoolConfiguration] = None,
     ) -> None:
         if endpoint_uri is None:
             self.endpoint_uri = get_default_http_endpoint()
@@ -74,8 +78,15 @@ class HTTPProvider(JSONBaseProvider):
         self._request_kwargs = request_kwargs or {}
         self._exception_retry_configuration = exception_retry_configuration
 
+        # providers for the endpoint with an equal pool configuration share its pool
+        self._session_pool = (
+            get_http_session_pool(self.endpoint_uri, pool_configuration)
+            if pool_configuration is not None
+            else None
+        )
+
         if session:
-            cache_and_return_session(self.endpoint_uri, session)
+            cache_and_return_session(self.endpoint_uri, session, self._session_pool)
 
         super().__init__()
 
@@ -126,7 +137,10 @@ class HTTPProvider(JSONBaseProvider):
             for i in range(self.exception_retry_configuration.retries):
                 try:
                     return make_post_request(
-                        self.endpoint_uri, request_data, **self.get_request_kwargs()
+                        self.endpoint_uri,
+                        request_data,
+                        session_pool=self._session_pool,
+                        **self.get_request_kwargs(),
                     )
                 except tuple(self.exception_retry_configuration.errors) as e:
                     if i < self.exception_retry_configuration.retries - 1:
@@ -139,7 +153,10 @@ class HTTPProvider(JSONBaseProvider):
             return None
         else:
             return make_post_request(
-                self.endpoint_uri, request_data, **self.get_request_kwargs()
+                self.endpoint_uri,
+                request_data,
+                session_pool=self._session_pool,
+                **self.get_request_kwargs(),
             )
 
     @handle_request_caching
@@ -155,3 +172,20 @@ class HTTPProvider(JSONBaseProvider):
             f"Method: {method}, Response: {response}"
         )
         return response
+
+    def make_batch_request(
+        self, requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> Union[List[RPCResponse], RPCResponse]:
+        self.logger.debug(
+            f"Making batch request HTTP. URI: {self.endpoint_uri}, "
+            f"Batch size: {len(requests)}"
+        )
+        request_data = self.encode_batch_rpc_request(requests)
+        raw_response = make_post_request(
+            self.endpoint_uri,
+            request_data,
+            session_pool=self._session_pool,
+            **self.get_request_kwargs(),
+        )
+        self.logger.debug(f"Getting batch response HTTP. URI: {self.endpoint_uri}")
+        return self.decode_batch_rpc_response(raw_response)
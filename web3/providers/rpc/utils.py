@@ -1,4 +1,5 @@
 from typing import (
+    Optional,
     Sequence,
     Type,
 )
@@ -6,6 +7,10 @@ from typing import (
 from pydantic import (
     BaseModel,
 )
+from requests.adapters import (
+    DEFAULT_POOLBLOCK,
+    DEFAULT_POOLSIZE,
+)
 
 from web3.types import (
     RPCEndpoint,
@@ -93,3 +98,62 @@ class ExceptionRetryConfiguration(BaseModel):
             backoff_factor=backoff_factor,
             method_allowlist=method_allowlist or REQUEST_RETRY_ALLOWLIST,
         )
+
+
+class HTTPPoolConfiguration(BaseModel):
+    """
+    Pools the connections of ``HTTPProvider`` sessions across the threads making
+    requests to an endpoint. ``pool_maxsize`` is the number of connections kept open to
+    each host, so it should be at least the number of threads making requests, unless
+    ``pool_block`` is set to wait for a free connection instead of opening a new one.
+    """
+
+    pool_connections: int
+    pool_maxsize: int
+    pool_block: bool
+    keep_alive: bool
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        keep_alive: bool = True,
+    ):
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+        )
+
+
+class AsyncHTTPPoolConfiguration(BaseModel):
+    """
+    Connection limits for the ``AsyncHTTPProvider`` sessions making requests to an
+    endpoint. ``limit`` and ``limit_per_host`` cap the connections each session opens,
+    ``0`` for no limit. ``max_in_flight_requests`` caps the requests in flight to the
+    endpoint per event loop, queueing the others, ``None`` for no limit.
+    """
+
+    limit: int
+    limit_per_host: int
+    max_in_flight_requests: Optional[int]
+    ttl_dns_cache: Optional[int]
+    keepalive_timeout: float
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        max_in_flight_requests: Optional[int] = None,
+        ttl_dns_cache: Optional[int] = 10,
+        keepalive_timeout: float = 15.0,
+    ):
+        super().__init__(
+            limit=limit,
+            limit_per_host=limit_per_host,
+            max_in_flight_requests=max_in_flight_requests,
+            ttl_dns_cache=ttl_dns_cache,
+            keepalive_timeout=keepalive_timeout,
+        )
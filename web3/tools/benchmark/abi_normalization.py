@@ -0,0 +1,107 @@
+"""
+Benchmark for the normalization of decoded contract call outputs by ``map_abi_data``.
+
+Normalizes outputs with ``BASE_RETURN_NORMALIZERS``, as contract calls and event
+decoding do, over the typed data tree ``map_abi_data`` used to build, and with the
+normalization plan compiled for the output types. The outputs range from a few
+values to arrays of nested tuples. No node is needed.
+
+    python web3/tools/benchmark/abi_normalization.py --num-calls 2000
+"""
+import argparse
+import logging
+import sys
+import timeit
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Tuple,
+)
+
+from eth_typing import (
+    TypeStr,
+)
+
+from web3._utils.abi import (
+    _map_abi_data_tree,
+    map_abi_data,
+)
+from web3._utils.normalizers import (
+    BASE_RETURN_NORMALIZERS,
+)
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-calls",
+    type=int,
+    default=2000,
+    help="The number of times each output is normalized",
+)
+
+ADDRESS = "0x5b2063246f2191f18f2675cedb8b28102e957458"
+HASH = b"\xab" * 32
+
+
+def _position(index: int) -> Tuple[Any, ...]:
+    # a lending position: owner, collateral, debt, id and its (token, amount) legs
+    return (
+        ADDRESS,
+        index * 10**18,
+        index * 10**6,
+        HASH,
+        tuple((ADDRESS, amount) for amount in range(4)),
+    )
+
+
+POSITION_TYPE = "(address,uint256,uint256,bytes32,(address,uint256)[])"
+
+OUTPUTS: Dict[str, Tuple[List[TypeStr], List[Any]]] = {
+    "(address,uint256,bool)": (
+        ["address", "uint256", "bool"],
+        [ADDRESS, 10**18, True],
+    ),
+    "uint256[100]": (["uint256[100]"], [tuple(range(100))]),
+    "address[100]": (["address[100]"], [(ADDRESS,) * 100]),
+    "position": ([POSITION_TYPE], [_position(1)]),
+    "position[50]": ([f"{POSITION_TYPE}[]"], [tuple(map(_position, range(50)))]),
+}
+
+
+def _time(num_calls: int, fn: Callable[..., Any], *args: Any) -> float:
+    # microseconds per call
+    return timeit.timeit(lambda: fn(*args), number=num_calls) / num_calls * 1_000_000
+
+
+def main(logger: logging.Logger, num_calls: int) -> None:
+    logger.info(
+        "|{:^28}|{:^16}|{:^16}|{:^10}|".format(
+            f"Output ({num_calls} calls)", "tree (us)", "plan (us)", "speedup"
+        )
+    )
+    logger.info("-" * 75)
+    for name, (types, data) in OUTPUTS.items():
+        assert map_abi_data(BASE_RETURN_NORMALIZERS, types, data) == _map_abi_data_tree(
+            BASE_RETURN_NORMALIZERS, types, data
+        )
+        tree_time = _time(
+            num_calls, _map_abi_data_tree, BASE_RETURN_NORMALIZERS, types, data
+        )
+        plan_time = _time(num_calls, map_abi_data, BASE_RETURN_NORMALIZERS, types, data)
+        logger.info(
+            "|{:^28}|{:^16.2f}|{:^16.2f}|{:^10.1f}|".format(
+                name, tree_time, plan_time, tree_time / plan_time
+            )
+        )
+    logger.info("-" * 75)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    main(logger, args.num_calls)
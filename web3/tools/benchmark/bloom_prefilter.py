@@ -0,0 +1,244 @@
+"""
+Benchmark for the ``logsBloom`` prefilter of ``LocalFilterMiddleware`` log filters.
+
+Simulates a node serving a chain where a contract emits an event in only a few of the
+blocks, answering each request after a fixed latency, and ``eth_getLogs`` requests after
+a longer one, as nodes do for the block ranges they scan. A log filter on the contract
+is polled over the whole chain, with and without the prefilter. Also times the bloom
+test alone, over the blooms of the chain.
+
+    python web3/tools/benchmark/bloom_prefilter.py --num-blocks 5000 --event-every 500
+"""
+import argparse
+import logging
+import sys
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+)
+
+from eth_typing import (
+    BlockNumber,
+)
+from hexbytes import (
+    HexBytes,
+)
+
+from web3 import (
+    Web3,
+)
+from web3._utils.bloom import (
+    LogsBloomFilter,
+    bloom_mask,
+)
+from web3.middleware import (
+    LocalFilterMiddleware,
+)
+from web3.providers.base import (
+    JSONBaseProvider,
+)
+from web3.types import (
+    RPCEndpoint,
+    RPCResponse,
+)
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-blocks",
+    type=int,
+    default=5000,
+    help="The number of blocks of the simulated chain",
+)
+parser.add_argument(
+    "--event-every",
+    type=int,
+    default=500,
+    help="The contract emits an event once every this many blocks",
+)
+parser.add_argument(
+    "--latency",
+    type=float,
+    default=0.002,
+    help="Seconds the simulated node takes to answer a request or a batch request",
+)
+parser.add_argument(
+    "--logs-latency",
+    type=float,
+    default=0.02,
+    help="Seconds the simulated node takes to answer an eth_getLogs request",
+)
+
+CONTRACT_ADDRESS = Web3.to_checksum_address("0x" + "ab" * 20)
+# the addresses of the contracts emitting events in every block
+OTHER_ADDRESSES = [Web3.to_checksum_address(f"0x{i:040x}") for i in range(1, 17)]
+
+
+def _bloom(*addresses: str) -> str:
+    bloom = 0
+    for address in addresses:
+        bloom |= bloom_mask(HexBytes(address))
+    return "0x" + bloom.to_bytes(256, "big").hex()
+
+
+def _block_hash(block_number: int) -> str:
+    return "0x" + max(block_number, 0).to_bytes(32, "big").hex()
+
+
+def _log(address: str, block_number: int) -> Dict[str, Any]:
+    return {
+        "address": address,
+        "topics": [],
+        "data": "0x",
+        "blockNumber": hex(block_number),
+        "blockHash": _block_hash(block_number),
+        "transactionHash": "0x" + "23" * 32,
+        "transactionIndex": "0x0",
+        "logIndex": "0x0",
+        "removed": False,
+    }
+
+
+class SimulatedNodeProvider(JSONBaseProvider):
+    """
+    Serves a chain of ``num_blocks`` blocks where the contract emits an event once
+    every ``event_every`` blocks, and other contracts in every block.
+    """
+
+    def __init__(
+        self, num_blocks: int, event_every: int, latency: float, logs_latency: float
+    ) -> None:
+        super().__init__()
+        self.num_blocks = num_blocks
+        self.event_every = event_every
+        self.latency = latency
+        self.logs_latency = logs_latency
+        self.requests: Dict[str, int] = {}
+        self.blooms = {
+            has_event: _bloom(*OTHER_ADDRESSES, *([CONTRACT_ADDRESS] * has_event))
+            for has_event in (False, True)
+        }
+
+    def _has_event(self, block_number: int) -> bool:
+        return block_number % self.event_every == 0
+
+    def _result(self, method: RPCEndpoint, params: Any) -> Any:
+        self.requests[method] = self.requests.get(method, 0) + 1
+        if method == "eth_blockNumber":
+            return hex(self.num_blocks - 1)
+        elif method == "eth_getBlockByNumber":
+            block_number = int(params[0], 16)
+            return {
+                "number": params[0],
+                "hash": _block_hash(block_number),
+                "parentHash": _block_hash(block_number - 1),
+                "logsBloom": self.blooms[self._has_event(block_number)],
+            }
+        elif method == "eth_getLogs":
+            from_block = int(params[0]["fromBlock"], 16)
+            to_block = int(params[0]["toBlock"], 16)
+            return [
+                _log(CONTRACT_ADDRESS, block_number)
+                for block_number in range(from_block, to_block + 1)
+                if self._has_event(block_number)
+            ]
+        raise NotImplementedError(f"Simulated node does not support {method}")
+
+    def _response(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return {
+            "jsonrpc": "2.0",
+            "id": next(self.request_counter),
+            "result": self._result(method, params),
+        }
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        time.sleep(self.logs_latency if method == "eth_getLogs" else self.latency)
+        return self._response(method, params)
+
+    def make_batch_request(
+        self, requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> List[RPCResponse]:
+        time.sleep(self.latency)
+        return [self._response(method, params) for method, params in requests]
+
+
+def run_benchmark(
+    name: str, bloom_prefilter: bool, args: argparse.Namespace
+) -> Dict[str, Any]:
+    provider = SimulatedNodeProvider(
+        args.num_blocks, args.event_every, args.latency, args.logs_latency
+    )
+    w3 = Web3(
+        provider,
+        middleware=[LocalFilterMiddleware.build(bloom_prefilter=bloom_prefilter)],
+    )
+    log_filter = w3.eth.filter({"fromBlock": 0, "address": CONTRACT_ADDRESS})
+
+    start = time.perf_counter()
+    logs = log_filter.get_new_entries()
+    return {
+        "name": name,
+        "time": time.perf_counter() - start,
+        "logs": len(logs),
+        "get_logs": provider.requests.get("eth_getLogs", 0),
+        "get_block": provider.requests.get("eth_getBlockByNumber", 0),
+    }
+
+
+def time_bloom_test(num_blocks: int) -> float:
+    bloom_filter = LogsBloomFilter(
+        CONTRACT_ADDRESS, [[HexBytes(bytes(32)), HexBytes(b"\x01" * 32)]]
+    )
+    blooms = [
+        (BlockNumber(block_number), HexBytes(_bloom(*OTHER_ADDRESSES)))
+        for block_number in range(num_blocks)
+    ]
+    start = time.perf_counter()
+    bloom_filter.matching_blocks(blooms)
+    return time.perf_counter() - start
+
+
+def main(logger: logging.Logger, args: argparse.Namespace) -> None:
+    logger.info(
+        "|{:^28}|{:^12}|{:^8}|{:^16}|{:^16}|".format(
+            f"Log filter ({args.num_blocks} blocks)",
+            "time (s)",
+            "logs",
+            "eth_getLogs",
+            "blocks fetched",
+        )
+    )
+    logger.info("-" * 86)
+    for outcome in (
+        run_benchmark("without prefilter", False, args),
+        run_benchmark("with bloom prefilter", True, args),
+    ):
+        logger.info(
+            "|{:^28}|{:^12.4f}|{:^8}|{:^16}|{:^16}|".format(
+                outcome["name"],
+                outcome["time"],
+                outcome["logs"],
+                outcome["get_logs"],
+                outcome["get_block"],
+            )
+        )
+    logger.info("-" * 86)
+
+    num_blooms = 100_000
+    seconds = time_bloom_test(num_blooms)
+    logger.info(
+        f"Bloom test: {num_blooms} blooms in {seconds:.4f}s "
+        f"({num_blooms / seconds:,.0f} blooms/s)"
+    )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    main(logger, args)
@@ -0,0 +1,109 @@
+"""
+Micro-benchmarks for the request and response cache key strategies.
+
+Compares the MD5 based ``generate_cache_key`` with ``generate_structural_cache_key``
+for the kinds of values the caches are keyed by: request ids, subscription ids and
+``(method, params)`` requests. No node is needed.
+
+    python web3/tools/benchmark/cache_keys.py --num-calls 100000
+"""
+import argparse
+import logging
+import sys
+import threading
+import timeit
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+)
+
+from web3._utils.caching import (
+    generate_cache_key,
+    generate_structural_cache_key,
+)
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-calls",
+    type=int,
+    default=100000,
+    help="The number of times each key is generated",
+)
+
+ADDRESS = "0xd3CdA913deB6f67967B99D67aCDFa1712C293601"
+BLOCK_HASH = "0x" + "ab" * 32
+
+CACHE_KEY_VALUES: Dict[str, Any] = {
+    "request id": 1234,
+    "subscription id": "0x" + "cd" * 16,
+    "eth_chainId": ("eth_chainId", []),
+    "eth_getBlockByHash": ("eth_getBlockByHash", [BLOCK_HASH, True]),
+    "eth_getBalance": ("eth_getBalance", [ADDRESS, "latest"]),
+    "eth_getLogs": (
+        "eth_getLogs",
+        [
+            {
+                "address": [ADDRESS],
+                "fromBlock": "0x1",
+                "toBlock": "0x100",
+                "topics": [BLOCK_HASH, None, [BLOCK_HASH, BLOCK_HASH]],
+            }
+        ],
+    ),
+}
+
+
+def _md5_request_cache_key(method: str, params: Any) -> Hashable:
+    # the request cache key as it was generated before cache key strategies
+    return generate_cache_key(f"{threading.get_ident()}:{(method, params)}")
+
+
+def _structural_request_cache_key(method: str, params: Any) -> Hashable:
+    return generate_structural_cache_key((threading.get_ident(), method, params))
+
+
+def _time(num_calls: int, fn: Callable[..., Any], *args: Any) -> float:
+    # microseconds per call
+    return timeit.timeit(lambda: fn(*args), number=num_calls) / num_calls * 1_000_000
+
+
+def main(logger: logging.Logger, num_calls: int) -> None:
+    logger.info(
+        "|{:^36}|{:^16}|{:^16}|{:^10}|".format(
+            f"Key ({num_calls} calls)", "md5 (us)", "structural (us)", "speedup"
+        )
+    )
+    logger.info("-" * 83)
+
+    timings = {
+        name: (
+            _time(num_calls, generate_cache_key, value),
+            _time(num_calls, generate_structural_cache_key, value),
+        )
+        for name, value in CACHE_KEY_VALUES.items()
+    }
+    for name, (method, params) in list(CACHE_KEY_VALUES.items())[2:]:
+        timings[f"request cache: {name}"] = (
+            _time(num_calls, _md5_request_cache_key, method, params),
+            _time(num_calls, _structural_request_cache_key, method, params),
+        )
+
+    for name, (md5_time, structural_time) in timings.items():
+        logger.info(
+            "|{:^36}|{:^16.3f}|{:^16.3f}|{:^10.1f}|".format(
+                name, md5_time, structural_time, md5_time / structural_time
+            )
+        )
+    logger.info("-" * 83)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    main(logger, args.num_calls)
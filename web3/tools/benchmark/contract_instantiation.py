@@ -0,0 +1,161 @@
+"""
+Benchmark for the instantiation of contract objects with large ABIs.
+
+Instantiates a contract class with an ABI of many functions and events, as diamond
+proxies have, at many addresses. The functions and events of a contract object are
+built on first access, so instantiating it is timed alone, then along with one
+call to one of its functions, and along with the access of all its functions and
+events, as building them eagerly did. No node is needed.
+
+    python web3/tools/benchmark/contract_instantiation.py --num-contracts 1000
+"""
+import argparse
+import logging
+import sys
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Type,
+    cast,
+)
+
+from eth_typing import (
+    ChecksumAddress,
+)
+
+from web3 import (
+    Web3,
+)
+from web3.contract import (
+    Contract,
+)
+from web3.types import (
+    ABI,
+)
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-contracts",
+    type=int,
+    default=1000,
+    help="The number of contract objects instantiated by each run",
+)
+parser.add_argument(
+    "--num-functions",
+    type=int,
+    default=300,
+    help="The number of functions in the contract ABI",
+)
+parser.add_argument(
+    "--num-events",
+    type=int,
+    default=50,
+    help="The number of events in the contract ABI",
+)
+
+
+def _abi(num_functions: int, num_events: int) -> ABI:
+    abi: List[Dict[str, Any]] = []
+    for i in range(num_functions):
+        abi.append(
+            {
+                "type": "function",
+                "name": f"function{i}",
+                "inputs": [{"name": "account", "type": "address"}],
+                "outputs": [{"name": "", "type": "uint256"}],
+                "stateMutability": "view",
+            }
+        )
+    for i in range(num_events):
+        abi.append(
+            {
+                "type": "event",
+                "name": f"Event{i}",
+                "inputs": [{"name": "account", "type": "address", "indexed": True}],
+                "anonymous": False,
+            }
+        )
+    return cast(ABI, abi)
+
+
+def _address(i: int) -> ChecksumAddress:
+    return Web3.to_checksum_address(f"0x{i:040x}")
+
+
+def _instantiate(contract: Type[Contract], address: ChecksumAddress) -> Any:
+    return contract(address)
+
+
+def _instantiate_and_encode_call(
+    contract: Type[Contract], address: ChecksumAddress
+) -> Any:
+    return contract(address).functions.function0(address)._encode_transaction_data()
+
+
+def _instantiate_and_access_all(
+    contract: Type[Contract], address: ChecksumAddress
+) -> Any:
+    instance = contract(address)
+    return [
+        getattr(
+            instance.functions if entry["type"] == "function" else instance.events,
+            entry["name"],
+        )
+        for entry in contract.abi
+    ]
+
+
+def _time(
+    contract: Type[Contract],
+    num_contracts: int,
+    fn: Callable[[Type[Contract], ChecksumAddress], Any],
+) -> float:
+    addresses = [_address(i) for i in range(num_contracts)]
+    start = time.perf_counter()
+    for address in addresses:
+        fn(contract, address)
+    return time.perf_counter() - start
+
+
+def main(
+    logger: logging.Logger, num_contracts: int, num_functions: int, num_events: int
+) -> None:
+    w3 = Web3()
+    contract = w3.eth.contract(abi=_abi(num_functions, num_events))
+
+    runs = {
+        "instantiate": _instantiate,
+        "instantiate, encode a call": _instantiate_and_encode_call,
+        "instantiate, access all": _instantiate_and_access_all,
+    }
+
+    logger.info(
+        "|{:^40}|{:^16}|{:^16}|".format(
+            f"{num_contracts} contracts, {num_functions} functions, "
+            f"{num_events} events",
+            "total (s)",
+            "per contract (us)",
+        )
+    )
+    logger.info("-" * 76)
+    for name, fn in runs.items():
+        total_time = _time(contract, num_contracts, fn)
+        logger.info(
+            "|{:^40}|{:^16.4f}|{:^16.1f}|".format(
+                name, total_time, total_time / num_contracts * 1_000_000
+            )
+        )
+    logger.info("-" * 76)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    main(logger, args.num_contracts, args.num_functions, args.num_events)
@@ -0,0 +1,184 @@
+"""
+Benchmark for the function ABI resolution of ``Contract.encode_abi``.
+
+Encodes calls to ``transfer`` on an ERC-20 contract class, resolving the function ABI
+with the resolver cached by the contract class, and as it was resolved before, by
+searching the ABI and checking the arguments against each candidate for every call.
+The ABI also has overloaded ``approve`` functions, resolved by their arguments either
+way. Also times the resolution alone, as most of the time of ``encode_abi`` is spent
+normalizing and encoding the arguments. No node is needed.
+
+    python web3/tools/benchmark/encode_abi.py --num-calls 100000
+"""
+import argparse
+import logging
+import sys
+import time
+from typing import (
+    Any,
+    Callable,
+    List,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from eth_typing import (
+    HexStr,
+)
+
+from web3 import (
+    Web3,
+)
+from web3._utils.contracts import (
+    encode_abi,
+    get_function_info,
+)
+from web3.contract import (
+    Contract,
+)
+from web3.types import (
+    ABI,
+)
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-calls",
+    type=int,
+    default=100000,
+    help="The number of calls encoded by each resolution strategy",
+)
+
+
+def _function(name: str, *input_types: str, output_type: str = "bool") -> Any:
+    return {
+        "type": "function",
+        "name": name,
+        "inputs": [
+            {"name": f"arg{i}", "type": input_type}
+            for i, input_type in enumerate(input_types)
+        ],
+        "outputs": [{"name": "", "type": output_type}],
+        "stateMutability": "nonpayable",
+    }
+
+
+ERC20_ABI: ABI = [
+    _function("name", output_type="string"),
+    _function("symbol", output_type="string"),
+    _function("decimals", output_type="uint8"),
+    _function("totalSupply", output_type="uint256"),
+    _function("balanceOf", "address", output_type="uint256"),
+    _function("allowance", "address", "address", output_type="uint256"),
+    _function("transfer", "address", "uint256"),
+    _function("transferFrom", "address", "address", "uint256"),
+    _function("approve", "address", "uint256"),
+    # an overload, as some tokens add to change the allowance atomically
+    _function("approve", "address", "uint256", "uint256"),
+]
+
+RECIPIENT = Web3.to_checksum_address("0x" + "ab" * 20)
+
+
+def _uncached_encode_abi(
+    contract: Type[Contract], fn_name: str, args: Sequence[Any]
+) -> HexStr:
+    # ``Contract.encode_abi`` as it resolved the function ABI before it was cached
+    fn_abi, fn_selector, fn_arguments = get_function_info(
+        fn_name, contract.w3.codec, contract_abi=contract.abi, args=args
+    )
+    return encode_abi(contract.w3, fn_abi, fn_arguments, fn_selector)
+
+
+def _transfer_call(i: int) -> Tuple[str, List[Any]]:
+    return "transfer", [RECIPIENT, i]
+
+
+def _approve_call(i: int) -> Tuple[str, List[Any]]:
+    return "approve", [RECIPIENT, i, i + 1]
+
+
+def _time(num_calls: int, fn: Callable[[int], Any]) -> float:
+    start = time.perf_counter()
+    for i in range(num_calls):
+        fn(i)
+    return time.perf_counter() - start
+
+
+def _log_timings(
+    logger: logging.Logger, name: str, uncached_time: float, cached_time: float
+) -> None:
+    logger.info(
+        "|{:^36}|{:^16.4f}|{:^16.4f}|{:^10.2f}|".format(
+            name, uncached_time, cached_time, uncached_time / cached_time
+        )
+    )
+
+
+def _log_call_timings(
+    logger: logging.Logger,
+    name: str,
+    num_calls: int,
+    contract: Type[Contract],
+    call: Callable[[int], Tuple[str, List[Any]]],
+) -> None:
+    resolver = contract._get_function_abi_resolver()
+
+    def uncached_encode_abi(i: int) -> Any:
+        return _uncached_encode_abi(contract, *call(i))
+
+    def cached_encode_abi(i: int) -> Any:
+        return contract.encode_abi(*call(i))
+
+    def uncached_resolution(i: int) -> Any:
+        fn_name, args = call(i)
+        return get_function_info(
+            fn_name, contract.w3.codec, contract_abi=contract.abi, args=args
+        )
+
+    def cached_resolution(i: int) -> Any:
+        return resolver.function_info(contract.w3.codec, *call(i))
+
+    _log_timings(
+        logger,
+        f"encode_abi: {name}",
+        _time(num_calls, uncached_encode_abi),
+        _time(num_calls, cached_encode_abi),
+    )
+    _log_timings(
+        logger,
+        f"resolution: {name}",
+        _time(num_calls, uncached_resolution),
+        _time(num_calls, cached_resolution),
+    )
+
+
+def main(logger: logging.Logger, num_calls: int) -> None:
+    w3 = Web3()
+    contract = w3.eth.contract(abi=ERC20_ABI)
+
+    calls = {"transfer": _transfer_call, "approve (overloaded)": _approve_call}
+
+    logger.info(
+        "|{:^36}|{:^16}|{:^16}|{:^10}|".format(
+            f"Function ({num_calls} calls)", "uncached (s)", "cached (s)", "speedup"
+        )
+    )
+    logger.info("-" * 83)
+    for name, call in calls.items():
+        fn_name, args = call(0)
+        assert contract.encode_abi(fn_name, args) == _uncached_encode_abi(
+            contract, fn_name, args
+        )
+        _log_call_timings(logger, name, num_calls, contract, call)
+    logger.info("-" * 83)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    main(logger, args.num_calls)
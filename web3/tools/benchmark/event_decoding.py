@@ -0,0 +1,261 @@
+"""
+Benchmark for decoding event logs.
+
+Decodes ERC-20 ``Transfer`` logs, as returned by ``eth_getLogs``, with
+``get_event_data`` as it was before event decoders, with ``get_event_data``, which
+builds an ``EventDecoder`` for every log, and with a single ``EventDecoder``, as
+``ContractEvent.process_log``, ``process_receipt`` and ``get_logs`` do, log by log and
+into columns. No node is needed.
+
+    python web3/tools/benchmark/event_decoding.py --num-logs 1000000
+"""
+import argparse
+import itertools
+import logging
+import sys
+import time
+from typing import (
+    Callable,
+    List,
+    cast,
+)
+
+from eth_abi.codec import (
+    ABICodec,
+)
+from eth_utils import (
+    event_abi_to_log_topic,
+)
+from hexbytes import (
+    HexBytes,
+)
+
+from web3 import (
+    Web3,
+)
+from web3._utils.abi import (
+    exclude_indexed_event_inputs,
+    get_indexed_event_inputs,
+    map_abi_data,
+    named_tree,
+    normalize_event_input_types,
+)
+from web3._utils.events import (
+    EventDecoder,
+    _log_entry_data_to_bytes,
+    get_event_abi_types_for_decoding,
+    get_event_data,
+)
+from web3._utils.normalizers import (
+    BASE_RETURN_NORMALIZERS,
+)
+from web3.datastructures import (
+    AttributeDict,
+)
+from web3.exceptions import (
+    InvalidEventABI,
+    LogTopicError,
+    MismatchedABI,
+)
+from web3.types import (
+    ABIEvent,
+    EventData,
+    LogReceipt,
+)
+from web3.utils import (
+    get_abi_input_names,
+)
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-logs",
+    type=int,
+    default=1000000,
+    help="The number of logs to decode",
+)
+
+TRANSFER_ABI = ABIEvent(
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "name": "from", "type": "address"},
+            {"indexed": True, "name": "to", "type": "address"},
+            {"indexed": False, "name": "value", "type": "uint256"},
+        ],
+        "name": "Transfer",
+        "type": "event",
+    }
+)
+
+
+def legacy_get_event_data(
+    abi_codec: ABICodec, event_abi: ABIEvent, log_entry: LogReceipt
+) -> EventData:
+    """
+    Decodes a log as ``get_event_data`` did before event decoders.
+    """
+    if event_abi["anonymous"]:
+        log_topics = log_entry["topics"]
+    elif not log_entry["topics"]:
+        raise MismatchedABI("Expected non-anonymous event to have 1 or more topics")
+    elif event_abi_to_log_topic(dict(event_abi)) != _log_entry_data_to_bytes(
+        log_entry["topics"][0]
+    ):
+        raise MismatchedABI("The event signature did not match the provided ABI")
+    else:
+        log_topics = log_entry["topics"][1:]
+
+    log_topics_bytes = [_log_entry_data_to_bytes(topic) for topic in log_topics]
+    log_topics_abi = get_indexed_event_inputs(event_abi)
+    log_topic_normalized_inputs = normalize_event_input_types(log_topics_abi)
+    log_topic_types = get_event_abi_types_for_decoding(log_topic_normalized_inputs)
+    log_topic_names = get_abi_input_names(ABIEvent({"inputs": log_topics_abi}))
+
+    if len(log_topics_bytes) != len(log_topic_types):
+        raise LogTopicError(
+            f"Expected {len(log_topic_types)} log topics.  Got {len(log_topics_bytes)}"
+        )
+
+    log_data = _log_entry_data_to_bytes(log_entry["data"])
+    log_data_abi = exclude_indexed_event_inputs(event_abi)
+    log_data_normalized_inputs = normalize_event_input_types(log_data_abi)
+    log_data_types = get_event_abi_types_for_decoding(log_data_normalized_inputs)
+    log_data_names = get_abi_input_names(ABIEvent({"inputs": log_data_abi}))
+
+    duplicate_names = set(log_topic_names).intersection(log_data_names)
+    if duplicate_names:
+        raise InvalidEventABI(
+            "The following argument names are duplicated "
+            f"between event inputs: '{', '.join(duplicate_names)}'"
+        )
+
+    decoded_log_data = abi_codec.decode(log_data_types, log_data)
+    normalized_log_data = map_abi_data(
+        BASE_RETURN_NORMALIZERS, log_data_types, decoded_log_data
+    )
+    named_log_data = named_tree(log_data_normalized_inputs, normalized_log_data)
+
+    decoded_topic_data = [
+        abi_codec.decode([topic_type], topic_data)[0]
+        for topic_type, topic_data in zip(log_topic_types, log_topics_bytes)
+    ]
+    normalized_topic_data = map_abi_data(
+        BASE_RETURN_NORMALIZERS, log_topic_types, decoded_topic_data
+    )
+
+    event_args = dict(
+        itertools.chain(
+            zip(log_topic_names, normalized_topic_data),
+            named_log_data.items(),
+        )
+    )
+
+    event_data = EventData(
+        args=event_args,
+        event=event_abi["name"],
+        logIndex=log_entry["logIndex"],
+        transactionIndex=log_entry["transactionIndex"],
+        transactionHash=log_entry["transactionHash"],
+        address=log_entry["address"],
+        blockHash=log_entry["blockHash"],
+        blockNumber=log_entry["blockNumber"],
+    )
+
+    if isinstance(log_entry, AttributeDict):
+        return cast(EventData, AttributeDict.recursive(event_data))
+
+    return event_data
+
+
+def build_logs(num_logs: int) -> List[LogReceipt]:
+    topic = HexBytes(event_abi_to_log_topic(dict(TRANSFER_ABI)))
+    return [
+        cast(
+            LogReceipt,
+            AttributeDict(
+                {
+                    "address": "0xd3CdA913deB6f67967B99D67aCDFa1712C293601",
+                    "topics": [
+                        topic,
+                        HexBytes((i % 1000).to_bytes(32, "big")),
+                        HexBytes((i % 997 + 1).to_bytes(32, "big")),
+                    ],
+                    "data": HexBytes(i.to_bytes(32, "big")),
+                    "blockNumber": i // 100,
+                    "transactionHash": HexBytes(i.to_bytes(32, "big")),
+                    "transactionIndex": i % 100,
+                    "blockHash": HexBytes((i // 100).to_bytes(32, "big")),
+                    "logIndex": i % 100,
+                    "removed": False,
+                }
+            ),
+        )
+        for i in range(num_logs)
+    ]
+
+
+def time_decoding(
+    decode: Callable[[LogReceipt], EventData], logs: List[LogReceipt]
+) -> float:
+    start = time.perf_counter()
+    for log in logs:
+        decode(log)
+    return time.perf_counter() - start
+
+
+def time_decoding_columns(decoder: EventDecoder, logs: List[LogReceipt]) -> float:
+    start = time.perf_counter()
+    decoder.decode_columns(logs)
+    return time.perf_counter() - start
+
+
+def main(logger: logging.Logger, num_logs: int) -> None:
+    codec = Web3().codec
+    logs = build_logs(num_logs)
+
+    decoder = EventDecoder(codec, TRANSFER_ABI)
+    assert decoder.decode(logs[-1]) == legacy_get_event_data(
+        codec, TRANSFER_ABI, logs[-1]
+    )
+    assert decoder.decode_columns(logs[-1:])["args"] == {
+        name: [value] for name, value in decoder.decode(logs[-1])["args"].items()
+    }
+
+    timings = {
+        "legacy get_event_data": time_decoding(
+            lambda log: legacy_get_event_data(codec, TRANSFER_ABI, log), logs
+        ),
+        "get_event_data": time_decoding(
+            lambda log: get_event_data(codec, TRANSFER_ABI, log), logs
+        ),
+        "EventDecoder.decode": time_decoding(decoder.decode, logs),
+        "EventDecoder.decode_columns": time_decoding_columns(decoder, logs),
+    }
+
+    logger.info(
+        "|{:^30}|{:^14}|{:^16}|{:^10}|".format(
+            f"Path ({num_logs} logs)", "total (s)", "per log (us)", "speedup"
+        )
+    )
+    logger.info("-" * 75)
+    legacy = timings["legacy get_event_data"]
+    for path, timing in timings.items():
+        logger.info(
+            "|{:^30}|{:^14}|{:^16}|{:^10}|".format(
+                path,
+                f"{timing:.2f}",
+                f"{timing / num_logs * 1_000_000:.2f}",
+                f"{legacy / timing:.2f}x",
+            )
+        )
+    logger.info("-" * 75)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    main(logger, args.num_logs)
@@ -0,0 +1,184 @@
+"""
+Benchmark for decoding large responses read by the ``AsyncIPCProvider``.
+
+Serves an ``eth_getLogs`` response of a given size over a unix socket, written in 4 KiB
+writes, and times requesting it through an ``AsyncIPCProvider``. Compares the streaming
+decoder used by the provider, at several read sizes, with the listener used before,
+which read 4 KiB at a time and re-decoded the whole buffer after every read. The time
+the legacy listener takes grows with the square of the response size, so it is only run
+for responses of up to ``--legacy-max-mb``.
+
+    python web3/tools/benchmark/ipc_decoding.py --size-mb 50
+"""
+import argparse
+import asyncio
+import json
+from json import (
+    JSONDecodeError,
+)
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import (
+    List,
+    Optional,
+)
+
+from eth_utils import (
+    to_text,
+)
+
+from web3.providers.persistent import (
+    AsyncIPCProvider,
+)
+from web3.types import (
+    RPCEndpoint,
+)
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--size-mb",
+    type=int,
+    default=50,
+    help="The size of the largest response, in MB",
+)
+parser.add_argument(
+    "--legacy-max-mb",
+    type=int,
+    default=2,
+    help="The size of the largest response to decode with the legacy listener, in MB",
+)
+
+LOG_ENTRY = {
+    "address": "0x" + "ab" * 20,
+    "topics": ["0x" + "cd" * 32, "0x" + "ef" * 32],
+    "data": "0x" + "01" * 64,
+    "blockNumber": "0x10",
+    "transactionHash": "0x" + "23" * 32,
+    "transactionIndex": "0x0",
+    "blockHash": "0x" + "45" * 32,
+    "logIndex": "0x0",
+    "removed": False,
+}
+
+
+def build_response(size: int) -> bytes:
+    entry = json.dumps(LOG_ENTRY)
+    num_entries = max(1, size // (len(entry) + 2))
+    logs = ", ".join([entry] * num_entries)
+    return f'{{"jsonrpc": "2.0", "id": 0, "result": [{logs}]}}\n'.encode()
+
+
+class LegacyAsyncIPCProvider(AsyncIPCProvider):
+    """
+    Decodes responses as the ``AsyncIPCProvider`` did before the streaming decoder.
+    """
+
+    async def _message_listener(self) -> None:
+        raw_message = ""
+        decoder = json.JSONDecoder()
+
+        while True:
+            await asyncio.sleep(0)
+            raw_message += to_text(await self._reader.read(4096)).lstrip()
+
+            while raw_message:
+                try:
+                    response, pos = decoder.raw_decode(raw_message)
+                except JSONDecodeError:
+                    break
+
+                await self._request_processor.cache_raw_response(response)
+                raw_message = raw_message[pos:].lstrip()
+
+
+async def time_request(
+    ipc_path: str, response: bytes, provider: AsyncIPCProvider
+) -> float:
+    async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await reader.read(1024)
+        for i in range(0, len(response), 4096):
+            writer.write(response[i : i + 4096])
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_unix_server(serve, ipc_path)
+    try:
+        await provider.connect()
+        start = time.perf_counter()
+        await provider.make_request(RPCEndpoint("eth_getLogs"), [{}])
+        elapsed = time.perf_counter() - start
+        await provider.disconnect()
+    finally:
+        server.close()
+        await server.wait_closed()
+        os.remove(ipc_path)
+    return elapsed
+
+
+async def run_benchmark(
+    size: int, legacy: bool, read_buffer_limits: List[int]
+) -> List[Optional[float]]:
+    response = build_response(size)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        ipc_path = os.path.join(tmp_dir, "benchmark.ipc")
+        timings: List[Optional[float]] = [
+            await time_request(
+                ipc_path,
+                response,
+                LegacyAsyncIPCProvider(ipc_path, request_timeout=600),
+            )
+            if legacy
+            else None
+        ]
+        for read_buffer_limit in read_buffer_limits:
+            timings.append(
+                await time_request(
+                    ipc_path,
+                    response,
+                    AsyncIPCProvider(
+                        ipc_path,
+                        read_buffer_limit=read_buffer_limit,
+                        request_timeout=600,
+                    ),
+                )
+            )
+    return timings
+
+
+def main(logger: logging.Logger, size_mb: int, legacy_max_mb: int) -> None:
+    read_buffer_limits = [2**16, 2**20, 2**22]
+    logger.info(
+        "|{:^12}|{:^14}|{:^20}|{:^20}|{:^20}|".format(
+            "Size (MB)",
+            "legacy (s)",
+            *[f"{limit // 1024} KiB reads (s)" for limit in read_buffer_limits],
+        )
+    )
+    logger.info("-" * 92)
+
+    sizes_mb = sorted({size for size in (1, 2, 10, size_mb) if size <= size_mb})
+    for size in sizes_mb:
+        timings = asyncio.run(
+            run_benchmark(size * 2**20, size <= legacy_max_mb, read_buffer_limits)
+        )
+        logger.info(
+            "|{:^12}|{:^14}|{:^20}|{:^20}|{:^20}|".format(
+                size,
+                *["-" if timing is None else f"{timing:.4f}" for timing in timings],
+            )
+        )
+    logger.info("-" * 92)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+    logging.getLogger("web3").setLevel(logging.WARNING)
+
+    main(logger, args.size_mb, args.legacy_max_mb)
@@ -0,0 +1,182 @@
+"""
+Benchmark for waiting on responses over a persistent connection.
+
+Runs many concurrent requests through a ``WebSocketProvider`` backed by an in-memory
+socket that answers every request after a fixed delay, so no node is needed. Compares
+the response futures used by the provider with the ``asyncio.sleep(0)`` polling of the
+response cache that was used before, reporting CPU time and request latency.
+
+    python web3/tools/benchmark/persistent_connection.py --num-requests 1000
+"""
+import argparse
+import asyncio
+from collections import (
+    deque,
+)
+import json
+import logging
+import sys
+import time
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Type,
+)
+
+from web3.providers.persistent import (
+    WebSocketProvider,
+)
+from web3.types import (
+    RPCEndpoint,
+    RPCId,
+    RPCResponse,
+)
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-requests",
+    type=int,
+    default=1000,
+    help="The number of concurrent requests to make",
+)
+parser.add_argument(
+    "--response-delay",
+    type=float,
+    default=0.01,
+    help="Seconds the in-memory socket waits before answering a request",
+)
+
+
+class InMemoryWebSocket:
+    """
+    Stand-in for a websocket connection that answers each request with a result after
+    ``response_delay`` seconds.
+    """
+
+    closed = False
+
+    def __init__(self, response_delay: float) -> None:
+        self.response_delay = response_delay
+        self._messages: "asyncio.Queue[str]" = asyncio.Queue()
+
+    async def send(self, request_data: bytes) -> None:
+        request = json.loads(request_data)
+        response = json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": "0x1"})
+        asyncio.get_running_loop().call_later(
+            self.response_delay, self._messages.put_nowait, response
+        )
+
+    def __aiter__(self) -> "InMemoryWebSocket":
+        return self
+
+    async def __anext__(self) -> str:
+        return await self._messages.get()
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class PollingWebSocketProvider(WebSocketProvider):
+    """
+    Waits for responses by polling the response cache with ``asyncio.sleep(0)``, the
+    strategy used before response futures. Kept as the baseline for this benchmark.
+    """
+
+    async def _get_response_for_request_id(
+        self, request_id: RPCId, timeout: Optional[float] = None
+    ) -> RPCResponse:
+        request_cache_key = self.cache_key_fn(request_id)
+
+        async def _match_response_id_to_request_id() -> RPCResponse:
+            while True:
+                await asyncio.sleep(0)
+                if request_cache_key in self._request_processor._request_response_cache:
+                    return await self._request_processor.pop_raw_response(
+                        cache_key=request_cache_key,
+                    )
+
+        return await asyncio.wait_for(
+            _match_response_id_to_request_id(), timeout or self.request_timeout
+        )
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * percentile))
+    return sorted_values[index]
+
+
+async def run_benchmark(
+    provider_class: Type[WebSocketProvider], num_requests: int, response_delay: float
+) -> Dict[str, Any]:
+    provider = provider_class("ws://benchmark")
+    provider._ws = InMemoryWebSocket(response_delay)  # type: ignore
+    provider._message_listener_task = asyncio.create_task(provider._message_listener())
+    latencies: Deque[float] = deque()
+
+    async def _timed_request() -> None:
+        start = time.perf_counter()
+        await provider.make_request(RPCEndpoint("eth_blockNumber"), [])
+        latencies.append(time.perf_counter() - start)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    await asyncio.gather(*(_timed_request() for _ in range(num_requests)))
+    cpu_time = time.process_time() - cpu_start
+    wall_time = time.perf_counter() - wall_start
+
+    provider._message_listener_task.cancel()
+    try:
+        await provider._message_listener_task
+    except asyncio.CancelledError:
+        pass
+
+    sorted_latencies = sorted(latencies)
+    return {
+        "name": provider_class.__name__,
+        "wall": wall_time,
+        "cpu": cpu_time,
+        "p50": _percentile(sorted_latencies, 0.50),
+        "p99": _percentile(sorted_latencies, 0.99),
+    }
+
+
+def main(logger: logging.Logger, num_requests: int, response_delay: float) -> None:
+    logger.info(
+        "|{:^28}|{:^14}|{:^14}|{:^14}|{:^14}|".format(
+            f"Provider ({num_requests} requests)",
+            "wall (s)",
+            "cpu (s)",
+            "p50 (ms)",
+            "p99 (ms)",
+        )
+    )
+    logger.info("-" * 90)
+    for provider_class in (PollingWebSocketProvider, WebSocketProvider):
+        outcome = asyncio.run(
+            run_benchmark(provider_class, num_requests, response_delay)
+        )
+        logger.info(
+            "|{:^28}|{:^14.4f}|{:^14.4f}|{:^14.2f}|{:^14.2f}|".format(
+                outcome["name"],
+                outcome["wall"],
+                outcome["cpu"],
+                outcome["p50"] * 1000,
+                outcome["p99"] * 1000,
+            )
+        )
+    logger.info("-" * 90)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+    # keep the provider's own logging out of the report
+    logging.getLogger("web3").setLevel(logging.WARNING)
+
+    main(logger, args.num_requests, args.response_delay)
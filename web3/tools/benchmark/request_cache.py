@@ -0,0 +1,187 @@
+"""
+Warm-start benchmark for the request cache backends.
+
+Simulates a backfill worker that fetches finalized blocks and their receipts from a
+node that answers each request after a fixed latency, so no node is needed. The worker
+is run twice, with a new provider the second time to simulate a restart. The in-memory
+``SimpleCache`` starts cold after the restart, while the ``SQLiteCache`` serves the
+finalized responses cached on disk by the first run.
+
+    python web3/tools/benchmark/request_cache.py --num-blocks 200
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    cast,
+)
+
+from hexbytes import (
+    HexBytes,
+)
+
+from web3 import (
+    Web3,
+)
+from web3._utils.caching import (
+    handle_request_caching,
+)
+from web3.providers.base import (
+    JSONBaseProvider,
+)
+from web3.types import (
+    RPCEndpoint,
+    RPCResponse,
+)
+from web3.utils import (
+    CacheBackend,
+    SimpleCache,
+    SQLiteCache,
+)
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-blocks",
+    type=int,
+    default=200,
+    help="The number of blocks to backfill, along with one receipt per block",
+)
+parser.add_argument(
+    "--latency",
+    type=float,
+    default=0.002,
+    help="Seconds the simulated node takes to answer a request",
+)
+
+HEAD_BLOCK_NUMBER = 1_000_000
+
+
+def _block_hash(block_number: int) -> str:
+    return "0x" + block_number.to_bytes(32, "big").hex()
+
+
+def _block(block_number: int) -> Dict[str, Any]:
+    return {
+        "number": hex(block_number),
+        "hash": _block_hash(block_number),
+        "parentHash": _block_hash(block_number - 1),
+        "transactions": [_block_hash(block_number)],
+    }
+
+
+class SimulatedNodeProvider(JSONBaseProvider):
+    """
+    Answers block and receipt requests after ``latency`` seconds, counting the
+    requests that reach the node.
+    """
+
+    def __init__(self, latency: float, request_cache: CacheBackend) -> None:
+        super().__init__()
+        self.latency = latency
+        self.node_requests = 0
+        self.cache_allowed_requests = True
+        self.request_cache = request_cache
+
+    @handle_request_caching
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        time.sleep(self.latency)
+        self.node_requests += 1
+
+        result: Any
+        if method == "eth_getBlockByNumber":
+            block_id = params[0]
+            block_number = (
+                HEAD_BLOCK_NUMBER if block_id == "latest" else int(block_id, 16)
+            )
+            result = _block(block_number)
+        elif method == "eth_getTransactionReceipt":
+            result = {
+                "blockNumber": hex(int(params[0], 16)),
+                "transactionHash": params[0],
+                "status": "0x1",
+                "logs": [],
+            }
+        else:
+            raise NotImplementedError(f"Simulated node does not support {method}")
+        return {"jsonrpc": "2.0", "id": next(self.request_counter), "result": result}
+
+
+def backfill(w3: Web3, num_blocks: int) -> None:
+    start_block = HEAD_BLOCK_NUMBER - 10_000
+    for block_number in range(start_block, start_block + num_blocks):
+        block = w3.eth.get_block(block_number)
+        for tx_hash in block["transactions"]:
+            w3.eth.get_transaction_receipt(cast(HexBytes, tx_hash))
+
+
+def run_benchmark(
+    name: str,
+    make_cache: Callable[[], CacheBackend],
+    num_blocks: int,
+    latency: float,
+) -> Dict[str, Any]:
+    outcome: Dict[str, Any] = {"name": name}
+    for run in ("cold", "warm"):
+        provider = SimulatedNodeProvider(latency, make_cache())
+        w3 = Web3(provider)
+
+        start = time.perf_counter()
+        backfill(w3, num_blocks)
+        outcome[run] = time.perf_counter() - start
+        outcome[f"{run}_requests"] = provider.node_requests
+
+        if isinstance(provider.request_cache, SQLiteCache):
+            provider.request_cache.close()
+    return outcome
+
+
+def main(logger: logging.Logger, num_blocks: int, latency: float) -> None:
+    logger.info(
+        "|{:^24}|{:^14}|{:^14}|{:^16}|{:^16}|".format(
+            f"Cache ({num_blocks} blocks)",
+            "cold (s)",
+            "warm (s)",
+            "cold requests",
+            "warm requests",
+        )
+    )
+    logger.info("-" * 90)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_path = os.path.join(tmp_dir, "request_cache.sqlite")
+        outcomes = (
+            run_benchmark(
+                "SimpleCache", lambda: SimpleCache(100_000), num_blocks, latency
+            ),
+            run_benchmark(
+                "SQLiteCache", lambda: SQLiteCache(cache_path), num_blocks, latency
+            ),
+        )
+
+    for outcome in outcomes:
+        logger.info(
+            "|{:^24}|{:^14.4f}|{:^14.4f}|{:^16}|{:^16}|".format(
+                outcome["name"],
+                outcome["cold"],
+                outcome["warm"],
+                outcome["cold_requests"],
+                outcome["warm_requests"],
+            )
+        )
+    logger.info("-" * 90)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    main(logger, args.num_blocks, args.latency)
@@ -12,8 +12,19 @@ from .async_exception_handling import (  # NOQA
     async_handle_offchain_lookup,
 )
 from .caching import (  # NOQA
+    CacheBackend,
+    CacheStats,
     SimpleCache,
+    SQLiteCache,
 )
 from .exception_handling import (  # NOQA
     handle_offchain_lookup,
 )
+from .log_scanning import (  # NOQA
+    AsyncLogScanner,
+    EventCheckpoint,
+    LogScanner,
+    LogScanStats,
+    get_checkpoint,
+    set_checkpoint,
+)
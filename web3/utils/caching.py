@@ -1,53 +1,416 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
 from collections import (
     OrderedDict,
 )
+import hashlib
+import heapq
+import itertools
+import json
+from os import (
+    PathLike,
+)
+import sqlite3
+import threading
+import time
 from typing import (
     Any,
     Dict,
+    Hashable,
     List,
+    NamedTuple,
     Optional,
     Tuple,
+    Union,
+)
+
+from web3.exceptions import (
+    Web3ValueError,
 )
 
 
-class SimpleCache:
-    def __init__(self, size: int = 100):
+class CacheBackend(ABC):
+    """
+    The interface for the caches used by web3.py, e.g. a provider's request cache.
+    """
+
+    # Whether entries outlive the process. Only responses that can never change are
+    # cached in persistent backends, and their keys are not scoped to a thread.
+    is_persistent: bool = False
+
+    @abstractmethod
+    def cache(
+        self, key: Hashable, value: Any
+    ) -> Tuple[Any, Optional[Dict[Hashable, Any]]]:
+        """
+        Cache ``value`` by ``key``. Returns the value along with the items evicted to
+        make room for it, if any.
+        """
+
+    @abstractmethod
+    def get_cache_entry(self, key: Hashable) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    @abstractmethod
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        pass
+
+    @abstractmethod
+    def pop(self, key: Hashable) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    def __contains__(self, key: Hashable) -> bool:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+LRU = "lru"
+LFU = "lfu"
+EVICTION_POLICIES = (LRU, LFU)
+
+_MISSING = object()
+
+
+class SimpleCache(CacheBackend):
+    """
+    An in-memory cache of up to ``size`` entries. When full, the least recently used
+    entry is evicted, or with ``eviction_policy="lfu"`` the least frequently used
+    entry, with ties broken by recency. Entries expire ``ttl`` seconds after they are
+    cached, if set, and expired entries are evicted when they are looked up or to make
+    room for new entries.
+
+    Caching a new value for a key that is already cached replaces the value in place,
+    only looking the entry up counts as a use. The cache is safe to use across threads.
+    """
+
+    def __init__(
+        self,
+        size: int = 100,
+        eviction_policy: str = LRU,
+        ttl: Optional[float] = None,
+    ):
+        if eviction_policy not in EVICTION_POLICIES:
+            raise Web3ValueError(
+                f"Unknown eviction policy {eviction_policy!r}, expected one of "
+                f"{EVICTION_POLICIES}"
+            )
+
         self._size = size
-        self._data: OrderedDict[str, Any] = OrderedDict()
+        self._eviction_policy = eviction_policy
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        # expiry times, only for entries cached with a ttl, and a heap of them to find
+        # expired entries by. Entries in the heap are stale once their key is removed
+        # or cached again, and are skipped.
+        self._expires_at: Dict[Hashable, float] = {}
+        self._expiry_heap: List[Tuple[float, int, Hashable]] = []
+        self._expiry_counter = itertools.count()
+        # LFU: the use count of each key and the keys for each count, in LRU order
+        self._frequencies: Dict[Hashable, int] = {}
+        self._frequency_keys: Dict[int, OrderedDict[Hashable, None]] = {}
+        self._min_frequency = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(self._hits, self._misses, self._evictions, self._expirations)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = self._misses = self._evictions = self._expirations = 0
 
-    def cache(self, key: str, value: Any) -> Tuple[Any, Dict[str, Any]]:
+    def cache(
+        self, key: Hashable, value: Any, ttl: Optional[float] = None
+    ) -> Tuple[Any, Optional[Dict[Hashable, Any]]]:
+        """
+        Cache ``value`` by ``key``, expiring after ``ttl`` seconds if given, or after
+        the cache's ttl otherwise.
+        """
         evicted_items = {}
-        # If the key is already in the OrderedDict just update it
-        # and don't evict any values. Ideally, we could still check to see
-        # if there are too many items in the OrderedDict but that may rearrange
-        # the order it should be unlikely that the size could grow over the limit
-        if key not in self._data:
-            while len(self._data) >= self._size:
-                k, v = self._data.popitem(last=False)
-                evicted_items[k] = v
-        self._data[key] = value
+        ttl = self._ttl if ttl is None else ttl
+        with self._lock:
+            if key not in self._data:
+                while len(self._data) >= self._size:
+                    k, v = self._pop_eviction_candidate()
+                    evicted_items[k] = v
+                    self._evictions += 1
+                if self._eviction_policy == LFU:
+                    self._add_frequency(key, 1)
+                    self._min_frequency = 1
+            self._data[key] = value
+
+            if ttl is not None:
+                expires_at = time.monotonic() + ttl
+                self._expires_at[key] = expires_at
+                self._push_expiry(key, expires_at)
+            elif self._expires_at:
+                self._expires_at.pop(key, None)
 
         # Return the cached value along with the evicted items at the same time. No
         # need to reach back into the cache to grab the value.
         return value, evicted_items or None
 
-    def get_cache_entry(self, key: str) -> Optional[Any]:
-        return self._data[key] if key in self._data else None
+    def get_cache_entry(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self._misses += 1
+                return None
+
+            if self._expires_at and self._is_expired(key, time.monotonic()):
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            if self._eviction_policy == LRU:
+                self._data.move_to_end(key)
+            else:
+                self._increment_frequency(key)
+            self._hits += 1
+            return value
 
     def clear(self) -> None:
-        self._data.clear()
+        with self._lock:
+            self._data.clear()
+            self._expires_at.clear()
+            self._expiry_heap.clear()
+            self._frequencies.clear()
+            self._frequency_keys.clear()
+            self._min_frequency = 0
 
-    def items(self) -> List[Tuple[str, Any]]:
-        return list(self._data.items())
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        with self._lock:
+            return list(self._data.items())
 
-    def pop(self, key: str) -> Optional[Any]:
-        if key not in self._data:
-            return None
+    def pop(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            if key not in self._data:
+                return None
+            return self._remove(key)
 
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data and not (
+                self._expires_at and self._is_expired(key, time.monotonic())
+            )
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    # -- the methods below are called with the lock held -- #
+
+    def _push_expiry(self, key: Hashable, expires_at: float) -> None:
+        if len(self._expiry_heap) > 2 * len(self._expires_at) + 64:
+            # drop the stale entries, which are left behind by removed and re-cached
+            # keys
+            self._expiry_heap = [
+                entry
+                for entry in self._expiry_heap
+                if self._expires_at.get(entry[2]) == entry[0]
+            ]
+            heapq.heapify(self._expiry_heap)
+        # the counter breaks ties between equal expiry times, as keys may not be
+        # comparable
+        heapq.heappush(self._expiry_heap, (expires_at, next(self._expiry_counter), key))
+
+    def _is_expired(self, key: Hashable, now: float) -> bool:
+        expires_at = self._expires_at.get(key)
+        return expires_at is not None and now >= expires_at
+
+    def _remove(self, key: Hashable) -> Any:
+        self._expires_at.pop(key, None)
+        if self._eviction_policy == LFU:
+            self._remove_frequency(key)
         return self._data.pop(key)
 
-    def __contains__(self, key: str) -> bool:
-        return key in self._data
+    def _pop_eviction_candidate(self) -> Tuple[Hashable, Any]:
+        if self._expiry_heap:
+            now = time.monotonic()
+            while self._expiry_heap and self._expiry_heap[0][0] <= now:
+                expires_at, _, key = heapq.heappop(self._expiry_heap)
+                if self._expires_at.get(key) == expires_at:
+                    return key, self._remove(key)
+
+        if self._eviction_policy == LRU:
+            key, value = self._data.popitem(last=False)
+            self._expires_at.pop(key, None)
+            return key, value
+
+        if self._min_frequency not in self._frequency_keys:
+            # the least frequently used entries were popped
+            self._min_frequency = min(self._frequency_keys)
+        key = next(iter(self._frequency_keys[self._min_frequency]))
+        return key, self._remove(key)
+
+    def _add_frequency(self, key: Hashable, frequency: int) -> None:
+        self._frequencies[key] = frequency
+        keys = self._frequency_keys.get(frequency)
+        if keys is None:
+            keys = self._frequency_keys[frequency] = OrderedDict()
+        keys[key] = None
+
+    def _remove_frequency(self, key: Hashable) -> int:
+        frequency = self._frequencies.pop(key)
+        keys = self._frequency_keys[frequency]
+        del keys[key]
+        if not keys:
+            del self._frequency_keys[frequency]
+        return frequency
+
+    def _increment_frequency(self, key: Hashable) -> None:
+        frequency = self._remove_frequency(key)
+        if frequency == self._min_frequency and frequency not in self._frequency_keys:
+            self._min_frequency += 1
+        self._add_frequency(key, frequency + 1)
+
+
+class SQLiteCache(CacheBackend):
+    """
+    A cache stored in a local SQLite database, which survives restarts and can be
+    shared by the processes on one host. Values must be JSON serializable. The least
+    recently used entries are evicted once the cache holds more than ``size`` entries.
+
+    Keys are stored as a hash of their ``repr``, so ``items()`` returns the hashed keys.
+    To keep hits cheap, the time an entry was last used is only updated once every
+    ``ACCESS_RESOLUTION`` seconds, and the size limit is enforced every 1% of ``size``
+    entries cached.
+    """
+
+    is_persistent = True
+    ACCESS_RESOLUTION = 1.0
+
+    def __init__(
+        self,
+        path: Union[str, "PathLike[str]"],
+        size: int = 100_000,
+        timeout: float = 30.0,
+    ) -> None:
+        self._size = size
+        self._evict_every = max(1, size // 100)
+        self._cached_since_eviction = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=timeout, check_same_thread=False, isolation_level=None
+        )
+        with self._lock:
+            # write-ahead logging allows readers in other processes while writing
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)"
+            )
+
+    @staticmethod
+    def _hash_key(key: Hashable) -> str:
+        if isinstance(key, str):
+            return key
+        return hashlib.md5(repr(key).encode()).hexdigest()
+
+    def cache(self, key: Hashable, value: Any) -> Tuple[Any, None]:
+        serialized_value = json.dumps(value)
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache (key, value, accessed_at) "
+                "VALUES (?, ?, ?)",
+                (self._hash_key(key), serialized_value, time.time()),
+            )
+            self._cached_since_eviction += 1
+            if self._cached_since_eviction >= self._evict_every:
+                self._evict()
+        # evicted entries are not read back from the database to be returned
+        return value, None
+
+    def _evict(self) -> None:
+        self._cached_since_eviction = 0
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM cache").fetchone()
+        if count > self._size:
+            self._connection.execute(
+                "DELETE FROM cache WHERE key IN "
+                "(SELECT key FROM cache ORDER BY accessed_at LIMIT ?)",
+                (count - self._size,),
+            )
+
+    def get_cache_entry(self, key: Hashable) -> Optional[Any]:
+        hashed_key = self._hash_key(key)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, accessed_at FROM cache WHERE key = ?", (hashed_key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            now = time.time()
+            if now - row[1] >= self.ACCESS_RESOLUTION:
+                self._connection.execute(
+                    "UPDATE cache SET accessed_at = ? WHERE key = ?", (now, hashed_key)
+                )
+        return json.loads(row[0])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM cache")
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT key, value FROM cache ORDER BY accessed_at"
+            ).fetchall()
+        return [(key, json.loads(value)) for key, value in rows]
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        hashed_key = self._hash_key(key)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM cache WHERE key = ?", (hashed_key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("DELETE FROM cache WHERE key = ?", (hashed_key,))
+        return json.loads(row[0])
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM cache WHERE key = ?", (self._hash_key(key),)
+            ).fetchone()
+        return row is not None
 
     def __len__(self) -> int:
-        return len(self._data)
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
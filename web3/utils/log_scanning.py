@@ -0,0 +1,417 @@
+import asyncio
+from collections import (
+    deque,
+)
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
+import re
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Deque,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    cast,
+)
+
+from eth_typing import (
+    BlockNumber,
+)
+from eth_utils import (
+    is_integer,
+)
+from hexbytes import (
+    HexBytes,
+)
+
+from web3.exceptions import (
+    Web3RPCError,
+    Web3ValueError,
+)
+from web3.types import (
+    BlockIdentifier,
+    FilterParams,
+    LogReceipt,
+)
+from web3.utils.caching import (
+    CacheBackend,
+)
+
+if TYPE_CHECKING:
+    from web3 import (  # noqa: F401
+        AsyncWeb3,
+        Web3,
+    )
+
+
+# the errors nodes and node providers return for ``eth_getLogs`` requests over block
+# ranges holding too many logs, or spanning too many blocks
+LOG_RANGE_ERROR_PATTERN = re.compile(
+    r"more than \d+ results"
+    r"|too many (?:logs|results|blocks)"
+    r"|response size"
+    r"|range (?:is )?too (?:large|wide|big)"
+    r"|exceed(?:s|ed)? (?:the )?max"
+    r"|limited to"
+    r"|query timeout",
+    re.IGNORECASE,
+)
+LIMIT_EXCEEDED_ERROR_CODE = -32005
+
+
+def is_log_range_error(exception: BaseException) -> bool:
+    """
+    Whether ``exception`` was raised for an ``eth_getLogs`` request over a block range
+    holding too many logs, or spanning too many blocks, for the node to return.
+    """
+    if not isinstance(exception, Web3RPCError):
+        return False
+
+    error = (exception.rpc_response or {}).get("error")
+    if isinstance(error, dict) and error.get("code") == LIMIT_EXCEEDED_ERROR_CODE:
+        return True
+    return LOG_RANGE_ERROR_PATTERN.search(exception.message) is not None
+
+
+class LogScanStats(NamedTuple):
+    # ``eth_getLogs`` requests made
+    requests: int
+    # requests whose block range was split in two after a range error
+    range_errors: int
+    # the number of blocks the next request spans
+    block_range: int
+
+
+class EventCheckpoint(NamedTuple):
+    # the last block whose logs were fully processed, and its hash
+    block_number: BlockNumber
+    block_hash: HexBytes
+
+
+def get_checkpoint(store: CacheBackend, key: str) -> Optional[EventCheckpoint]:
+    """
+    Return the checkpoint saved in ``store`` by ``key``, if any.
+    """
+    checkpoint = store.get_cache_entry(key)
+    if checkpoint is None:
+        return None
+    return EventCheckpoint(
+        BlockNumber(checkpoint["block_number"]), HexBytes(checkpoint["block_hash"])
+    )
+
+
+def set_checkpoint(store: CacheBackend, key: str, checkpoint: EventCheckpoint) -> None:
+    """
+    Save ``checkpoint`` in ``store`` by ``key``, as JSON serializable values so that
+    it can be saved in a persistent store, e.g. a ``SQLiteCache``.
+    """
+    store.cache(
+        key,
+        {
+            "block_number": checkpoint.block_number,
+            "block_hash": checkpoint.block_hash.to_0x_hex(),
+        },
+    )
+
+
+class _BaseLogScanner:
+    def __init__(
+        self,
+        block_range: int = 50,
+        min_block_range: int = 1,
+        max_block_range: int = 10_000,
+        max_concurrent_requests: int = 4,
+        target_logs_per_request: int = 1_000,
+    ) -> None:
+        if not 1 <= min_block_range <= block_range <= max_block_range:
+            raise Web3ValueError(
+                "Block ranges must satisfy "
+                "1 <= min_block_range <= block_range <= max_block_range"
+            )
+        if max_concurrent_requests < 1:
+            raise Web3ValueError("max_concurrent_requests must be at least 1")
+
+        self.block_range = block_range
+        self.min_block_range = min_block_range
+        self.max_block_range = max_block_range
+        self.max_concurrent_requests = max_concurrent_requests
+        self.target_logs_per_request = target_logs_per_request
+        # below the smallest block range the node rejected, to not grow back past it
+        self._block_range_limit = max_block_range
+        self._requests = 0
+        self._range_errors = 0
+
+    @property
+    def stats(self) -> LogScanStats:
+        return LogScanStats(self._requests, self._range_errors, self.block_range)
+
+    def reset_stats(self) -> None:
+        self._requests = self._range_errors = 0
+
+    def _next_range(
+        self, from_block: BlockNumber, to_block: BlockNumber
+    ) -> Tuple[BlockNumber, BlockNumber]:
+        return from_block, BlockNumber(min(from_block + self.block_range - 1, to_block))
+
+    def _adapt_block_range(
+        self, from_block: BlockNumber, to_block: BlockNumber, num_logs: int
+    ) -> None:
+        # halve the block range of dense ranges and double that of sparse ones
+        if num_logs > self.target_logs_per_request:
+            self.block_range = max(self.min_block_range, self.block_range // 2)
+        elif (
+            num_logs * 2 <= self.target_logs_per_request
+            and to_block - from_block + 1 >= self.block_range
+        ):
+            self.block_range = min(self._block_range_limit, self.block_range * 2)
+
+    def _split_range(
+        self, from_block: BlockNumber, to_block: BlockNumber, exception: Exception
+    ) -> Tuple[Tuple[BlockNumber, BlockNumber], Tuple[BlockNumber, BlockNumber]]:
+        if from_block == to_block:
+            # the logs of a single block cannot be split any further
+            raise exception
+
+        self._range_errors += 1
+        middle = BlockNumber((from_block + to_block) // 2)
+        self._block_range_limit = max(
+            self.min_block_range,
+            min(self._block_range_limit, to_block - from_block),
+        )
+        self.block_range = max(
+            self.min_block_range, min(self.block_range, middle - from_block + 1)
+        )
+        return (from_block, middle), (BlockNumber(middle + 1), to_block)
+
+
+def _validate_filter_params(filter_params: FilterParams) -> None:
+    if "blockHash" in filter_params:
+        raise Web3ValueError(
+            "The logs of a block hash cannot be scanned, use ``eth.get_logs`` instead"
+        )
+
+
+def _filter_params_for_range(
+    filter_params: FilterParams, from_block: BlockNumber, to_block: BlockNumber
+) -> FilterParams:
+    return cast(
+        FilterParams, {**filter_params, "fromBlock": from_block, "toBlock": to_block}
+    )
+
+
+class LogScanner(_BaseLogScanner):
+    """
+    Fetches the logs matching a filter over a range of blocks with ``eth_getLogs``
+    requests over sub-ranges, up to ``max_concurrent_requests`` of them at a time.
+
+    The block range of the requests adapts to the logs they return: it is halved
+    when a request returns more than ``target_logs_per_request`` logs and doubled when
+    a request returns fewer than half as many, within ``min_block_range`` and
+    ``max_block_range``. A request rejected by the node because its range holds too
+    many logs, or spans too many blocks, is split in two, and the block range is kept
+    below that of the rejected request from then on.
+
+    The logs are yielded in the order of the blocks, as the requests complete.
+    """
+
+    def __init__(
+        self,
+        w3: "Web3",
+        block_range: int = 50,
+        min_block_range: int = 1,
+        max_block_range: int = 10_000,
+        max_concurrent_requests: int = 4,
+        target_logs_per_request: int = 1_000,
+    ) -> None:
+        super().__init__(
+            block_range,
+            min_block_range,
+            max_block_range,
+            max_concurrent_requests,
+            target_logs_per_request,
+        )
+        self.w3 = w3
+
+    def _get_block_number(self, block_identifier: BlockIdentifier) -> BlockNumber:
+        if is_integer(block_identifier):
+            return cast(BlockNumber, block_identifier)
+        elif block_identifier == "earliest":
+            return BlockNumber(0)
+        return self.w3.eth.get_block(block_identifier)["number"]
+
+    def scan(self, filter_params: FilterParams) -> Iterator[LogReceipt]:
+        """
+        Yield the logs matching ``filter_params``, from its ``fromBlock`` to its
+        ``toBlock``, both ``"latest"`` if not set.
+        """
+        _validate_filter_params(filter_params)
+        next_block = self._get_block_number(filter_params.get("fromBlock", "latest"))
+        to_block = self._get_block_number(filter_params.get("toBlock", "latest"))
+
+        executor = ThreadPoolExecutor(
+            self.max_concurrent_requests, thread_name_prefix="web3-log-scanner"
+        )
+        # the requests in flight, or whose logs are yet to be yielded, and the ranges
+        # split off rejected requests that are yet to be requested, in block order
+        pending: Deque[
+            Tuple[BlockNumber, BlockNumber, Optional["Future[List[LogReceipt]]"]]
+        ] = deque()
+        in_flight = 0
+
+        def request(
+            from_block: BlockNumber, to_block: BlockNumber
+        ) -> Tuple[BlockNumber, BlockNumber, "Future[List[LogReceipt]]"]:
+            self._requests += 1
+            params = _filter_params_for_range(filter_params, from_block, to_block)
+            return from_block, to_block, executor.submit(self.w3.eth.get_logs, params)
+
+        try:
+            while pending or next_block <= to_block:
+                # request the ranges split off before new ones
+                for i in range(len(pending)):
+                    if in_flight >= self.max_concurrent_requests:
+                        break
+                    range_from, range_to, future = pending[i]
+                    if future is None:
+                        pending[i] = request(range_from, range_to)
+                        in_flight += 1
+                while (
+                    in_flight < self.max_concurrent_requests and next_block <= to_block
+                ):
+                    range_from, range_to = self._next_range(next_block, to_block)
+                    pending.append(request(range_from, range_to))
+                    in_flight += 1
+                    next_block = BlockNumber(range_to + 1)
+
+                range_from, range_to, future = pending.popleft()
+                in_flight -= 1
+                try:
+                    logs = cast("Future[List[LogReceipt]]", future).result()
+                except Exception as e:
+                    if not is_log_range_error(e):
+                        raise
+                    first_half, second_half = self._split_range(range_from, range_to, e)
+                    # the second half is requested once a request completes, to not
+                    # exceed max_concurrent_requests
+                    pending.extendleft(((*second_half, None), request(*first_half)))
+                    in_flight += 1
+                    continue
+
+                self._adapt_block_range(range_from, range_to, len(logs))
+                yield from logs
+        finally:
+            for _, _, future in pending:
+                if future is not None:
+                    future.cancel()
+            executor.shutdown(wait=False)
+
+
+class AsyncLogScanner(_BaseLogScanner):
+    """
+    The async version of ``LogScanner``, making its ``eth_getLogs`` requests
+    concurrently on the event loop.
+    """
+
+    def __init__(
+        self,
+        w3: "AsyncWeb3",
+        block_range: int = 50,
+        min_block_range: int = 1,
+        max_block_range: int = 10_000,
+        max_concurrent_requests: int = 4,
+        target_logs_per_request: int = 1_000,
+    ) -> None:
+        super().__init__(
+            block_range,
+            min_block_range,
+            max_block_range,
+            max_concurrent_requests,
+            target_logs_per_request,
+        )
+        self.w3 = w3
+
+    async def _get_block_number(self, block_identifier: BlockIdentifier) -> BlockNumber:
+        if is_integer(block_identifier):
+            return cast(BlockNumber, block_identifier)
+        elif block_identifier == "earliest":
+            return BlockNumber(0)
+        return (await self.w3.eth.get_block(block_identifier))["number"]
+
+    async def scan(self, filter_params: FilterParams) -> AsyncIterator[LogReceipt]:
+        """
+        Yield the logs matching ``filter_params``, from its ``fromBlock`` to its
+        ``toBlock``, both ``"latest"`` if not set.
+        """
+        _validate_filter_params(filter_params)
+        next_block = await self._get_block_number(
+            filter_params.get("fromBlock", "latest")
+        )
+        to_block = await self._get_block_number(filter_params.get("toBlock", "latest"))
+
+        # the requests in flight, or whose logs are yet to be yielded, and the ranges
+        # split off rejected requests that are yet to be requested, in block order
+        pending: Deque[
+            Tuple[BlockNumber, BlockNumber, Optional["asyncio.Task[List[LogReceipt]]"]]
+        ] = deque()
+        in_flight = 0
+
+        def request(
+            from_block: BlockNumber, to_block: BlockNumber
+        ) -> Tuple[BlockNumber, BlockNumber, "asyncio.Task[List[LogReceipt]]"]:
+            self._requests += 1
+            params = _filter_params_for_range(filter_params, from_block, to_block)
+            return (
+                from_block,
+                to_block,
+                asyncio.ensure_future(self.w3.eth.get_logs(params)),
+            )
+
+        try:
+            while pending or next_block <= to_block:
+                # request the ranges split off before new ones
+                for i in range(len(pending)):
+                    if in_flight >= self.max_concurrent_requests:
+                        break
+                    range_from, range_to, task = pending[i]
+                    if task is None:
+                        pending[i] = request(range_from, range_to)
+                        in_flight += 1
+                while (
+                    in_flight < self.max_concurrent_requests and next_block <= to_block
+                ):
+                    range_from, range_to = self._next_range(next_block, to_block)
+                    pending.append(request(range_from, range_to))
+                    in_flight += 1
+                    next_block = BlockNumber(range_to + 1)
+
+                range_from, range_to, task = pending.popleft()
+                in_flight -= 1
+                try:
+                    logs = await cast("asyncio.Task[List[LogReceipt]]", task)
+                except Exception as e:
+                    if not is_log_range_error(e):
+                        raise
+                    first_half, second_half = self._split_range(range_from, range_to, e)
+                    # the second half is requested once a request completes, to not
+                    # exceed max_concurrent_requests
+                    pending.extendleft(((*second_half, None), request(*first_half)))
+                    in_flight += 1
+                    continue
+
+                self._adapt_block_range(range_from, range_to, len(logs))
+                for log in logs:
+                    yield log
+        finally:
+            for _, _, task in pending:
+                if task is None:
+                    continue
+                if task.done() and not task.cancelled():
+                    # retrieve the exception, if any, of a request no longer awaited
+                    task.exception()
+                else:
+                    task.cancel()